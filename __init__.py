@@ -1,21 +1,49 @@
 from grassmanntn.param import *
-from grassmanntn.gauge2d import *
-from grassmanntn.gauge2d_block import *
-from grassmanntn.arith import *
 
 import numpy as np
 import math
+import importlib
 from grassmanntn import param
 import sparse as sp
 import opt_einsum as oe
 import time
 import copy
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import gc
 import tracemalloc
 import os
 from datetime import datetime
 
+####################################################
+##               Lazy submodule import            ##
+####################################################
+
+# arith, gauge2d and gauge2d_block pull in sympy, so they are only imported when one of the names
+# below is looked up on the package; any other unknown name fails without importing anything.
+# As with the former star imports, gauge2d_block shadows gauge2d, and the names that are also
+# defined in this file (get_char, show_progress, absolute_sign, ...) are taken from this file.
+lazy_submodules = ("arith","gauge2d","gauge2d_block")
+arith_names = ("error_message","exterior","isxscalar","iszero","set_ac","set_anticommutative",
+               "is_generator","grassmann_number","relative_sign_redux","d","berezin_measure","exp")
+gauge2d_names = ("cI","tensor_preparation","myQuadrature","get_ABtensors","get_ABtensors_manual",
+                 "fcompress_B","compress_B","compress_A","compress_T","zcap","logZ","logZhotrg3dz",
+                 "trg","atrg2dy","atrg2dx","hotrg3dz")
+lazy_names = {}                         # public name -> the submodule that provides it
+lazy_names.update([ (module_name,module_name) for module_name in lazy_submodules ])
+lazy_names.update([ (name,"arith") for name in arith_names ])
+lazy_names.update([ (name,"gauge2d_block") for name in gauge2d_names ])
+
+def __getattr__(name):
+    if name not in lazy_names :
+        raise AttributeError("module 'grassmanntn' has no attribute '"+name+"'")
+    module = importlib.import_module("grassmanntn."+lazy_names[name])
+    if name == lazy_names[name] :
+        return module
+    return getattr(module,name)
+
 hybrid_symbol = "*"
 separator_list = ("|",":",";",",",".")
 number_character = ("0","1","2","3","4","5","6","7","8","9")
@@ -38,6 +66,27 @@ char_list = (
 
 progress_bar_enabled = False
 
+sign_factor_mode = "dense"   # "dense" or "factorized", see sign_factors()
+einsum_cache_enabled = True
+einsum_cache_size = 64
+einsum_cache_bytes = 2**26              # the memory (bytes) of the sign tensors kept in einsum_cache
+sign_program_table_size = 1024          # the number of compiled sign programs kept, see compiled_sign_program()
+parity_sector_enabled = True            # contract Grassmann-even dense tensors sector by sector
+parity_sector_min_intensity = 512       # ... if the contraction costs this many flops per (entry x leg)
+parity_sector_min_cost = 2**20          # ... and this many flops per parity configuration
+parity_sector_cache_enabled = True      # keep the parity-sorted data of each dense operand, see parity_sorted_data()
+executor = None                         # thread pool for independent parity blocks, see set_executor()
+executor_blas_threads = None            # BLAS threads per worker while the pool is busy
+svd_method = "full"                     # "full", "randomized" or "lanczos", see SortedSVD()
+svd_method_type = ("full","randomized","lanczos")
+svd_oversampling = 10                   # extra random vectors of the randomized svd
+svd_power_iterations = 2                # power iterations of the randomized svd
+svd_report = None                       # the truncation error of the last svd, see svd_truncation_report()
+eig_method = "full"                     # "full", "partial" or "lanczos", see SortedEig()
+eig_method_type = ("full","partial","lanczos")
+hermiticity_check = "sample"            # "full", "sample" or "none", see check_hermiticity()
+hermiticity_samples = 32                # the number of rows compared by the sampled check
+
 ####################################################
 ##                Random Utilities                ##
 ####################################################
@@ -242,7 +291,24 @@ def none(shape,initial=None):
 
 class block:
 
+    # the cells are kept in an object array indexed by the parities of the fermionic axes;
+    # the attributes are fixed, so no per-instance dictionary is needed
+    __slots__ = ("stored_data","share_count","data_escaped","diagonal_data","norm_cache","zero_cell_cache","sgn","statistics","format","shape","marked_as_joined")
+
     def __init__(self, data=None):
+
+        self.share_count = None
+        self.data_escaped = False
+        self.zero_cell_cache = None
+        if data is None :
+            # an empty container, to be filled by the caller (see block.copy)
+            self.data = None
+            self.sgn = [[],[]]
+            self.statistics = ()
+            self.format = "standard"
+            self.shape = ()
+            self.marked_as_joined = False
+            return
         
         #import from dense only
         dat = data.copy()
@@ -250,102 +316,83 @@ class block:
             dat = dense(data)
         dat = dat.force_encoder('parity-preserving')
 
-        datatype = data.data.dtype
+        datatype = read_data(data).dtype
 
         # create a Z2-blocking structure
         # cell is a larger matrix containing smaller blocks
         grading = 2
 
-        # pick up the shape of the fermionic sector
-        fshape = []
-        for i,d in enumerate(dat.shape):
-            if dat.statistics[i] in fermi_type:
-                fshape += [d]
-        fshape = tuple(fshape)
-
-        cell_shape = tuple([grading]*len(fshape))
-
-        # compute the base block shape
-        base_block_shape = []
+        # in the parity-preserving encoder, the block number of an index is i%2 and the
+        # position inside the block is i//2, so every fermionic axis of size d is reshaped
+        # to (d/2,2) and the grading axes are then moved to the front
+        arr = np.array(read_data(dat),dtype=datatype)
+        split_shape = []
+        grading_axes = []
+        element_axes = []
         for i,d in enumerate(dat.shape):
             if dat.statistics[i] in fermi_type:
-                base_block_shape += [max(1,int(d/grading))]
+                element_axes += [len(split_shape)]
+                grading_axes += [len(split_shape)+1]
+                split_shape += [d//grading,grading]
             else:
-                base_block_shape += [d]
-        base_block_shape = tuple(base_block_shape)
-
-        # initialize the cells and sgn_cells =============================================
-        cells = none(cell_shape,np.zeros(base_block_shape,dtype=datatype))
-
-        # create a blank list
-        sgn = []
-        for p in [0,1]:
-            sgn_p = []
-            for d,stat in zip(dat.shape,dat.statistics):
-                if stat in fermi_type:
-                    dim = int(d/grading)
-                else:
-                    dim = d
-                sgn_p+=[np.zeros([dim],dtype=int)]
-            sgn += [sgn_p]
-
-        for axis,(d,stat) in enumerate(zip(dat.shape,dat.statistics)):
-            for i in range(d):
-                if stat in bose_type:
-                    sgn[0][axis][i]=1
-                    sgn[1][axis][i]=1
-                else:
-                    block = i%2
-                    sub_i = int(math.floor(i/2))
-                    sign = param.sgn(param.encoder(i))
-                    sgn[block][axis][sub_i]=sign
+                element_axes += [len(split_shape)]
+                split_shape += [d]
+        arr = arr.reshape(split_shape).transpose(grading_axes+element_axes)
 
-        # Consider using the fact that all odd axis use the same sign factor (also the even axis)
+        cell_shape = tuple([grading]*len(grading_axes))
 
-        # now iterate through the dat tensor and separate it into blocks
-        it = np.nditer(dat, flags=['multi_index'])
-        for val in it:
-            
-            #total index
-            index = it.multi_index
-
-            #fermionic index
-            findex = []
-            for i,d in enumerate(index):
-                if dat.statistics[i] in fermi_type:
-                    findex += [d]
-
-            #determine the block number
-            blocknum = [ elem%grading for elem in findex ]
-            blocknum = tuple(blocknum)
-
-            blockelem = [ int((d-d%grading)/grading) for d in findex ]
-
-            #determine the block matrix elements
-            blockelem = []
-            for i,d in enumerate(index):
-                if dat.statistics[i] in fermi_type:
-                    blockelem += [int((d-d%grading)/grading)]
-                else:
-                    blockelem += [d]
-            blockelem = tuple(blockelem)
-            cells[blocknum][blockelem] += val.item()
-
-            # compute the sigma sign factor
-            #for i,dim in enumerate(blockelem):
-            #    σ = 1
-            #    if dat.statistics[i] in fermi_type:
-            #        canonical_index = param.encoder(index[i])
-            #        σ = param.sgn(canonical_index)
-            #    sgn_cells[blocknum][i][dim]=σ
+        # initialize the cells ============================================================
+        cells = none(cell_shape)
+        for blocknum in np.ndindex(cell_shape):
+            cells[blocknum] = np.ascontiguousarray(arr[blocknum])
 
         self.data = cells.copy()
-        self.sgn  = copy.deepcopy(sgn)
+        self.sgn  = block_sign_vectors(dat.shape,dat.statistics)
         self.statistics = dat.statistics
         self.format = dat.format
         self.shape = dat.shape # not the actual shape, but the 'physical' shape
         self.marked_as_joined = False
 
+    # A block with two fermionic legs whose only nonzero cells are the diagonal matrices of the
+    # even-even and odd-odd cells (singular values and eigenvalues, see decompose_block) can keep them as
+    # diagonal_data = [even vector, odd vector]; power, norm, dtype, copy and the format switch work on the
+    # vectors, and the cells are only built the first time data is accessed.
+    # The norm is cached in norm_cache, and the identically zero cells in zero_cell_cache (see zero_cells());
+    # both are dropped whenever data is accessed, since the cells can then be replaced by the caller.
+    # The cells are shared by copies in the same way as the data of dense (see share_stored_data()):
+    # data gives cells that the block can modify, and read_data() gives the cells without copying.
+
+    @property
+    def data(self):
+        read_data(self)
+        self.norm_cache = None
+        self.zero_cell_cache = None
+        own_stored_data(self)
+        self.data_escaped = True
+        return self.stored_data
+
+    @data.setter
+    def data(self, value):
+        release_stored_data(self)
+        self.stored_data = value
+        self.data_escaped = False
+        self.diagonal_data = None
+        self.norm_cache = None
+        self.zero_cell_cache = None
+
+    @data.deleter
+    def data(self):
+        release_stored_data(self)
+        del self.stored_data
+        self.data_escaped = False
+        self.diagonal_data = None
+        self.norm_cache = None
+        self.zero_cell_cache = None
+
+    @property
+    def is_diagonal(self):
+        return self.diagonal_data is not None
+
     def display(self,name=None,indent_size=0):
         indent = ""
         for i in range(indent_size):
@@ -353,10 +400,10 @@ class block:
 
         mem = 0
 
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
+        it = np.nditer(read_data(self), flags=['multi_index','refs_ok'])
         for val in it:
             block = it.multi_index
-            dat = self.data[block]
+            dat = read_data(self)[block]
             mem += sys.getsizeof(dat)
 
         print()
@@ -385,10 +432,10 @@ class block:
         print(" ::::::::::::::::::: Block information ::::::::::::::::::")
 
         i=0
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
+        it = np.nditer(read_data(self), flags=['multi_index','refs_ok'])
         for val in it:
             block = it.multi_index
-            dat = self.data[block]
+            dat = read_data(self)[block]
             
             if(np.linalg.norm(dat)>numer_display_cutoff):
                 if i>0:
@@ -410,10 +457,10 @@ class block:
 
         mem = 0
 
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
+        it = np.nditer(read_data(self), flags=['multi_index','refs_ok'])
         for val in it:
             block = it.multi_index
-            dat = self.data[block]
+            dat = read_data(self)[block]
             mem += sys.getsizeof(dat)
 
         print()
@@ -433,11 +480,13 @@ class block:
 
     @property
     def norm(self):
-        ret = 0
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
-        for val in it:
-            ret += np.linalg.norm(val.item())**2
-        return np.sqrt(ret)
+        if self.norm_cache is None :
+            if self.diagonal_data is not None :
+                cell_list = self.diagonal_data
+            else:
+                cell_list = self.stored_data.flat
+            self.norm_cache = np.sqrt(sum([ np.vdot(cell,cell).real for cell in cell_list ]))
+        return self.norm_cache
 
     @property
     def effective_shape(self):
@@ -464,17 +513,26 @@ class block:
     
     @property
     def dtype(self):
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
-        for val in it:
-            #total index
-            return val.item().dtype
+        # the dtype of the first cell
+        if self.diagonal_data is not None :
+            return self.diagonal_data[0].dtype
+        return self.stored_data.flat[0].dtype
 
     def copy(self):
+        """
+        Copy-on-write copy: the cells are shared with self until one of the two blocks asks data
+        for cells it can modify (see share_stored_data()), and the sign vectors are shared as well
+        (only the lists holding them are new).
+        """
+        ret = block()
 
-        ret = block( gtn.random(shape=(2,2),statistics=(1,1)) )
-
-        ret.data = copy.deepcopy(self.data)
-        ret.sgn  = copy.deepcopy(self.sgn)
+        if self.diagonal_data is not None :
+            ret.diagonal_data = list(self.diagonal_data)
+        else:
+            share_stored_data(self,ret)
+        ret.norm_cache = self.norm_cache
+        ret.zero_cell_cache = self.zero_cell_cache
+        ret.sgn  = [ list(self.sgn[0]), list(self.sgn[1]) ]
         ret.statistics = self.statistics
         ret.format = self.format
         ret.shape = self.shape # not the actual shape, but the 'physical' shape
@@ -494,11 +552,9 @@ class block:
         if self.marked_as_joined or other.marked_as_joined :
             error("Error[block.+]: You cannot add a joined object to ther object.")
 
+        # the cells are added one by one into a new cell array
         ret = self.copy()
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
-        for val in it:
-            block = it.multi_index
-            ret.data[block] = self.data[block]+other.data[block]
+        ret.data = read_data(self)+read_data(other)
         return ret
         
     def __mul__(self, other):
@@ -506,10 +562,11 @@ class block:
             error("Error[block.*]: Only scalar multiplication is allowed.")
 
         ret = self.copy()
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
-        for val in it:
-            block = it.multi_index
-            ret.data[block] = self.data[block]*other
+        if self.diagonal_data is not None :
+            ret.diagonal_data = [ v*other for v in self.diagonal_data ]
+            ret.norm_cache = None
+            return ret
+        ret.data = read_data(self)*other
 
         return ret
         
@@ -517,8 +574,10 @@ class block:
         
         if np.isscalar(other):
             # dividing the scalar
+            if self.diagonal_data is not None :
+                return self*(1.0/other)
             ret = self.copy()
-            ret.data = self.data*(1.0/other)
+            ret.data = read_data(self)*(1.0/other)
             return ret
         else:
             error("Error[block./]: Only scalar division is allowed.")
@@ -555,20 +614,31 @@ class block:
         #print()
         #print("statistics = ",self.statistics)
         ret = self.copy()
-        it = np.nditer(self.data, flags=['multi_index','refs_ok'])
-        for val in it:
-            #total index
-            block = it.multi_index
-            #print("block = ",block)
-            val_replace = val.item().copy()
-            fd = 0
-            for d in range(self.ndim):
-                if self.statistics[d] == -1:
-                    #print(val_replace.shape,self.statistics[d],self.sgn[block[d]][d].shape,d)
-                    val_replace = mult_along_axis(val_replace,self.sgn[block[fd]][d],d)
-                if self.statistics[d] in fermi_type:
-                    fd += 1
-            ret.data[block] = val_replace.copy()
+        if self.diagonal_data is not None :
+            # the diagonal of the cell (p,p) is multiplied by the sign factors of both conjugated legs
+            for p,v in enumerate(self.diagonal_data):
+                for d in range(self.ndim):
+                    if self.statistics[d] == -1:
+                        v = v*self.sgn[p][d]
+                ret.diagonal_data[p] = v
+            ret.norm_cache = self.norm_cache
+        else:
+            cells = read_data(self).copy()
+            it = np.nditer(cells, flags=['multi_index','refs_ok'])
+            for val in it:
+                #total index
+                block = it.multi_index
+                #print("block = ",block)
+                val_replace = val.item().copy()
+                fd = 0
+                for d in range(self.ndim):
+                    if self.statistics[d] == -1:
+                        #print(val_replace.shape,self.statistics[d],self.sgn[block[d]][d].shape,d)
+                        val_replace = mult_along_axis(val_replace,self.sgn[block[fd]][d],d)
+                    if self.statistics[d] in fermi_type:
+                        fd += 1
+                cells[block] = val_replace.copy()
+            ret.data = cells
 
         if self.format == "standard":
             ret.format = "matrix"
@@ -598,16 +668,49 @@ class block:
     def hconjugate(self,string,save_memory=False):
         return hconjugate_block(self,string,save_memory)
 
-    def svd(self,string,cutoff=None,save_memory=False):
-        return svd_block(self,string,cutoff,save_memory)
-
-    def eig(self,string,cutoff=None,save_memory=False):
-        return eig_block(self,string,cutoff,save_memory)
+    def svd(self,string,cutoff=None,save_memory=False,method=None):
+        return svd_block(self,string,cutoff,save_memory,method)
+
+    def eig(self,string,cutoff=None,save_memory=False,method=None):
+        return eig_block(self,string,cutoff,save_memory,method)
+
+def diagonal_cells(diagonal_data):
+    # the cells of a diagonal block with two fermionic legs, see the block class
+    [vE,vO] = diagonal_data
+    cells = none((2,2))
+    cells[0,0] = np.diag(vE)
+    cells[1,1] = np.diag(vO)
+    cells[0,1] = np.zeros((len(vE),len(vO)))
+    cells[1,0] = np.zeros((len(vO),len(vE)))
+    return cells
+
+def block_sign_vectors(shape,statistics):
+    # the sign factors of the even (odd) block are those of the even (odd) parity-preserving indices
+    sgn = [[],[]]
+    for d,stat in zip(shape,statistics):
+        if stat in bose_type:
+            sgn[0] += [np.ones([d],dtype=int)]
+            sgn[1] += [np.ones([d],dtype=int)]
+        else:
+            σ = sigma_vector(d,'parity-preserving')
+            sgn[0] += [σ[0::2].copy()]
+            sgn[1] += [σ[1::2].copy()]
+    return sgn
+
+def empty_block(shape,statistics,format):
+    # a block with the cell array and sign vectors of the given (physical) shape but no cells yet
+    ret = block()
+    ret.data = none(tuple([ 2 for stat in statistics if stat in fermi_type ]))
+    ret.sgn = block_sign_vectors(shape,statistics)
+    ret.statistics = make_tuple(statistics)
+    ret.format = format
+    ret.shape = make_tuple(shape)
+    return ret
 
 def zero_block(effective_shape,statistics,format='standard',dtype=float):
     shape = [ 2**int(np.ceil(np.log2(dim))) if stat in fermi_type else dim for dim,stat in zip(effective_shape,statistics) ]
     oeshape = [ max(1,int(round(dim/2))) if stat in fermi_type else dim for dim,stat in zip(effective_shape,statistics) ]
-    ret = block(dense(np.zeros(shape,dtype=dtype),statistics=statistics,format=format))
+    ret = empty_block(shape,statistics,format)
     it = np.nditer(ret.data, flags=['multi_index','refs_ok'])
     for val in it:
         #total index
@@ -621,7 +724,7 @@ def zero_block(effective_shape,statistics,format='standard',dtype=float):
 def zero_block_eo(even_shape,odd_shape,statistics,format='standard',dtype=float):
     effective_shape = [ edim+odim if stat in fermi_type else edim for edim,odim,stat in zip(even_shape,odd_shape,statistics) ]
     shape = [ 2**int(np.ceil(np.log2(dim))) if stat in fermi_type else dim for dim,stat in zip(effective_shape,statistics) ]
-    ret = block(dense(np.zeros(shape,dtype=dtype),statistics=statistics,format=format))
+    ret = empty_block(shape,statistics,format)
     it = np.nditer(ret.data, flags=['multi_index','refs_ok'])
     for val in it:
         #total index
@@ -670,31 +773,23 @@ def todense(obj,encoder,skip_joined_check=False):
 
     ret = dense(np.zeros(obj.shape,dtype=obj.dtype),statistics=obj.statistics,encoder='parity-preserving',format=obj.format)
 
+    # the element c of a block goes to the parity-preserving index 2c+p on a fermionic axis,
+    # where p is the block number of the axis, so each block fills a strided slice
     it = np.nditer(obj.data, flags=['multi_index','refs_ok'])
     for _ in it:
         block = it.multi_index
         dat = obj.data[block]
         #print("block:",block)
-        sub_it = np.nditer(dat, flags=['multi_index','refs_ok'])
-        for val in sub_it:
-            coords = sub_it.multi_index
-            fcoords = [ c for i,c in enumerate(coords) if obj.statistics[i] in fermi_type ]
-            new_coords = []
-            fi = 0
-            for i,c in enumerate(coords):
-                if obj.statistics[i] in fermi_type:
-                    if block[fi]==0:
-                        new_coords += [2*c]
-                    else:
-                        new_coords += [2*c+1]
-                    fi += 1
-                else:
-                    new_coords += [c]
-
-            new_coords = tuple(new_coords)
-            #print("  M",coords,"= M'",new_coords,"=",val)
+        new_slices = []
+        fi = 0
+        for i,dim in enumerate(dat.shape):
+            if obj.statistics[i] in fermi_type:
+                new_slices += [slice(block[fi],block[fi]+2*dim,2)]
+                fi += 1
+            else:
+                new_slices += [slice(0,dim)]
 
-            ret.data[new_coords] = val
+        ret.data[tuple(new_slices)] = dat
 
     ret = ret.force_encoder(encoder)
 
@@ -768,7 +863,9 @@ class dense:
     def __init__(self, data=None, encoder = "canonical", format = "standard", statistics=None):
     
         #copy dense properties
-        self.data = None
+        self.share_count = None
+        self.data_escaped = False
+        self.data = None # sets stored_data, diagonal_data, axis_permutation and axis_sign, see the data property
         self.statistics = None
         self.format = format
         self.encoder = encoder
@@ -789,14 +886,16 @@ class dense:
             default = False
         elif(type(data)==sparse):
             #copy dense properties
-            self.data = data.data.todense()
+            self.data = read_data(data).todense()
             self.statistics = data.statistics
             self.format = data.format
             self.encoder = data.encoder
             default = False
         elif(type(data)==dense):
-            #copy dense properties
-            self.data = data.data.copy()
+            #copy dense properties (the data is shared until one of them modifies it)
+            share_stored_data(data,self)
+            self.diagonal_data = data.diagonal_data
+            copy_pending_state(data,self)
             self.statistics = data.statistics
             self.format = data.format
             self.encoder = data.encoder
@@ -814,32 +913,88 @@ class dense:
             self.statistics = make_tuple(statistics)
             
         if not default and not skip_power_of_two_check:
-            for i,dim in enumerate(self.data.shape):
+            for i,dim in enumerate(self.shape):
                 if self.statistics[i] in fermi_type and dim != int(2**math.floor(np.log2(dim))):
                     error("Error[dense]: Some of the fermionic tensor shapes are not a power of two."
                         +"\n              Have you added the <statistics> argument when calling this function?")
                 
+    # The encoder switch only permutes the indices of each fermionic axis and the format switch only
+    # multiplies each conjugated axis by a sign vector, so both are kept pending:
+    #   data[i0,i1,...] = (stored_data*s0*s1*...)[p0[i0],p1[i1],...]
+    # with axis_permutation = [p0,p1,...] and axis_sign = [s0,s1,...] (each s along its own axis),
+    # an entry being None if the axis is untouched (or the whole list being None).
+    # They are carried out in one pass the first time data is accessed, see resolve_dense().
+    # copy() and dense(dense) share stored_data until one of the tensors asks data for a buffer it can
+    # modify, which is then a private copy (see share_stored_data()); read_data() gives the data without copying.
+    # A square matrix that is diagonal (singular values and eigenvalues, see svd and eig) can keep only
+    # its diagonal as diagonal_data, with stored_data = None and no pending switches; power, norm, copy,
+    # the switches and the contractions in einsum work on the vector (see diagonal()), and the matrix is
+    # only built the first time data is accessed.
+    # The parity-sorted data used by the sector contraction is kept in sector_cache (see parity_sorted_data()).
+
+    @property
+    def data(self):
+        read_data(self)
+        own_stored_data(self)
+        self.data_escaped = True
+        self.sector_cache = None
+        return self.stored_data
+
+    @data.setter
+    def data(self, value):
+        release_stored_data(self)
+        self.stored_data = value
+        self.data_escaped = False
+        self.diagonal_data = None
+        self.axis_permutation = None
+        self.axis_sign = None
+        self.sector_cache = None
+
+    @data.deleter
+    def data(self):
+        release_stored_data(self)
+        del self.stored_data
+        self.data_escaped = False
+        self.diagonal_data = None
+        self.axis_permutation = None
+        self.axis_sign = None
+        self.sector_cache = None
+
     def __getitem__(self, index):
+        # the result can be a view, so the data is made private first
         return self.data[index]
     
     def __setitem__(self, index, value):
         self.data[index] = value
         
+    @property
+    def is_diagonal(self):
+        return self.diagonal_data is not None
+
     @property
     def shape(self):
-        return self.data.shape
+        if self.diagonal_data is not None :
+            return (len(self.diagonal_data),len(self.diagonal_data))
+        return self.stored_data.shape
 
     @property
     def size(self):
-        return self.data.size
+        if self.diagonal_data is not None :
+            return len(self.diagonal_data)**2
+        return self.stored_data.size
 
     @property
     def ndim(self):
-        return self.data.ndim
+        if self.diagonal_data is not None :
+            return 2
+        return self.stored_data.ndim
 
     @property
     def norm(self):
-        array_form = self.data
+        # the norm does not depend on the order of the indices
+        array_form = self.stored_data
+        if self.diagonal_data is not None :
+            array_form = self.diagonal_data
         return np.linalg.norm(array_form)
 
     @property
@@ -898,9 +1053,12 @@ class dense:
         print()
 
     def copy(self):
-        #copy dense properties
+        #copy dense properties (copy-on-write)
         ret = dense()
-        ret.data = self.data.copy()
+        share_stored_data(self,ret)
+        ret.diagonal_data = self.diagonal_data
+        copy_pending_state(self,ret)
+        ret.sector_cache = self.sector_cache
         ret.statistics = self.statistics
         ret.format = self.format
         ret.encoder = self.encoder
@@ -914,14 +1072,17 @@ class dense:
             error("Error[dense.+]: Inconsistent object properties")
             
         ret = self.copy()
-        ret.data = ret.data+other.data
+        ret.data = read_data(ret)+read_data(other)
         return ret
         
     def __mul__(self, other):
         if not np.isscalar(other):
             error("Error[dense.*]: Only scalar multiplication is allowed.")
         ret = self.copy()
-        ret.data = ret.data*other
+        if self.diagonal_data is not None :
+            ret.diagonal_data = self.diagonal_data*other
+            return ret
+        ret.data = read_data(ret)*other
         return ret
         
     def __truediv__(self, other):
@@ -929,7 +1090,10 @@ class dense:
         if np.isscalar(other):
             # dividing the scalar
             ret = self.copy()
-            ret.data = self.data/other
+            if self.diagonal_data is not None :
+                ret.diagonal_data = self.diagonal_data/other
+                return ret
+            ret.data = read_data(self)/other
             return ret
         else:
             error("Error[dense./]: Only scalar division is allowed.")
@@ -950,61 +1114,27 @@ class dense:
         return self*other
         
     def __len__(self):
-        return len(self.data)
+        return len(read_data(self))
     
     def __str__(self):
-        return str(self.data)
+        return str(read_data(self))
     
     def __repr__(self):
-        return repr(self.data)
+        return repr(read_data(self))
         
     def switch_format(self,save_memory=False):
         # multiply sign factor sigma[i] to every conjugated indices i
-
-        #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
-        # WORK IN THE FOLLOWING CONDITIONS      :::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
-        # (WILL CONVERT AUTOMATICALLY)          :::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
-        #   - canonical encoder                 :::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
-        #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+        # (kept pending until the data is accessed)
 
         if save_memory :
             ret = self
         else:
             ret = self.copy()
-        if(self.encoder=='parity-preserving'):
-            ret = ret.switch_encoder(save_memory=True)
-        to_calc = []
-        for i in range(self.ndim):
-            to_calc += (ret.statistics[i]==-1),
-            if(ret.statistics[i]==hybrid_symbol):
-                error("Error[switch_format]: Cannot switch format with a hybrid index.\n                      Split them into bosonic and fermionic ones first!")
-        
-        k=0
-        kmax = ret.ndim
-        s0 = time.time()
-        s00 = s0
-        progress_space()
-
-        dat = ret.data
-        for i in range(ret.ndim):
-            if not to_calc[i] :
-                continue
 
-            ss = [None] * ret.ndim    # slice object
-            ss[i] = slice(None)       # sum over axis i
-            ss = make_tuple(ss)
-            d = ret.shape[i]
-            v = np.array([param.sgn(j) for j in range(d)])
-            dat = dat*v[ss]
-
-            if time.time()-s0 > 2 :
-                show_progress(i,kmax,process_name = "switch_format",ratio = False,color="blue",time=time.time()-s00)
-                s0 = time.time()
-
-        clear_progress()
-        tab_up()
-
-        ret.data = dat
+        if ret.diagonal_data is not None :
+            diagonal_format_switch(ret)
+        else:
+            pending_format_switch(ret)
 
         if(ret.format=='standard'):
             ret.format = 'matrix'
@@ -1012,38 +1142,22 @@ class dense:
             ret.format = 'standard'
         else:
             error("Error[switch_format]: unknown format")
-            
-        if(self.encoder=='parity-preserving'):
-            ret = ret.switch_encoder(save_memory=True)
+
         return ret
 
     def switch_encoder(self,save_memory=False):
+        # permute the indices of every fermionic axis
+        # (kept pending until the data is accessed)
 
         if save_memory :
             ret = self
         else:
             ret = self.copy()
 
-        k=0
-        kmax = ret.ndim
-        s0 = time.time()
-        s00 = s0
-        progress_space()
-
-        dat = ret.data
-        for axis in range(ret.ndim):
-            d = ret.shape[axis]
-            if ret.statistics[axis] in fermi_type :
-                dat = dat.take(indices=np.array([param.encoder(i) for i in range(d)]),axis=axis)
-
-            if time.time()-s0 > 2 :
-                show_progress(axis,kmax,process_name = "switch_encoder",ratio = False,color="cyan",time=time.time()-s00)
-                s0 = time.time()
-            
-        clear_progress()
-        tab_up()
-
-        ret.data = dat
+        if ret.diagonal_data is not None :
+            diagonal_encoder_switch(ret)
+        else:
+            pending_encoder_switch(ret)
 
         if(ret.encoder=='canonical'):
             ret.encoder='parity-preserving'
@@ -1076,11 +1190,11 @@ class dense:
     def hconjugate(self,input_string,save_memory=False):
         return hconjugate(self,input_string,save_memory)
 
-    def svd(self,string_inp,cutoff=None,save_memory=False):
-        return svd(self,string_inp,cutoff,save_memory)
+    def svd(self,string_inp,cutoff=None,save_memory=False,method=None):
+        return svd(self,string_inp,cutoff,save_memory,method)
 
-    def eig(self,string_inp,cutoff=None,debug_mode=False,save_memory=False):
-        return eig(self,string_inp,cutoff,debug_mode,save_memory)
+    def eig(self,string_inp,cutoff=None,debug_mode=False,save_memory=False,method=None):
+        return eig(self,string_inp,cutoff,debug_mode,save_memory,method)
 
     def toblock(self):
         return block(self)
@@ -1093,7 +1207,9 @@ class sparse:
     def __init__(self, data=None, encoder = "canonical", format = "standard", statistics = None):
     
         #copy sparse properties
-        self.data = None
+        self.share_count = None
+        self.data_escaped = False
+        self.data = None # sets stored_data, axis_permutation and axis_sign, see the data property
         self.statistics = None
         self.format = format
         self.encoder = encoder
@@ -1114,14 +1230,20 @@ class sparse:
             default = False
         elif(type(data)==dense):
             #copy sparse properties
-            self.data  = sp.COO.from_numpy(data.data)
+            if data.is_diagonal :
+                # only the nonzero diagonal entries are stored
+                index = np.flatnonzero(data.diagonal_data)
+                self.data = sp.COO(np.array([index,index]),data.diagonal_data[index],shape=data.shape)
+            else:
+                self.data  = sp.COO.from_numpy(read_data(data))
             self.statistics = data.statistics
             self.format = data.format
             self.encoder = data.encoder
             default = False
         elif(type(data)==sparse):
-            #copy sparse properties
-            self.data = data.data.copy()
+            #copy sparse properties (the data is shared until one of them modifies it)
+            share_stored_data(data,self)
+            copy_pending_state(data,self)
             self.statistics = data.statistics
             self.format = data.format
             self.encoder = data.encoder
@@ -1136,47 +1258,76 @@ class sparse:
             self.statistics = make_tuple(statistics)
         
         if not default and not skip_power_of_two_check:
-            for i,dim in enumerate(self.data.shape):
+            for i,dim in enumerate(self.shape):
                 if self.statistics[i] in fermi_type and dim != int(2**math.floor(np.log2(dim))):
                     error("Error[sparse]: Some of the fermionic tensor shapes are not a power of two.\n               Have you added the <statistics> argument when calling this function?")
                
+    # the encoder and format switches are kept pending as in dense, see the comments there;
+    # they are carried out on the coordinates and the values, see resolve_sparse().
+    # The sparse.COO object is shared by copies as well, in the same way.
+
+    @property
+    def data(self):
+        read_data(self)
+        own_stored_data(self)
+        self.data_escaped = True
+        return self.stored_data
+
+    @data.setter
+    def data(self, value):
+        release_stored_data(self)
+        self.stored_data = value
+        self.data_escaped = False
+        self.axis_permutation = None
+        self.axis_sign = None
+
+    @data.deleter
+    def data(self):
+        release_stored_data(self)
+        del self.stored_data
+        self.data_escaped = False
+        self.axis_permutation = None
+        self.axis_sign = None
+
     @property
     def nnz(self):
-        return self.data.nnz
+        return self.stored_data.nnz
 
     @property
     def shape(self):
-        return self.data.shape
+        return self.stored_data.shape
 
     @property
     def size(self):
-        return self.data.size
+        return self.stored_data.size
 
     @property
     def ndim(self):
-        return self.data.ndim
+        return self.stored_data.ndim
 
     @property
     def coords(self):
+        arr = read_data(self)
         coords_list = []
-        for entry in range(self.data.nnz):
+        for entry in range(arr.nnz):
             coords = []
-            for axis in range(self.data.ndim):
-                coords = coords + [self.data.coords[axis][entry]]
+            for axis in range(arr.ndim):
+                coords = coords + [arr.coords[axis][entry]]
             coords_list = coords_list + [tuple(coords)]
         return coords_list
 
     @property
     def value(self):
+        arr = read_data(self)
         value_list = []
-        for entry in range(self.data.nnz):
-            value_list = value_list + [self.data.data[entry]]
+        for entry in range(arr.nnz):
+            value_list = value_list + [arr.data[entry]]
         return value_list
 
     @property
     def norm(self):
-        array_form = self.data.todense()
-        return np.linalg.norm(array_form)
+        # the norm does not depend on the signs or on the order of the indices
+        return np.linalg.norm(self.stored_data.data)
 
     def display(self, name=None,indent_size=0):
 
@@ -1224,44 +1375,52 @@ class sparse:
         print(indent+"        norm:",self.norm)
         print()
 
+    # The entry editing methods below work on whole index arrays at once; entry refers to the position
+    # in the COO arrays data.coords and data.data.
+
     def set_value(self,entry,value):
-        self.data.data[entry] = value
+        self.set_values([entry],[value])
+
+    def set_values(self,entry_list,value_list):
+        self.data.data[np.asarray(entry_list,dtype=int)] = value_list
 
     def remove_entry(self,entry):
-        popped_coords = []
-        for axis in range(self.data.ndim):
-            popped_coords = popped_coords + [np.delete(self.data.coords[axis],entry)]
-        popped_coords = np.array(popped_coords)
-        popped_value = np.delete(self.data.data,entry)
-        
-        self.data.coords = popped_coords
-        self.data.data = popped_value
+        self.remove_entries([entry])
+
+    def remove_entries(self,entry_list):
+        arr = read_data(self)
+        keep = np.ones(arr.nnz,dtype=bool)
+        keep[np.asarray(entry_list,dtype=int)] = False
+        self.data = select_entries(arr,keep)
 
     def append_entry(self,coords,value):
-        appended_coords = []
-        for axis in range(self.data.ndim):
-            appended_coords = appended_coords + [np.append(self.data.coords[axis],coords[axis])]
-        appended_coords = np.array(appended_coords)
-        appended_value = np.append(self.data.data,value)
-        
-        self.data.coords = appended_coords
-        self.data.data = appended_value
+        self.append_entries(np.reshape(coords,(-1,1)),[value])
+
+    def append_entries(self,coords_list,value_list):
+        """
+        Append new entries in one pass.
+
+        Parameters:
+        coords_list (array-like): the coordinates in the COO layout, of shape (ndim, number of entries)
+        value_list (array-like): the values of the new entries
+        """
+        # entries appended at an existing coordinate are added to it
+        arr = read_data(self)
+        coords = np.asarray(coords_list,dtype=arr.coords.dtype).reshape(self.ndim,-1)
+        self.data = insert_entries(arr,coords,np.asarray(value_list).ravel())
 
     def remove_zeros(self):
         ret = self.copy()
-        zero_entry_list = []
-        for entry in range(ret.data.nnz):
-            if np.abs(ret.data.data[entry]) < numer_cutoff:
-                zero_entry_list = zero_entry_list + [entry]
-
-        for i,zero_entry in enumerate(zero_entry_list):
-            ret.remove_entry(zero_entry-i)
+        arr = read_data(ret)
+        # written as a negation so that NaN entries are kept, as they were by the entry-by-entry loop
+        ret.data = select_entries(arr,~(np.abs(arr.data) < numer_cutoff))
         return ret
 
     def copy(self):
-        #copy sparse properties
+        #copy sparse properties (copy-on-write)
         ret = sparse()
-        ret.data = self.data.copy()
+        share_stored_data(self,ret)
+        copy_pending_state(self,ret)
         ret.statistics = self.statistics
         ret.format = self.format
         ret.encoder = self.encoder
@@ -1275,14 +1434,14 @@ class sparse:
             error("Error[sparse.+]: Inconsistent object properties")
             
         ret = self.copy()
-        ret.data = ret.data+other.data
+        ret.data = read_data(ret)+read_data(other)
         return ret
         
     def __mul__(self, other):
         if not np.isscalar(other):
             error("Error[sparse.*]: Only scalar multiplication is allowed.")
         ret = self.copy()
-        ret.data = ret.data*other
+        ret.data = read_data(ret)*other
         return ret
         
     def __truediv__(self, other):
@@ -1290,7 +1449,7 @@ class sparse:
         if np.isscalar(other):
             # dividing the scalar
             ret = self.copy()
-            ret.data = self.data/other
+            ret.data = read_data(self)/other
             return ret
         else:
             error("Error[sparse./]: Only scalar division is allowed.")
@@ -1311,16 +1470,43 @@ class sparse:
         return self*other
         
     def __str__(self):
-        return str(self.data)
+        return str(read_data(self))
     
     def __repr__(self):
-        return repr(self.data)
+        return repr(read_data(self))
 
     def switch_format(self,save_memory=False):
-        return sparse(dense(self).switch_format(save_memory=save_memory))
+        # kept pending until the data is accessed, as in dense
+        if save_memory :
+            ret = self
+        else:
+            ret = self.copy()
+
+        pending_format_switch(ret)
+
+        if(ret.format=='standard'):
+            ret.format = 'matrix'
+        elif(ret.format=='matrix'):
+            ret.format = 'standard'
+        else:
+            error("Error[switch_format]: unknown format")
+
+        return ret
 
     def switch_encoder(self,save_memory=False):
-        return sparse(dense(self).switch_encoder(save_memory=save_memory))
+        # kept pending until the data is accessed, as in dense
+        if save_memory :
+            ret = self
+        else:
+            ret = self.copy()
+
+        pending_encoder_switch(ret)
+
+        if(ret.encoder=='canonical'):
+            ret.encoder='parity-preserving'
+        else:
+            ret.encoder='canonical'
+        return ret
 
     def force_encoder(self,target="canonical"):
         if target not in encoder_type:
@@ -1347,11 +1533,11 @@ class sparse:
     def hconjugate(self,input_string,save_memory=False):
         return hconjugate(self,input_string,save_memory)
 
-    def svd(self,string_inp,cutoff=None,save_memory=False):
-        return svd(self,string_inp,cutoff,save_memory)
+    def svd(self,string_inp,cutoff=None,save_memory=False,method=None):
+        return svd(self,string_inp,cutoff,save_memory,method)
 
-    def eig(self,string_inp,cutoff=None,debug_mode=False,save_memory=False):
-        return eig(self,string_inp,cutoff,debug_mode,save_memory)
+    def eig(self,string_inp,cutoff=None,debug_mode=False,save_memory=False,method=None):
+        return eig(self,string_inp,cutoff,debug_mode,save_memory,method)
 
     def toblock(self):
         return block(self)
@@ -1360,6 +1546,80 @@ class sparse:
 ##       Parity Calculation (internal tools)      ##
 ####################################################
 
+class sign_program:
+    """
+    The fermionic sign of reordering object_set1 into object_set2, compiled once per pair of orderings.
+    Every pair of Grassmann-odd objects whose order is flipped contributes a factor of -1, so with the
+    parities packed into the bits of an integer P (bit a is the parity of the a-th object of object_set1),
+    the sign is (-1)**sum_a( P_a * popcount(P & mask_a) ), where mask_a marks the objects
+    after a that end up in front of it.
+    Objects that are absent from object_set2 (e.g. the summed indices of an einsum) are skipped,
+    and copies of the same object are never flipped with each other (as in absolute_sign()).
+
+    Parameters:
+    object_set1 (str or list): the initial ordering
+    object_set2 (str or list): the final ordering
+
+    Attributes:
+    size (int): the number of objects in object_set1
+    pairs (list[list[int]]): the flipped pairs [a,b] with a<b, as positions in object_set1
+    masks (list[list[int]]): [a,mask_a] for every a with a nonzero mask
+    """
+    def __init__(self, object_set1, object_set2):
+        object_set1 = list(object_set1)
+        object_set2 = list(object_set2)
+        location = { x:i for i,x in enumerate(object_set2) }
+        kept = [ x in location for x in object_set1 ]
+
+        self.size = len(object_set1)
+        self.pairs = []
+        self.masks = []
+        for a in range(self.size):
+            if not kept[a] :
+                continue
+            mask = 0
+            for b in range(a+1,self.size):
+                if kept[b] and location[object_set1[a]] > location[object_set1[b]] :
+                    self.pairs += [[a,b]]
+                    mask |= 1 << b
+            if mask != 0 :
+                self.masks += [[a,mask]]
+
+    def sign(self, parity):
+        """
+        Parameters:
+        parity (int or numpy.ndarray): a packed parity bit-vector, or an integer array of them
+
+        Returns:
+        int or numpy.ndarray: the sign(s), +1 or -1
+        """
+        if type(parity)==np.ndarray :
+            exponent = np.zeros(parity.shape,dtype=int)
+            for [a,mask] in self.masks :
+                exponent ^= (parity >> a) & param.popcount(parity & mask)
+        else:
+            exponent = 0
+            for [a,mask] in self.masks :
+                exponent ^= (parity >> a) & bin(parity & mask).count("1")
+        return 1-2*(exponent & 1)
+
+def compiled_sign_program(object_set1, object_set2):
+    # the sign_program of a pair of orderings, compiled on first use
+    # (the least recently used programs are dropped from sign_program_table)
+    key = (tuple(object_set1),tuple(object_set2))
+    program = sign_program_table.get(key)
+    if program == None :
+        program = sign_program(object_set1,object_set2)
+        sign_program_table.put(key,program)
+    return program
+
+def pack_parity(parity):
+    # pack a list of parities into the bits of an integer (bit a is the parity of the a-th element)
+    packed = 0
+    for a,p in enumerate(parity):
+        packed |= (int(p)%2) << a
+    return packed
+
 def absolute_sign(object_set, parity):
     """
     Compute the absolute sign of an object_set, assuming that some elements always commute with every other element.
@@ -1371,14 +1631,7 @@ def absolute_sign(object_set, parity):
     Returns:
     int: 1 if the permutation is even, -1 if the permutation is odd.
     """
-    noncommutative_elements = [x for i,x in enumerate(object_set)
-                                if parity[i]%2==1]
-    inversions = 0
-    for i in range(len(noncommutative_elements)):
-        for j in range(i+1, len(noncommutative_elements)):
-            if noncommutative_elements[i] > noncommutative_elements[j]:
-                inversions += 1
-    return (-1)**inversions
+    return compiled_sign_program(object_set,sorted(object_set)).sign(pack_parity(parity))
 
 def relative_sign_int(object_set1, object_set2, parity1):
     """
@@ -1392,43 +1645,15 @@ def relative_sign_int(object_set1, object_set2, parity1):
     Returns:
     int: relative parity of the permutation
     """
-    
-    def permute_c(a, b, c):
-        """
-        Permute elements of c according to the permutation that maps a to b.
-        """
-        x = list(np.argsort(a))
-        xc = [ c[i] for i in x ]
-        bxc = [ xc[i] for i in b ]
-        return bxc
-    def get_noncommutative(object_set, parity):
-        """
-        Return a list of noncommutative elements
-        """
-        noncommutative_elements = [x for i,x in enumerate(object_set)
-                                    if parity[i]%2==1]
-        return noncommutative_elements
-    # get parity of object_set2
-    parity2 = permute_c(object_set1, object_set2, parity1)
-    
-    noncommutative_elements1 = get_noncommutative(object_set1,parity1)
-    noncommutative_elements2 = get_noncommutative(object_set2,parity2)
-    
-    absolute_sign1 = absolute_sign(object_set1, parity1)
-    absolute_sign2 = absolute_sign(object_set2, parity2)
-    return absolute_sign1*absolute_sign2
+    return compiled_sign_program(object_set1,object_set2).sign(pack_parity(parity1))
 
 def relative_sign_single_input(string, parity1):
     """
     the string version of relative_sign_int
     the sign factor version of single input einsum
     """
-    [string1,string2] = list(string.split("->"))
-    unique_chars = list(set(string1+string2))
-    char_to_int = {char: i for i, char in enumerate(unique_chars)}
-    permutation1 = [char_to_int[char] for char in string1]
-    permutation2 = [char_to_int[char] for char in string2]
-    return relative_sign_int(permutation1, permutation2, parity1)
+    [string1,string2] = string.split("->")
+    return compiled_sign_program(string1,string2).sign(pack_parity(parity1))
 
 def relative_sign(string, parity):
     """
@@ -1445,30 +1670,14 @@ def relative_sign(string, parity):
     >> -1
     
     """
-    [string_input,string_output] = list(string.split("->"))
-    string_list = list(string_input.split(","))
-    
-    join_string = ""
-    for i in range(len(string_list)):
-        join_string = join_string + string_list[i]
+    [string_input,string_output] = string.split("->")
+    join_string = string_input.replace(",","")
         
     if(len(join_string)!=len(parity)):
         error("Error[relative_sign]: The number of input list and parity list are not consistent!")
-        
-        
-    #remove the summed indices
-    def remove_duplicates(list1, list2):
-        new_list1 = []
-        new_list2 = []
-        for i, val in enumerate(list1):
-            if list1.count(val)==1 :
-                new_list1.append(val)
-                new_list2.append(list2[i])
-        return new_list1, new_list2
-        
-    join_string_list,parity = remove_duplicates(list(join_string), parity)
-    join_string = ''.join(join_string_list)+"->"+string_output
-    return relative_sign_single_input(join_string, parity)
+
+    # the summed indices are skipped by the sign program
+    return compiled_sign_program(join_string,string_output).sign(pack_parity(parity))
 
 def reordering(stringa,stringb,mylist):
 
@@ -1483,6 +1692,650 @@ def reordering(stringa,stringb,mylist):
 
     return rC
 
+encoder_table = {}
+
+def encoder_permutation(d):
+    # the index map param.encoder on 0,1,...,d-1, tabulated once per dimension
+    if d not in encoder_table :
+        encoder_table[d] = param.encoder_vector(d)
+    return encoder_table[d]
+
+sigma_table = {}
+
+def sigma_vector(d,encoder="canonical"):
+    # the sign factors param.sgn of the canonical indices 0,1,...,d-1 listed in the given encoder,
+    # tabulated once per dimension; the tables are shared, so do not modify them
+    if (d,encoder) not in sigma_table :
+        v = param.sgn_vector(d)
+        if encoder=='parity-preserving' :
+            v = v[encoder_permutation(d)]
+        sigma_table[(d,encoder)] = v
+    return sigma_table[(d,encoder)]
+
+def multiply_axis_signs(arr,sign_list,in_place=False):
+    """
+    Multiply arr by a sign vector along each of the given axes.
+    The vectors are fused into one broadcast factor (as long as it stays much smaller than arr),
+    so that arr is usually traversed only once.
+
+    Parameters:
+    arr (numpy.ndarray): the array
+    sign_list (list): [axis, vector] pairs
+    in_place (bool): arr was allocated by the caller and can be overwritten; otherwise
+                     (e.g. arr may be referenced outside of the library) a new array is returned
+
+    Returns:
+    numpy.ndarray: arr multiplied by the signs
+    """
+    factor = None
+    for [axis,v] in sign_list:
+        v = v.reshape([ -1 if ax==axis else 1 for ax in range(arr.ndim) ])
+        factor = v if factor is None else factor*v
+        if 8*factor.size > arr.size :
+            arr = multiply_in_place(arr,factor,in_place)
+            in_place = True
+            factor = None
+    if factor is not None :
+        arr = multiply_in_place(arr,factor,in_place)
+    return arr
+
+def multiply_in_place(arr,factor,in_place):
+    # the product is written into arr only if it is a buffer of our own
+    if in_place and arr.flags.writeable :
+        return np.multiply(arr,factor,out=arr)
+    return arr*factor
+
+def pending_encoder_switch(obj):
+    # compose the encoder permutation of every fermionic axis with the pending one (dense or sparse)
+    permutation = obj.axis_permutation
+    if permutation == None :
+        permutation = [None]*obj.ndim
+    for axis in range(obj.ndim):
+        if obj.statistics[axis] in fermi_type :
+            enc = encoder_permutation(obj.shape[axis])
+            perm = permutation[axis]
+            if perm is None :
+                permutation[axis] = enc
+            else:
+                perm = perm[enc]
+                # the encoder is an involution, so switching back and forth cancels
+                if np.array_equal(perm,np.arange(len(perm))) :
+                    perm = None
+                permutation[axis] = perm
+    if all([ perm is None for perm in permutation ]) :
+        permutation = None
+    obj.axis_permutation = permutation
+
+def pending_format_switch(obj):
+    # multiply the pending sign of every conjugated axis by sigma (dense or sparse);
+    # sigma is listed in the current encoder, i.e. after the permutation, so it is moved
+    # back through the permutation: (stored_data*s)[p]*v = (stored_data*s*v[p^-1])[p]
+    sign = obj.axis_sign
+    if sign == None :
+        sign = [None]*obj.ndim
+    for axis in range(obj.ndim):
+        if obj.statistics[axis]==hybrid_symbol :
+            error("Error[switch_format]: Cannot switch format with a hybrid index.\n                      Split them into bosonic and fermionic ones first!")
+        if obj.statistics[axis]!=-1 :
+            continue
+        v = sigma_vector(obj.shape[axis],obj.encoder)
+        if obj.axis_permutation != None and obj.axis_permutation[axis] is not None :
+            v = v[np.argsort(obj.axis_permutation[axis])]
+        if sign[axis] is not None :
+            v = sign[axis]*v
+        # switching back and forth cancels
+        if np.all(v==1) :
+            v = None
+        sign[axis] = v
+    if all([ v is None for v in sign ]) :
+        sign = None
+    obj.axis_sign = sign
+
+def diagonal(vector,statistics,encoder="canonical",format="standard"):
+    """
+    A square dense tensor whose only nonzero components are on the diagonal, in the given encoder
+    and format, stored as the vector of its diagonal (see the dense class).
+
+    Parameters:
+    vector (numpy.ndarray): the diagonal
+    statistics (tuple): the statistics of the two axes
+
+    Returns:
+    dense
+    """
+    ret = dense(encoder=encoder,format=format,statistics=statistics)
+    ret.diagonal_data = np.array(vector)
+    if len(ret.statistics)!=2 or ret.diagonal_data.ndim!=1 :
+        error("Error[diagonal]: The diagonal must be a vector and the tensor must have two axes.")
+    d = len(ret.diagonal_data)
+    if not skip_power_of_two_check and ret.statistics[0] in fermi_type and d != int(2**math.floor(np.log2(d))):
+        error("Error[diagonal]: The fermionic tensor shapes are not a power of two.")
+    return ret
+
+def expand_diagonal(obj):
+    # build the matrix of a diagonal dense tensor (there are no pending switches in that case)
+    if obj.diagonal_data is not None :
+        obj.stored_data = np.diag(obj.diagonal_data)
+        obj.data_escaped = False
+        obj.diagonal_data = None
+
+def diagonal_encoder_switch(obj):
+    # the encoder switch of a diagonal dense tensor: if both axes are fermionic, they are permuted
+    # by the same permutation and so is the diagonal; if both are bosonic, nothing changes
+    fermionic = [ stat in fermi_type for stat in obj.statistics ]
+    if fermionic==[True,True] :
+        obj.diagonal_data = obj.diagonal_data[encoder_permutation(len(obj.diagonal_data))]
+    elif fermionic!=[False,False] :
+        expand_diagonal(obj)
+        pending_encoder_switch(obj)
+
+def diagonal_format_switch(obj):
+    # the format switch of a diagonal dense tensor multiplies the diagonal by sigma once per conjugated axis
+    if hybrid_symbol in obj.statistics :
+        expand_diagonal(obj)
+        pending_format_switch(obj)
+        return
+    for stat in obj.statistics :
+        if stat==-1 :
+            obj.diagonal_data = obj.diagonal_data*sigma_vector(len(obj.diagonal_data),obj.encoder)
+
+def copy_stored_data(arr):
+    # a private copy of the stored data; the cell array of a block is copied together with the cells
+    ret = arr.copy()
+    if arr.dtype == object :
+        for index in np.ndindex(ret.shape):
+            if ret[index] is not None :
+                ret[index] = ret[index].copy()
+    return ret
+
+def share_stored_data(source,target):
+    """
+    Let target use the stored data of source without copying it (copy-on-write).
+    The tensors that use the same data share the counter share_count = [number of tensors];
+    a tensor that asks for a buffer it can modify (own_stored_data(), used by the data property)
+    while the data is still used by another one takes a private copy, and the last one keeps the data.
+    The arrays themselves are left untouched.
+    Once the data property has handed out the buffer of source (data_escaped), it can be modified
+    from outside at any time, so target gets a private copy instead.
+    """
+    target.stored_data = source.stored_data
+    target.share_count = None
+    target.data_escaped = False
+    if source.stored_data is None :
+        return
+    if source.data_escaped :
+        target.stored_data = copy_stored_data(source.stored_data)
+        return
+    if source.share_count is None :
+        source.share_count = [1]
+    source.share_count[0] += 1
+    target.share_count = source.share_count
+
+def release_stored_data(obj):
+    # the tensor stops using its stored data, which may be shared with other tensors
+    if obj.share_count is not None :
+        obj.share_count[0] -= 1
+        obj.share_count = None
+
+def own_stored_data(obj):
+    # the stored data, replaced by a private copy first if it is shared with another tensor
+    if obj.share_count is not None :
+        if obj.share_count[0] > 1 :
+            obj.share_count[0] -= 1
+            obj.stored_data = copy_stored_data(obj.stored_data)
+        obj.share_count = None
+    return obj.stored_data
+
+def read_data(obj):
+    """
+    The data of a dense or sparse tensor (or the cells of a block) for reading only: the pending
+    switches are carried out (and a diagonal matrix or the diagonal cells are built), but data shared
+    with other tensors is not copied, so the result must not be modified.
+    """
+    if type(obj)==block :
+        if obj.diagonal_data is not None :
+            release_stored_data(obj)
+            obj.stored_data = diagonal_cells(obj.diagonal_data)
+            obj.data_escaped = False
+            obj.diagonal_data = None
+        return obj.stored_data
+    if type(obj)==dense :
+        expand_diagonal(obj)
+    if obj.axis_permutation != None or obj.axis_sign != None :
+        if type(obj)==dense :
+            arr = resolve_dense(obj.stored_data,obj.axis_permutation,obj.axis_sign)
+        else:
+            arr = resolve_sparse(obj.stored_data,obj.axis_permutation,obj.axis_sign)
+        # the result is a new array
+        release_stored_data(obj)
+        obj.stored_data = arr
+        obj.data_escaped = False
+        obj.axis_permutation = None
+        obj.axis_sign = None
+    return obj.stored_data
+
+def zero_cells(obj):
+    """
+    The cells of a block that are identically zero, and whether the block is Grassmann even
+    (no nonzero cell of odd total parity). For a diagonal block this follows from diagonal_data;
+    otherwise the cells are scanned once and the result is kept in zero_cell_cache until
+    the cells are accessed through data (it is not kept while the cells can be modified
+    from outside, see data_escaped).
+
+    Returns:
+    set: the indices of the zero cells
+    bool: True if the block is Grassmann even
+    """
+    if obj.diagonal_data is not None :
+        # the diagonal is kept for two fermionic legs, so only the cells (0,0) and (1,1) can be nonzero
+        ret = set([(0,1),(1,0)])
+        for p,v in enumerate(obj.diagonal_data):
+            if not np.any(v) :
+                ret.add((p,p))
+        return ret, True
+    if obj.zero_cell_cache is not None and not obj.data_escaped :
+        return obj.zero_cell_cache
+    ret = set()
+    is_even = True
+    cells = read_data(obj)
+    for cell in np.ndindex(cells.shape):
+        if not np.any(cells[cell]):
+            ret.add(cell)
+        elif sum(cell)%2==1:
+            is_even = False
+    if not obj.data_escaped :
+        obj.zero_cell_cache = (ret,is_even)
+    return ret, is_even
+
+def is_canonical(arr):
+    # whether the coordinates of a sparse.COO array are sorted and without duplicates
+    location = arr.linear_loc()
+    return bool(np.all(location[1:] > location[:-1]))
+
+def select_entries(arr,keep):
+    """
+    The entries of a sparse.COO array selected by a boolean mask over its entries, in one pass.
+    A subset of sorted coordinates without duplicates is again sorted without duplicates,
+    so the array is not sorted again in that case.
+    """
+    canonical = is_canonical(arr)
+    return sp.COO(arr.coords[:,keep],arr.data[keep],shape=arr.shape,
+                  sorted=canonical,has_duplicates=not canonical)
+
+def insert_entries(arr,coords,values):
+    """
+    Add new entries to a sparse.COO array; the values at coordinates that are already present
+    (or repeated among the new ones) are summed.
+    If arr is sorted without duplicates, the new entries are merged in with a binary search,
+    so that only the new entries are sorted instead of the whole array.
+
+    Parameters:
+    arr (sparse.COO): the array
+    coords (numpy.ndarray): the new coordinates, of shape (ndim, number of entries)
+    values (numpy.ndarray): the new values
+
+    Returns:
+    sparse.COO
+    """
+    if not is_canonical(arr) :
+        return sp.COO(np.concatenate([arr.coords,coords],axis=1),np.concatenate([arr.data,values]),shape=arr.shape)
+
+    location = arr.linear_loc()
+    new_location, inverse = np.unique(np.ravel_multi_index(tuple(coords),arr.shape),return_inverse=True)
+    new_values = np.zeros(len(new_location),dtype=np.result_type(arr.data,values))
+    np.add.at(new_values,inverse,values)
+
+    # the new coordinates that are already present only change the values
+    position = np.searchsorted(location,new_location)
+    found = position < len(location)
+    found[found] = location[position[found]] == new_location[found]
+    data = arr.data.astype(new_values.dtype)
+    data[position[found]] += new_values[found]
+
+    insert_at = position[~found]
+    new_coords = np.array(np.unravel_index(new_location[~found],arr.shape),dtype=arr.coords.dtype)
+    return sp.COO(np.insert(arr.coords,insert_at,new_coords,axis=1),np.insert(data,insert_at,new_values[~found]),
+                  shape=arr.shape,sorted=True,has_duplicates=False)
+
+def copy_pending_state(source,target):
+    # the vectors are never modified in place, so only the lists are copied
+    target.axis_permutation = None
+    target.axis_sign = None
+    if source.axis_permutation != None :
+        target.axis_permutation = list(source.axis_permutation)
+    if source.axis_sign != None :
+        target.axis_sign = list(source.axis_sign)
+
+def resolve_dense(arr,permutation,sign):
+    """
+    Carry out the pending sign and permutation of a dense array (see the data property of dense).
+    The permutation is done first, so that the signs are multiplied in place into the new array;
+    arr itself is never modified.
+
+    Returns:
+    numpy.ndarray: (arr*s0*s1*...)[p0,p1,...]
+    """
+    sign_list = []
+    if sign != None :
+        sign_list = [ [axis,v] for axis,v in enumerate(sign) if v is not None ]
+    permuted = arr
+    if permutation != None :
+        permuted = permute_axes(arr,permutation)
+        sign_list = [ [axis,v if permutation[axis] is None else v[permutation[axis]]] for [axis,v] in sign_list ]
+    return multiply_axis_signs(permuted,sign_list,in_place=permuted is not arr)
+
+def resolve_sparse(arr,permutation,sign):
+    """
+    Carry out the pending sign and permutation of a sparse.COO array (see the data property of sparse).
+    The entry at coordinate k of an axis with permutation p moves to p^-1[k].
+
+    Returns:
+    sparse.COO: (arr*s0*s1*...)[p0,p1,...]
+    """
+    coords = arr.coords.copy()
+    values = arr.data
+    if sign != None :
+        for axis,v in enumerate(sign):
+            if v is not None :
+                values = values*v[coords[axis]]
+    if permutation != None :
+        for axis,perm in enumerate(permutation):
+            if perm is not None :
+                coords[axis] = np.argsort(perm)[coords[axis]]
+    return sp.COO(coords,values,shape=arr.shape)
+
+def permute_axes(arr,permutation):
+    """
+    Gather arr[p0[i0],p1[i1],...] for the index arrays in permutation.
+
+    Parameters:
+    arr (numpy.ndarray): the array
+    permutation (list): one index array per axis, or None if the axis is left as it is
+
+    Returns:
+    numpy.ndarray: the permuted copy of arr
+    """
+    axes = [ axis for axis,perm in enumerate(permutation) if perm is not None ]
+    if len(axes)==0 :
+        return arr
+    if len(axes)==1 :
+        return arr.take(permutation[axes[0]],axis=axes[0])
+
+    # several axes: the leading axes are fused into one gather of contiguous rows,
+    # which is faster than one take (and one temporary) per axis
+    shape = arr.shape
+    index = [ np.arange(d) if perm is None else perm for d,perm in zip(shape,permutation) ]
+    row_index = index[0]
+    for axis in range(1,arr.ndim-1):
+        row_index = np.add.outer(row_index*shape[axis],index[axis])
+    ret = arr.reshape(-1,shape[-1])[row_index.ravel()]
+    if permutation[-1] is not None :
+        ret = ret.take(permutation[-1],axis=1)
+    return ret.reshape(shape)
+
+def parity_vector(d,encoder="canonical"):
+    # the Grassmann parity (0 or 1) of the indices 0,1,...,d-1 in the given encoder
+    if encoder=='parity-preserving' :
+        return np.arange(d)%2
+    return param.gparity_vector(d)%2
+
+def sign_tensor(string, shape, axis_map=None):
+    """
+    Vectorized version of relative_sign over every coordinate of a tensor.
+    The sign only depends on the parity of each index, so it is first tabulated
+    over the 2x2x...x2 parity configurations and then broadcast with the
+    per-axis parity vectors.
+
+    Parameters:
+    string (str): the sign computation string, e.g. "abcd->acbd"
+    shape (tuple): the shape of the sign tensor
+    axis_map (list[int]): axis_map[i] is the tensor axis carrying the i-th character
+                          of the left string (default: one axis per character)
+
+    Returns:
+    numpy.ndarray: the sign tensor of the given shape
+    """
+    [string1,string2] = string.split("->")
+    n = len(shape)
+    if axis_map == None:
+        axis_map = list(range(len(string1)))
+
+    # pack the parities of every 2x2x...x2 configuration of the axes into one bit per character
+    configurations = np.arange(2**n)
+    packed = np.zeros(2**n,dtype=int)
+    for a,axis in enumerate(axis_map):
+        packed |= ((configurations >> (n-1-axis)) & 1) << a
+    sgn_table = compiled_sign_program(string1,string2).sign(packed).reshape([2]*n)
+
+    return sgn_table[np.ix_(*[ parity_vector(d) for d in shape ])]
+
+def sign_factors(string, index_string, shape, axis_map=None):
+    """
+    Factorized version of sign_tensor.
+    Every pair of noncommuting objects that changes its order contributes the rank-2 factor
+    1-2*p(x)*p(y), so the sign tensor is a product of matrices (or vectors, when both
+    objects live on the same axis) that are given to the contraction instead of the full tensor.
+
+    Parameters:
+    string (str): the sign computation string, e.g. "abcd->acbd"
+    index_string (str): the einsum character of each axis of the sign tensor
+    shape (tuple): the shape of the sign tensor
+    axis_map (list[int]): axis_map[i] is the tensor axis carrying the i-th character
+                          of the left string (default: one axis per character)
+
+    Returns:
+    str: the comma-separated index strings of the factors
+    list[numpy.ndarray]: the factors
+    """
+    [string1,string2] = string.split("->")
+    if axis_map == None:
+        axis_map = list(range(len(string1)))
+
+    # count the flipped pairs per pair of axes; only the count modulo 2 matters
+    multiplicity = {}
+    for [a,b] in compiled_sign_program(string1,string2).pairs :
+        pair = tuple(sorted([axis_map[a],axis_map[b]]))
+        multiplicity[pair] = multiplicity.get(pair,0)+1
+
+    factor_strings = []
+    factor_list = []
+    for [x,y] in sorted(multiplicity):
+        if multiplicity[(x,y)]%2==0 :
+            continue
+        if x==y :
+            factor_strings += index_string[x],
+            factor_list += 1-2*parity_vector(shape[x]),
+        else:
+            factor_strings += index_string[x]+index_string[y],
+            factor_list += 1-2*np.outer(parity_vector(shape[x]),parity_vector(shape[y])),
+
+    return ",".join(factor_strings), factor_list
+
+####################################################
+##             Contraction plan cache             ##
+####################################################
+
+class contraction_cache:
+    """
+    A least-recently-used store of compiled einsum plans (also used for the compiled sign programs).
+
+    Parameters:
+    maxsize (int): the number of plans kept before the oldest one is evicted
+    maxbytes (int): if given, the oldest plans are also evicted while the stored plans take more
+                    memory than this, and a plan larger than this is not stored at all
+
+    Attributes:
+    hits (int): the number of successful lookups
+    misses (int): the number of failed lookups
+    nbytes (int): the memory taken by the stored plans (as reported to put)
+    """
+    def __init__(self, maxsize=64, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.plans = OrderedDict()
+        self.plan_bytes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.plans)
+
+    def get(self, key):
+        if key in self.plans :
+            self.plans.move_to_end(key)
+            self.hits += 1
+            return self.plans[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, plan, nbytes=0):
+        if self.maxbytes != None and nbytes > self.maxbytes :
+            return
+        if key in self.plans :
+            self.nbytes -= self.plan_bytes[key]
+        self.plans[key] = plan
+        self.plans.move_to_end(key)
+        self.plan_bytes[key] = nbytes
+        self.nbytes += nbytes
+        while len(self.plans) > self.maxsize or ( self.maxbytes != None and self.nbytes > self.maxbytes ):
+            old_key, old_plan = self.plans.popitem(last=False)
+            self.nbytes -= self.plan_bytes.pop(old_key)
+
+    def clear(self):
+        self.plans.clear()
+        self.plan_bytes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {"hits":self.hits, "misses":self.misses, "size":len(self.plans), "maxsize":self.maxsize,
+                "nbytes":self.nbytes, "maxbytes":self.maxbytes}
+
+einsum_cache = contraction_cache(einsum_cache_size,einsum_cache_bytes)
+expression_cache = contraction_cache(4*einsum_cache_size)
+sign_program_table = contraction_cache(sign_program_table_size)
+
+def cached_contract(subscripts,*operands):
+    """
+    opt_einsum.contract with the contraction expression stored in expression_cache.
+
+    Parameters:
+    subscripts (str): the einsum string
+    operands (numpy.ndarray): the arrays to be contracted
+
+    Returns:
+    numpy.ndarray: the result of the contraction
+    """
+    expression = cached_expression(subscripts,[ operand.shape for operand in operands ])
+    return expression(*operands)
+
+def cached_expression(subscripts,shapes):
+    """
+    The opt_einsum contraction expression for the given operand shapes, stored in expression_cache.
+
+    Parameters:
+    subscripts (str): the einsum string
+    shapes (list of tuple): the shapes of the operands
+
+    Returns:
+    opt_einsum.contract.ContractExpression: the compiled contraction
+    """
+    shapes = tuple([ tuple(shape) for shape in shapes ])
+    key = (subscripts,shapes)
+    expression = expression_cache.get(key)
+    if expression == None :
+        expression = oe.contract_expression(subscripts,*shapes)
+        expression_cache.put(key,expression)
+    return expression
+
+def einsum_cache_info():
+    """
+    Report the usage of the einsum plan cache.
+
+    Returns:
+    dict: the number of hits, misses, stored plans and the maximum number of plans,
+          and the memory of the stored sign tensors with its maximum
+    """
+    return einsum_cache.info()
+
+def clear_einsum_cache(maxsize=None,maxbytes=None):
+    """
+    Remove every stored einsum plan, contraction expression and sign program and reset the counters.
+
+    Parameters:
+    maxsize (int): if given, also change the maximum number of stored plans
+    maxbytes (int): if given, also change the maximum memory of the sign tensors of the stored plans
+    """
+    if maxsize != None :
+        einsum_cache.maxsize = maxsize
+    if maxbytes != None :
+        einsum_cache.maxbytes = maxbytes
+    einsum_cache.clear()
+    expression_cache.clear()
+    sign_program_table.clear()
+
+####################################################
+##               Parallel execution               ##
+####################################################
+
+def set_executor(threads=1,blas_threads=None):
+    """
+    Evaluate independent parity blocks (block einsums, the even/odd parts of block SVD and Eig)
+    on a pool of threads.
+
+    Parameters:
+    threads (int): the number of worker threads; 1 switches back to serial evaluation
+    blas_threads (int): the number of BLAS threads each worker may use while the pool is busy;
+                        by default the cores are shared among the workers (needs threadpoolctl)
+    """
+    global executor, executor_blas_threads
+    if executor != None :
+        executor.shutdown(wait=True)
+        executor = None
+    executor_blas_threads = None
+    if threads > 1 :
+        executor = ThreadPoolExecutor(max_workers=threads)
+        if blas_threads == None :
+            blas_threads = max(1,(os.cpu_count() or 1)//threads)
+        executor_blas_threads = blas_threads
+
+def blas_limits():
+    # limit the BLAS threads so that the workers do not oversubscribe the cores
+    if executor_blas_threads == None :
+        return contextlib.nullcontext()
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return contextlib.nullcontext()
+    return threadpool_limits(limits=executor_blas_threads)
+
+def run_parallel(task_list):
+    """
+    Call every function in task_list, on the executor if one is set.
+
+    Parameters:
+    task_list (list): functions without arguments
+
+    Returns:
+    list: the return values, in the order of task_list
+    """
+    if executor == None or len(task_list) < 2 :
+        return [ task() for task in task_list ]
+    with blas_limits():
+        future_list = [ executor.submit(task) for task in task_list ]
+        return [ future.result() for future in future_list ]
+
+def reduce_contractions(contraction_list):
+    # a task summing sign*expression(*operands) in the given order
+    def task():
+        ret = 0
+        for sign,expression,operands in contraction_list:
+            ret = ret + sign*expression(*operands)
+        return ret
+    return task
+
 ####################################################
 ##                     Einsums                    ##
 ####################################################
@@ -1510,7 +2363,172 @@ def denumerate(string):
         string = string.replace(c1,c2)
     return string
 
-def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
+def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False,sign_mode=None,use_cache=True):
+
+    # the contractions with diagonal matrices are multiplications, see contract_diagonal_operands()
+    subscripts, obj_list = contract_diagonal_operands(args[0],args[1:])
+    if subscripts != None :
+        first = make_list(args[1:])[0]
+        input_string, output_string = subscripts.split("->")
+        if input_string == output_string :
+            ret = obj_list[0]
+        else:
+            ret = einsum_ds(subscripts,*obj_list,debug_mode=debug_mode,sign_mode=sign_mode,use_cache=use_cache)
+        if type(ret)!=type(first) :
+            ret = type(first)(ret)
+        return ret.force_encoder(first.encoder).force_format(first.format)
+
+    # the plan only depends on the subscripts and on the layout of the operands ---------------------
+    if sign_mode == None :
+        sign_mode = sign_factor_mode
+    obj_list = make_list(args[1:])
+    this_type = type(obj_list[0])
+    this_encoder = obj_list[0].encoder
+    this_format = obj_list[0].format
+    plan_key = (
+        args[0], this_type,
+        tuple([ make_tuple(obj.shape) for obj in obj_list ]),
+        tuple([ make_tuple(obj.statistics) for obj in obj_list ]),
+        this_encoder, this_format, sign_mode )
+
+    use_cache = use_cache and einsum_cache_enabled and not debug_mode
+    plan = None
+    if use_cache :
+        plan = einsum_cache.get(plan_key)
+    if plan == None :
+        plan = einsum_ds_plan(args[0],obj_list,debug_mode=debug_mode,sign_mode=sign_mode)
+        if use_cache :
+            # the sign tensors dominate the memory of a plan; a plan whose sign tensors are
+            # larger than einsum_cache.maxbytes is not stored and is compiled again on every call
+            einsum_cache.put(plan_key,plan,sum([ obj.nbytes for obj in plan["sign_operands"] ]))
+
+    # force everything to be canonical and standard -------------------------------------------------
+    # also force everything to be of the same type
+
+    nobj = plan["nobj"]
+
+    einsum_tensor_list = []
+    for obj in obj_list[:nobj]:
+        if type(obj)==this_type and obj.encoder=='canonical' and obj.format=='standard' :
+            # the contraction does not write to its operands, so no copy is needed
+            einsum_tensor_list += obj,
+        else:
+            einsum_tensor_list += this_type(obj.force_encoder('canonical').force_format('standard')),
+    einsum_obj_list = [ read_data(obj) for obj in einsum_tensor_list ]
+
+    # Grassmann-even dense objects are contracted parity sector by parity sector
+    ret = None
+    if parity_sector_enabled and plan["sector_ready"] :
+        nentries = plan["output_size"]*len(plan["output_string"])
+        nentries += sum([ data.size*data.ndim for data in einsum_obj_list ])
+        if ( plan["cost"] >= parity_sector_min_intensity*nentries
+             and plan["cost"] >= parity_sector_min_cost*2**len(plan["sector_chars"]) ):
+            ret = einsum_ds_sectors(plan,[ parity_sorted_data(obj) for obj in einsum_tensor_list ])
+
+    if ret is None :
+        einsum_obj_list += plan["sign_operands"]
+        ret = plan["expression"](*einsum_obj_list)
+
+    if plan["has_output"] :
+        return this_type(ret,statistics=plan["final_stats"]).force_encoder(this_encoder).force_format(this_format)
+    else:
+        if this_type == sparse :
+            if type(ret.data)==memoryview:
+                return ret
+            else:
+                return ret.data[0]
+        else:
+            return np.array(ret).flatten()[0]
+
+def contract_diagonal_operands(subscripts,obj_list):
+    """
+    Carry out the contractions of einsum_ds with the diagonal dense operands (see the dense class).
+    A diagonal matrix with the statistics (-1,1) in the matrix format, or (0,0) in any format, is the
+    Grassmann identity multiplied by its diagonal, so contracting it with another operand only multiplies
+    that operand by the diagonal along the contracted axis, which then takes the name of the other index.
+    This is done whenever one index of the diagonal matrix is contracted with exactly one other operand
+    and the other index only appears in the output.
+
+    Returns:
+    (str, list): the subscripts and the operands that are left, or (None, None) if nothing was contracted
+    """
+    subscripts = subscripts.replace(" ","")
+    subscripts = denumerate(subscripts)
+    if subscripts.count("->")!=1 :
+        return None, None
+
+    input_string, output_string = subscripts.split("->")
+    index_list = input_string.split(",")
+    obj_list = make_list(obj_list[:len(index_list)])
+
+    contracted = False
+    k = 0
+    while k < len(index_list) and len(index_list) > 1 :
+        D = obj_list[k]
+        if type(D)!=dense or not D.is_diagonal or D.statistics not in [(-1,1),(0,0)] or len(index_list[k])!=2 :
+            k += 1
+            continue
+
+        # find the contracted index (and the operand it is contracted with) and the output index
+        other_string = "".join(index_list[:k]+index_list[k+1:])
+        target = None
+        for [i_sum,i_out] in [[0,1],[1,0]]:
+            c_sum = index_list[k][i_sum]
+            c_out = index_list[k][i_out]
+            if ( c_sum!=c_out and other_string.count(c_sum)==1 and other_string.count(c_out)==0
+                 and output_string.count(c_sum)==0 and output_string.count(c_out)==1 ):
+                j = [ j for j,indices in enumerate(index_list) if j!=k and c_sum in indices ][0]
+                axis = index_list[j].index(c_sum)
+                # inconsistent shapes or statistics are left to einsum_ds to report
+                if ( obj_list[j].shape[axis]==D.shape[i_sum]
+                     and obj_list[j].statistics[axis]==-D.statistics[i_sum] ):
+                    target = [c_sum,c_out,j,axis]
+                break
+        if target == None :
+            k += 1
+            continue
+
+        [c_sum,c_out,j,axis] = target
+        v = D.copy().force_format("matrix").force_encoder(obj_list[j].encoder).diagonal_data
+        obj_list[j] = scale_axis(obj_list[j],axis,v)
+        index_list[j] = index_list[j].replace(c_sum,c_out)
+        del index_list[k]
+        del obj_list[k]
+        contracted = True
+        k = 0
+
+    if not contracted :
+        return None, None
+    return ",".join(index_list)+"->"+output_string, obj_list
+
+def scale_axis(obj,axis,v):
+    # a copy of a dense or sparse tensor with the components multiplied by the vector v along one axis
+    ret = obj.copy()
+    if type(obj)==sparse :
+        arr = read_data(obj)
+        ret.data = sp.COO(arr.coords,arr.data*v[arr.coords[axis]],shape=arr.shape)
+    elif obj.is_diagonal :
+        ret.diagonal_data = obj.diagonal_data*v
+    else:
+        ret.data = read_data(obj)*v.reshape([ -1 if ax==axis else 1 for ax in range(obj.ndim) ])
+    return ret
+
+def einsum_ds_plan(subscripts,obj_list,debug_mode=False,sign_mode=None):
+    """
+    Compile the contraction of einsum_ds into a reusable plan.
+
+    Parameters:
+    subscripts (str): the einsum string
+    obj_list (list[dense|sparse]): the input objects (only their shape and statistics are used)
+    debug_mode (bool): print the intermediate steps
+    sign_mode (str): "dense" or "factorized" sign factors (default: sign_factor_mode)
+
+    Returns:
+    dict: the rewritten einsum string, the sign operands, the number of input objects,
+          the final statistics and the opt_einsum contraction expression
+    """
+    if sign_mode == None :
+        sign_mode = sign_factor_mode
 
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
     #                     Important variables and its meanings
@@ -1534,7 +2552,7 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
     # remove spaces ---------------------------------------------------------------------------------
-    subscripts = args[0].replace(" ","")
+    subscripts = subscripts.replace(" ","")
     subscripts = denumerate(subscripts)
 
     has_output = subscripts.count("->") > 0
@@ -1553,18 +2571,10 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
     obj_index_list = input_string.split(",")
     nobj = len(obj_index_list)
 
-    obj_list = make_list(args[1:1+nobj])
+    obj_list = make_list(obj_list[:nobj])
     stats_list = sum([ make_list(obj.statistics) for obj in obj_list ],[])
     shape_list = sum([ make_list(obj.shape) for obj in obj_list ],[])
-
-    # force everything to be canonical and standard -------------------------------------------------
-    # also force everything to be of the same type
-
     this_type = type(obj_list[0])
-    this_encoder = obj_list[0].encoder
-    this_format = obj_list[0].format
-    for i in range(len(obj_list)):
-        obj_list[i] = this_type(obj_list[i].force_encoder('canonical').force_format('standard')).data
 
     # get some information about the summed indices -------------------------------------------------
     # [ f=<char>, [index locations in lf], [statistics] ]
@@ -1841,46 +2851,18 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
     
     if S1dim>0 and not skip_S1:
 
-        S1 = np.zeros(S1_shape,dtype=int)
-        iterator = np.nditer(S1, flags=['multi_index'])
-        parity_list = []
-        sgn_list = []
-
-        k=1
-        kmax = getsize(S1_shape)
-
-        s0 = time.time()
-        s00 = s0
-        progress_space() # << Don't remove this. This is for the show_progress!
-
-        for element in iterator:
-            coords = iterator.multi_index
-            dupped_coords = use_copy_map(copy_map,coords)
-            
-            parity = [ param.gparity(i)%2 for i in dupped_coords ]
-
-            if parity not in parity_list:
-                parity_list += parity,
-                sgn = relative_sign(S1_sgn_computation_string,parity)
-                sgn_list += sgn,
-            else:
-                index = parity_list.index(parity)
-                sgn = sgn_list[index]
-
-            S1[coords] = sgn
-
-            if time.time()-s0 > 2 :
-                show_progress(k,kmax+1,process_name = "einsum_sgn1",ratio = False,color="red",time=time.time()-s00)
-                s0 = time.time()
-            
-            k+=1
-
-        clear_progress()
-        tab_up()
+        # dupped_coords = use_copy_map(copy_map,coords), so the copy map also tells
+        # which axis of S1 carries each character of S1_sgn_computation_string
+        S1_axis_map = use_copy_map(copy_map,list(range(S1dim)))
+        if sign_mode == "factorized" :
+            S1_index_string, S1_list = sign_factors(S1_sgn_computation_string,S1_index_string,S1_shape,S1_axis_map)
+            skip_S1 = len(S1_list)==0
+        else :
+            S1_list = [ sign_tensor(S1_sgn_computation_string,S1_shape,S1_axis_map) ]
         
     #  ::: Summary :::
     #
-    #  S1 is the sign factor from the initial rearrangement
+    #  S1 is the sign factor from the initial rearrangement (a list of factors if factorized)
     #  Its index string is S1_index_string
 
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
@@ -1915,8 +2897,7 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
 
         S2_list = []
         for i in range(nS2):
-            S2i = [ param.sgn(j) for j in range(S2_dimlist[i]) ]
-            S2_list += np.array(S2i),
+            S2_list += sigma_vector(S2_dimlist[i]),
 
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
     #              Step 4: rearrange to the final form
@@ -1967,47 +2948,16 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
 
         if not skip_S3 :
 
-            k=1
-            kmax = 1
-            for d in S3_shape:
-                kmax*=d
-
-            s0 = time.time()
-            s00 = s0
-            progress_space() # << Don't remove this. This is for the show_progress!
-
-            S3 = np.zeros(S3_shape,dtype=int)
-            iterator = np.nditer(S3, flags=['multi_index'])
-            parity_list = []
-            sgn_list = []
-            for element in iterator:
-                coords = iterator.multi_index
-
-                parity = [ param.gparity(i)%2 for i in coords ]
-
-                if parity not in parity_list:
-                    parity_list += parity,
-                    sgn = relative_sign(S3_sgn_computation_string,parity)
-                    sgn_list += sgn,
-                else:
-                    index = parity_list.index(parity)
-                    sgn = sgn_list[index]
-
-                S3[coords] = sgn
-
-                if time.time()-s0 > 0.5 :
-                    show_progress(k,kmax+1,process_name = "einsum_sgn3",ratio = False,color="red",time=time.time()-s00)
-                    s0 = time.time()
-
-                k+=1
-            clear_progress()
-            tab_up()
-
-            skip_S3 = len(S3_shape)==0
+            if sign_mode == "factorized" :
+                S3_index_string, S3_list = sign_factors(S3_sgn_computation_string,S3_index_string,S3_shape)
+                skip_S3 = len(S3_list)==0
+            else :
+                S3_list = [ sign_tensor(S3_sgn_computation_string,S3_shape) ]
+                skip_S3 = len(S3_shape)==0
 
     #  ::: Summary :::
     #
-    #  S3 is the sign factor from the final rearrangement
+    #  S3 is the sign factor from the final rearrangement (a list of factors if factorized)
     #  Its index string is S3_index_string
     
     if debug_mode and not skip_S3:
@@ -2022,20 +2972,28 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
     
     einsum_input = input_string
-    einsum_obj_list = obj_list
+    sign_operands = []
+    sign_strings = []       # the index string of each sign operand
+    sign_parity_only = []   # True if the sign operand only depends on the index parities
 
     if S1dim>0 and not skip_S1:
         einsum_input += ","+S1_index_string
-        einsum_obj_list += S1,
+        sign_operands += S1_list
+        sign_strings += S1_index_string.split(",")
+        sign_parity_only += [True]*len(S1_list)
 
     if nS2>0 :
         einsum_input += S2_index_string
-        einsum_obj_list += S2_list
+        sign_operands += S2_list
+        sign_strings += S2_index_string.split(",")
+        sign_parity_only += [False]*len(S2_list)
 
     if has_output :
         if not skip_S3 :
             einsum_input += ","+S3_index_string
-            einsum_obj_list += S3,
+            sign_operands += S3_list
+            sign_strings += S3_index_string.split(",")
+            sign_parity_only += [True]*len(S3_list)
 
     if this_type == sparse :
         
@@ -2139,11 +3097,11 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
         print(final_stats,"<--- final stats")
         
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
-    #              Step 7: the actual sum
+    #              Step 7: compile the actual sum
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
     if this_type==sparse :
-        einsum_obj_list += vertex_obj_list
+        sign_operands += vertex_obj_list
         einsum_string = einsum_string_replaced
     
     if has_output :
@@ -2151,34 +3109,229 @@ def einsum_ds(*args,format="standard",encoder="canonical",debug_mode=False):
 
     # convert all object to this_type
     if this_type == sparse :
-        for i, obj in enumerate(einsum_obj_list):
+        for i, obj in enumerate(sign_operands):
             if type(obj) == np.ndarray:
-                einsum_obj_list[i] = sp.COO.from_numpy(obj)
+                sign_operands[i] = sp.COO.from_numpy(obj)
     if this_type == dense :
-        for i, obj in enumerate(einsum_obj_list):
+        for i, obj in enumerate(sign_operands):
             if type(obj) != np.ndarray:
-                einsum_obj_list[i] = sp.COO.todense(obj)
+                sign_operands[i] = sp.COO.todense(obj)
+
+    operand_shapes = [ make_tuple(obj.shape) for obj in obj_list ]
+    operand_shapes += [ make_tuple(obj.shape) for obj in sign_operands ]
     
     if debug_mode :
         print(" ::::::::::::::::::::::::::: the actual sum :::::::::::::::::::::::::: ")
         print(einsum_string,"<-- einsum string")
         print("[shape,type]:")
-        for obj in einsum_obj_list:
+        for obj in obj_list:
+            print(" ",[obj.shape,this_type])
+        for obj in sign_operands:
             print(" ",[obj.shape,type(obj)])
 
-            
-    ret = oe.contract(*tuple([einsum_string]+einsum_obj_list))
+    path, path_info = oe.contract_path(einsum_string,*operand_shapes,shapes=True)
+    expression = oe.contract_expression(einsum_string,*operand_shapes,optimize=path)
 
+    # information for the parity-sector contraction (see einsum_ds_sectors)
+    sector_chars = ""
+    char_dims = {}
+    for i,c in enumerate(summand):
+        char_dims[c] = shape_list[i]
+        if stats_list[i] in fermi_type and c not in sector_chars:
+            sector_chars += c
+    sector_ready = ( this_type==dense
+                     and hybrid_symbol not in stats_list
+                     and ( (has_output and len(set(output_string))==len(output_string))
+                           or (not has_output and all([ summand.count(c)>1 for c in summand ])) ) )
+
+    cost = path_info.opt_cost
+    output_size = 1
     if has_output :
-        return this_type(ret,statistics=final_stats).force_encoder(this_encoder).force_format(this_format)
-    else:
-        if this_type == sparse :
-            if type(ret.data)==memoryview:
-                return ret
-            else:
-                return ret.data[0]
+        output_size = int(np.prod([ char_dims[c] for c in output_string ]))
+
+    return {
+        "einsum_string" : einsum_string,
+        "sign_operands" : sign_operands,
+        "nobj"          : nobj,
+        "has_output"    : has_output,
+        "final_stats"   : final_stats,
+        "expression"    : expression,
+        "obj_index_list"     : obj_index_list,
+        "output_string"      : output_string if has_output else "",
+        "sign_strings"       : sign_strings,
+        "sign_parity_only"   : sign_parity_only,
+        "sector_chars"       : sector_chars,
+        "char_dims"          : char_dims,
+        "sector_ready"       : sector_ready,
+        "cost"               : cost,
+        "output_size"        : output_size,
+        "sector_expressions" : {}
+        }
+
+def parity_sorted_data(obj):
+    """
+    The canonical, standard-format data of a dense tensor with the indices of every fermionic axis
+    permuted so that the even indices come before the odd ones (see einsum_ds_sectors), and whether
+    every sector of odd total parity is empty.
+    The result is kept in sector_cache (if parity_sector_cache_enabled), so a tensor that is
+    contracted repeatedly is only sorted and scanned once; the cache is dropped when the data is
+    accessed through the data property, and it is not kept while the buffer can be modified from
+    outside (data_escaped).
+
+    Parameters:
+    obj (dense): a canonical, standard-format dense tensor
+
+    Returns:
+    numpy.ndarray: the sorted data
+    bool: True if the sectors of odd total parity are empty
+    """
+    if obj.sector_cache is not None and not obj.data_escaped :
+        if obj.sector_cache[0] == make_tuple(obj.statistics) :
+            return obj.sector_cache[1:]
+
+    data = read_data(obj)
+    faxes = [ axis for axis,stat in enumerate(make_tuple(obj.statistics)) if stat in fermi_type ]
+    parity_slices = {}
+    for axis in faxes:
+        dim = data.shape[axis]
+        pvec = parity_vector(dim)
+        if dim > 2 :
+            data = data.take(np.argsort(pvec,kind="stable"),axis=axis)
+        neven = dim-np.count_nonzero(pvec)
+        parity_slices[axis] = [ slice(0,neven), slice(neven,dim) ]
+
+    is_even = True
+    for n in range(2**len(faxes)):
+        config = { axis:(n>>k)&1 for k,axis in enumerate(faxes) }
+        if sum(config.values())%2==1 :
+            slicer = tuple([ parity_slices[axis][config[axis]] if axis in config else slice(None) for axis in range(data.ndim) ])
+            if np.any(data[slicer]):
+                is_even = False
+                break
+
+    if parity_sector_cache_enabled and not obj.data_escaped :
+        obj.sector_cache = (make_tuple(obj.statistics),data,is_even)
+    return data, is_even
+
+def einsum_ds_sectors(plan,sorted_list):
+    """
+    Evaluate a compiled einsum_ds plan parity sector by parity sector.
+    This only works if the input objects are Grassmann even, since every configuration of
+    the index parities in which an object has odd total parity is skipped. Every fermionic
+    axis is first permuted so that the even indices come before the odd ones, which makes
+    each sector a plain slice.
+    The S1 and S3 signs are constant inside a sector, and the summed-pair sign vectors (S2)
+    are folded into the first object that carries the summed index.
+
+    Parameters:
+    plan (dict): the output of einsum_ds_plan
+    sorted_list (list): the output of parity_sorted_data for each input object
+
+    Returns:
+    numpy.ndarray: the contracted data (a 0-dimensional array if there is no output),
+                   or None if one of the objects is not Grassmann even
+    """
+    obj_index_list = plan["obj_index_list"]
+    output_string = plan["output_string"]
+    sector_chars = plan["sector_chars"]
+    char_dims = plan["char_dims"]
+    nchar = len(sector_chars)
+
+    # the canonical indices sorted by parity, and where the odd ones begin
+    parity_order = {}
+    parity_slices = {}
+    for c in sector_chars:
+        pvec = parity_vector(char_dims[c])
+        parity_order[c] = np.argsort(pvec,kind="stable")
+        neven = char_dims[c]-np.count_nonzero(pvec)
+        parity_slices[c] = [ slice(0,neven), slice(neven,char_dims[c]) ]
+
+    def sort_by_parity(data,string,inverse=False):
+        for axis,c in enumerate(string):
+            if c in parity_order :
+                order = parity_order[c]
+                if inverse :
+                    order = np.argsort(order)
+                data = data.take(order,axis=axis)
+        return data
+
+    def sector_slicer(string,config):
+        return tuple([ parity_slices[c][config[c]] if c in config else slice(None) for c in string ])
+
+    data_list = [ data for data,is_even in sorted_list ]
+
+    # check that the sectors with odd total parity are empty
+    # (the objects with a repeated index only need the sectors where both copies have the same parity)
+    for [data,is_even],string in zip(sorted_list,obj_index_list):
+        if is_even :
+            continue
+        fchars = "".join(dict.fromkeys([ c for c in string if c in parity_slices ]))
+        for n in range(2**len(fchars)):
+            config = { c:(n>>k)&1 for k,c in enumerate(fchars) }
+            if sum([ config[c] for c in string if c in config ])%2==1 and np.any(data[sector_slicer(string,config)]):
+                return None
+
+    # the summed-pair sign vectors and the object they are folded into
+    sigma_list = []
+    for string,parity_only,sgn_operand in zip(plan["sign_strings"],plan["sign_parity_only"],plan["sign_operands"]):
+        if parity_only :
+            continue
+        for i,obj_string in enumerate(obj_index_list):
+            if string in obj_string :
+                sigma_list += [ i, obj_string.index(string), string, sgn_operand[parity_order[string]] ],
+                break
+
+    ret = np.zeros([ char_dims[c] for c in output_string ],dtype=np.result_type(*data_list))
+
+    sector_string = ",".join(obj_index_list)+"->"+output_string
+    data_sectors = [ {} for data in data_list ]
+    ret_sectors = {}
+
+    for n in range(2**nchar):
+        config = { c:(n>>k)&1 for k,c in enumerate(sector_chars) }
+
+        # prune the configurations where an object has odd parity
+        if any([ sum([ config[c] for c in string if c in config ])%2==1 for string in obj_index_list ]):
+            continue
+        if any([ char_dims[c]==1 and config[c]==1 for c in sector_chars ]):
+            continue
+
+        operands = []
+        for i,string in enumerate(obj_index_list):
+            key = tuple([ config[c] for c in string if c in config ])
+            if key not in data_sectors[i]:
+                operand = data_list[i][sector_slicer(string,config)]
+                for [obj,axis,c,sigma] in sigma_list:
+                    if obj==i :
+                        sigma = sigma[parity_slices[c][config[c]]]
+                        operand = operand*sigma.reshape([ len(sigma) if ax==axis else 1 for ax in range(len(string)) ])
+                data_sectors[i][key] = np.ascontiguousarray(operand)
+            operands += data_sectors[i][key],
+
+        # the first canonical index of each parity is 0 or 1
+        sign = 1
+        for string,parity_only,sgn_operand in zip(plan["sign_strings"],plan["sign_parity_only"],plan["sign_operands"]):
+            if parity_only :
+                sign *= sgn_operand[tuple([ config[c] for c in string ])]
+
+        shapes = tuple([ operand.shape for operand in operands ])
+        if shapes not in plan["sector_expressions"]:
+            plan["sector_expressions"][shapes] = oe.contract_expression(sector_string,*shapes)
+        sector_ret = plan["sector_expressions"][shapes](*operands)
+
+        # sum the contributions to each output sector before writing it
+        key = tuple([ config[c] for c in output_string if c in config ])
+        if key not in ret_sectors :
+            ret_sectors[key] = [ config, sign*sector_ret ]
+        elif sign==1 :
+            ret_sectors[key][1] += sector_ret
         else:
-            return np.array(ret).flatten()[0]
+            ret_sectors[key][1] -= sector_ret
+
+    for [config,sector_ret] in ret_sectors.values():
+        ret[sector_slicer(output_string,config)] = sector_ret
+
+    return sort_by_parity(ret,output_string,inverse=True)
 
 def einsum(*args):
     subscripts = args[0].replace(" ","")
@@ -2249,7 +3402,10 @@ def einsum_block(*args):
     for i,obj in enumerate(obj_list):
         if type(obj)==dense or type(obj)==sparse:
             error("Error[einsum_block]: This function only works with block data format.")
-        obj_list[i] = obj_list[i].force_format("standard")
+        if obj.format != "standard" :
+            # a standard block is used as it is (the contraction does not write to its operands),
+            # so that the scan of zero_cells() is kept on it for the next contraction
+            obj_list[i] = obj.force_format("standard")
         has_int = has_int or obj_list[i].dtype==int
         has_float = has_float or obj_list[i].dtype==float
         has_complex = has_complex or obj_list[i].dtype==complex
@@ -2519,16 +3675,82 @@ def einsum_block(*args):
     # Step IV: Determine the einsum string                                                         #
     # =============================================================================================#
 
-    before_plus_sigma = before
+    # the sign vectors of the summed indices are multiplied into the first object carrying the index
+    final_einsum_string = before+"->"+after
+    sigma_location = []
     for elem in summed_index_info:
-        before_plus_sigma+=(","+elem[0][0])
-    final_einsum_string = before_plus_sigma+"->"+after
+        c = elem[0][0]
+        for i,obj_ind in enumerate(obj_index_list):
+            if c in obj_ind:
+                sigma_location += [i,obj_ind.index(c)],
+                break
+
+    def object_blocks(block,unique_fsummand):
+        # the block number of each object for the parity config block of the indices unique_fsummand
+        obj_block_list = []
+        for i,findex in enumerate(obj_findex_list):
+            sub_block = []
+            for c in findex:
+                if c not in unique_fsummand:
+                    error("Error[einsum_block]: the character c is not contained in unique_fsummand. Unexplanable error! Possibly a bug.")
+                c_location = unique_fsummand.index(c)
+                sub_block += [block[c_location]]
+            obj_block_list += [tuple(sub_block)]
+        return obj_block_list
+
+    # cells with the sign vectors folded in, keyed by (object number, block);
+    # fold_count is the number of remaining parity configs using each cell (see count_folds),
+    # so a folded cell is dropped from folded_cells after its last use
+    folded_cells = {}
+    fold_count = {}
+
+    def count_folds(block_list,unique_fsummand):
+        for block in block_list:
+            obj_block_list = object_blocks(block,unique_fsummand)
+            if is_zero_config(obj_block_list):
+                continue
+            for i,sub_block in enumerate(obj_block_list):
+                fold_count[(i,sub_block)] = fold_count.get((i,sub_block),0)+1
+
+    def fold_sigma(i,sub_block,cell,sigma_summed_list):
+        if (i,sub_block) in folded_cells :
+            cell = folded_cells[(i,sub_block)]
+        else :
+            if cell.dtype == object :
+                cell = np.array(cell.tolist())
+            for [iobj,axis],sigma in zip(sigma_location,sigma_summed_list):
+                if iobj==i :
+                    cell = cell*sigma.reshape([ len(sigma) if ax==axis else 1 for ax in range(cell.ndim) ])
+            folded_cells[(i,sub_block)] = cell
+        fold_count[(i,sub_block)] -= 1
+        if fold_count[(i,sub_block)] == 0 :
+            del folded_cells[(i,sub_block)]
+        return cell
 
     # =============================================================================================#
     # Step V: Iterate over all parity config                                                       #
     #          For each parity config, the sign factor is computed                                 #
     # =============================================================================================#
 
+    # list the cells that are identically zero and check if the objects are Grassmann even;
+    # the parity configs where an even object has odd parity are skipped without touching the data
+    # (the scan is cached on each block, see zero_cells())
+    zero_cell_list = []
+    obj_is_even = []
+    for obj in obj_list:
+        [zero_set,is_even] = zero_cells(obj)
+        zero_cell_list += zero_set,
+        obj_is_even += is_even,
+
+    def is_zero_config(obj_block_list):
+        for i,sub_block in enumerate(obj_block_list):
+            if obj_is_even[i] and sum(sub_block)%2==1 :
+                return True
+        for i,sub_block in enumerate(obj_block_list):
+            if sub_block in zero_cell_list[i] :
+                return True
+        return False
+
     if has_output:
         # count unique indices
         unique_fsummand = "".join(sorted(list(set(fbefore))))
@@ -2548,7 +3770,11 @@ def einsum_block(*args):
             block_list = block_list_E+block_list_O
 
         block_list = [ tuple(block) for block in block_list ]
+        count_folds(block_list,unique_fsummand)
 
+        # without an executor each parity config is added to its output cell as soon as it is
+        # contracted, so that only the folded cells still needed by later configs are kept
+        cell_contractions = {}
         for block in block_list:
             #print()
             #print(unique_fsummand,"=",block)
@@ -2562,22 +3788,17 @@ def einsum_block(*args):
             # ======================================================================================================
             # This part determines the block number of each object
             # ======================================================================================================
-            obj_block_list = []
-            for i,findex in enumerate(obj_findex_list):
-                sub_block = []
-                for c in findex:
-                    if c not in unique_fsummand:
-                        error("Error[einsum_block]: the character c is not contained in unique_fsummand. Unexplanable error! Possibly a bug.")
-                    c_location = unique_fsummand.index(c)
-                    sub_block += [block[c_location]]
-                obj_block_list += [tuple(sub_block)]
+            obj_block_list = object_blocks(block,unique_fsummand)
             
             #print(obj_findex_list,"=",obj_block_list)
 
+            if is_zero_config(obj_block_list):
+                continue
+
             # ======================================================================================================
             # get the specified block from each object
             # ======================================================================================================
-            blocked_obj_list = [ obj.data[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
+            blocked_obj_list = [ read_data(obj)[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
 
             sigma_list = []
             #print(summand)
@@ -2640,13 +3861,9 @@ def einsum_block(*args):
             # ======================================================================================================
             # the summation
             # ======================================================================================================
-            einsum_obj_list = blocked_obj_list + sigma_summed_list
-            for i,elem in enumerate(einsum_obj_list):
-                if elem.dtype == object :
-                    newelem = np.array(elem.tolist())
-                    einsum_obj_list[i] = newelem
-
-            sum_result = block_sign*np.einsum(*tuple([final_einsum_string]+einsum_obj_list))
+            einsum_obj_list = [ fold_sigma(i,obj_block_list[i],cell,sigma_summed_list)
+                                    for i,cell in enumerate(blocked_obj_list) ]
+            expression = cached_expression(final_einsum_string,[ cell.shape for cell in einsum_obj_list ])
 
 
             # ======================================================================================================
@@ -2655,10 +3872,21 @@ def einsum_block(*args):
 
             out_block = tuple([ block[unique_fsummand.index(c)] for c in fafter ])
             #print("output block:",fafter,";",out_block)
+            if executor == None :
+                ret.data[out_block] += block_sign*expression(*einsum_obj_list)
+                continue
+            if out_block not in cell_contractions :
+                cell_contractions[out_block] = []
+            cell_contractions[out_block] += [ (block_sign,expression,einsum_obj_list) ]
+
+        # each output cell is summed by a single task, in the order of block_list
+        out_block_list = list(cell_contractions.keys())
+        sum_result_list = run_parallel([ reduce_contractions(cell_contractions[out_block]) for out_block in out_block_list ])
+        for out_block,sum_result in zip(out_block_list,sum_result_list):
             ret.data[out_block] += sum_result
-            ret.shape = newshape_final
 
-            skip_power_of_two_check = False
+        ret.shape = newshape_final
+        skip_power_of_two_check = False
             
     else:
         # if returns scalar
@@ -2680,8 +3908,10 @@ def einsum_block(*args):
             block_list = block_list_E+block_list_O
 
         block_list = [ tuple(block) for block in block_list ]
+        count_folds(block_list,unique_fsummand)
 
-        scalar_output=0
+        scalar_output = 0
+        contraction_list = []
         for block in block_list:
             #print()
             #print(unique_fsummand,"=",block)
@@ -2695,23 +3925,18 @@ def einsum_block(*args):
             # ======================================================================================================
             # This part determines the block number of each object
             # ======================================================================================================
-            obj_block_list = []
-            for i,findex in enumerate(obj_findex_list):
-                sub_block = []
-                for c in findex:
-                    if c not in unique_fsummand:
-                        error("Error[einsum_block]: the character c is not contained in unique_fsummand. Unexplanable error! Possibly a bug.")
-                    c_location = unique_fsummand.index(c)
-                    sub_block += [block[c_location]]
-                obj_block_list += [tuple(sub_block)]
+            obj_block_list = object_blocks(block,unique_fsummand)
             
             #print(obj_findex_list,"=",obj_block_list)
 
+            if is_zero_config(obj_block_list):
+                continue
+
             # ======================================================================================================
             # get the specified block from each object
             # ======================================================================================================
             '''
-            blocked_obj_list = [ obj.data[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
+            blocked_obj_list = [ read_data(obj)[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
             blocked_sgn_list = sum([ obj.sgn[obj_block_list[i]].tolist()  for i,obj in enumerate(obj_list) ],[])
             blocked_sgn_list = [ np.array(elem) for elem in blocked_sgn_list ]
             #
@@ -2739,7 +3964,7 @@ def einsum_block(*args):
                         error("Error[einsum_block]: some sign factors are not consistent.")
                 sigma_list += [ sgn_c ]
             '''
-            blocked_obj_list = [ obj.data[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
+            blocked_obj_list = [ read_data(obj)[obj_block_list[i]] for i,obj in enumerate(obj_list) ]
 
             sigma_list = []
             #print(summand)
@@ -2792,12 +4017,18 @@ def einsum_block(*args):
             # ======================================================================================================
             # the summation
             # ======================================================================================================
-            einsum_obj_list = blocked_obj_list + sigma_summed_list
-            sum_result = block_sign*np.einsum(*tuple([final_einsum_string]+einsum_obj_list))
+            einsum_obj_list = [ fold_sigma(i,obj_block_list[i],cell,sigma_summed_list)
+                                    for i,cell in enumerate(blocked_obj_list) ]
+            expression = cached_expression(final_einsum_string,[ cell.shape for cell in einsum_obj_list ])
+            if executor == None :
+                scalar_output += block_sign*expression(*einsum_obj_list)
+                continue
+            contraction_list += [ (block_sign,expression,einsum_obj_list) ]
 
+        for sum_result in run_parallel([ reduce_contractions([contraction]) for contraction in contraction_list ]):
             scalar_output+=sum_result
 
-            skip_power_of_two_check = False
+        skip_power_of_two_check = False
 
         return scalar_output
 
@@ -3135,7 +4366,7 @@ def get_grouping_sign_factors(sorted_group_info, intermediate_stat):
     # generate the sign factor tensor (separately)
     sign_factors_list = [ sign_factors_info[0], [] ]
     for d in sign_factors_info[1] :
-        sgn = np.array([ (-1)**param.gparity(ind) for ind in range(d) ])
+        sgn = 1-2*parity_vector(d)
         sign_factors_list[1] += [sgn]
     
     #print(sign_factors_list)
@@ -3222,10 +4453,8 @@ def join_index(*args):
 
         sub_block_shift += sub_block_size
 
-    sgn_sigma_perm = 1
-    for i in range(ndim):
-        for j in range(i+1,ndim):
-            sgn_sigma_perm *= (-1)**(pi[i]*pi[j])
+    # every pair of odd indices contributes a factor of -1, i.e., the sign of reversing their order
+    sgn_sigma_perm = compiled_sign_program(range(ndim),range(ndim-1,-1,-1)).sign(pack_parity(pi))
 
     einsum_string_before = ",".join(char_list[:ndim])
     einsum_string_after = "".join(char_list[:ndim])
@@ -3398,7 +4627,7 @@ def join_legs_block(InpObj,string_inp,final_stat):
 
             x_list = zip(block_group[fielem],d0,d1,sgn_list)
 
-            _block,_shift,_size,_sgn = gtn.join_index(*x_list)
+            _block,_shift,_size,_sgn = join_index(*x_list)
             check_block += [_block]
             fblock_shift += [_shift]
             subblocksize += [_size]
@@ -3739,50 +4968,109 @@ def split_legs_block(InpObj,string_inp,final_stat,final_shape,final_even_shape,f
 ##               (for testing only)               ##
 ####################################################
 
-def trim_grassmann_odd(Obj):
-    objtype=type(Obj)
-    objencoder=Obj.encoder
-
-    if(Obj.encoder == 'canonical'):
-        Obj = Obj.switch_encoder(save_memory=True)
-        
-    if(objtype==dense):
-        Obj = sparse(Obj)
-    C = Obj.coords
-    s0 = time.time()
-    s00 = s0
-    progress_space() # << Don't remove this. This is for the show_progress!
-
-    for i in range(Obj.nnz):
-        fcoords = [ ind for j,ind in enumerate(C[i]) if (Obj.statistics[j] in fermi_type)]
-        if(sum(fcoords)%2 == 1):
-            Obj.data.data[i] = 0
+parity_check_chunk = 2**20 # the number of sparse entries checked at a time by is_grassmann_even
 
-        if time.time()-s0 > 0.5 :
-            show_progress(i,Obj.nnz,"trim_grassmann_odd",time=time.time()-s00)
-
-    clear_progress()
-    tab_up()
+def stored_parity_list(Obj):
+    """
+    The Grassmann parity of the stored indices of every fermionic axis of a dense or sparse tensor.
+    The pending permutation only relabels the indices, and the pending signs never turn
+    an entry into zero, so the parity tests can work on stored_data directly.
 
+    Returns:
+    list: a parity vector for every fermionic axis and None for every bosonic axis
+    """
+    ret = []
+    for axis,(d,stat) in enumerate(zip(Obj.shape,Obj.statistics)):
+        if stat not in fermi_type :
+            ret += [None]
+            continue
+        pvec = parity_vector(d,Obj.encoder)
+        if Obj.axis_permutation != None and Obj.axis_permutation[axis] is not None :
+            pvec = pvec[np.argsort(Obj.axis_permutation[axis])]
+        ret += [pvec]
+    return ret
 
-    if(objtype==dense):
-        Obj = dense(Obj)
+def odd_mask(parity_list):
+    # the mask of the Grassmann-odd coordinates, built by broadcasting the per-axis parities
+    # (the bosonic axes are left with length 1)
+    ndim = len(parity_list)
+    mask = np.zeros([1]*ndim,dtype=bool)
+    for axis,pvec in enumerate(parity_list):
+        if pvec is not None :
+            mask = mask ^ pvec.astype(bool).reshape([ -1 if i==axis else 1 for i in range(ndim) ])
+    return mask
+
+def odd_entries(coords,parity_list):
+    # the Grassmann-odd columns of a COO coordinate array
+    parity = np.zeros(coords.shape[1],dtype=int)
+    for axis,pvec in enumerate(parity_list):
+        if pvec is not None :
+            parity ^= pvec[coords[axis]]
+    return parity.astype(bool)
 
-    if(objencoder == 'canonical'):
-        Obj = Obj.switch_encoder(save_memory=True)
+def trim_grassmann_odd(Obj):
+    """
+    Remove the Grassmann-odd components of a dense or sparse tensor.
 
-    return Obj
+    Returns:
+    the Grassmann-even part of Obj (same type, format and encoder)
+    """
+    if type(Obj) not in [dense,sparse] :
+        error("Error[trim_grassmann_odd]: Only dense and sparse tensors are supported.")
+
+    parity_list = stored_parity_list(Obj)
+    ret = Obj.copy()
+    if type(Obj)==dense :
+        expand_diagonal(ret)
+        np.copyto(own_stored_data(ret),0,where=odd_mask(parity_list))
+    else:
+        arr = ret.stored_data
+        even = ~odd_entries(arr.coords,parity_list)
+        release_stored_data(ret)
+        ret.stored_data = sp.COO(arr.coords[:,even],arr.data[even],shape=arr.shape)
+    return ret
 
 def is_grassmann_even(Obj):
-    if Obj.encoder == 'canonical':
-        Obj = Obj.switch_encoder(save_memory=True)
-    if type(Obj) == dense:
-        Obj = sparse(Obj)
+    """
+    Check that every nonzero component of a tensor is Grassmann even.
+    The check stops at the first odd block (block), leading slice (dense) or chunk of entries (sparse)
+    that contains a nonzero component.
 
-    C = Obj.coords
-    for x in C:
-        parity = sum([ ind for i,ind in enumerate(x) if Obj.statistics[i] in fermi_type ])
-        if parity%2!=0 :
+    Returns:
+    bool
+    """
+    if type(Obj)==block :
+        if Obj.diagonal_data is not None :
+            # only the even-even and the odd-odd cells are nonzero
+            return True
+        cells = read_data(Obj)
+        for blocknum in np.ndindex(cells.shape):
+            if sum(blocknum)%2==1 and np.any(cells[blocknum]) :
+                return False
+        return True
+
+    parity_list = stored_parity_list(Obj)
+    if type(Obj)==dense :
+        expand_diagonal(Obj)
+    arr = Obj.stored_data
+
+    if type(Obj)==dense :
+        if arr.ndim==0 or all([ pvec is None for pvec in parity_list ]) :
+            return True
+        # the odd mask of one leading slice is that of the other axes, flipped by the leading parity
+        rest_mask = odd_mask(parity_list[1:])
+        leading = parity_list[0]
+        if leading is None :
+            leading = np.zeros(arr.shape[0],dtype=int)
+        for i in range(arr.shape[0]):
+            if np.any(arr[i],where=rest_mask^bool(leading[i])) :
+                return False
+        return True
+
+    nonzero = arr.data!=0
+    for start in range(0,arr.nnz,parity_check_chunk):
+        chunk = slice(start,start+parity_check_chunk)
+        if np.any(odd_entries(arr.coords[:,chunk],parity_list) & nonzero[chunk]) :
             return False
     return True
 
@@ -3790,8 +5078,38 @@ def is_grassmann_even(Obj):
 ##          Singular value decomposition          ##
 ####################################################
 
-def SortedSVD(M,cutoff=None):
-    U, Λ, V = np.linalg.svd(M, full_matrices=False)
+def SortedSVD(M,cutoff=None,method=None):
+    """
+    Singular value decomposition M = U.diag(Λ).V with the singular values in descending order.
+    Only the singular values above numer_cutoff (relative to the largest one) are kept,
+    and at most cutoff of them.
+
+    Parameters:
+    M (numpy.ndarray): the matrix
+    cutoff (int): the maximum number of singular values
+    method (str): "full" decomposes the whole matrix with LAPACK, while "randomized" and "lanczos"
+                  only compute the leading cutoff singular values (default: svd_method)
+
+    Returns:
+    U, Λ, V
+    """
+    if method == None :
+        method = svd_method
+    if method not in svd_method_type :
+        error("Error[SortedSVD]: method must be one of "+str(svd_method_type)+".")
+
+    # the truncated methods are only worth it if a part of the spectrum is thrown away
+    if cutoff==None or cutoff<1 or cutoff>=min(M.shape) :
+        method = "full"
+    elif method=="randomized" and cutoff+svd_oversampling>=min(M.shape) :
+        method = "full"
+
+    if method=="randomized" :
+        U, Λ, V = RandomizedSVD(M,cutoff)
+    elif method=="lanczos" :
+        U, Λ, V = LanczosSVD(M,cutoff)
+    else:
+        U, Λ, V = np.linalg.svd(M, full_matrices=False)
 
 
     nnz = 0
@@ -3811,10 +5129,102 @@ def SortedSVD(M,cutoff=None):
 
 
     return U, Λ, V
+
+def RandomizedSVD(M,k,oversampling=None,power_iterations=None):
+    """
+    The leading k singular triplets of M from a randomized range finder (Halko, Martinsson, Tropp).
+    The random sketch has a fixed seed so that the result is reproducible.
+
+    Parameters:
+    M (numpy.ndarray): the matrix
+    k (int): the number of singular values
+    oversampling (int): the number of extra random vectors (default: svd_oversampling)
+    power_iterations (int): the number of power iterations (default: svd_power_iterations)
+
+    Returns:
+    U, Λ, V
+    """
+    if oversampling == None :
+        oversampling = svd_oversampling
+    if power_iterations == None :
+        power_iterations = svd_power_iterations
+
+    m,n = M.shape
+    p = min(m,n,k+oversampling)
+    rng = np.random.default_rng(0)
+    Ω = rng.standard_normal((n,p))
+    if np.iscomplexobj(M):
+        Ω = Ω + 1j*rng.standard_normal((n,p))
+
+    cM = np.conjugate(np.transpose(M))
+    Q = np.linalg.qr(M@Ω)[0]
+    for it in range(power_iterations):
+        Q = np.linalg.qr(cM@Q)[0]
+        Q = np.linalg.qr(M@Q)[0]
+
+    # M ≈ Q.(cQ.M), and cQ.M is only p×n
+    UB, Λ, V = np.linalg.svd(np.conjugate(np.transpose(Q))@M, full_matrices=False)
+    U = Q@UB[:,:k]
+
+    return U, Λ[:k], V[:k,:]
+
+def LanczosSVD(M,k):
+    """
+    The leading k singular triplets of M from scipy.sparse.linalg.svds (requires scipy).
+
+    Parameters:
+    M (numpy.ndarray): the matrix
+    k (int): the number of singular values, must be smaller than min(M.shape)
+
+    Returns:
+    U, Λ, V
+    """
+    try:
+        from scipy.sparse.linalg import svds
+    except ImportError:
+        error("Error[LanczosSVD]: method=\"lanczos\" requires scipy.")
+    U, Λ, V = svds(M,k=k)
+    order = np.argsort(Λ)[::-1]
+    return U[:,order], Λ[order], V[order,:]
+
+def svd_truncation_report(M_list,Λ_list,method=None):
+    """
+    Compare the kept singular values with the norm of the decomposed matrices and store the result in svd_report.
+    Since U.diag(Λ).V is an orthogonal projection of M for every method, the discarded weight
+    |M|^2-ΣΛ^2 is exactly the squared error of the truncated decomposition.
+
+    Parameters:
+    M_list (list of numpy.ndarray): the decomposed matrices (e.g. the even and the odd block)
+    Λ_list (list of numpy.ndarray): the kept singular values of each matrix
+    method (str): the decomposition method (default: svd_method)
+
+    Returns:
+    dict: the method, the number of kept singular values, the total weight |M|^2,
+          the discarded weight and the relative error sqrt(discarded/total)
+    """
+    global svd_report
+    if method == None :
+        method = svd_method
+    total_weight = sum([ np.linalg.norm(M)**2 for M in M_list ])
+    kept_weight = sum([ np.sum(np.abs(Λ)**2) for Λ in Λ_list ])
+    discarded_weight = max(0.0,total_weight-kept_weight)
+    relative_error = 0.0
+    if total_weight > 0 :
+        relative_error = np.sqrt(discarded_weight/total_weight)
+    svd_report = {
+        "method":method,
+        "kept":sum([ len(Λ) for Λ in Λ_list ]),
+        "total_weight":total_weight,
+        "discarded_weight":discarded_weight,
+        "relative_error":relative_error
+        }
+    return svd_report
+
 # I = cUU = VcV
-def BlockSVD(Obj,cutoff=None):
+def BlockSVD(Obj,cutoff=None,method=None):
     
     # performing an svd of a matrix block by block
+    # (the singular values are returned as the diagonal of Λ only)
 
     if(type(Obj)!=np.array and type(Obj)!=np.ndarray):
         error("Error[BlockSVD]: An input must be of type numpy.array or numpy.ndarray only!")
@@ -3836,11 +5246,8 @@ def BlockSVD(Obj,cutoff=None):
         error("Error[BlockSVD]: The matrix dimensions must be at least 2!")
         
 
-    parity_norm = 0
-    for i in range(m):
-        for j in range(n):
-            if (i+j)%2!=0:
-                parity_norm += np.linalg.norm(Obj[i,j])
+    # the entries with (i+j)%2!=0
+    parity_norm = np.sum(np.abs(Obj[0::2,1::2]))+np.sum(np.abs(Obj[1::2,0::2]))
     if( (not skip_parity_blocking_check) and parity_norm/(m*n/2)>1.0e-14):
         error("Error[BlockSVD]: This matrix is not constructed from a Grassmann-even tensor.")
         print("                 (Or that one of the indices are non-fermionic.)")
@@ -3849,27 +5256,24 @@ def BlockSVD(Obj,cutoff=None):
     # At this point the matrix is well-behaved
 
     # time to separate the blocks
-    ME = np.zeros([int(m/2),int(n/2)],dtype=type(Obj[0][0]))
-    MO = np.zeros([int(m/2),int(n/2)],dtype=type(Obj[0][0]))
-
-    for i in range(int(m/2)):
-        for j in range(int(n/2)):
-            ME[i,j] = Obj[2*i,2*j]
-            MO[i,j] = Obj[2*i+1,2*j+1]
+    mhalf = int(m/2)
+    nhalf = int(n/2)
+    ME = np.array(Obj[0:2*mhalf:2,0:2*nhalf:2],dtype=type(Obj[0][0]))
+    MO = np.array(Obj[1:2*mhalf:2,1:2*nhalf:2],dtype=type(Obj[0][0]))
 
     halfcutoff = None
     if cutoff!=None :
         halfcutoff = int(cutoff/2)
 
-    UE, ΛE, VE = SortedSVD(ME,halfcutoff)
-    UO, ΛO, VO = SortedSVD(MO,halfcutoff)
+    [UE, ΛE, VE], [UO, ΛO, VO] = run_parallel([ lambda: SortedSVD(ME,halfcutoff,method), lambda: SortedSVD(MO,halfcutoff,method) ])
+    svd_truncation_report([ME,MO],[ΛE,ΛO],method)
 
     d = max(len(ΛE),len(ΛO))
     d = int(2**math.ceil(np.log2(d)))
 
     def padding(Ux, Λx, Vx, padding_dimension):
         Ux = np.pad(Ux,((0,0),(0,padding_dimension)),'constant',constant_values=((0,0),(0,0)))
-        Λx = np.diag(np.pad(Λx,(0,padding_dimension),'constant',constant_values=   (0,0)    ))
+        Λx = np.pad(Λx,(0,padding_dimension),'constant',constant_values=   (0,0)    )
         Vx = np.pad(Vx,((0,padding_dimension),(0,0)),'constant',constant_values=((0,0),(0,0)))
         return Ux, Λx, Vx
 
@@ -3879,20 +5283,28 @@ def BlockSVD(Obj,cutoff=None):
     def get_full_matrix(AE, AO):
         mhalf,nhalf = AE.shape
         A = np.zeros([2*mhalf,2*nhalf],dtype=type(AE[0][0]))
-        for i in range(mhalf):
-            for j in range(nhalf):
-                A[2*i,2*j] = AE[i,j]
-                A[2*i+1,2*j+1] = AO[i,j]
+        A[0::2,0::2] = AE
+        A[1::2,1::2] = AO
+        return A
+
+    def get_full_vector(AE, AO):
+        # the diagonal of get_full_matrix(np.diag(AE),np.diag(AO))
+        A = np.zeros([2*len(AE)],dtype=AE.dtype)
+        A[0::2] = AE
+        A[1::2] = AO
         return A
 
     U = get_full_matrix(UE,UO)
-    Λ = get_full_matrix(ΛE,ΛO)
+    Λ = get_full_vector(ΛE,ΛO)
     V = get_full_matrix(VE,VO)
     
 
     return U, Λ, V
 
-def svd(InpObj,string,cutoff=None,save_memory=False):
+def svd(InpObj,string,cutoff=None,save_memory=False,method=None):
+
+    if type(InpObj)==product_operator :
+        return implicit_svd(InpObj,string,cutoff,method)
 
     process_name = "svd"
     process_color = "yellow"
@@ -4027,10 +5439,10 @@ def svd(InpObj,string,cutoff=None,save_memory=False):
 
     step = show_progress(step,process_length,process_name+" "+"<"+current_memory_display()+">",color=process_color,time=time.time()-s00) #3
     if Obj.statistics[0]==0 or Obj.statistics[1]==0:
-        U, Λ, V = SortedSVD(Obj.data,cutoff)
-        Λ = np.diag(Λ)
+        U, Λ, V = SortedSVD(Obj.data,cutoff,method)
+        svd_truncation_report([Obj.data],[Λ],method)
     else:
-        U, Λ, V = BlockSVD(Obj.data,cutoff)
+        U, Λ, V = BlockSVD(Obj.data,cutoff,method)
 
     step = show_progress(step,process_length,process_name+" "+"<"+current_memory_display()+">",color=process_color,time=time.time()-s00) #4
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
@@ -4045,19 +5457,19 @@ def svd(InpObj,string,cutoff=None,save_memory=False):
     
     if Obj.statistics[0]==0:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(0,0))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(0,Obj.statistics[1]))
         Λstatleft = 0
         Λstatright = 0
     elif Obj.statistics[1]==0:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(Obj.statistics[0],0))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(0,0))
         Λstatleft = 0
         Λstatright = 0
     else:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(Obj.statistics[0],1))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(-1,1))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(-1,1))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(-1,Obj.statistics[1]))
     dΛ = Λ.shape[0]
 
@@ -4130,18 +5542,77 @@ def svd(InpObj,string,cutoff=None,save_memory=False):
 ##            Eigen value decomposition           ##
 ####################################################
 
-def SortedEig(M,cutoff=None,debug_mode=False):
+def check_hermiticity(M,process_name="check_hermiticity"):
+    """
+    Raise an error if the matrix M is not Hermitian.
+    With hermiticity_check="sample", only a few rows are compared with the corresponding columns,
+    which costs O(n) per row instead of forming M-cM.
+
+    Parameters:
+    M (numpy.ndarray): the square matrix
+    process_name (str): the function name shown in the error message
+    """
+    if hermiticity_check == "none" :
+        return
+    if hermiticity_check == "sample" and M.shape[0] > hermiticity_samples :
+        rows = np.random.default_rng(0).choice(M.shape[0],hermiticity_samples,replace=False)
+        M_rows = M[rows,:]
+        cM_rows = np.conjugate(np.transpose(M[:,rows]))
+        NonHermitianNorm = np.linalg.norm(M_rows-cM_rows)/np.linalg.norm(M_rows)
+    else:
+        NonHermitianNorm = np.linalg.norm(M-np.conjugate(np.transpose(M)))/np.linalg.norm(M)
+    if NonHermitianNorm>numer_cutoff :
+        error("Error["+process_name+"]: The input matrix is not Hermitian!")
 
-    NonHeritianNorm = np.linalg.norm(M-np.conjugate(np.transpose(M)))/np.linalg.norm(M)
-    if NonHeritianNorm>numer_cutoff :
-        error("Error[SortedEig]: The input matrix is not Hermitian!")
+def SortedEig(M,cutoff=None,debug_mode=False,method=None):
+    """
+    Eigen-decomposition M = U.diag(Λ).cU of a Hermitian matrix with |Λ| in descending order.
+    Only the eigenvalues above numer_cutoff (relative to the largest one) are kept,
+    and at most cutoff of them.
 
-    U, Λ, V = np.linalg.svd(M, full_matrices=False)
+    Parameters:
+    M (numpy.ndarray): the Hermitian matrix
+    cutoff (int): the maximum number of eigenvalues
+    method (str): "full" diagonalizes the whole matrix with eigh,
+                  "partial" only computes the cutoff largest eigenvalues with scipy's eigh(subset_by_index)
+                  (these are the largest in magnitude if M is positive semi-definite, e.g. cQ.Q),
+                  "lanczos" computes the cutoff eigenvalues of largest magnitude with scipy's eigsh
+                  (default: eig_method)
 
-    nnz = 0
-    #if np.abs(Λ[0]) < numer_cutoff:
-    #    error("Error[SortedSVD]: np.linalg.svd() returns zero singular value vector!")
+    Returns:
+    U, Λ, cU
+    """
+    if method == None :
+        method = eig_method
+    if method not in eig_method_type :
+        error("Error[SortedEig]: method must be one of "+str(eig_method_type)+".")
+
+    check_hermiticity(M,"SortedEig")
+
+    n = M.shape[0]
+    if cutoff==None or cutoff<1 or cutoff>=n :
+        method = "full"
+
+    if method=="partial" :
+        try:
+            from scipy.linalg import eigh
+        except ImportError:
+            error("Error[SortedEig]: method=\"partial\" requires scipy.")
+        Λ, U = eigh(M,subset_by_index=[n-cutoff,n-1])
+    elif method=="lanczos" :
+        try:
+            from scipy.sparse.linalg import eigsh
+        except ImportError:
+            error("Error[SortedEig]: method=\"lanczos\" requires scipy.")
+        Λ, U = eigsh(M,k=cutoff,which='LM')
+    else:
+        Λ, U = np.linalg.eigh(M)
 
+    order = np.argsort(-np.abs(Λ),kind='stable')
+    Λ = Λ[order].astype(np.result_type(Λ,M))
+    U = U[:,order]
+
+    nnz = 0
     for i,s in enumerate(Λ):
         if np.abs(s/Λ[0]) > numer_cutoff:
             nnz+=1
@@ -4151,16 +5622,14 @@ def SortedEig(M,cutoff=None,debug_mode=False):
 
     Λ = Λ[:nnz]
     U = U[:,:nnz]
-    V = V[:nnz,:]
     cU = np.conjugate(np.transpose(U))
-    ΛVU = np.einsum('i,ij,jk->ik',Λ,V,U)
-    Λ = np.einsum('i,ij,jk->k',Λ,V,U)
 
     return U, Λ, cU
 # I = cUU
-def BlockEig(Obj,cutoff=None,debug_mode=False):
+def BlockEig(Obj,cutoff=None,debug_mode=False,method=None):
     
     # performing an svd of a matrix block by block
+    # (the eigenvalues are returned as the diagonal of Λ only)
 
     if(type(Obj)!=np.array and type(Obj)!=np.ndarray):
         error("Error[BlockEig]: An input must be of type numpy.array or numpy.ndarray only!")
@@ -4182,11 +5651,8 @@ def BlockEig(Obj,cutoff=None,debug_mode=False):
         error("Error[BlockEig]: The matrix dimensions must be at least 2!")
         
 
-    parity_norm = 0
-    for i in range(m):
-        for j in range(n):
-            if (i+j)%2!=0:
-                parity_norm += np.linalg.norm(Obj[i,j])
+    # the entries with (i+j)%2!=0
+    parity_norm = np.sum(np.abs(Obj[0::2,1::2]))+np.sum(np.abs(Obj[1::2,0::2]))
     if( (not skip_parity_blocking_check) and parity_norm/(m*n/2)>1.0e-14):
         error("Error[BlockEig]: This matrix is not constructed from a Grassmann-even tensor.")
         print("                 (Or that one of the indices are non-fermionic.)")
@@ -4195,27 +5661,23 @@ def BlockEig(Obj,cutoff=None,debug_mode=False):
     # At this point the matrix is well-behaved
 
     # time to separate the blocks
-    ME = np.zeros([int(m/2),int(n/2)],dtype=type(Obj[0][0]))
-    MO = np.zeros([int(m/2),int(n/2)],dtype=type(Obj[0][0]))
-
-    for i in range(int(m/2)):
-        for j in range(int(n/2)):
-            ME[i,j] = Obj[2*i,2*j]
-            MO[i,j] = Obj[2*i+1,2*j+1]
+    mhalf = int(m/2)
+    nhalf = int(n/2)
+    ME = np.array(Obj[0:2*mhalf:2,0:2*nhalf:2],dtype=type(Obj[0][0]))
+    MO = np.array(Obj[1:2*mhalf:2,1:2*nhalf:2],dtype=type(Obj[0][0]))
 
     halfcutoff = None
     if cutoff!=None :
         halfcutoff = int(cutoff/2)
 
-    UE, ΛE, cUE = SortedEig(ME,halfcutoff,debug_mode)
-    UO, ΛO, cUO = SortedEig(MO,halfcutoff,debug_mode)
+    [UE, ΛE, cUE], [UO, ΛO, cUO] = run_parallel([ lambda: SortedEig(ME,halfcutoff,debug_mode,method), lambda: SortedEig(MO,halfcutoff,debug_mode,method) ])
 
     d = max(len(ΛE),len(ΛO))
     d = int(2**math.ceil(np.log2(d)))
 
     def padding(Ux, Λx, cUx, padding_dimension):
         Ux = np.pad(Ux,((0,0),(0,padding_dimension)),'constant',constant_values=((0,0),(0,0)))
-        Λx = np.diag(np.pad(Λx,(0,padding_dimension),'constant',constant_values=(0,0)       ))
+        Λx = np.pad(Λx,(0,padding_dimension),'constant',constant_values=(0,0)       )
         cUx = np.pad(cUx,((0,padding_dimension),(0,0)),'constant',constant_values=((0,0),(0,0)))
         return Ux, Λx, cUx
 
@@ -4225,20 +5687,25 @@ def BlockEig(Obj,cutoff=None,debug_mode=False):
     def get_full_matrix(AE, AO):
         mhalf,nhalf = AE.shape
         A = np.zeros([2*mhalf,2*nhalf],dtype=type(AE[0][0]))
-        for i in range(mhalf):
-            for j in range(nhalf):
-                A[2*i,2*j] = AE[i,j]
-                A[2*i+1,2*j+1] = AO[i,j]
+        A[0::2,0::2] = AE
+        A[1::2,1::2] = AO
+        return A
+
+    def get_full_vector(AE, AO):
+        # the diagonal of get_full_matrix(np.diag(AE),np.diag(AO))
+        A = np.zeros([2*len(AE)],dtype=AE.dtype)
+        A[0::2] = AE
+        A[1::2] = AO
         return A
 
     U = get_full_matrix(UE,UO)
-    Λ = get_full_matrix(ΛE,ΛO)
+    Λ = get_full_vector(ΛE,ΛO)
     cU = get_full_matrix(cUE,cUO)
     
 
     return U, Λ, cU
 
-def eig(InpObj,string,cutoff=None,debug_mode=False,save_memory=False):
+def eig(InpObj,string,cutoff=None,debug_mode=False,save_memory=False,method=None):
 
     process_name = "eig"
     process_color = "yellow"
@@ -4374,10 +5841,9 @@ def eig(InpObj,string,cutoff=None,debug_mode=False,save_memory=False):
 
     step = show_progress(step,process_length,process_name+" "+"<"+current_memory_display()+">",color=process_color,time=time.time()-s00) #3
     if Obj.statistics[0]==0 or Obj.statistics[1]==0:
-        U, Λ, V = SortedEig(Obj.data,cutoff,debug_mode)
-        Λ = np.diag(Λ)
+        U, Λ, V = SortedEig(Obj.data,cutoff,debug_mode,method)
     else:
-        U, Λ, V = BlockEig(Obj.data,cutoff,debug_mode)
+        U, Λ, V = BlockEig(Obj.data,cutoff,debug_mode,method)
 
     step = show_progress(step,process_length,process_name+" "+"<"+current_memory_display()+">",color=process_color,time=time.time()-s00) #4
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
@@ -4392,19 +5858,19 @@ def eig(InpObj,string,cutoff=None,debug_mode=False,save_memory=False):
     
     if Obj.statistics[0]==0:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(0,0))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(0,Obj.statistics[1]))
         Λstatleft = 0
         Λstatright = 0
     elif Obj.statistics[1]==0:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(Obj.statistics[0],0))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(0,0))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(0,0))
         Λstatleft = 0
         Λstatright = 0
     else:
         U = dense(U,encoder="parity-preserving",format="matrix",statistics=(Obj.statistics[0],1))
-        Λ = dense(Λ,encoder="parity-preserving",format="matrix",statistics=(-1,1))
+        Λ = diagonal(Λ,encoder="parity-preserving",format="matrix",statistics=(-1,1))
         V = dense(V,encoder="parity-preserving",format="matrix",statistics=(-1,Obj.statistics[1]))
     dΛ = Λ.shape[0]
 
@@ -4477,7 +5943,7 @@ def eig(InpObj,string,cutoff=None,debug_mode=False,save_memory=False):
 ##               Block decomposition              ##
 ####################################################
 
-def decompose_block(InpObj,string,cutoff=None,save_memory=False,option=None):
+def decompose_block(InpObj,string,cutoff=None,save_memory=False,option=None,method=None):
 
     string = string.replace(" ","")
     string = denumerate(string)
@@ -4786,20 +6252,18 @@ def decompose_block(InpObj,string,cutoff=None,save_memory=False,option=None):
     # ===========================================================================
 
     if option=="SVD":
-        UE,SE,VE = SortedSVD(ME,cutoff=int(math.ceil(cutoff/2)))
-        UO,SO,VO = SortedSVD(MO,cutoff=int(math.floor(cutoff/2)))
+        [UE,SE,VE],[UO,SO,VO] = run_parallel([ lambda: SortedSVD(ME,cutoff=int(math.ceil(cutoff/2)),method=method),
+                                               lambda: SortedSVD(MO,cutoff=int(math.floor(cutoff/2)),method=method) ])
+        svd_truncation_report([ME,MO],[SE,SO],method)
     elif option=="Eig":
-        UE,SE,VE = SortedEig(ME,cutoff=int(math.ceil(cutoff/2)))
-        UO,SO,VO = SortedEig(MO,cutoff=int(math.floor(cutoff/2)))
+        [UE,SE,VE],[UO,SO,VO] = run_parallel([ lambda: SortedEig(ME,cutoff=int(math.ceil(cutoff/2)),method=method),
+                                               lambda: SortedEig(MO,cutoff=int(math.floor(cutoff/2)),method=method) ])
     else:
         error("Error[decompose_block]: Unknown decomposition type")
 
 
-    SE = np.diag(SE)
-    SO = np.diag(SO)
-
-    NE = SE.shape[0]
-    NO = SO.shape[0]
+    NE = len(SE)
+    NO = len(SO)
 
     Nfull = 2**int(1+np.ceil(np.log2(max(NE,NO))))
 
@@ -4848,10 +6312,8 @@ def decompose_block(InpObj,string,cutoff=None,save_memory=False,option=None):
     U.data[0,1] = np.zeros(U_01_shape)
     U.data[1,0] = np.zeros(U_10_shape)
 
-    S.data[0,0] = SE
-    S.data[1,1] = SO
-    S.data[0,1] = np.zeros(S_01_shape)
-    S.data[1,0] = np.zeros(S_10_shape)
+    # S only keeps its diagonal, see the block class
+    S.diagonal_data = [SE,SO]
 
     V.data[0,0] = VE
     V.data[1,1] = VO
@@ -4974,11 +6436,263 @@ def decompose_block(InpObj,string,cutoff=None,save_memory=False,option=None):
 
     return U, S, V
 
-def svd_block(InpObj,string,cutoff=None,save_memory=False):
-    return decompose_block(InpObj,string,cutoff,save_memory,option="SVD")
+def svd_block(InpObj,string,cutoff=None,save_memory=False,method=None):
+    if type(InpObj)==product_operator :
+        return implicit_svd(InpObj,string,cutoff,method)
+    return decompose_block(InpObj,string,cutoff,save_memory,option="SVD",method=method)
 
-def eig_block(InpObj,string,cutoff=None,save_memory=False):
-    return decompose_block(InpObj,string,cutoff,save_memory,option="Eig")
+def eig_block(InpObj,string,cutoff=None,save_memory=False,method=None):
+    return decompose_block(InpObj,string,cutoff,save_memory,option="Eig",method=method)
+
+####################################################
+##             Implicit decompositions            ##
+####################################################
+
+class product_operator:
+    """
+    The einsum of a list of Grassmann tensors, kept as the list of factors.
+    svd() and svd_block() decompose it by contracting it with thin tensors only,
+    so the product itself is never formed.
+
+    Parameters:
+    string (str): the einsum string, which must have an output, e.g. "ajk,jib->aibk"
+    obj_list (dense, sparse or block): the factors
+    """
+    def __init__(self, string, *obj_list):
+        string = denumerate(string.replace(" ",""))
+        if string.count("->")!=1 :
+            error("Error[product_operator]: The einsum string must have an output.")
+        [summand,output] = string.split("->")
+        if len(summand.split(","))!=len(obj_list) :
+            error("Error[product_operator]: The number of factors is not consistent with the einsum string.")
+
+        # the factor and the axis carrying each output leg
+        leg_owner = []
+        for c in output:
+            for term,obj in zip(summand.split(","),obj_list):
+                if c in term :
+                    leg_owner += [[obj,term.index(c)]]
+                    break
+
+        self.string = string
+        self.obj_list = list(obj_list)
+        self.leg_owner = leg_owner
+        self.statistics = tuple([ obj.statistics[axis] for [obj,axis] in leg_owner ])
+        self.shape = tuple([ obj.shape[axis] for [obj,axis] in leg_owner ])
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        for obj in self.obj_list:
+            dtype = obj.dtype if type(obj)==block else obj.data.dtype
+            if np.issubdtype(dtype,np.complexfloating):
+                return complex
+        return float
+
+    def evaluate(self):
+        return einsum(self.string,*self.obj_list)
+
+    def contract(self,string,*obj_list):
+        """
+        einsum(string,self,*obj_list) evaluated from the factors of self.
+        The first of the other tensors is contracted with the factor it shares the most legs with,
+        and the neighbouring factors are then absorbed one at a time, so every einsum has only two
+        operands and its sign factors only cover the legs of one pair (factorized for dense factors,
+        see sign_factors()). These plans are not stored in einsum_cache. The other tensors must be
+        Grassmann even (as Ω and cQ in implicit_svd), so that they commute with the factors.
+
+        Parameters:
+        string (str): the einsum string, whose first term refers to self
+        obj_list (dense, sparse or block): the other tensors
+
+        Returns:
+        the result of the einsum
+        """
+        string = denumerate(string.replace(" ",""))
+        [summand,output] = string.split("->")
+        term_list = summand.split(",")
+        [inner_summand,inner_output] = self.string.split("->")
+
+        # the output legs take the names in the first term; the summed legs get unused names
+        rename = { ",":"," }
+        for c,new_c in zip(inner_output,term_list[0]):
+            rename[c] = new_c
+        used_chars = string
+        for c in inner_summand:
+            if c not in rename :
+                rename[c] = get_char(used_chars)
+                used_chars += rename[c]
+        inner_summand = "".join([ rename[c] for c in inner_summand ])
+        factor_terms = inner_summand.split(",")
+
+        char_dims = {}
+        for term,obj in zip(factor_terms+term_list[1:],self.obj_list+list(obj_list)):
+            for c,dim in zip(term,obj.shape):
+                char_dims[c] = dim
+
+        def pair_output(term1,term2):
+            # the legs that are not summed in the pair, in their order of appearance
+            return "".join([ c for c in term1+term2 if (term1+term2).count(c)==1 ])
+
+        def pair_size(term1,term2):
+            return int(np.prod([ char_dims[c] for c in pair_output(term1,term2) ]))
+
+        # the factorized sign matrices make sparse contractions fill in, so sparse pairs keep the sign tensor
+        pair_sign_mode = "dense"
+        if type(self.obj_list[0])==dense :
+            pair_sign_mode = "factorized"
+
+        def contract_pair(term1,term2,obj1,obj2,last):
+            # the last pair is contracted directly into the requested output
+            ret_term = pair_output(term1,term2)
+            if last :
+                ret_term = output
+            if type(obj1)==block :
+                return ret_term, einsum_block(term1+","+term2+"->"+ret_term,obj1,obj2)
+            return ret_term, einsum_ds(term1+","+term2+"->"+ret_term,obj1,obj2,sign_mode=pair_sign_mode,use_cache=False)
+
+        nfactor = len(factor_terms)
+        no_rest = len(term_list)==2
+        overlap = [ len(set(term)&set(term_list[1])) for term in factor_terms ]
+        lo = overlap.index(max(overlap))
+        hi = lo
+        ret_term, ret = contract_pair(factor_terms[lo],term_list[1],self.obj_list[lo],obj_list[0],no_rest and nfactor==1)
+
+        # grow the run of absorbed factors lo..hi to the side with the smaller intermediate
+        while hi-lo+1 < nfactor :
+            last = no_rest and hi-lo+2==nfactor
+            grow_left = lo > 0
+            if lo > 0 and hi < nfactor-1 :
+                grow_left = pair_size(factor_terms[lo-1],ret_term) <= pair_size(ret_term,factor_terms[hi+1])
+            if grow_left :
+                lo -= 1
+                ret_term, ret = contract_pair(factor_terms[lo],ret_term,self.obj_list[lo],ret,last)
+            else :
+                hi += 1
+                ret_term, ret = contract_pair(ret_term,factor_terms[hi],ret,self.obj_list[hi],last)
+
+        if no_rest :
+            return ret
+        return einsum(",".join([ret_term]+term_list[2:])+"->"+output,ret,*obj_list[1:])
+
+    def svd(self,string,cutoff=None,save_memory=False,method=None):
+        return implicit_svd(self,string,cutoff,method)
+
+def implicit_svd(Op,string,cutoff=None,method=None,oversampling=None,power_iterations=None,rng=None):
+    """
+    Truncated svd of a product_operator with a randomized range finder written in Grassmann tensors:
+    Y = Op.Ω for a random Grassmann-even Ω, Q = the left singular vectors of Y, and then Q.svd(cQ.Op).
+    Only the contractions of the factors with Ω, cQ and (cQ.Op)^† are evaluated.
+    The entries of Ω are centred Gaussian numbers. Ω pairs its even columns with the even sector of
+    the right legs and its odd columns with the odd sector, so each sector gets cutoff+oversampling
+    columns and the kept singular values are found even if they all lie in one sector.
+
+    svd_report refers to Op: the weight of Op outside the range of Q ("range_residual") is estimated
+    from a second Gaussian sketch and added to the total and the discarded weight of the svd of cQ.Op.
+
+    Parameters:
+    Op (product_operator): the tensor to be decomposed
+    string (str): the partition of the legs, e.g. "ai|bk"
+    cutoff (int): the number of singular values to keep
+    method (str): the method of the small decompositions, see SortedSVD()
+    oversampling (int): the number of extra random vectors per parity sector (default: svd_oversampling)
+    power_iterations (int): the number of power iterations (default: svd_power_iterations)
+    rng (numpy.random.Generator or int): the random generator or its seed (default: seed 0, as in RandomizedSVD())
+
+    Returns:
+    U, Λ, V: as in svd()
+    """
+    global svd_report
+    if oversampling == None :
+        oversampling = svd_oversampling
+    if power_iterations == None :
+        power_iterations = svd_power_iterations
+    if rng == None :
+        rng = 0
+    rng = np.random.default_rng(rng)
+
+    string = denumerate(string.replace(" ",""))
+    string = string.replace(")(","|").replace("(","").replace(")","")
+    for partition in separator_list:
+        string = string.replace(partition,"|")
+    if string.count("|")!=1 :
+        error("Error[implicit_svd]: The input string must contain one and only one partition.")
+    [left,right] = string.split("|")
+    if len(left)+len(right)!=Op.ndim :
+        error("Error[implicit_svd]: The number of indices is not consistent with the operator's shape.")
+
+    is_block = type(Op.obj_list[0])==block
+    left_dim = int(np.prod(Op.shape[:len(left)]))
+    right_dim = int(np.prod(Op.shape[len(left):]))
+
+    # p/2 columns of Ω are even and p/2 are odd
+    p = 0
+    if cutoff != None :
+        p = 2**int(np.ceil(np.log2(2*(cutoff+oversampling))))
+    if cutoff == None or p >= min(left_dim,right_dim) :
+        return Op.evaluate().svd(left+"|"+right,cutoff,method=method)
+
+    c = get_char(string)
+    d = get_char(string+c)
+
+    def gaussian_sketch(ncol):
+        # a random Grassmann-even tensor with centred Gaussian entries, conjugate to the right legs
+        Ωstats = tuple([ -stat for stat in Op.statistics[len(left):] ])+(1,)
+        Ωshape = Op.shape[len(left):]+(ncol,)
+        X = rng.standard_normal(Ωshape)
+        if Op.dtype == complex :
+            X = (X + complex(0,1)*rng.standard_normal(Ωshape))/np.sqrt(2)
+        Ω = trim_grassmann_odd(dense(X,statistics=Ωstats))
+        if is_block :
+            Ω = block(Ω)
+            # match the block sizes and the sign factors of the right legs
+            for j,[obj,axis] in enumerate(Op.leg_owner[len(left):]):
+                Ω.sgn[0][j] = obj.sgn[0][axis].copy()
+                Ω.sgn[1][j] = obj.sgn[1][axis].copy()
+            it = np.nditer(Ω.data, flags=['multi_index','refs_ok'])
+            for _ in it:
+                cell = it.multi_index
+                cell_slices = []
+                fi = 0
+                for j,stat in enumerate(Ωstats):
+                    if stat in fermi_type :
+                        cell_slices += [slice(0,len(Ω.sgn[cell[fi]][j]))]
+                        fi += 1
+                    else:
+                        cell_slices += [slice(0,Ωshape[j])]
+                Ω.data[cell] = Ω.data[cell][tuple(cell_slices)].copy()
+        elif type(Op.obj_list[0])==sparse :
+            Ω = sparse(Ω)
+        return Ω
+
+    Y = Op.contract(left+right+","+right+c+"->"+left+c,gaussian_sketch(p))
+    for it in range(power_iterations+1):
+        Q = Y.svd(left+"|"+c,p)[0]
+        cQ = Q.hconjugate(left+"|"+c)
+        cQOp = Op.contract(left+right+","+c+left+"->"+c+right,cQ)
+        if it < power_iterations :
+            Y = Op.contract(left+right+","+right+c+"->"+left+c,cQOp.hconjugate(c+"|"+right))
+
+    UQ, Λ, V = cQOp.svd(c+"|"+right,cutoff,method=method)
+    U = einsum(left+c+","+c+d+"->"+left+d,Q,UQ)
+
+    # every column of the test sketch Z = Op.Ωt sees the right sector of its parity, so for
+    # ncol columns E|Z|^2 = (ncol/2)|Op|^2, and the same holds for the part of Z outside the range of Q
+    ncol = 2**int(np.ceil(np.log2(max(2,2*oversampling))))
+    Z = Op.contract(left+right+","+right+d+"->"+left+d,gaussian_sketch(ncol))
+    cQZ = einsum(c+left+","+left+d+"->"+c+d,cQ,Z)
+    range_residual = max(0.0,Z.norm**2-cQZ.norm**2)*2/ncol
+
+    svd_report["range_residual"] = range_residual
+    svd_report["total_weight"] += range_residual
+    svd_report["discarded_weight"] += range_residual
+    if svd_report["total_weight"] > 0 :
+        svd_report["relative_error"] = np.sqrt(svd_report["discarded_weight"]/svd_report["total_weight"])
+
+    return U, Λ, V
 
 ####################################################
 ##                   Conjugation                  ##
@@ -5112,7 +6826,7 @@ def hconjugate(InpObj,string,save_memory=False):
     #:::::      STEP 2 - Perform Hermitian Conjugation                                          :::::
     #::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
 
-    Obj.data = np.conjugate(oe.contract('ij->ji',Obj.data))
+    Obj.data = np.conjugate(oe.contract('ij->ji',read_data(Obj)))
     
     new_stat = [1,1]
     
@@ -5582,7 +7296,11 @@ def power_ds(T,p):
     this_format = T.format
     this_encoder = T.encoder
     T = dense(T).force_format("matrix").force_encoder("canonical")
-    T.data = np.power(T.data,p)
+    if T.is_diagonal :
+        # only the diagonal is raised to the power p (the off-diagonal zeros stay zero)
+        T.diagonal_data = np.power(T.diagonal_data,p)
+    else:
+        T.data = np.power(read_data(T),p)
     T = T.force_format(this_format).force_encoder(this_encoder)
     if this_type==sparse :
         T = sparse(T)
@@ -5591,11 +7309,23 @@ def power_ds(T,p):
 def power_block(T,p):
     this_format = T.format
     T = T.force_format("matrix")
+
+    if T.is_diagonal :
+        # only the diagonal is raised to the power p (the off-diagonal zeros stay zero)
+        T.diagonal_data = [ np.power(v,p) for v in T.diagonal_data ]
+        T.norm_cache = None
+        return T.force_format(this_format)
     
-    it = np.nditer(T.data, flags=['multi_index','refs_ok'])
+    cells = read_data(T).copy()
+    it = np.nditer(cells, flags=['multi_index','refs_ok'])
     for val in it:
         block = it.multi_index
-        T.data[block] = np.power(val.item(),p)
+        cells[block] = np.power(val.item(),p)
+    T.data = cells
 
     T = T.force_format(this_format)
     return T
+
+# the star import also exports the lazily imported names (and therefore imports sympy)
+__all__ = [ name for name in globals() if not name.startswith("_") ]
+__all__ += [ name for name in lazy_names if name not in __all__ ]
@@ -636,14 +636,7 @@ def absolute_sign(object_set, parity):
     Returns:
     int: 1 if the permutation is even, -1 if the permutation is odd.
     """
-    noncommutative_elements = [x for i,x in enumerate(object_set)
-                                if parity[i]%2==1]
-    inversions = 0
-    for i in range(len(noncommutative_elements)):
-        for j in range(i+1, len(noncommutative_elements)):
-            if noncommutative_elements[i] > noncommutative_elements[j]:
-                inversions += 1
-    return (-1)**inversions
+    return gtn.absolute_sign(object_set, parity)
 
 def relative_sign_int(object_set1, object_set2, parity1):
     """
@@ -657,43 +650,14 @@ def relative_sign_int(object_set1, object_set2, parity1):
     Returns:
     int: relative parity of the permutation
     """
-    
-    def permute_c(a, b, c):
-        """
-        Permute elements of c according to the permutation that maps a to b.
-        """
-        x = list(np.argsort(a))
-        xc = [ c[i] for i in x ]
-        bxc = [ xc[i] for i in b ]
-        return bxc
-    def get_noncommutative(object_set, parity):
-        """
-        Return a list of noncommutative elements
-        """
-        noncommutative_elements = [x for i,x in enumerate(object_set)
-                                    if parity[i]%2==1]
-        return noncommutative_elements
-    # get parity of object_set2
-    parity2 = permute_c(object_set1, object_set2, parity1)
-    
-    noncommutative_elements1 = get_noncommutative(object_set1,parity1)
-    noncommutative_elements2 = get_noncommutative(object_set2,parity2)
-    
-    absolute_sign1 = absolute_sign(object_set1, parity1)
-    absolute_sign2 = absolute_sign(object_set2, parity2)
-    return absolute_sign1*absolute_sign2
+    return gtn.relative_sign_int(object_set1, object_set2, parity1)
 
 def relative_sign_single_input(string, parity1):
     """
     the string version of relative_sign_int
     the sign factor version of single input einsum
     """
-    [string1,string2] = list(string.split("->"))
-    unique_chars = list(set(string1+string2))
-    char_to_int = {char: i for i, char in enumerate(unique_chars)}
-    permutation1 = [char_to_int[char] for char in string1]
-    permutation2 = [char_to_int[char] for char in string2]
-    return relative_sign_int(permutation1, permutation2, parity1)
+    return gtn.relative_sign_single_input(string, parity1)
 
 def reordering(lista,listb,mylist):
 
@@ -0,0 +1,59 @@
+#:::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::#
+#                                    README                                   #
+#:::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::#
+#                                                                             #
+#  --- How to use ---                                                         #
+#  run the script in console with the command                                 #
+#  > python3 benchmark_import.py                                              #
+#  It imports grassmanntn in fresh interpreters and reports the import time.  #
+#  You can modify parameters by, e.g.                                         #
+#  > python3 benchmark_import.py --repeat=10 --top=20                         #
+#                                                                             #
+#  The followings are the parameters as well as their initialized values:     #
+#  --repeat=5 (the number of fresh interpreters; the median is reported)      #
+#  --top=10 (the number of slowest modules listed from the last run)          #
+#  --module=grassmanntn (the statement timed is "import <module>")            #
+#                                                                             #
+#:::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::#
+
+import argparse
+import subprocess
+import sys
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--repeat', default=5, type=int)
+parser.add_argument('--top', default=10, type=int)
+parser.add_argument('--module', default="grassmanntn", type=str)
+args = parser.parse_args()
+
+def import_profile(module):
+    # run "python -X importtime -c 'import module'" and parse the (self, cumulative) times in μs
+    statement = "import sys, "+module+"; print('sympy' in sys.modules)"
+    result = subprocess.run([sys.executable,"-X","importtime","-c",statement],
+                            capture_output=True,text=True,check=True)
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line :
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        profile += [[name.rstrip(),int(self_time),int(cumulative)]]
+    return profile, result.stdout.strip()=="True"
+
+# the first run also writes the bytecode caches, so it is not counted
+import_profile(args.module)
+
+total_list = []
+for i in range(args.repeat):
+    profile, sympy_loaded = import_profile(args.module)
+    total_list += [ [ cumulative for name,self_time,cumulative in profile if name.strip()==args.module ][-1] ]
+
+total_list.sort()
+print()
+print("  import "+args.module)
+print("  median:",round(total_list[len(total_list)//2]/1000,1),"ms (min",round(total_list[0]/1000,1),"ms, max",round(total_list[-1]/1000,1),"ms)")
+print("  sympy imported:",sympy_loaded)
+print()
+print("  slowest modules (cumulative ms, self ms):")
+for name,self_time,cumulative in sorted(profile,key=lambda x:-x[2])[:args.top]:
+    print("   ",str(round(cumulative/1000,1)).rjust(8),str(round(self_time/1000,1)).rjust(8),name)
+print()
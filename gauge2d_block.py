@@ -1608,7 +1608,7 @@ def logZ(T,boundary_conditions='periodic'):
     if boundary_conditions=='anti-periodic' and type(T)!=gtn.block:
         Tdat = T.data
         d = Tdat.shape[1]
-        sgn = [ (-1)**param.gparity(i) for i in range(d) ]
+        sgn = 1-2*(param.gparity_vector(d)%2)
         Tdat = np.einsum('IJKL,J->IJKL',Tdat,sgn)
         T.data = Tdat
 
@@ -1632,7 +1632,7 @@ def logZhotrg3dz(T1,T2,boundary_conditions='periodic'):
         T1dat = T1.data
         T2dat = T2.data
         d = T1dat.shape[1]
-        sgn = [ (-1)**param.gparity(i) for i in range(d) ]
+        sgn = 1-2*(param.gparity_vector(d)%2)
         T1dat = np.einsum('IJKLmn,J->IJKLmn',T1dat,sgn)
         T2dat = np.einsum('IJKLmn,J->IJKLmn',T2dat,sgn)
         T1.data = T1dat
@@ -1757,7 +1757,7 @@ def trg(T,dcut=64,iternum=None,error_test=False):
 ##                     2D ATRG                    ##
 ####################################################
 
-def atrg2dy(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,alignment="y"):
+def atrg2dy(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,alignment="y",implicit_svd=False):
     
     T1ori = T1.copy()
     T2ori = T2.copy()
@@ -1799,9 +1799,14 @@ def atrg2dy(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,a
     C = gtn.einsum("ab,bjk->ajk",S2,V2)
     D = U2.copy()
 
-    M = gtn.einsum("ajk,jib->aibk",C,B)
+    # with implicit_svd, M is only contracted with thin tensors inside the svd
+    if implicit_svd :
+        M = gtn.product_operator("ajk,jib->aibk",C,B)
+    else:
+        M = gtn.einsum("ajk,jib->aibk",C,B)
+        del B.data,C.data
 
-    del U1.data,S1.data,V1.data,U2.data,S2.data,V2.data,B.data,C.data
+    del U1.data,S1.data,V1.data,U2.data,S2.data,V2.data
     del U1,S1,V1,U2,S2,V2,B,C
     gc.collect()
 
@@ -1817,6 +1822,7 @@ def atrg2dy(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,a
 
     step = gtn.show_progress(step,process_length,process_name+" "+"<"+gtn.current_memory_display()+">",color=process_color,time=time.time()-s00)
     U, S, V = M.svd("ai|bk",intermediate_dcut)
+    del M
 
     sqrtS = gtn.sqrt(S)
     Y = gtn.einsum('abx,xc->abc',U,sqrtS)
@@ -1867,15 +1873,15 @@ def atrg2dy(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,a
     else :
         return T, Tnorm
 
-def atrg2dx(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False):
+def atrg2dx(T1,T2,dcut=64,intermediate_dcut=None,iternum=None,error_test=False,implicit_svd=False):
     T1 = gtn.einsum('ijkl->jikl',T1)
     T1 = gtn.einsum('jikl->jilk',T1)
     T2 = gtn.einsum('ijkl->jikl',T2)
     T2 = gtn.einsum('jikl->jilk',T2)
     if error_test :
-        T, Tnorm, err = atrg2dy(T1,T2,dcut,intermediate_dcut,iternum,True,alignment="x")
+        T, Tnorm, err = atrg2dy(T1,T2,dcut,intermediate_dcut,iternum,True,alignment="x",implicit_svd=implicit_svd)
     else:
-        T, Tnorm = atrg2dy(T1,T2,dcut,intermediate_dcut,iternum,alignment="x")
+        T, Tnorm = atrg2dy(T1,T2,dcut,intermediate_dcut,iternum,alignment="x",implicit_svd=implicit_svd)
     T = gtn.einsum('ijkl->jikl',T)
     T = gtn.einsum('jikl->jilk',T)
     if error_test :
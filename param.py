@@ -1,20 +1,45 @@
 import numpy as np
-import math
 
-arr_gparity=np.array([0,1,1,2,1,2,2,3,1,2,2,3,2,3,3,4,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,1,2,2,3,2,3,3,4,2,3,3,4,3,4,4,5,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,2,3,3,4,3,4,4,5,3,4,4,5,4,5,5,6,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,3,4,4,5,4,5,5,6,4,5,5,6,5,6,6,7,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,4,5,5,6,5,6,6,7,5,6,6,7,6,7,7,8,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,5,6,6,7,6,7,7,8,6,7,7,8,7,8,8,9,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,6,7,7,8,7,8,8,9,7,8,8,9,8,9,9,10,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,7,8,8,9,8,9,9,10,8,9,9,10,9,10,10,11,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,8,9,9,10,9,10,10,11,9,10,10,11,10,11,11,12,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,9,10,10,11,10,11,11,12,10,11,11,12,11,12,12,13,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,10,11,11,12,11,12,12,13,11,12,12,13,12,13,13,14,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,11,12,12,13,12,13,13,14,12,13,13,14,13,14,14,15,12,13,13,14,13,14,14,15,13,14,14,15,14,15,15,16])
-arr_encoder=np.array([0,1,3,2,5,4,6,7,9,8,10,11,12,13,15,14,17,16,18,19,20,21,23,22,24,25,27,26,29,28,30,31,33,32,34,35,36,37,39,38,40,41,43,42,45,44,46,47,48,49,51,50,53,52,54,55,57,56,58,59,60,61,63,62,65,64,66,67,68,69,71,70,72,73,75,74,77,76,78,79,80,81,83,82,85,84,86,87,89,88,90,91,92,93,95,94,96,97,99,98,101,100,102,103,105,104,106,107,108,109,111,110,113,112,114,115,116,117,119,118,120,121,123,122,125,124,126,127,129,128,130,131,132,133,135,134,136,137,139,138,141,140,142,143,144,145,147,146,149,148,150,151,153,152,154,155,156,157,159,158,160,161,163,162,165,164,166,167,169,168,170,171,172,173,175,174,177,176,178,179,180,181,183,182,184,185,187,186,189,188,190,191,192,193,195,194,197,196,198,199,201,200,202,203,204,205,207,206,209,208,210,211,212,213,215,214,216,217,219,218,221,220,222,223,225,224,226,227,228,229,231,230,232,233,235,234,237,236,238,239,240,241,243,242,245,244,246,247,249,248,250,251,252,253,255,254,257,256,258,259,260,261,263,262,264,265,267,266,269,268,270,271,272,273,275,274,277,276,278,279,281,280,282,283,284,285,287,286,288,289,291,290,293,292,294,295,297,296,298,299,300,301,303,302,305,304,306,307,308,309,311,310,312,313,315,314,317,316,318,319,320,321,323,322,325,324,326,327,329,328,330,331,332,333,335,334,337,336,338,339,340,341,343,342,344,345,347,346,349,348,350,351,353,352,354,355,356,357,359,358,360,361,363,362,365,364,366,367,368,369,371,370,373,372,374,375,377,376,378,379,380,381,383,382,384,385,387,386,389,388,390,391,393,392,394,395,396,397,399,398,401,400,402,403,404,405,407,406,408,409,411,410,413,412,414,415,417,416,418,419,420,421,423,422,424,425,427,426,429,428,430,431,432,433,435,434,437,436,438,439,441,440,442,443,444,445,447,446,449,448,450,451,452,453,455,454,456,457,459,458,461,460,462,463,464,465,467,466,469,468,470,471,473,472,474,475,476,477,479,478,480,481,483,482,485,484,486,487,489,488,490,491,492,493,495,494,497,496,498,499,500,501,503,502,504,505,507,506,509,508,510,511,513,512,514,515,516,517,519,518,520,521,523,522,525,524,526,527,528,529,531,530,533,532,534,535,537,536,538,539,540,541,543,542,544,545,547,546,549,548,550,551,553,552,554,555,556,557,559,558,561,560,562,563,564,565,567,566,568,569,571,570,573,572,574,575,576,577,579,578,581,580,582,583,585,584,586,587,588,589,591,590,593,592,594,595,596,597,599,598,600,601,603,602,605,604,606,607,609,608,610,611,612,613,615,614,616,617,619,618,621,620,622,623,624,625,627,626,629,628,630,631,633,632,634,635,636,637,639,638,640,641,643,642,645,644,646,647,649,648,650,651,652,653,655,654,657,656,658,659,660,661,663,662,664,665,667,666,669,668,670,671,673,672,674,675,676,677,679,678,680,681,683,682,685,684,686,687,688,689,691,690,693,692,694,695,697,696,698,699,700,701,703,702,705,704,706,707,708,709,711,710,712,713,715,714,717,716,718,719,720,721,723,722,725,724,726,727,729,728,730,731,732,733,735,734,736,737,739,738,741,740,742,743,745,744,746,747,748,749,751,750,753,752,754,755,756,757,759,758,760,761,763,762,765,764,766,767,768,769,771,770,773,772,774,775,777,776,778,779,780,781,783,782,785,784,786,787,788,789,791,790,792,793,795,794,797,796,798,799,801,800,802,803,804,805,807,806,808,809,811,810,813,812,814,815,816,817,819,818,821,820,822,823,825,824,826,827,828,829,831,830,833,832,834,835,836,837,839,838,840,841,843,842,845,844,846,847,848,849,851,850,853,852,854,855,857,856,858,859,860,861,863,862,864,865,867,866,869,868,870,871,873,872,874,875,876,877,879,878,881,880,882,883,884,885,887,886,888,889,891,890,893,892,894,895,897,896,898,899,900,901,903,902,904,905,907,906,909,908,910,911,912,913,915,914,917,916,918,919,921,920,922,923,924,925,927,926,928,929,931,930,933,932,934,935,937,936,938,939,940,941,943,942,945,944,946,947,948,949,951,950,952,953,955,954,957,956,958,959,960,961,963,962,965,964,966,967,969,968,970,971,972,973,975,974,977,976,978,979,980,981,983,982,984,985,987,986,989,988,990,991,993,992,994,995,996,997,999,998,1000,1001,1003,1002,1005,1004,1006,1007,1008,1009,1011,1010,1013,1012,1014,1015,1017,1016,1018,1019,1020,1021,1023,1022,1025,1024,1026,1027,1028,1029,1031,1030,1032,1033,1035,1034,1037,1036,1038,1039,1040,1041,1043,1042,1045,1044,1046,1047,1049,1048,1050,1051,1052,1053,1055,1054,1056,1057,1059,1058,1061,1060,1062,1063,1065,1064,1066,1067,1068,1069,1071,1070,1073,1072,1074,1075,1076,1077,1079,1078,1080,1081,1083,1082,1085,1084,1086,1087,1088,1089,1091,1090,1093,1092,1094,1095,1097,1096,1098,1099,1100,1101,1103,1102,1105,1104,1106,1107,1108,1109,1111,1110,1112,1113,1115,1114,1117,1116,1118,1119,1121,1120,1122,1123,1124,1125,1127,1126,1128,1129,1131,1130,1133,1132,1134,1135,1136,1137,1139,1138,1141,1140,1142,1143,1145,1144,1146,1147,1148,1149,1151,1150,1152,1153,1155,1154,1157,1156,1158,1159,1161,1160,1162,1163,1164,1165,1167,1166,1169,1168,1170,1171,1172,1173,1175,1174,1176,1177,1179,1178,1181,1180,1182,1183,1185,1184,1186,1187,1188,1189,1191,1190,1192,1193,1195,1194,1197,1196,1198,1199,1200,1201,1203,1202,1205,1204,1206,1207,1209,1208,1210,1211,1212,1213,1215,1214,1217,1216,1218,1219,1220,1221,1223,1222,1224,1225,1227,1226,1229,1228,1230,1231,1232,1233,1235,1234,1237,1236,1238,1239,1241,1240,1242,1243,1244,1245,1247,1246,1248,1249,1251,1250,1253,1252,1254,1255,1257,1256,1258,1259,1260,1261,1263,1262,1265,1264,1266,1267,1268,1269,1271,1270,1272,1273,1275,1274,1277,1276,1278,1279,1280,1281,1283,1282,1285,1284,1286,1287,1289,1288,1290,1291,1292,1293,1295,1294,1297,1296,1298,1299,1300,1301,1303,1302,1304,1305,1307,1306,1309,1308,1310,1311,1313,1312,1314,1315,1316,1317,1319,1318,1320,1321,1323,1322,1325,1324,1326,1327,1328,1329,1331,1330,1333,1332,1334,1335,1337,1336,1338,1339,1340,1341,1343,1342,1345,1344,1346,1347,1348,1349,1351,1350,1352,1353,1355,1354,1357,1356,1358,1359,1360,1361,1363,1362,1365,1364,1366,1367,1369,1368,1370,1371,1372,1373,1375,1374,1376,1377,1379,1378,1381,1380,1382,1383,1385,1384,1386,1387,1388,1389,1391,1390,1393,1392,1394,1395,1396,1397,1399,1398,1400,1401,1403,1402,1405,1404,1406,1407,1409,1408,1410,1411,1412,1413,1415,1414,1416,1417,1419,1418,1421,1420,1422,1423,1424,1425,1427,1426,1429,1428,1430,1431,1433,1432,1434,1435,1436,1437,1439,1438,1440,1441,1443,1442,1445,1444,1446,1447,1449,1448,1450,1451,1452,1453,1455,1454,1457,1456,1458,1459,1460,1461,1463,1462,1464,1465,1467,1466,1469,1468,1470,1471,1472,1473,1475,1474,1477,1476,1478,1479,1481,1480,1482,1483,1484,1485,1487,1486,1489,1488,1490,1491,1492,1493,1495,1494,1496,1497,1499,1498,1501,1500,1502,1503,1505,1504,1506,1507,1508,1509,1511,1510,1512,1513,1515,1514,1517,1516,1518,1519,1520,1521,1523,1522,1525,1524,1526,1527,1529,1528,1530,1531,1532,1533,1535,1534,1536,1537,1539,1538,1541,1540,1542,1543,1545,1544,1546,1547,1548,1549,1551,1550,1553,1552,1554,1555,1556,1557,1559,1558,1560,1561,1563,1562,1565,1564,1566,1567,1569,1568,1570,1571,1572,1573,1575,1574,1576,1577,1579,1578,1581,1580,1582,1583,1584,1585,1587,1586,1589,1588,1590,1591,1593,1592,1594,1595,1596,1597,1599,1598,1601,1600,1602,1603,1604,1605,1607,1606,1608,1609,1611,1610,1613,1612,1614,1615,1616,1617,1619,1618,1621,1620,1622,1623,1625,1624,1626,1627,1628,1629,1631,1630,1632,1633,1635,1634,1637,1636,1638,1639,1641,1640,1642,1643,1644,1645,1647,1646,1649,1648,1650,1651,1652,1653,1655,1654,1656,1657,1659,1658,1661,1660,1662,1663,1665,1664,1666,1667,1668,1669,1671,1670,1672,1673,1675,1674,1677,1676,1678,1679,1680,1681,1683,1682,1685,1684,1686,1687,1689,1688,1690,1691,1692,1693,1695,1694,1696,1697,1699,1698,1701,1700,1702,1703,1705,1704,1706,1707,1708,1709,1711,1710,1713,1712,1714,1715,1716,1717,1719,1718,1720,1721,1723,1722,1725,1724,1726,1727,1728,1729,1731,1730,1733,1732,1734,1735,1737,1736,1738,1739,1740,1741,1743,1742,1745,1744,1746,1747,1748,1749,1751,1750,1752,1753,1755,1754,1757,1756,1758,1759,1761,1760,1762,1763,1764,1765,1767,1766,1768,1769,1771,1770,1773,1772,1774,1775,1776,1777,1779,1778,1781,1780,1782,1783,1785,1784,1786,1787,1788,1789,1791,1790,1793,1792,1794,1795,1796,1797,1799,1798,1800,1801,1803,1802,1805,1804,1806,1807,1808,1809,1811,1810,1813,1812,1814,1815,1817,1816,1818,1819,1820,1821,1823,1822,1824,1825,1827,1826,1829,1828,1830,1831,1833,1832,1834,1835,1836,1837,1839,1838,1841,1840,1842,1843,1844,1845,1847,1846,1848,1849,1851,1850,1853,1852,1854,1855,1856,1857,1859,1858,1861,1860,1862,1863,1865,1864,1866,1867,1868,1869,1871,1870,1873,1872,1874,1875,1876,1877,1879,1878,1880,1881,1883,1882,1885,1884,1886,1887,1889,1888,1890,1891,1892,1893,1895,1894,1896,1897,1899,1898,1901,1900,1902,1903,1904,1905,1907,1906,1909,1908,1910,1911,1913,1912,1914,1915,1916,1917,1919,1918,1920,1921,1923,1922,1925,1924,1926,1927,1929,1928,1930,1931,1932,1933,1935,1934,1937,1936,1938,1939,1940,1941,1943,1942,1944,1945,1947,1946,1949,1948,1950,1951,1953,1952,1954,1955,1956,1957,1959,1958,1960,1961,1963,1962,1965,1964,1966,1967,1968,1969,1971,1970,1973,1972,1974,1975,1977,1976,1978,1979,1980,1981,1983,1982,1985,1984,1986,1987,1988,1989,1991,1990,1992,1993,1995,1994,1997,1996,1998,1999,2000,2001,2003,2002,2005,2004,2006,2007,2009,2008,2010,2011,2012,2013,2015,2014,2016,2017,2019,2018,2021,2020,2022,2023,2025,2024,2026,2027,2028,2029,2031,2030,2033,2032,2034,2035,2036,2037,2039,2038,2040,2041,2043,2042,2045,2044,2046,2047,2049,2048,2050,2051,2052,2053,2055,2054,2056,2057,2059,2058,2061,2060,2062,2063,2064,2065,2067,2066,2069,2068,2070,2071,2073,2072,2074,2075,2076,2077,2079,2078,2080,2081,2083,2082,2085,2084,2086,2087,2089,2088,2090,2091,2092,2093,2095,2094,2097,2096,2098,2099,2100,2101,2103,2102,2104,2105,2107,2106,2109,2108,2110,2111,2112,2113,2115,2114,2117,2116,2118,2119,2121,2120,2122,2123,2124,2125,2127,2126,2129,2128,2130,2131,2132,2133,2135,2134,2136,2137,2139,2138,2141,2140,2142,2143,2145,2144,2146,2147,2148,2149,2151,2150,2152,2153,2155,2154,2157,2156,2158,2159,2160,2161,2163,2162,2165,2164,2166,2167,2169,2168,2170,2171,2172,2173,2175,2174,2176,2177,2179,2178,2181,2180,2182,2183,2185,2184,2186,2187,2188,2189,2191,2190,2193,2192,2194,2195,2196,2197,2199,2198,2200,2201,2203,2202,2205,2204,2206,2207,2209,2208,2210,2211,2212,2213,2215,2214,2216,2217,2219,2218,2221,2220,2222,2223,2224,2225,2227,2226,2229,2228,2230,2231,2233,2232,2234,2235,2236,2237,2239,2238,2241,2240,2242,2243,2244,2245,2247,2246,2248,2249,2251,2250,2253,2252,2254,2255,2256,2257,2259,2258,2261,2260,2262,2263,2265,2264,2266,2267,2268,2269,2271,2270,2272,2273,2275,2274,2277,2276,2278,2279,2281,2280,2282,2283,2284,2285,2287,2286,2289,2288,2290,2291,2292,2293,2295,2294,2296,2297,2299,2298,2301,2300,2302,2303,2304,2305,2307,2306,2309,2308,2310,2311,2313,2312,2314,2315,2316,2317,2319,2318,2321,2320,2322,2323,2324,2325,2327,2326,2328,2329,2331,2330,2333,2332,2334,2335,2337,2336,2338,2339,2340,2341,2343,2342,2344,2345,2347,2346,2349,2348,2350,2351,2352,2353,2355,2354,2357,2356,2358,2359,2361,2360,2362,2363,2364,2365,2367,2366,2369,2368,2370,2371,2372,2373,2375,2374,2376,2377,2379,2378,2381,2380,2382,2383,2384,2385,2387,2386,2389,2388,2390,2391,2393,2392,2394,2395,2396,2397,2399,2398,2400,2401,2403,2402,2405,2404,2406,2407,2409,2408,2410,2411,2412,2413,2415,2414,2417,2416,2418,2419,2420,2421,2423,2422,2424,2425,2427,2426,2429,2428,2430,2431,2433,2432,2434,2435,2436,2437,2439,2438,2440,2441,2443,2442,2445,2444,2446,2447,2448,2449,2451,2450,2453,2452,2454,2455,2457,2456,2458,2459,2460,2461,2463,2462,2464,2465,2467,2466,2469,2468,2470,2471,2473,2472,2474,2475,2476,2477,2479,2478,2481,2480,2482,2483,2484,2485,2487,2486,2488,2489,2491,2490,2493,2492,2494,2495,2496,2497,2499,2498,2501,2500,2502,2503,2505,2504,2506,2507,2508,2509,2511,2510,2513,2512,2514,2515,2516,2517,2519,2518,2520,2521,2523,2522,2525,2524,2526,2527,2529,2528,2530,2531,2532,2533,2535,2534,2536,2537,2539,2538,2541,2540,2542,2543,2544,2545,2547,2546,2549,2548,2550,2551,2553,2552,2554,2555,2556,2557,2559,2558,2560,2561,2563,2562,2565,2564,2566,2567,2569,2568,2570,2571,2572,2573,2575,2574,2577,2576,2578,2579,2580,2581,2583,2582,2584,2585,2587,2586,2589,2588,2590,2591,2593,2592,2594,2595,2596,2597,2599,2598,2600,2601,2603,2602,2605,2604,2606,2607,2608,2609,2611,2610,2613,2612,2614,2615,2617,2616,2618,2619,2620,2621,2623,2622,2625,2624,2626,2627,2628,2629,2631,2630,2632,2633,2635,2634,2637,2636,2638,2639,2640,2641,2643,2642,2645,2644,2646,2647,2649,2648,2650,2651,2652,2653,2655,2654,2656,2657,2659,2658,2661,2660,2662,2663,2665,2664,2666,2667,2668,2669,2671,2670,2673,2672,2674,2675,2676,2677,2679,2678,2680,2681,2683,2682,2685,2684,2686,2687,2689,2688,2690,2691,2692,2693,2695,2694,2696,2697,2699,2698,2701,2700,2702,2703,2704,2705,2707,2706,2709,2708,2710,2711,2713,2712,2714,2715,2716,2717,2719,2718,2720,2721,2723,2722,2725,2724,2726,2727,2729,2728,2730,2731,2732,2733,2735,2734,2737,2736,2738,2739,2740,2741,2743,2742,2744,2745,2747,2746,2749,2748,2750,2751,2752,2753,2755,2754,2757,2756,2758,2759,2761,2760,2762,2763,2764,2765,2767,2766,2769,2768,2770,2771,2772,2773,2775,2774,2776,2777,2779,2778,2781,2780,2782,2783,2785,2784,2786,2787,2788,2789,2791,2790,2792,2793,2795,2794,2797,2796,2798,2799,2800,2801,2803,2802,2805,2804,2806,2807,2809,2808,2810,2811,2812,2813,2815,2814,2817,2816,2818,2819,2820,2821,2823,2822,2824,2825,2827,2826,2829,2828,2830,2831,2832,2833,2835,2834,2837,2836,2838,2839,2841,2840,2842,2843,2844,2845,2847,2846,2848,2849,2851,2850,2853,2852,2854,2855,2857,2856,2858,2859,2860,2861,2863,2862,2865,2864,2866,2867,2868,2869,2871,2870,2872,2873,2875,2874,2877,2876,2878,2879,2880,2881,2883,2882,2885,2884,2886,2887,2889,2888,2890,2891,2892,2893,2895,2894,2897,2896,2898,2899,2900,2901,2903,2902,2904,2905,2907,2906,2909,2908,2910,2911,2913,2912,2914,2915,2916,2917,2919,2918,2920,2921,2923,2922,2925,2924,2926,2927,2928,2929,2931,2930,2933,2932,2934,2935,2937,2936,2938,2939,2940,2941,2943,2942,2944,2945,2947,2946,2949,2948,2950,2951,2953,2952,2954,2955,2956,2957,2959,2958,2961,2960,2962,2963,2964,2965,2967,2966,2968,2969,2971,2970,2973,2972,2974,2975,2977,2976,2978,2979,2980,2981,2983,2982,2984,2985,2987,2986,2989,2988,2990,2991,2992,2993,2995,2994,2997,2996,2998,2999,3001,3000,3002,3003,3004,3005,3007,3006,3009,3008,3010,3011,3012,3013,3015,3014,3016,3017,3019,3018,3021,3020,3022,3023,3024,3025,3027,3026,3029,3028,3030,3031,3033,3032,3034,3035,3036,3037,3039,3038,3040,3041,3043,3042,3045,3044,3046,3047,3049,3048,3050,3051,3052,3053,3055,3054,3057,3056,3058,3059,3060,3061,3063,3062,3064,3065,3067,3066,3069,3068,3070,3071,3072,3073,3075,3074,3077,3076,3078,3079,3081,3080,3082,3083,3084,3085,3087,3086,3089,3088,3090,3091,3092,3093,3095,3094,3096,3097,3099,3098,3101,3100,3102,3103,3105,3104,3106,3107,3108,3109,3111,3110,3112,3113,3115,3114,3117,3116,3118,3119,3120,3121,3123,3122,3125,3124,3126,3127,3129,3128,3130,3131,3132,3133,3135,3134,3137,3136,3138,3139,3140,3141,3143,3142,3144,3145,3147,3146,3149,3148,3150,3151,3152,3153,3155,3154,3157,3156,3158,3159,3161,3160,3162,3163,3164,3165,3167,3166,3168,3169,3171,3170,3173,3172,3174,3175,3177,3176,3178,3179,3180,3181,3183,3182,3185,3184,3186,3187,3188,3189,3191,3190,3192,3193,3195,3194,3197,3196,3198,3199,3201,3200,3202,3203,3204,3205,3207,3206,3208,3209,3211,3210,3213,3212,3214,3215,3216,3217,3219,3218,3221,3220,3222,3223,3225,3224,3226,3227,3228,3229,3231,3230,3232,3233,3235,3234,3237,3236,3238,3239,3241,3240,3242,3243,3244,3245,3247,3246,3249,3248,3250,3251,3252,3253,3255,3254,3256,3257,3259,3258,3261,3260,3262,3263,3264,3265,3267,3266,3269,3268,3270,3271,3273,3272,3274,3275,3276,3277,3279,3278,3281,3280,3282,3283,3284,3285,3287,3286,3288,3289,3291,3290,3293,3292,3294,3295,3297,3296,3298,3299,3300,3301,3303,3302,3304,3305,3307,3306,3309,3308,3310,3311,3312,3313,3315,3314,3317,3316,3318,3319,3321,3320,3322,3323,3324,3325,3327,3326,3329,3328,3330,3331,3332,3333,3335,3334,3336,3337,3339,3338,3341,3340,3342,3343,3344,3345,3347,3346,3349,3348,3350,3351,3353,3352,3354,3355,3356,3357,3359,3358,3360,3361,3363,3362,3365,3364,3366,3367,3369,3368,3370,3371,3372,3373,3375,3374,3377,3376,3378,3379,3380,3381,3383,3382,3384,3385,3387,3386,3389,3388,3390,3391,3392,3393,3395,3394,3397,3396,3398,3399,3401,3400,3402,3403,3404,3405,3407,3406,3409,3408,3410,3411,3412,3413,3415,3414,3416,3417,3419,3418,3421,3420,3422,3423,3425,3424,3426,3427,3428,3429,3431,3430,3432,3433,3435,3434,3437,3436,3438,3439,3440,3441,3443,3442,3445,3444,3446,3447,3449,3448,3450,3451,3452,3453,3455,3454,3456,3457,3459,3458,3461,3460,3462,3463,3465,3464,3466,3467,3468,3469,3471,3470,3473,3472,3474,3475,3476,3477,3479,3478,3480,3481,3483,3482,3485,3484,3486,3487,3489,3488,3490,3491,3492,3493,3495,3494,3496,3497,3499,3498,3501,3500,3502,3503,3504,3505,3507,3506,3509,3508,3510,3511,3513,3512,3514,3515,3516,3517,3519,3518,3521,3520,3522,3523,3524,3525,3527,3526,3528,3529,3531,3530,3533,3532,3534,3535,3536,3537,3539,3538,3541,3540,3542,3543,3545,3544,3546,3547,3548,3549,3551,3550,3552,3553,3555,3554,3557,3556,3558,3559,3561,3560,3562,3563,3564,3565,3567,3566,3569,3568,3570,3571,3572,3573,3575,3574,3576,3577,3579,3578,3581,3580,3582,3583,3585,3584,3586,3587,3588,3589,3591,3590,3592,3593,3595,3594,3597,3596,3598,3599,3600,3601,3603,3602,3605,3604,3606,3607,3609,3608,3610,3611,3612,3613,3615,3614,3616,3617,3619,3618,3621,3620,3622,3623,3625,3624,3626,3627,3628,3629,3631,3630,3633,3632,3634,3635,3636,3637,3639,3638,3640,3641,3643,3642,3645,3644,3646,3647,3648,3649,3651,3650,3653,3652,3654,3655,3657,3656,3658,3659,3660,3661,3663,3662,3665,3664,3666,3667,3668,3669,3671,3670,3672,3673,3675,3674,3677,3676,3678,3679,3681,3680,3682,3683,3684,3685,3687,3686,3688,3689,3691,3690,3693,3692,3694,3695,3696,3697,3699,3698,3701,3700,3702,3703,3705,3704,3706,3707,3708,3709,3711,3710,3712,3713,3715,3714,3717,3716,3718,3719,3721,3720,3722,3723,3724,3725,3727,3726,3729,3728,3730,3731,3732,3733,3735,3734,3736,3737,3739,3738,3741,3740,3742,3743,3745,3744,3746,3747,3748,3749,3751,3750,3752,3753,3755,3754,3757,3756,3758,3759,3760,3761,3763,3762,3765,3764,3766,3767,3769,3768,3770,3771,3772,3773,3775,3774,3777,3776,3778,3779,3780,3781,3783,3782,3784,3785,3787,3786,3789,3788,3790,3791,3792,3793,3795,3794,3797,3796,3798,3799,3801,3800,3802,3803,3804,3805,3807,3806,3808,3809,3811,3810,3813,3812,3814,3815,3817,3816,3818,3819,3820,3821,3823,3822,3825,3824,3826,3827,3828,3829,3831,3830,3832,3833,3835,3834,3837,3836,3838,3839,3840,3841,3843,3842,3845,3844,3846,3847,3849,3848,3850,3851,3852,3853,3855,3854,3857,3856,3858,3859,3860,3861,3863,3862,3864,3865,3867,3866,3869,3868,3870,3871,3873,3872,3874,3875,3876,3877,3879,3878,3880,3881,3883,3882,3885,3884,3886,3887,3888,3889,3891,3890,3893,3892,3894,3895,3897,3896,3898,3899,3900,3901,3903,3902,3905,3904,3906,3907,3908,3909,3911,3910,3912,3913,3915,3914,3917,3916,3918,3919,3920,3921,3923,3922,3925,3924,3926,3927,3929,3928,3930,3931,3932,3933,3935,3934,3936,3937,3939,3938,3941,3940,3942,3943,3945,3944,3946,3947,3948,3949,3951,3950,3953,3952,3954,3955,3956,3957,3959,3958,3960,3961,3963,3962,3965,3964,3966,3967,3969,3968,3970,3971,3972,3973,3975,3974,3976,3977,3979,3978,3981,3980,3982,3983,3984,3985,3987,3986,3989,3988,3990,3991,3993,3992,3994,3995,3996,3997,3999,3998,4000,4001,4003,4002,4005,4004,4006,4007,4009,4008,4010,4011,4012,4013,4015,4014,4017,4016,4018,4019,4020,4021,4023,4022,4024,4025,4027,4026,4029,4028,4030,4031,4032,4033,4035,4034,4037,4036,4038,4039,4041,4040,4042,4043,4044,4045,4047,4046,4049,4048,4050,4051,4052,4053,4055,4054,4056,4057,4059,4058,4061,4060,4062,4063,4065,4064,4066,4067,4068,4069,4071,4070,4072,4073,4075,4074,4077,4076,4078,4079,4080,4081,4083,4082,4085,4084,4086,4087,4089,4088,4090,4091,4092,4093,4095,4094,4097,4096,4098,4099,4100,4101,4103,4102,4104,4105,4107,4106,4109,4108,4110,4111,4112,4113,4115,4114,4117,4116,4118,4119,4121,4120,4122,4123,4124,4125,4127,4126,4128,4129,4131,4130,4133,4132,4134,4135,4137,4136,4138,4139,4140,4141,4143,4142,4145,4144,4146,4147,4148,4149,4151,4150,4152,4153,4155,4154,4157,4156,4158,4159,4160,4161,4163,4162,4165,4164,4166,4167,4169,4168,4170,4171,4172,4173,4175,4174,4177,4176,4178,4179,4180,4181,4183,4182,4184,4185,4187,4186,4189,4188,4190,4191,4193,4192,4194,4195,4196,4197,4199,4198,4200,4201,4203,4202,4205,4204,4206,4207,4208,4209,4211,4210,4213,4212,4214,4215,4217,4216,4218,4219,4220,4221,4223,4222,4224,4225,4227,4226,4229,4228,4230,4231,4233,4232,4234,4235,4236,4237,4239,4238,4241,4240,4242,4243,4244,4245,4247,4246,4248,4249,4251,4250,4253,4252,4254,4255,4257,4256,4258,4259,4260,4261,4263,4262,4264,4265,4267,4266,4269,4268,4270,4271,4272,4273,4275,4274,4277,4276,4278,4279,4281,4280,4282,4283,4284,4285,4287,4286,4289,4288,4290,4291,4292,4293,4295,4294,4296,4297,4299,4298,4301,4300,4302,4303,4304,4305,4307,4306,4309,4308,4310,4311,4313,4312,4314,4315,4316,4317,4319,4318,4320,4321,4323,4322,4325,4324,4326,4327,4329,4328,4330,4331,4332,4333,4335,4334,4337,4336,4338,4339,4340,4341,4343,4342,4344,4345,4347,4346,4349,4348,4350,4351,4352,4353,4355,4354,4357,4356,4358,4359,4361,4360,4362,4363,4364,4365,4367,4366,4369,4368,4370,4371,4372,4373,4375,4374,4376,4377,4379,4378,4381,4380,4382,4383,4385,4384,4386,4387,4388,4389,4391,4390,4392,4393,4395,4394,4397,4396,4398,4399,4400,4401,4403,4402,4405,4404,4406,4407,4409,4408,4410,4411,4412,4413,4415,4414,4417,4416,4418,4419,4420,4421,4423,4422,4424,4425,4427,4426,4429,4428,4430,4431,4432,4433,4435,4434,4437,4436,4438,4439,4441,4440,4442,4443,4444,4445,4447,4446,4448,4449,4451,4450,4453,4452,4454,4455,4457,4456,4458,4459,4460,4461,4463,4462,4465,4464,4466,4467,4468,4469,4471,4470,4472,4473,4475,4474,4477,4476,4478,4479,4481,4480,4482,4483,4484,4485,4487,4486,4488,4489,4491,4490,4493,4492,4494,4495,4496,4497,4499,4498,4501,4500,4502,4503,4505,4504,4506,4507,4508,4509,4511,4510,4512,4513,4515,4514,4517,4516,4518,4519,4521,4520,4522,4523,4524,4525,4527,4526,4529,4528,4530,4531,4532,4533,4535,4534,4536,4537,4539,4538,4541,4540,4542,4543,4544,4545,4547,4546,4549,4548,4550,4551,4553,4552,4554,4555,4556,4557,4559,4558,4561,4560,4562,4563,4564,4565,4567,4566,4568,4569,4571,4570,4573,4572,4574,4575,4577,4576,4578,4579,4580,4581,4583,4582,4584,4585,4587,4586,4589,4588,4590,4591,4592,4593,4595,4594,4597,4596,4598,4599,4601,4600,4602,4603,4604,4605,4607,4606,4608,4609,4611,4610,4613,4612,4614,4615,4617,4616,4618,4619,4620,4621,4623,4622,4625,4624,4626,4627,4628,4629,4631,4630,4632,4633,4635,4634,4637,4636,4638,4639,4641,4640,4642,4643,4644,4645,4647,4646,4648,4649,4651,4650,4653,4652,4654,4655,4656,4657,4659,4658,4661,4660,4662,4663,4665,4664,4666,4667,4668,4669,4671,4670,4673,4672,4674,4675,4676,4677,4679,4678,4680,4681,4683,4682,4685,4684,4686,4687,4688,4689,4691,4690,4693,4692,4694,4695,4697,4696,4698,4699,4700,4701,4703,4702,4704,4705,4707,4706,4709,4708,4710,4711,4713,4712,4714,4715,4716,4717,4719,4718,4721,4720,4722,4723,4724,4725,4727,4726,4728,4729,4731,4730,4733,4732,4734,4735,4737,4736,4738,4739,4740,4741,4743,4742,4744,4745,4747,4746,4749,4748,4750,4751,4752,4753,4755,4754,4757,4756,4758,4759,4761,4760,4762,4763,4764,4765,4767,4766,4768,4769,4771,4770,4773,4772,4774,4775,4777,4776,4778,4779,4780,4781,4783,4782,4785,4784,4786,4787,4788,4789,4791,4790,4792,4793,4795,4794,4797,4796,4798,4799,4800,4801,4803,4802,4805,4804,4806,4807,4809,4808,4810,4811,4812,4813,4815,4814,4817,4816,4818,4819,4820,4821,4823,4822,4824,4825,4827,4826,4829,4828,4830,4831,4833,4832,4834,4835,4836,4837,4839,4838,4840,4841,4843,4842,4845,4844,4846,4847,4848,4849,4851,4850,4853,4852,4854,4855,4857,4856,4858,4859,4860,4861,4863,4862,4865,4864,4866,4867,4868,4869,4871,4870,4872,4873,4875,4874,4877,4876,4878,4879,4880,4881,4883,4882,4885,4884,4886,4887,4889,4888,4890,4891,4892,4893,4895,4894,4896,4897,4899,4898,4901,4900,4902,4903,4905,4904,4906,4907,4908,4909,4911,4910,4913,4912,4914,4915,4916,4917,4919,4918,4920,4921,4923,4922,4925,4924,4926,4927,4928,4929,4931,4930,4933,4932,4934,4935,4937,4936,4938,4939,4940,4941,4943,4942,4945,4944,4946,4947,4948,4949,4951,4950,4952,4953,4955,4954,4957,4956,4958,4959,4961,4960,4962,4963,4964,4965,4967,4966,4968,4969,4971,4970,4973,4972,4974,4975,4976,4977,4979,4978,4981,4980,4982,4983,4985,4984,4986,4987,4988,4989,4991,4990,4992,4993,4995,4994,4997,4996,4998,4999,5001,5000,5002,5003,5004,5005,5007,5006,5009,5008,5010,5011,5012,5013,5015,5014,5016,5017,5019,5018,5021,5020,5022,5023,5025,5024,5026,5027,5028,5029,5031,5030,5032,5033,5035,5034,5037,5036,5038,5039,5040,5041,5043,5042,5045,5044,5046,5047,5049,5048,5050,5051,5052,5053,5055,5054,5057,5056,5058,5059,5060,5061,5063,5062,5064,5065,5067,5066,5069,5068,5070,5071,5072,5073,5075,5074,5077,5076,5078,5079,5081,5080,5082,5083,5084,5085,5087,5086,5088,5089,5091,5090,5093,5092,5094,5095,5097,5096,5098,5099,5100,5101,5103,5102,5105,5104,5106,5107,5108,5109,5111,5110,5112,5113,5115,5114,5117,5116,5118,5119,5120,5121,5123,5122,5125,5124,5126,5127,5129,5128,5130,5131,5132,5133,5135,5134,5137,5136,5138,5139,5140,5141,5143,5142,5144,5145,5147,5146,5149,5148,5150,5151,5153,5152,5154,5155,5156,5157,5159,5158,5160,5161,5163,5162,5165,5164,5166,5167,5168,5169,5171,5170,5173,5172,5174,5175,5177,5176,5178,5179,5180,5181,5183,5182,5185,5184,5186,5187,5188,5189,5191,5190,5192,5193,5195,5194,5197,5196,5198,5199,5200,5201,5203,5202,5205,5204,5206,5207,5209,5208,5210,5211,5212,5213,5215,5214,5216,5217,5219,5218,5221,5220,5222,5223,5225,5224,5226,5227,5228,5229,5231,5230,5233,5232,5234,5235,5236,5237,5239,5238,5240,5241,5243,5242,5245,5244,5246,5247,5249,5248,5250,5251,5252,5253,5255,5254,5256,5257,5259,5258,5261,5260,5262,5263,5264,5265,5267,5266,5269,5268,5270,5271,5273,5272,5274,5275,5276,5277,5279,5278,5280,5281,5283,5282,5285,5284,5286,5287,5289,5288,5290,5291,5292,5293,5295,5294,5297,5296,5298,5299,5300,5301,5303,5302,5304,5305,5307,5306,5309,5308,5310,5311,5312,5313,5315,5314,5317,5316,5318,5319,5321,5320,5322,5323,5324,5325,5327,5326,5329,5328,5330,5331,5332,5333,5335,5334,5336,5337,5339,5338,5341,5340,5342,5343,5345,5344,5346,5347,5348,5349,5351,5350,5352,5353,5355,5354,5357,5356,5358,5359,5360,5361,5363,5362,5365,5364,5366,5367,5369,5368,5370,5371,5372,5373,5375,5374,5377,5376,5378,5379,5380,5381,5383,5382,5384,5385,5387,5386,5389,5388,5390,5391,5392,5393,5395,5394,5397,5396,5398,5399,5401,5400,5402,5403,5404,5405,5407,5406,5408,5409,5411,5410,5413,5412,5414,5415,5417,5416,5418,5419,5420,5421,5423,5422,5425,5424,5426,5427,5428,5429,5431,5430,5432,5433,5435,5434,5437,5436,5438,5439,5440,5441,5443,5442,5445,5444,5446,5447,5449,5448,5450,5451,5452,5453,5455,5454,5457,5456,5458,5459,5460,5461,5463,5462,5464,5465,5467,5466,5469,5468,5470,5471,5473,5472,5474,5475,5476,5477,5479,5478,5480,5481,5483,5482,5485,5484,5486,5487,5488,5489,5491,5490,5493,5492,5494,5495,5497,5496,5498,5499,5500,5501,5503,5502,5504,5505,5507,5506,5509,5508,5510,5511,5513,5512,5514,5515,5516,5517,5519,5518,5521,5520,5522,5523,5524,5525,5527,5526,5528,5529,5531,5530,5533,5532,5534,5535,5537,5536,5538,5539,5540,5541,5543,5542,5544,5545,5547,5546,5549,5548,5550,5551,5552,5553,5555,5554,5557,5556,5558,5559,5561,5560,5562,5563,5564,5565,5567,5566,5569,5568,5570,5571,5572,5573,5575,5574,5576,5577,5579,5578,5581,5580,5582,5583,5584,5585,5587,5586,5589,5588,5590,5591,5593,5592,5594,5595,5596,5597,5599,5598,5600,5601,5603,5602,5605,5604,5606,5607,5609,5608,5610,5611,5612,5613,5615,5614,5617,5616,5618,5619,5620,5621,5623,5622,5624,5625,5627,5626,5629,5628,5630,5631,5633,5632,5634,5635,5636,5637,5639,5638,5640,5641,5643,5642,5645,5644,5646,5647,5648,5649,5651,5650,5653,5652,5654,5655,5657,5656,5658,5659,5660,5661,5663,5662,5664,5665,5667,5666,5669,5668,5670,5671,5673,5672,5674,5675,5676,5677,5679,5678,5681,5680,5682,5683,5684,5685,5687,5686,5688,5689,5691,5690,5693,5692,5694,5695,5696,5697,5699,5698,5701,5700,5702,5703,5705,5704,5706,5707,5708,5709,5711,5710,5713,5712,5714,5715,5716,5717,5719,5718,5720,5721,5723,5722,5725,5724,5726,5727,5729,5728,5730,5731,5732,5733,5735,5734,5736,5737,5739,5738,5741,5740,5742,5743,5744,5745,5747,5746,5749,5748,5750,5751,5753,5752,5754,5755,5756,5757,5759,5758,5760,5761,5763,5762,5765,5764,5766,5767,5769,5768,5770,5771,5772,5773,5775,5774,5777,5776,5778,5779,5780,5781,5783,5782,5784,5785,5787,5786,5789,5788,5790,5791,5793,5792,5794,5795,5796,5797,5799,5798,5800,5801,5803,5802,5805,5804,5806,5807,5808,5809,5811,5810,5813,5812,5814,5815,5817,5816,5818,5819,5820,5821,5823,5822,5825,5824,5826,5827,5828,5829,5831,5830,5832,5833,5835,5834,5837,5836,5838,5839,5840,5841,5843,5842,5845,5844,5846,5847,5849,5848,5850,5851,5852,5853,5855,5854,5856,5857,5859,5858,5861,5860,5862,5863,5865,5864,5866,5867,5868,5869,5871,5870,5873,5872,5874,5875,5876,5877,5879,5878,5880,5881,5883,5882,5885,5884,5886,5887,5888,5889,5891,5890,5893,5892,5894,5895,5897,5896,5898,5899,5900,5901,5903,5902,5905,5904,5906,5907,5908,5909,5911,5910,5912,5913,5915,5914,5917,5916,5918,5919,5921,5920,5922,5923,5924,5925,5927,5926,5928,5929,5931,5930,5933,5932,5934,5935,5936,5937,5939,5938,5941,5940,5942,5943,5945,5944,5946,5947,5948,5949,5951,5950,5953,5952,5954,5955,5956,5957,5959,5958,5960,5961,5963,5962,5965,5964,5966,5967,5968,5969,5971,5970,5973,5972,5974,5975,5977,5976,5978,5979,5980,5981,5983,5982,5984,5985,5987,5986,5989,5988,5990,5991,5993,5992,5994,5995,5996,5997,5999,5998,6001,6000,6002,6003,6004,6005,6007,6006,6008,6009,6011,6010,6013,6012,6014,6015,6017,6016,6018,6019,6020,6021,6023,6022,6024,6025,6027,6026,6029,6028,6030,6031,6032,6033,6035,6034,6037,6036,6038,6039,6041,6040,6042,6043,6044,6045,6047,6046,6048,6049,6051,6050,6053,6052,6054,6055,6057,6056,6058,6059,6060,6061,6063,6062,6065,6064,6066,6067,6068,6069,6071,6070,6072,6073,6075,6074,6077,6076,6078,6079,6080,6081,6083,6082,6085,6084,6086,6087,6089,6088,6090,6091,6092,6093,6095,6094,6097,6096,6098,6099,6100,6101,6103,6102,6104,6105,6107,6106,6109,6108,6110,6111,6113,6112,6114,6115,6116,6117,6119,6118,6120,6121,6123,6122,6125,6124,6126,6127,6128,6129,6131,6130,6133,6132,6134,6135,6137,6136,6138,6139,6140,6141,6143,6142,6144,6145,6147,6146,6149,6148,6150,6151,6153,6152,6154,6155,6156,6157,6159,6158,6161,6160,6162,6163,6164,6165,6167,6166,6168,6169,6171,6170,6173,6172,6174,6175,6177,6176,6178,6179,6180,6181,6183,6182,6184,6185,6187,6186,6189,6188,6190,6191,6192,6193,6195,6194,6197,6196,6198,6199,6201,6200,6202,6203,6204,6205,6207,6206,6209,6208,6210,6211,6212,6213,6215,6214,6216,6217,6219,6218,6221,6220,6222,6223,6224,6225,6227,6226,6229,6228,6230,6231,6233,6232,6234,6235,6236,6237,6239,6238,6240,6241,6243,6242,6245,6244,6246,6247,6249,6248,6250,6251,6252,6253,6255,6254,6257,6256,6258,6259,6260,6261,6263,6262,6264,6265,6267,6266,6269,6268,6270,6271,6273,6272,6274,6275,6276,6277,6279,6278,6280,6281,6283,6282,6285,6284,6286,6287,6288,6289,6291,6290,6293,6292,6294,6295,6297,6296,6298,6299,6300,6301,6303,6302,6304,6305,6307,6306,6309,6308,6310,6311,6313,6312,6314,6315,6316,6317,6319,6318,6321,6320,6322,6323,6324,6325,6327,6326,6328,6329,6331,6330,6333,6332,6334,6335,6336,6337,6339,6338,6341,6340,6342,6343,6345,6344,6346,6347,6348,6349,6351,6350,6353,6352,6354,6355,6356,6357,6359,6358,6360,6361,6363,6362,6365,6364,6366,6367,6369,6368,6370,6371,6372,6373,6375,6374,6376,6377,6379,6378,6381,6380,6382,6383,6384,6385,6387,6386,6389,6388,6390,6391,6393,6392,6394,6395,6396,6397,6399,6398,6401,6400,6402,6403,6404,6405,6407,6406,6408,6409,6411,6410,6413,6412,6414,6415,6416,6417,6419,6418,6421,6420,6422,6423,6425,6424,6426,6427,6428,6429,6431,6430,6432,6433,6435,6434,6437,6436,6438,6439,6441,6440,6442,6443,6444,6445,6447,6446,6449,6448,6450,6451,6452,6453,6455,6454,6456,6457,6459,6458,6461,6460,6462,6463,6464,6465,6467,6466,6469,6468,6470,6471,6473,6472,6474,6475,6476,6477,6479,6478,6481,6480,6482,6483,6484,6485,6487,6486,6488,6489,6491,6490,6493,6492,6494,6495,6497,6496,6498,6499,6500,6501,6503,6502,6504,6505,6507,6506,6509,6508,6510,6511,6512,6513,6515,6514,6517,6516,6518,6519,6521,6520,6522,6523,6524,6525,6527,6526,6528,6529,6531,6530,6533,6532,6534,6535,6537,6536,6538,6539,6540,6541,6543,6542,6545,6544,6546,6547,6548,6549,6551,6550,6552,6553,6555,6554,6557,6556,6558,6559,6561,6560,6562,6563,6564,6565,6567,6566,6568,6569,6571,6570,6573,6572,6574,6575,6576,6577,6579,6578,6581,6580,6582,6583,6585,6584,6586,6587,6588,6589,6591,6590,6593,6592,6594,6595,6596,6597,6599,6598,6600,6601,6603,6602,6605,6604,6606,6607,6608,6609,6611,6610,6613,6612,6614,6615,6617,6616,6618,6619,6620,6621,6623,6622,6624,6625,6627,6626,6629,6628,6630,6631,6633,6632,6634,6635,6636,6637,6639,6638,6641,6640,6642,6643,6644,6645,6647,6646,6648,6649,6651,6650,6653,6652,6654,6655,6657,6656,6658,6659,6660,6661,6663,6662,6664,6665,6667,6666,6669,6668,6670,6671,6672,6673,6675,6674,6677,6676,6678,6679,6681,6680,6682,6683,6684,6685,6687,6686,6688,6689,6691,6690,6693,6692,6694,6695,6697,6696,6698,6699,6700,6701,6703,6702,6705,6704,6706,6707,6708,6709,6711,6710,6712,6713,6715,6714,6717,6716,6718,6719,6720,6721,6723,6722,6725,6724,6726,6727,6729,6728,6730,6731,6732,6733,6735,6734,6737,6736,6738,6739,6740,6741,6743,6742,6744,6745,6747,6746,6749,6748,6750,6751,6753,6752,6754,6755,6756,6757,6759,6758,6760,6761,6763,6762,6765,6764,6766,6767,6768,6769,6771,6770,6773,6772,6774,6775,6777,6776,6778,6779,6780,6781,6783,6782,6784,6785,6787,6786,6789,6788,6790,6791,6793,6792,6794,6795,6796,6797,6799,6798,6801,6800,6802,6803,6804,6805,6807,6806,6808,6809,6811,6810,6813,6812,6814,6815,6817,6816,6818,6819,6820,6821,6823,6822,6824,6825,6827,6826,6829,6828,6830,6831,6832,6833,6835,6834,6837,6836,6838,6839,6841,6840,6842,6843,6844,6845,6847,6846,6849,6848,6850,6851,6852,6853,6855,6854,6856,6857,6859,6858,6861,6860,6862,6863,6864,6865,6867,6866,6869,6868,6870,6871,6873,6872,6874,6875,6876,6877,6879,6878,6880,6881,6883,6882,6885,6884,6886,6887,6889,6888,6890,6891,6892,6893,6895,6894,6897,6896,6898,6899,6900,6901,6903,6902,6904,6905,6907,6906,6909,6908,6910,6911,6912,6913,6915,6914,6917,6916,6918,6919,6921,6920,6922,6923,6924,6925,6927,6926,6929,6928,6930,6931,6932,6933,6935,6934,6936,6937,6939,6938,6941,6940,6942,6943,6945,6944,6946,6947,6948,6949,6951,6950,6952,6953,6955,6954,6957,6956,6958,6959,6960,6961,6963,6962,6965,6964,6966,6967,6969,6968,6970,6971,6972,6973,6975,6974,6977,6976,6978,6979,6980,6981,6983,6982,6984,6985,6987,6986,6989,6988,6990,6991,6992,6993,6995,6994,6997,6996,6998,6999,7001,7000,7002,7003,7004,7005,7007,7006,7008,7009,7011,7010,7013,7012,7014,7015,7017,7016,7018,7019,7020,7021,7023,7022,7025,7024,7026,7027,7028,7029,7031,7030,7032,7033,7035,7034,7037,7036,7038,7039,7041,7040,7042,7043,7044,7045,7047,7046,7048,7049,7051,7050,7053,7052,7054,7055,7056,7057,7059,7058,7061,7060,7062,7063,7065,7064,7066,7067,7068,7069,7071,7070,7072,7073,7075,7074,7077,7076,7078,7079,7081,7080,7082,7083,7084,7085,7087,7086,7089,7088,7090,7091,7092,7093,7095,7094,7096,7097,7099,7098,7101,7100,7102,7103,7104,7105,7107,7106,7109,7108,7110,7111,7113,7112,7114,7115,7116,7117,7119,7118,7121,7120,7122,7123,7124,7125,7127,7126,7128,7129,7131,7130,7133,7132,7134,7135,7137,7136,7138,7139,7140,7141,7143,7142,7144,7145,7147,7146,7149,7148,7150,7151,7152,7153,7155,7154,7157,7156,7158,7159,7161,7160,7162,7163,7164,7165,7167,7166,7169,7168,7170,7171,7172,7173,7175,7174,7176,7177,7179,7178,7181,7180,7182,7183,7184,7185,7187,7186,7189,7188,7190,7191,7193,7192,7194,7195,7196,7197,7199,7198,7200,7201,7203,7202,7205,7204,7206,7207,7209,7208,7210,7211,7212,7213,7215,7214,7217,7216,7218,7219,7220,7221,7223,7222,7224,7225,7227,7226,7229,7228,7230,7231,7232,7233,7235,7234,7237,7236,7238,7239,7241,7240,7242,7243,7244,7245,7247,7246,7249,7248,7250,7251,7252,7253,7255,7254,7256,7257,7259,7258,7261,7260,7262,7263,7265,7264,7266,7267,7268,7269,7271,7270,7272,7273,7275,7274,7277,7276,7278,7279,7280,7281,7283,7282,7285,7284,7286,7287,7289,7288,7290,7291,7292,7293,7295,7294,7296,7297,7299,7298,7301,7300,7302,7303,7305,7304,7306,7307,7308,7309,7311,7310,7313,7312,7314,7315,7316,7317,7319,7318,7320,7321,7323,7322,7325,7324,7326,7327,7329,7328,7330,7331,7332,7333,7335,7334,7336,7337,7339,7338,7341,7340,7342,7343,7344,7345,7347,7346,7349,7348,7350,7351,7353,7352,7354,7355,7356,7357,7359,7358,7361,7360,7362,7363,7364,7365,7367,7366,7368,7369,7371,7370,7373,7372,7374,7375,7376,7377,7379,7378,7381,7380,7382,7383,7385,7384,7386,7387,7388,7389,7391,7390,7392,7393,7395,7394,7397,7396,7398,7399,7401,7400,7402,7403,7404,7405,7407,7406,7409,7408,7410,7411,7412,7413,7415,7414,7416,7417,7419,7418,7421,7420,7422,7423,7424,7425,7427,7426,7429,7428,7430,7431,7433,7432,7434,7435,7436,7437,7439,7438,7441,7440,7442,7443,7444,7445,7447,7446,7448,7449,7451,7450,7453,7452,7454,7455,7457,7456,7458,7459,7460,7461,7463,7462,7464,7465,7467,7466,7469,7468,7470,7471,7472,7473,7475,7474,7477,7476,7478,7479,7481,7480,7482,7483,7484,7485,7487,7486,7489,7488,7490,7491,7492,7493,7495,7494,7496,7497,7499,7498,7501,7500,7502,7503,7504,7505,7507,7506,7509,7508,7510,7511,7513,7512,7514,7515,7516,7517,7519,7518,7520,7521,7523,7522,7525,7524,7526,7527,7529,7528,7530,7531,7532,7533,7535,7534,7537,7536,7538,7539,7540,7541,7543,7542,7544,7545,7547,7546,7549,7548,7550,7551,7553,7552,7554,7555,7556,7557,7559,7558,7560,7561,7563,7562,7565,7564,7566,7567,7568,7569,7571,7570,7573,7572,7574,7575,7577,7576,7578,7579,7580,7581,7583,7582,7584,7585,7587,7586,7589,7588,7590,7591,7593,7592,7594,7595,7596,7597,7599,7598,7601,7600,7602,7603,7604,7605,7607,7606,7608,7609,7611,7610,7613,7612,7614,7615,7616,7617,7619,7618,7621,7620,7622,7623,7625,7624,7626,7627,7628,7629,7631,7630,7633,7632,7634,7635,7636,7637,7639,7638,7640,7641,7643,7642,7645,7644,7646,7647,7649,7648,7650,7651,7652,7653,7655,7654,7656,7657,7659,7658,7661,7660,7662,7663,7664,7665,7667,7666,7669,7668,7670,7671,7673,7672,7674,7675,7676,7677,7679,7678,7680,7681,7683,7682,7685,7684,7686,7687,7689,7688,7690,7691,7692,7693,7695,7694,7697,7696,7698,7699,7700,7701,7703,7702,7704,7705,7707,7706,7709,7708,7710,7711,7713,7712,7714,7715,7716,7717,7719,7718,7720,7721,7723,7722,7725,7724,7726,7727,7728,7729,7731,7730,7733,7732,7734,7735,7737,7736,7738,7739,7740,7741,7743,7742,7745,7744,7746,7747,7748,7749,7751,7750,7752,7753,7755,7754,7757,7756,7758,7759,7760,7761,7763,7762,7765,7764,7766,7767,7769,7768,7770,7771,7772,7773,7775,7774,7776,7777,7779,7778,7781,7780,7782,7783,7785,7784,7786,7787,7788,7789,7791,7790,7793,7792,7794,7795,7796,7797,7799,7798,7800,7801,7803,7802,7805,7804,7806,7807,7809,7808,7810,7811,7812,7813,7815,7814,7816,7817,7819,7818,7821,7820,7822,7823,7824,7825,7827,7826,7829,7828,7830,7831,7833,7832,7834,7835,7836,7837,7839,7838,7840,7841,7843,7842,7845,7844,7846,7847,7849,7848,7850,7851,7852,7853,7855,7854,7857,7856,7858,7859,7860,7861,7863,7862,7864,7865,7867,7866,7869,7868,7870,7871,7872,7873,7875,7874,7877,7876,7878,7879,7881,7880,7882,7883,7884,7885,7887,7886,7889,7888,7890,7891,7892,7893,7895,7894,7896,7897,7899,7898,7901,7900,7902,7903,7905,7904,7906,7907,7908,7909,7911,7910,7912,7913,7915,7914,7917,7916,7918,7919,7920,7921,7923,7922,7925,7924,7926,7927,7929,7928,7930,7931,7932,7933,7935,7934,7937,7936,7938,7939,7940,7941,7943,7942,7944,7945,7947,7946,7949,7948,7950,7951,7952,7953,7955,7954,7957,7956,7958,7959,7961,7960,7962,7963,7964,7965,7967,7966,7968,7969,7971,7970,7973,7972,7974,7975,7977,7976,7978,7979,7980,7981,7983,7982,7985,7984,7986,7987,7988,7989,7991,7990,7992,7993,7995,7994,7997,7996,7998,7999,8000,8001,8003,8002,8005,8004,8006,8007,8009,8008,8010,8011,8012,8013,8015,8014,8017,8016,8018,8019,8020,8021,8023,8022,8024,8025,8027,8026,8029,8028,8030,8031,8033,8032,8034,8035,8036,8037,8039,8038,8040,8041,8043,8042,8045,8044,8046,8047,8048,8049,8051,8050,8053,8052,8054,8055,8057,8056,8058,8059,8060,8061,8063,8062,8064,8065,8067,8066,8069,8068,8070,8071,8073,8072,8074,8075,8076,8077,8079,8078,8081,8080,8082,8083,8084,8085,8087,8086,8088,8089,8091,8090,8093,8092,8094,8095,8097,8096,8098,8099,8100,8101,8103,8102,8104,8105,8107,8106,8109,8108,8110,8111,8112,8113,8115,8114,8117,8116,8118,8119,8121,8120,8122,8123,8124,8125,8127,8126,8129,8128,8130,8131,8132,8133,8135,8134,8136,8137,8139,8138,8141,8140,8142,8143,8144,8145,8147,8146,8149,8148,8150,8151,8153,8152,8154,8155,8156,8157,8159,8158,8160,8161,8163,8162,8165,8164,8166,8167,8169,8168,8170,8171,8172,8173,8175,8174,8177,8176,8178,8179,8180,8181,8183,8182,8184,8185,8187,8186,8189,8188,8190,8191,8193,8192,8194,8195,8196,8197,8199,8198,8200,8201,8203,8202,8205,8204,8206,8207,8208,8209,8211,8210,8213,8212,8214,8215,8217,8216,8218,8219,8220,8221,8223,8222,8224,8225,8227,8226,8229,8228,8230,8231,8233,8232,8234,8235,8236,8237,8239,8238,8241,8240,8242,8243,8244,8245,8247,8246,8248,8249,8251,8250,8253,8252,8254,8255,8256,8257,8259,8258,8261,8260,8262,8263,8265,8264,8266,8267,8268,8269,8271,8270,8273,8272,8274,8275,8276,8277,8279,8278,8280,8281,8283,8282,8285,8284,8286,8287,8289,8288,8290,8291,8292,8293,8295,8294,8296,8297,8299,8298,8301,8300,8302,8303,8304,8305,8307,8306,8309,8308,8310,8311,8313,8312,8314,8315,8316,8317,8319,8318,8320,8321,8323,8322,8325,8324,8326,8327,8329,8328,8330,8331,8332,8333,8335,8334,8337,8336,8338,8339,8340,8341,8343,8342,8344,8345,8347,8346,8349,8348,8350,8351,8353,8352,8354,8355,8356,8357,8359,8358,8360,8361,8363,8362,8365,8364,8366,8367,8368,8369,8371,8370,8373,8372,8374,8375,8377,8376,8378,8379,8380,8381,8383,8382,8385,8384,8386,8387,8388,8389,8391,8390,8392,8393,8395,8394,8397,8396,8398,8399,8400,8401,8403,8402,8405,8404,8406,8407,8409,8408,8410,8411,8412,8413,8415,8414,8416,8417,8419,8418,8421,8420,8422,8423,8425,8424,8426,8427,8428,8429,8431,8430,8433,8432,8434,8435,8436,8437,8439,8438,8440,8441,8443,8442,8445,8444,8446,8447,8448,8449,8451,8450,8453,8452,8454,8455,8457,8456,8458,8459,8460,8461,8463,8462,8465,8464,8466,8467,8468,8469,8471,8470,8472,8473,8475,8474,8477,8476,8478,8479,8481,8480,8482,8483,8484,8485,8487,8486,8488,8489,8491,8490,8493,8492,8494,8495,8496,8497,8499,8498,8501,8500,8502,8503,8505,8504,8506,8507,8508,8509,8511,8510,8513,8512,8514,8515,8516,8517,8519,8518,8520,8521,8523,8522,8525,8524,8526,8527,8528,8529,8531,8530,8533,8532,8534,8535,8537,8536,8538,8539,8540,8541,8543,8542,8544,8545,8547,8546,8549,8548,8550,8551,8553,8552,8554,8555,8556,8557,8559,8558,8561,8560,8562,8563,8564,8565,8567,8566,8568,8569,8571,8570,8573,8572,8574,8575,8577,8576,8578,8579,8580,8581,8583,8582,8584,8585,8587,8586,8589,8588,8590,8591,8592,8593,8595,8594,8597,8596,8598,8599,8601,8600,8602,8603,8604,8605,8607,8606,8608,8609,8611,8610,8613,8612,8614,8615,8617,8616,8618,8619,8620,8621,8623,8622,8625,8624,8626,8627,8628,8629,8631,8630,8632,8633,8635,8634,8637,8636,8638,8639,8640,8641,8643,8642,8645,8644,8646,8647,8649,8648,8650,8651,8652,8653,8655,8654,8657,8656,8658,8659,8660,8661,8663,8662,8664,8665,8667,8666,8669,8668,8670,8671,8673,8672,8674,8675,8676,8677,8679,8678,8680,8681,8683,8682,8685,8684,8686,8687,8688,8689,8691,8690,8693,8692,8694,8695,8697,8696,8698,8699,8700,8701,8703,8702,8704,8705,8707,8706,8709,8708,8710,8711,8713,8712,8714,8715,8716,8717,8719,8718,8721,8720,8722,8723,8724,8725,8727,8726,8728,8729,8731,8730,8733,8732,8734,8735,8737,8736,8738,8739,8740,8741,8743,8742,8744,8745,8747,8746,8749,8748,8750,8751,8752,8753,8755,8754,8757,8756,8758,8759,8761,8760,8762,8763,8764,8765,8767,8766,8769,8768,8770,8771,8772,8773,8775,8774,8776,8777,8779,8778,8781,8780,8782,8783,8784,8785,8787,8786,8789,8788,8790,8791,8793,8792,8794,8795,8796,8797,8799,8798,8800,8801,8803,8802,8805,8804,8806,8807,8809,8808,8810,8811,8812,8813,8815,8814,8817,8816,8818,8819,8820,8821,8823,8822,8824,8825,8827,8826,8829,8828,8830,8831,8833,8832,8834,8835,8836,8837,8839,8838,8840,8841,8843,8842,8845,8844,8846,8847,8848,8849,8851,8850,8853,8852,8854,8855,8857,8856,8858,8859,8860,8861,8863,8862,8864,8865,8867,8866,8869,8868,8870,8871,8873,8872,8874,8875,8876,8877,8879,8878,8881,8880,8882,8883,8884,8885,8887,8886,8888,8889,8891,8890,8893,8892,8894,8895,8896,8897,8899,8898,8901,8900,8902,8903,8905,8904,8906,8907,8908,8909,8911,8910,8913,8912,8914,8915,8916,8917,8919,8918,8920,8921,8923,8922,8925,8924,8926,8927,8929,8928,8930,8931,8932,8933,8935,8934,8936,8937,8939,8938,8941,8940,8942,8943,8944,8945,8947,8946,8949,8948,8950,8951,8953,8952,8954,8955,8956,8957,8959,8958,8961,8960,8962,8963,8964,8965,8967,8966,8968,8969,8971,8970,8973,8972,8974,8975,8976,8977,8979,8978,8981,8980,8982,8983,8985,8984,8986,8987,8988,8989,8991,8990,8992,8993,8995,8994,8997,8996,8998,8999,9001,9000,9002,9003,9004,9005,9007,9006,9009,9008,9010,9011,9012,9013,9015,9014,9016,9017,9019,9018,9021,9020,9022,9023,9024,9025,9027,9026,9029,9028,9030,9031,9033,9032,9034,9035,9036,9037,9039,9038,9041,9040,9042,9043,9044,9045,9047,9046,9048,9049,9051,9050,9053,9052,9054,9055,9057,9056,9058,9059,9060,9061,9063,9062,9064,9065,9067,9066,9069,9068,9070,9071,9072,9073,9075,9074,9077,9076,9078,9079,9081,9080,9082,9083,9084,9085,9087,9086,9088,9089,9091,9090,9093,9092,9094,9095,9097,9096,9098,9099,9100,9101,9103,9102,9105,9104,9106,9107,9108,9109,9111,9110,9112,9113,9115,9114,9117,9116,9118,9119,9121,9120,9122,9123,9124,9125,9127,9126,9128,9129,9131,9130,9133,9132,9134,9135,9136,9137,9139,9138,9141,9140,9142,9143,9145,9144,9146,9147,9148,9149,9151,9150,9153,9152,9154,9155,9156,9157,9159,9158,9160,9161,9163,9162,9165,9164,9166,9167,9168,9169,9171,9170,9173,9172,9174,9175,9177,9176,9178,9179,9180,9181,9183,9182,9184,9185,9187,9186,9189,9188,9190,9191,9193,9192,9194,9195,9196,9197,9199,9198,9201,9200,9202,9203,9204,9205,9207,9206,9208,9209,9211,9210,9213,9212,9214,9215,9216,9217,9219,9218,9221,9220,9222,9223,9225,9224,9226,9227,9228,9229,9231,9230,9233,9232,9234,9235,9236,9237,9239,9238,9240,9241,9243,9242,9245,9244,9246,9247,9249,9248,9250,9251,9252,9253,9255,9254,9256,9257,9259,9258,9261,9260,9262,9263,9264,9265,9267,9266,9269,9268,9270,9271,9273,9272,9274,9275,9276,9277,9279,9278,9281,9280,9282,9283,9284,9285,9287,9286,9288,9289,9291,9290,9293,9292,9294,9295,9296,9297,9299,9298,9301,9300,9302,9303,9305,9304,9306,9307,9308,9309,9311,9310,9312,9313,9315,9314,9317,9316,9318,9319,9321,9320,9322,9323,9324,9325,9327,9326,9329,9328,9330,9331,9332,9333,9335,9334,9336,9337,9339,9338,9341,9340,9342,9343,9345,9344,9346,9347,9348,9349,9351,9350,9352,9353,9355,9354,9357,9356,9358,9359,9360,9361,9363,9362,9365,9364,9366,9367,9369,9368,9370,9371,9372,9373,9375,9374,9376,9377,9379,9378,9381,9380,9382,9383,9385,9384,9386,9387,9388,9389,9391,9390,9393,9392,9394,9395,9396,9397,9399,9398,9400,9401,9403,9402,9405,9404,9406,9407,9408,9409,9411,9410,9413,9412,9414,9415,9417,9416,9418,9419,9420,9421,9423,9422,9425,9424,9426,9427,9428,9429,9431,9430,9432,9433,9435,9434,9437,9436,9438,9439,9441,9440,9442,9443,9444,9445,9447,9446,9448,9449,9451,9450,9453,9452,9454,9455,9456,9457,9459,9458,9461,9460,9462,9463,9465,9464,9466,9467,9468,9469,9471,9470,9473,9472,9474,9475,9476,9477,9479,9478,9480,9481,9483,9482,9485,9484,9486,9487,9488,9489,9491,9490,9493,9492,9494,9495,9497,9496,9498,9499,9500,9501,9503,9502,9504,9505,9507,9506,9509,9508,9510,9511,9513,9512,9514,9515,9516,9517,9519,9518,9521,9520,9522,9523,9524,9525,9527,9526,9528,9529,9531,9530,9533,9532,9534,9535,9536,9537,9539,9538,9541,9540,9542,9543,9545,9544,9546,9547,9548,9549,9551,9550,9553,9552,9554,9555,9556,9557,9559,9558,9560,9561,9563,9562,9565,9564,9566,9567,9569,9568,9570,9571,9572,9573,9575,9574,9576,9577,9579,9578,9581,9580,9582,9583,9584,9585,9587,9586,9589,9588,9590,9591,9593,9592,9594,9595,9596,9597,9599,9598,9600,9601,9603,9602,9605,9604,9606,9607,9609,9608,9610,9611,9612,9613,9615,9614,9617,9616,9618,9619,9620,9621,9623,9622,9624,9625,9627,9626,9629,9628,9630,9631,9633,9632,9634,9635,9636,9637,9639,9638,9640,9641,9643,9642,9645,9644,9646,9647,9648,9649,9651,9650,9653,9652,9654,9655,9657,9656,9658,9659,9660,9661,9663,9662,9665,9664,9666,9667,9668,9669,9671,9670,9672,9673,9675,9674,9677,9676,9678,9679,9680,9681,9683,9682,9685,9684,9686,9687,9689,9688,9690,9691,9692,9693,9695,9694,9696,9697,9699,9698,9701,9700,9702,9703,9705,9704,9706,9707,9708,9709,9711,9710,9713,9712,9714,9715,9716,9717,9719,9718,9720,9721,9723,9722,9725,9724,9726,9727,9729,9728,9730,9731,9732,9733,9735,9734,9736,9737,9739,9738,9741,9740,9742,9743,9744,9745,9747,9746,9749,9748,9750,9751,9753,9752,9754,9755,9756,9757,9759,9758,9760,9761,9763,9762,9765,9764,9766,9767,9769,9768,9770,9771,9772,9773,9775,9774,9777,9776,9778,9779,9780,9781,9783,9782,9784,9785,9787,9786,9789,9788,9790,9791,9792,9793,9795,9794,9797,9796,9798,9799,9801,9800,9802,9803,9804,9805,9807,9806,9809,9808,9810,9811,9812,9813,9815,9814,9816,9817,9819,9818,9821,9820,9822,9823,9825,9824,9826,9827,9828,9829,9831,9830,9832,9833,9835,9834,9837,9836,9838,9839,9840,9841,9843,9842,9845,9844,9846,9847,9849,9848,9850,9851,9852,9853,9855,9854,9856,9857,9859,9858,9861,9860,9862,9863,9865,9864,9866,9867,9868,9869,9871,9870,9873,9872,9874,9875,9876,9877,9879,9878,9880,9881,9883,9882,9885,9884,9886,9887,9889,9888,9890,9891,9892,9893,9895,9894,9896,9897,9899,9898,9901,9900,9902,9903,9904,9905,9907,9906,9909,9908,9910,9911,9913,9912,9914,9915,9916,9917,9919,9918,9921,9920,9922,9923,9924,9925,9927,9926,9928,9929,9931,9930,9933,9932,9934,9935,9936,9937,9939,9938,9941,9940,9942,9943,9945,9944,9946,9947,9948,9949,9951,9950,9952,9953,9955,9954,9957,9956,9958,9959,9961,9960,9962,9963,9964,9965,9967,9966,9969,9968,9970,9971,9972,9973,9975,9974,9976,9977,9979,9978,9981,9980,9982,9983,9984,9985,9987,9986,9989,9988,9990,9991,9993,9992,9994,9995,9996,9997,9999,9998,10001,10000,10002,10003,10004,10005,10007,10006,10008,10009,10011,10010,10013,10012,10014,10015,10017,10016,10018,10019,10020,10021,10023,10022,10024,10025,10027,10026,10029,10028,10030,10031,10032,10033,10035,10034,10037,10036,10038,10039,10041,10040,10042,10043,10044,10045,10047,10046,10049,10048,10050,10051,10052,10053,10055,10054,10056,10057,10059,10058,10061,10060,10062,10063,10064,10065,10067,10066,10069,10068,10070,10071,10073,10072,10074,10075,10076,10077,10079,10078,10080,10081,10083,10082,10085,10084,10086,10087,10089,10088,10090,10091,10092,10093,10095,10094,10097,10096,10098,10099,10100,10101,10103,10102,10104,10105,10107,10106,10109,10108,10110,10111,10113,10112,10114,10115,10116,10117,10119,10118,10120,10121,10123,10122,10125,10124,10126,10127,10128,10129,10131,10130,10133,10132,10134,10135,10137,10136,10138,10139,10140,10141,10143,10142,10144,10145,10147,10146,10149,10148,10150,10151,10153,10152,10154,10155,10156,10157,10159,10158,10161,10160,10162,10163,10164,10165,10167,10166,10168,10169,10171,10170,10173,10172,10174,10175,10176,10177,10179,10178,10181,10180,10182,10183,10185,10184,10186,10187,10188,10189,10191,10190,10193,10192,10194,10195,10196,10197,10199,10198,10200,10201,10203,10202,10205,10204,10206,10207,10209,10208,10210,10211,10212,10213,10215,10214,10216,10217,10219,10218,10221,10220,10222,10223,10224,10225,10227,10226,10229,10228,10230,10231,10233,10232,10234,10235,10236,10237,10239,10238,10240,10241,10243,10242,10245,10244,10246,10247,10249,10248,10250,10251,10252,10253,10255,10254,10257,10256,10258,10259,10260,10261,10263,10262,10264,10265,10267,10266,10269,10268,10270,10271,10273,10272,10274,10275,10276,10277,10279,10278,10280,10281,10283,10282,10285,10284,10286,10287,10288,10289,10291,10290,10293,10292,10294,10295,10297,10296,10298,10299,10300,10301,10303,10302,10305,10304,10306,10307,10308,10309,10311,10310,10312,10313,10315,10314,10317,10316,10318,10319,10320,10321,10323,10322,10325,10324,10326,10327,10329,10328,10330,10331,10332,10333,10335,10334,10336,10337,10339,10338,10341,10340,10342,10343,10345,10344,10346,10347,10348,10349,10351,10350,10353,10352,10354,10355,10356,10357,10359,10358,10360,10361,10363,10362,10365,10364,10366,10367,10369,10368,10370,10371,10372,10373,10375,10374,10376,10377,10379,10378,10381,10380,10382,10383,10384,10385,10387,10386,10389,10388,10390,10391,10393,10392,10394,10395,10396,10397,10399,10398,10400,10401,10403,10402,10405,10404,10406,10407,10409,10408,10410,10411,10412,10413,10415,10414,10417,10416,10418,10419,10420,10421,10423,10422,10424,10425,10427,10426,10429,10428,10430,10431,10432,10433,10435,10434,10437,10436,10438,10439,10441,10440,10442,10443,10444,10445,10447,10446,10449,10448,10450,10451,10452,10453,10455,10454,10456,10457,10459,10458,10461,10460,10462,10463,10465,10464,10466,10467,10468,10469,10471,10470,10472,10473,10475,10474,10477,10476,10478,10479,10480,10481,10483,10482,10485,10484,10486,10487,10489,10488,10490,10491,10492,10493,10495,10494,10497,10496,10498,10499,10500,10501,10503,10502,10504,10505,10507,10506,10509,10508,10510,10511,10512,10513,10515,10514,10517,10516,10518,10519,10521,10520,10522,10523,10524,10525,10527,10526,10528,10529,10531,10530,10533,10532,10534,10535,10537,10536,10538,10539,10540,10541,10543,10542,10545,10544,10546,10547,10548,10549,10551,10550,10552,10553,10555,10554,10557,10556,10558,10559,10560,10561,10563,10562,10565,10564,10566,10567,10569,10568,10570,10571,10572,10573,10575,10574,10577,10576,10578,10579,10580,10581,10583,10582,10584,10585,10587,10586,10589,10588,10590,10591,10593,10592,10594,10595,10596,10597,10599,10598,10600,10601,10603,10602,10605,10604,10606,10607,10608,10609,10611,10610,10613,10612,10614,10615,10617,10616,10618,10619,10620,10621,10623,10622,10624,10625,10627,10626,10629,10628,10630,10631,10633,10632,10634,10635,10636,10637,10639,10638,10641,10640,10642,10643,10644,10645,10647,10646,10648,10649,10651,10650,10653,10652,10654,10655,10657,10656,10658,10659,10660,10661,10663,10662,10664,10665,10667,10666,10669,10668,10670,10671,10672,10673,10675,10674,10677,10676,10678,10679,10681,10680,10682,10683,10684,10685,10687,10686,10689,10688,10690,10691,10692,10693,10695,10694,10696,10697,10699,10698,10701,10700,10702,10703,10704,10705,10707,10706,10709,10708,10710,10711,10713,10712,10714,10715,10716,10717,10719,10718,10720,10721,10723,10722,10725,10724,10726,10727,10729,10728,10730,10731,10732,10733,10735,10734,10737,10736,10738,10739,10740,10741,10743,10742,10744,10745,10747,10746,10749,10748,10750,10751,10753,10752,10754,10755,10756,10757,10759,10758,10760,10761,10763,10762,10765,10764,10766,10767,10768,10769,10771,10770,10773,10772,10774,10775,10777,10776,10778,10779,10780,10781,10783,10782,10784,10785,10787,10786,10789,10788,10790,10791,10793,10792,10794,10795,10796,10797,10799,10798,10801,10800,10802,10803,10804,10805,10807,10806,10808,10809,10811,10810,10813,10812,10814,10815,10816,10817,10819,10818,10821,10820,10822,10823,10825,10824,10826,10827,10828,10829,10831,10830,10833,10832,10834,10835,10836,10837,10839,10838,10840,10841,10843,10842,10845,10844,10846,10847,10849,10848,10850,10851,10852,10853,10855,10854,10856,10857,10859,10858,10861,10860,10862,10863,10864,10865,10867,10866,10869,10868,10870,10871,10873,10872,10874,10875,10876,10877,10879,10878,10880,10881,10883,10882,10885,10884,10886,10887,10889,10888,10890,10891,10892,10893,10895,10894,10897,10896,10898,10899,10900,10901,10903,10902,10904,10905,10907,10906,10909,10908,10910,10911,10913,10912,10914,10915,10916,10917,10919,10918,10920,10921,10923,10922,10925,10924,10926,10927,10928,10929,10931,10930,10933,10932,10934,10935,10937,10936,10938,10939,10940,10941,10943,10942,10945,10944,10946,10947,10948,10949,10951,10950,10952,10953,10955,10954,10957,10956,10958,10959,10960,10961,10963,10962,10965,10964,10966,10967,10969,10968,10970,10971,10972,10973,10975,10974,10976,10977,10979,10978,10981,10980,10982,10983,10985,10984,10986,10987,10988,10989,10991,10990,10993,10992,10994,10995,10996,10997,10999,10998,11000,11001,11003,11002,11005,11004,11006,11007,11008,11009,11011,11010,11013,11012,11014,11015,11017,11016,11018,11019,11020,11021,11023,11022,11025,11024,11026,11027,11028,11029,11031,11030,11032,11033,11035,11034,11037,11036,11038,11039,11041,11040,11042,11043,11044,11045,11047,11046,11048,11049,11051,11050,11053,11052,11054,11055,11056,11057,11059,11058,11061,11060,11062,11063,11065,11064,11066,11067,11068,11069,11071,11070,11073,11072,11074,11075,11076,11077,11079,11078,11080,11081,11083,11082,11085,11084,11086,11087,11088,11089,11091,11090,11093,11092,11094,11095,11097,11096,11098,11099,11100,11101,11103,11102,11104,11105,11107,11106,11109,11108,11110,11111,11113,11112,11114,11115,11116,11117,11119,11118,11121,11120,11122,11123,11124,11125,11127,11126,11128,11129,11131,11130,11133,11132,11134,11135,11137,11136,11138,11139,11140,11141,11143,11142,11144,11145,11147,11146,11149,11148,11150,11151,11152,11153,11155,11154,11157,11156,11158,11159,11161,11160,11162,11163,11164,11165,11167,11166,11168,11169,11171,11170,11173,11172,11174,11175,11177,11176,11178,11179,11180,11181,11183,11182,11185,11184,11186,11187,11188,11189,11191,11190,11192,11193,11195,11194,11197,11196,11198,11199,11200,11201,11203,11202,11205,11204,11206,11207,11209,11208,11210,11211,11212,11213,11215,11214,11217,11216,11218,11219,11220,11221,11223,11222,11224,11225,11227,11226,11229,11228,11230,11231,11233,11232,11234,11235,11236,11237,11239,11238,11240,11241,11243,11242,11245,11244,11246,11247,11248,11249,11251,11250,11253,11252,11254,11255,11257,11256,11258,11259,11260,11261,11263,11262,11265,11264,11266,11267,11268,11269,11271,11270,11272,11273,11275,11274,11277,11276,11278,11279,11280,11281,11283,11282,11285,11284,11286,11287,11289,11288,11290,11291,11292,11293,11295,11294,11296,11297,11299,11298,11301,11300,11302,11303,11305,11304,11306,11307,11308,11309,11311,11310,11313,11312,11314,11315,11316,11317,11319,11318,11320,11321,11323,11322,11325,11324,11326,11327,11328,11329,11331,11330,11333,11332,11334,11335,11337,11336,11338,11339,11340,11341,11343,11342,11345,11344,11346,11347,11348,11349,11351,11350,11352,11353,11355,11354,11357,11356,11358,11359,11361,11360,11362,11363,11364,11365,11367,11366,11368,11369,11371,11370,11373,11372,11374,11375,11376,11377,11379,11378,11381,11380,11382,11383,11385,11384,11386,11387,11388,11389,11391,11390,11392,11393,11395,11394,11397,11396,11398,11399,11401,11400,11402,11403,11404,11405,11407,11406,11409,11408,11410,11411,11412,11413,11415,11414,11416,11417,11419,11418,11421,11420,11422,11423,11425,11424,11426,11427,11428,11429,11431,11430,11432,11433,11435,11434,11437,11436,11438,11439,11440,11441,11443,11442,11445,11444,11446,11447,11449,11448,11450,11451,11452,11453,11455,11454,11457,11456,11458,11459,11460,11461,11463,11462,11464,11465,11467,11466,11469,11468,11470,11471,11472,11473,11475,11474,11477,11476,11478,11479,11481,11480,11482,11483,11484,11485,11487,11486,11488,11489,11491,11490,11493,11492,11494,11495,11497,11496,11498,11499,11500,11501,11503,11502,11505,11504,11506,11507,11508,11509,11511,11510,11512,11513,11515,11514,11517,11516,11518,11519,11520,11521,11523,11522,11525,11524,11526,11527,11529,11528,11530,11531,11532,11533,11535,11534,11537,11536,11538,11539,11540,11541,11543,11542,11544,11545,11547,11546,11549,11548,11550,11551,11553,11552,11554,11555,11556,11557,11559,11558,11560,11561,11563,11562,11565,11564,11566,11567,11568,11569,11571,11570,11573,11572,11574,11575,11577,11576,11578,11579,11580,11581,11583,11582,11585,11584,11586,11587,11588,11589,11591,11590,11592,11593,11595,11594,11597,11596,11598,11599,11600,11601,11603,11602,11605,11604,11606,11607,11609,11608,11610,11611,11612,11613,11615,11614,11616,11617,11619,11618,11621,11620,11622,11623,11625,11624,11626,11627,11628,11629,11631,11630,11633,11632,11634,11635,11636,11637,11639,11638,11640,11641,11643,11642,11645,11644,11646,11647,11649,11648,11650,11651,11652,11653,11655,11654,11656,11657,11659,11658,11661,11660,11662,11663,11664,11665,11667,11666,11669,11668,11670,11671,11673,11672,11674,11675,11676,11677,11679,11678,11680,11681,11683,11682,11685,11684,11686,11687,11689,11688,11690,11691,11692,11693,11695,11694,11697,11696,11698,11699,11700,11701,11703,11702,11704,11705,11707,11706,11709,11708,11710,11711,11712,11713,11715,11714,11717,11716,11718,11719,11721,11720,11722,11723,11724,11725,11727,11726,11729,11728,11730,11731,11732,11733,11735,11734,11736,11737,11739,11738,11741,11740,11742,11743,11745,11744,11746,11747,11748,11749,11751,11750,11752,11753,11755,11754,11757,11756,11758,11759,11760,11761,11763,11762,11765,11764,11766,11767,11769,11768,11770,11771,11772,11773,11775,11774,11776,11777,11779,11778,11781,11780,11782,11783,11785,11784,11786,11787,11788,11789,11791,11790,11793,11792,11794,11795,11796,11797,11799,11798,11800,11801,11803,11802,11805,11804,11806,11807,11809,11808,11810,11811,11812,11813,11815,11814,11816,11817,11819,11818,11821,11820,11822,11823,11824,11825,11827,11826,11829,11828,11830,11831,11833,11832,11834,11835,11836,11837,11839,11838,11841,11840,11842,11843,11844,11845,11847,11846,11848,11849,11851,11850,11853,11852,11854,11855,11856,11857,11859,11858,11861,11860,11862,11863,11865,11864,11866,11867,11868,11869,11871,11870,11872,11873,11875,11874,11877,11876,11878,11879,11881,11880,11882,11883,11884,11885,11887,11886,11889,11888,11890,11891,11892,11893,11895,11894,11896,11897,11899,11898,11901,11900,11902,11903,11905,11904,11906,11907,11908,11909,11911,11910,11912,11913,11915,11914,11917,11916,11918,11919,11920,11921,11923,11922,11925,11924,11926,11927,11929,11928,11930,11931,11932,11933,11935,11934,11936,11937,11939,11938,11941,11940,11942,11943,11945,11944,11946,11947,11948,11949,11951,11950,11953,11952,11954,11955,11956,11957,11959,11958,11960,11961,11963,11962,11965,11964,11966,11967,11968,11969,11971,11970,11973,11972,11974,11975,11977,11976,11978,11979,11980,11981,11983,11982,11985,11984,11986,11987,11988,11989,11991,11990,11992,11993,11995,11994,11997,11996,11998,11999,12001,12000,12002,12003,12004,12005,12007,12006,12008,12009,12011,12010,12013,12012,12014,12015,12016,12017,12019,12018,12021,12020,12022,12023,12025,12024,12026,12027,12028,12029,12031,12030,12033,12032,12034,12035,12036,12037,12039,12038,12040,12041,12043,12042,12045,12044,12046,12047,12048,12049,12051,12050,12053,12052,12054,12055,12057,12056,12058,12059,12060,12061,12063,12062,12064,12065,12067,12066,12069,12068,12070,12071,12073,12072,12074,12075,12076,12077,12079,12078,12081,12080,12082,12083,12084,12085,12087,12086,12088,12089,12091,12090,12093,12092,12094,12095,12096,12097,12099,12098,12101,12100,12102,12103,12105,12104,12106,12107,12108,12109,12111,12110,12113,12112,12114,12115,12116,12117,12119,12118,12120,12121,12123,12122,12125,12124,12126,12127,12129,12128,12130,12131,12132,12133,12135,12134,12136,12137,12139,12138,12141,12140,12142,12143,12144,12145,12147,12146,12149,12148,12150,12151,12153,12152,12154,12155,12156,12157,12159,12158,12160,12161,12163,12162,12165,12164,12166,12167,12169,12168,12170,12171,12172,12173,12175,12174,12177,12176,12178,12179,12180,12181,12183,12182,12184,12185,12187,12186,12189,12188,12190,12191,12193,12192,12194,12195,12196,12197,12199,12198,12200,12201,12203,12202,12205,12204,12206,12207,12208,12209,12211,12210,12213,12212,12214,12215,12217,12216,12218,12219,12220,12221,12223,12222,12225,12224,12226,12227,12228,12229,12231,12230,12232,12233,12235,12234,12237,12236,12238,12239,12240,12241,12243,12242,12245,12244,12246,12247,12249,12248,12250,12251,12252,12253,12255,12254,12256,12257,12259,12258,12261,12260,12262,12263,12265,12264,12266,12267,12268,12269,12271,12270,12273,12272,12274,12275,12276,12277,12279,12278,12280,12281,12283,12282,12285,12284,12286,12287,12288,12289,12291,12290,12293,12292,12294,12295,12297,12296,12298,12299,12300,12301,12303,12302,12305,12304,12306,12307,12308,12309,12311,12310,12312,12313,12315,12314,12317,12316,12318,12319,12321,12320,12322,12323,12324,12325,12327,12326,12328,12329,12331,12330,12333,12332,12334,12335,12336,12337,12339,12338,12341,12340,12342,12343,12345,12344,12346,12347,12348,12349,12351,12350,12353,12352,12354,12355,12356,12357,12359,12358,12360,12361,12363,12362,12365,12364,12366,12367,12368,12369,12371,12370,12373,12372,12374,12375,12377,12376,12378,12379,12380,12381,12383,12382,12384,12385,12387,12386,12389,12388,12390,12391,12393,12392,12394,12395,12396,12397,12399,12398,12401,12400,12402,12403,12404,12405,12407,12406,12408,12409,12411,12410,12413,12412,12414,12415,12417,12416,12418,12419,12420,12421,12423,12422,12424,12425,12427,12426,12429,12428,12430,12431,12432,12433,12435,12434,12437,12436,12438,12439,12441,12440,12442,12443,12444,12445,12447,12446,12448,12449,12451,12450,12453,12452,12454,12455,12457,12456,12458,12459,12460,12461,12463,12462,12465,12464,12466,12467,12468,12469,12471,12470,12472,12473,12475,12474,12477,12476,12478,12479,12480,12481,12483,12482,12485,12484,12486,12487,12489,12488,12490,12491,12492,12493,12495,12494,12497,12496,12498,12499,12500,12501,12503,12502,12504,12505,12507,12506,12509,12508,12510,12511,12513,12512,12514,12515,12516,12517,12519,12518,12520,12521,12523,12522,12525,12524,12526,12527,12528,12529,12531,12530,12533,12532,12534,12535,12537,12536,12538,12539,12540,12541,12543,12542,12545,12544,12546,12547,12548,12549,12551,12550,12552,12553,12555,12554,12557,12556,12558,12559,12560,12561,12563,12562,12565,12564,12566,12567,12569,12568,12570,12571,12572,12573,12575,12574,12576,12577,12579,12578,12581,12580,12582,12583,12585,12584,12586,12587,12588,12589,12591,12590,12593,12592,12594,12595,12596,12597,12599,12598,12600,12601,12603,12602,12605,12604,12606,12607,12608,12609,12611,12610,12613,12612,12614,12615,12617,12616,12618,12619,12620,12621,12623,12622,12625,12624,12626,12627,12628,12629,12631,12630,12632,12633,12635,12634,12637,12636,12638,12639,12641,12640,12642,12643,12644,12645,12647,12646,12648,12649,12651,12650,12653,12652,12654,12655,12656,12657,12659,12658,12661,12660,12662,12663,12665,12664,12666,12667,12668,12669,12671,12670,12672,12673,12675,12674,12677,12676,12678,12679,12681,12680,12682,12683,12684,12685,12687,12686,12689,12688,12690,12691,12692,12693,12695,12694,12696,12697,12699,12698,12701,12700,12702,12703,12705,12704,12706,12707,12708,12709,12711,12710,12712,12713,12715,12714,12717,12716,12718,12719,12720,12721,12723,12722,12725,12724,12726,12727,12729,12728,12730,12731,12732,12733,12735,12734,12737,12736,12738,12739,12740,12741,12743,12742,12744,12745,12747,12746,12749,12748,12750,12751,12752,12753,12755,12754,12757,12756,12758,12759,12761,12760,12762,12763,12764,12765,12767,12766,12768,12769,12771,12770,12773,12772,12774,12775,12777,12776,12778,12779,12780,12781,12783,12782,12785,12784,12786,12787,12788,12789,12791,12790,12792,12793,12795,12794,12797,12796,12798,12799,12801,12800,12802,12803,12804,12805,12807,12806,12808,12809,12811,12810,12813,12812,12814,12815,12816,12817,12819,12818,12821,12820,12822,12823,12825,12824,12826,12827,12828,12829,12831,12830,12832,12833,12835,12834,12837,12836,12838,12839,12841,12840,12842,12843,12844,12845,12847,12846,12849,12848,12850,12851,12852,12853,12855,12854,12856,12857,12859,12858,12861,12860,12862,12863,12864,12865,12867,12866,12869,12868,12870,12871,12873,12872,12874,12875,12876,12877,12879,12878,12881,12880,12882,12883,12884,12885,12887,12886,12888,12889,12891,12890,12893,12892,12894,12895,12897,12896,12898,12899,12900,12901,12903,12902,12904,12905,12907,12906,12909,12908,12910,12911,12912,12913,12915,12914,12917,12916,12918,12919,12921,12920,12922,12923,12924,12925,12927,12926,12928,12929,12931,12930,12933,12932,12934,12935,12937,12936,12938,12939,12940,12941,12943,12942,12945,12944,12946,12947,12948,12949,12951,12950,12952,12953,12955,12954,12957,12956,12958,12959,12961,12960,12962,12963,12964,12965,12967,12966,12968,12969,12971,12970,12973,12972,12974,12975,12976,12977,12979,12978,12981,12980,12982,12983,12985,12984,12986,12987,12988,12989,12991,12990,12993,12992,12994,12995,12996,12997,12999,12998,13000,13001,13003,13002,13005,13004,13006,13007,13008,13009,13011,13010,13013,13012,13014,13015,13017,13016,13018,13019,13020,13021,13023,13022,13024,13025,13027,13026,13029,13028,13030,13031,13033,13032,13034,13035,13036,13037,13039,13038,13041,13040,13042,13043,13044,13045,13047,13046,13048,13049,13051,13050,13053,13052,13054,13055,13056,13057,13059,13058,13061,13060,13062,13063,13065,13064,13066,13067,13068,13069,13071,13070,13073,13072,13074,13075,13076,13077,13079,13078,13080,13081,13083,13082,13085,13084,13086,13087,13089,13088,13090,13091,13092,13093,13095,13094,13096,13097,13099,13098,13101,13100,13102,13103,13104,13105,13107,13106,13109,13108,13110,13111,13113,13112,13114,13115,13116,13117,13119,13118,13121,13120,13122,13123,13124,13125,13127,13126,13128,13129,13131,13130,13133,13132,13134,13135,13136,13137,13139,13138,13141,13140,13142,13143,13145,13144,13146,13147,13148,13149,13151,13150,13152,13153,13155,13154,13157,13156,13158,13159,13161,13160,13162,13163,13164,13165,13167,13166,13169,13168,13170,13171,13172,13173,13175,13174,13176,13177,13179,13178,13181,13180,13182,13183,13185,13184,13186,13187,13188,13189,13191,13190,13192,13193,13195,13194,13197,13196,13198,13199,13200,13201,13203,13202,13205,13204,13206,13207,13209,13208,13210,13211,13212,13213,13215,13214,13216,13217,13219,13218,13221,13220,13222,13223,13225,13224,13226,13227,13228,13229,13231,13230,13233,13232,13234,13235,13236,13237,13239,13238,13240,13241,13243,13242,13245,13244,13246,13247,13248,13249,13251,13250,13253,13252,13254,13255,13257,13256,13258,13259,13260,13261,13263,13262,13265,13264,13266,13267,13268,13269,13271,13270,13272,13273,13275,13274,13277,13276,13278,13279,13281,13280,13282,13283,13284,13285,13287,13286,13288,13289,13291,13290,13293,13292,13294,13295,13296,13297,13299,13298,13301,13300,13302,13303,13305,13304,13306,13307,13308,13309,13311,13310,13313,13312,13314,13315,13316,13317,13319,13318,13320,13321,13323,13322,13325,13324,13326,13327,13328,13329,13331,13330,13333,13332,13334,13335,13337,13336,13338,13339,13340,13341,13343,13342,13344,13345,13347,13346,13349,13348,13350,13351,13353,13352,13354,13355,13356,13357,13359,13358,13361,13360,13362,13363,13364,13365,13367,13366,13368,13369,13371,13370,13373,13372,13374,13375,13376,13377,13379,13378,13381,13380,13382,13383,13385,13384,13386,13387,13388,13389,13391,13390,13393,13392,13394,13395,13396,13397,13399,13398,13400,13401,13403,13402,13405,13404,13406,13407,13409,13408,13410,13411,13412,13413,13415,13414,13416,13417,13419,13418,13421,13420,13422,13423,13424,13425,13427,13426,13429,13428,13430,13431,13433,13432,13434,13435,13436,13437,13439,13438,13440,13441,13443,13442,13445,13444,13446,13447,13449,13448,13450,13451,13452,13453,13455,13454,13457,13456,13458,13459,13460,13461,13463,13462,13464,13465,13467,13466,13469,13468,13470,13471,13473,13472,13474,13475,13476,13477,13479,13478,13480,13481,13483,13482,13485,13484,13486,13487,13488,13489,13491,13490,13493,13492,13494,13495,13497,13496,13498,13499,13500,13501,13503,13502,13505,13504,13506,13507,13508,13509,13511,13510,13512,13513,13515,13514,13517,13516,13518,13519,13520,13521,13523,13522,13525,13524,13526,13527,13529,13528,13530,13531,13532,13533,13535,13534,13536,13537,13539,13538,13541,13540,13542,13543,13545,13544,13546,13547,13548,13549,13551,13550,13553,13552,13554,13555,13556,13557,13559,13558,13560,13561,13563,13562,13565,13564,13566,13567,13568,13569,13571,13570,13573,13572,13574,13575,13577,13576,13578,13579,13580,13581,13583,13582,13585,13584,13586,13587,13588,13589,13591,13590,13592,13593,13595,13594,13597,13596,13598,13599,13601,13600,13602,13603,13604,13605,13607,13606,13608,13609,13611,13610,13613,13612,13614,13615,13616,13617,13619,13618,13621,13620,13622,13623,13625,13624,13626,13627,13628,13629,13631,13630,13633,13632,13634,13635,13636,13637,13639,13638,13640,13641,13643,13642,13645,13644,13646,13647,13648,13649,13651,13650,13653,13652,13654,13655,13657,13656,13658,13659,13660,13661,13663,13662,13664,13665,13667,13666,13669,13668,13670,13671,13673,13672,13674,13675,13676,13677,13679,13678,13681,13680,13682,13683,13684,13685,13687,13686,13688,13689,13691,13690,13693,13692,13694,13695,13697,13696,13698,13699,13700,13701,13703,13702,13704,13705,13707,13706,13709,13708,13710,13711,13712,13713,13715,13714,13717,13716,13718,13719,13721,13720,13722,13723,13724,13725,13727,13726,13728,13729,13731,13730,13733,13732,13734,13735,13737,13736,13738,13739,13740,13741,13743,13742,13745,13744,13746,13747,13748,13749,13751,13750,13752,13753,13755,13754,13757,13756,13758,13759,13760,13761,13763,13762,13765,13764,13766,13767,13769,13768,13770,13771,13772,13773,13775,13774,13777,13776,13778,13779,13780,13781,13783,13782,13784,13785,13787,13786,13789,13788,13790,13791,13793,13792,13794,13795,13796,13797,13799,13798,13800,13801,13803,13802,13805,13804,13806,13807,13808,13809,13811,13810,13813,13812,13814,13815,13817,13816,13818,13819,13820,13821,13823,13822,13824,13825,13827,13826,13829,13828,13830,13831,13833,13832,13834,13835,13836,13837,13839,13838,13841,13840,13842,13843,13844,13845,13847,13846,13848,13849,13851,13850,13853,13852,13854,13855,13857,13856,13858,13859,13860,13861,13863,13862,13864,13865,13867,13866,13869,13868,13870,13871,13872,13873,13875,13874,13877,13876,13878,13879,13881,13880,13882,13883,13884,13885,13887,13886,13889,13888,13890,13891,13892,13893,13895,13894,13896,13897,13899,13898,13901,13900,13902,13903,13904,13905,13907,13906,13909,13908,13910,13911,13913,13912,13914,13915,13916,13917,13919,13918,13920,13921,13923,13922,13925,13924,13926,13927,13929,13928,13930,13931,13932,13933,13935,13934,13937,13936,13938,13939,13940,13941,13943,13942,13944,13945,13947,13946,13949,13948,13950,13951,13953,13952,13954,13955,13956,13957,13959,13958,13960,13961,13963,13962,13965,13964,13966,13967,13968,13969,13971,13970,13973,13972,13974,13975,13977,13976,13978,13979,13980,13981,13983,13982,13984,13985,13987,13986,13989,13988,13990,13991,13993,13992,13994,13995,13996,13997,13999,13998,14001,14000,14002,14003,14004,14005,14007,14006,14008,14009,14011,14010,14013,14012,14014,14015,14016,14017,14019,14018,14021,14020,14022,14023,14025,14024,14026,14027,14028,14029,14031,14030,14033,14032,14034,14035,14036,14037,14039,14038,14040,14041,14043,14042,14045,14044,14046,14047,14049,14048,14050,14051,14052,14053,14055,14054,14056,14057,14059,14058,14061,14060,14062,14063,14064,14065,14067,14066,14069,14068,14070,14071,14073,14072,14074,14075,14076,14077,14079,14078,14081,14080,14082,14083,14084,14085,14087,14086,14088,14089,14091,14090,14093,14092,14094,14095,14096,14097,14099,14098,14101,14100,14102,14103,14105,14104,14106,14107,14108,14109,14111,14110,14112,14113,14115,14114,14117,14116,14118,14119,14121,14120,14122,14123,14124,14125,14127,14126,14129,14128,14130,14131,14132,14133,14135,14134,14136,14137,14139,14138,14141,14140,14142,14143,14144,14145,14147,14146,14149,14148,14150,14151,14153,14152,14154,14155,14156,14157,14159,14158,14161,14160,14162,14163,14164,14165,14167,14166,14168,14169,14171,14170,14173,14172,14174,14175,14177,14176,14178,14179,14180,14181,14183,14182,14184,14185,14187,14186,14189,14188,14190,14191,14192,14193,14195,14194,14197,14196,14198,14199,14201,14200,14202,14203,14204,14205,14207,14206,14208,14209,14211,14210,14213,14212,14214,14215,14217,14216,14218,14219,14220,14221,14223,14222,14225,14224,14226,14227,14228,14229,14231,14230,14232,14233,14235,14234,14237,14236,14238,14239,14241,14240,14242,14243,14244,14245,14247,14246,14248,14249,14251,14250,14253,14252,14254,14255,14256,14257,14259,14258,14261,14260,14262,14263,14265,14264,14266,14267,14268,14269,14271,14270,14273,14272,14274,14275,14276,14277,14279,14278,14280,14281,14283,14282,14285,14284,14286,14287,14288,14289,14291,14290,14293,14292,14294,14295,14297,14296,14298,14299,14300,14301,14303,14302,14304,14305,14307,14306,14309,14308,14310,14311,14313,14312,14314,14315,14316,14317,14319,14318,14321,14320,14322,14323,14324,14325,14327,14326,14328,14329,14331,14330,14333,14332,14334,14335,14337,14336,14338,14339,14340,14341,14343,14342,14344,14345,14347,14346,14349,14348,14350,14351,14352,14353,14355,14354,14357,14356,14358,14359,14361,14360,14362,14363,14364,14365,14367,14366,14368,14369,14371,14370,14373,14372,14374,14375,14377,14376,14378,14379,14380,14381,14383,14382,14385,14384,14386,14387,14388,14389,14391,14390,14392,14393,14395,14394,14397,14396,14398,14399,14400,14401,14403,14402,14405,14404,14406,14407,14409,14408,14410,14411,14412,14413,14415,14414,14417,14416,14418,14419,14420,14421,14423,14422,14424,14425,14427,14426,14429,14428,14430,14431,14433,14432,14434,14435,14436,14437,14439,14438,14440,14441,14443,14442,14445,14444,14446,14447,14448,14449,14451,14450,14453,14452,14454,14455,14457,14456,14458,14459,14460,14461,14463,14462,14464,14465,14467,14466,14469,14468,14470,14471,14473,14472,14474,14475,14476,14477,14479,14478,14481,14480,14482,14483,14484,14485,14487,14486,14488,14489,14491,14490,14493,14492,14494,14495,14497,14496,14498,14499,14500,14501,14503,14502,14504,14505,14507,14506,14509,14508,14510,14511,14512,14513,14515,14514,14517,14516,14518,14519,14521,14520,14522,14523,14524,14525,14527,14526,14529,14528,14530,14531,14532,14533,14535,14534,14536,14537,14539,14538,14541,14540,14542,14543,14544,14545,14547,14546,14549,14548,14550,14551,14553,14552,14554,14555,14556,14557,14559,14558,14560,14561,14563,14562,14565,14564,14566,14567,14569,14568,14570,14571,14572,14573,14575,14574,14577,14576,14578,14579,14580,14581,14583,14582,14584,14585,14587,14586,14589,14588,14590,14591,14592,14593,14595,14594,14597,14596,14598,14599,14601,14600,14602,14603,14604,14605,14607,14606,14609,14608,14610,14611,14612,14613,14615,14614,14616,14617,14619,14618,14621,14620,14622,14623,14625,14624,14626,14627,14628,14629,14631,14630,14632,14633,14635,14634,14637,14636,14638,14639,14640,14641,14643,14642,14645,14644,14646,14647,14649,14648,14650,14651,14652,14653,14655,14654,14657,14656,14658,14659,14660,14661,14663,14662,14664,14665,14667,14666,14669,14668,14670,14671,14672,14673,14675,14674,14677,14676,14678,14679,14681,14680,14682,14683,14684,14685,14687,14686,14688,14689,14691,14690,14693,14692,14694,14695,14697,14696,14698,14699,14700,14701,14703,14702,14705,14704,14706,14707,14708,14709,14711,14710,14712,14713,14715,14714,14717,14716,14718,14719,14721,14720,14722,14723,14724,14725,14727,14726,14728,14729,14731,14730,14733,14732,14734,14735,14736,14737,14739,14738,14741,14740,14742,14743,14745,14744,14746,14747,14748,14749,14751,14750,14752,14753,14755,14754,14757,14756,14758,14759,14761,14760,14762,14763,14764,14765,14767,14766,14769,14768,14770,14771,14772,14773,14775,14774,14776,14777,14779,14778,14781,14780,14782,14783,14784,14785,14787,14786,14789,14788,14790,14791,14793,14792,14794,14795,14796,14797,14799,14798,14801,14800,14802,14803,14804,14805,14807,14806,14808,14809,14811,14810,14813,14812,14814,14815,14817,14816,14818,14819,14820,14821,14823,14822,14824,14825,14827,14826,14829,14828,14830,14831,14832,14833,14835,14834,14837,14836,14838,14839,14841,14840,14842,14843,14844,14845,14847,14846,14848,14849,14851,14850,14853,14852,14854,14855,14857,14856,14858,14859,14860,14861,14863,14862,14865,14864,14866,14867,14868,14869,14871,14870,14872,14873,14875,14874,14877,14876,14878,14879,14881,14880,14882,14883,14884,14885,14887,14886,14888,14889,14891,14890,14893,14892,14894,14895,14896,14897,14899,14898,14901,14900,14902,14903,14905,14904,14906,14907,14908,14909,14911,14910,14913,14912,14914,14915,14916,14917,14919,14918,14920,14921,14923,14922,14925,14924,14926,14927,14928,14929,14931,14930,14933,14932,14934,14935,14937,14936,14938,14939,14940,14941,14943,14942,14944,14945,14947,14946,14949,14948,14950,14951,14953,14952,14954,14955,14956,14957,14959,14958,14961,14960,14962,14963,14964,14965,14967,14966,14968,14969,14971,14970,14973,14972,14974,14975,14977,14976,14978,14979,14980,14981,14983,14982,14984,14985,14987,14986,14989,14988,14990,14991,14992,14993,14995,14994,14997,14996,14998,14999,15001,15000,15002,15003,15004,15005,15007,15006,15008,15009,15011,15010,15013,15012,15014,15015,15017,15016,15018,15019,15020,15021,15023,15022,15025,15024,15026,15027,15028,15029,15031,15030,15032,15033,15035,15034,15037,15036,15038,15039,15040,15041,15043,15042,15045,15044,15046,15047,15049,15048,15050,15051,15052,15053,15055,15054,15057,15056,15058,15059,15060,15061,15063,15062,15064,15065,15067,15066,15069,15068,15070,15071,15073,15072,15074,15075,15076,15077,15079,15078,15080,15081,15083,15082,15085,15084,15086,15087,15088,15089,15091,15090,15093,15092,15094,15095,15097,15096,15098,15099,15100,15101,15103,15102,15105,15104,15106,15107,15108,15109,15111,15110,15112,15113,15115,15114,15117,15116,15118,15119,15120,15121,15123,15122,15125,15124,15126,15127,15129,15128,15130,15131,15132,15133,15135,15134,15136,15137,15139,15138,15141,15140,15142,15143,15145,15144,15146,15147,15148,15149,15151,15150,15153,15152,15154,15155,15156,15157,15159,15158,15160,15161,15163,15162,15165,15164,15166,15167,15168,15169,15171,15170,15173,15172,15174,15175,15177,15176,15178,15179,15180,15181,15183,15182,15185,15184,15186,15187,15188,15189,15191,15190,15192,15193,15195,15194,15197,15196,15198,15199,15201,15200,15202,15203,15204,15205,15207,15206,15208,15209,15211,15210,15213,15212,15214,15215,15216,15217,15219,15218,15221,15220,15222,15223,15225,15224,15226,15227,15228,15229,15231,15230,15232,15233,15235,15234,15237,15236,15238,15239,15241,15240,15242,15243,15244,15245,15247,15246,15249,15248,15250,15251,15252,15253,15255,15254,15256,15257,15259,15258,15261,15260,15262,15263,15265,15264,15266,15267,15268,15269,15271,15270,15272,15273,15275,15274,15277,15276,15278,15279,15280,15281,15283,15282,15285,15284,15286,15287,15289,15288,15290,15291,15292,15293,15295,15294,15297,15296,15298,15299,15300,15301,15303,15302,15304,15305,15307,15306,15309,15308,15310,15311,15312,15313,15315,15314,15317,15316,15318,15319,15321,15320,15322,15323,15324,15325,15327,15326,15328,15329,15331,15330,15333,15332,15334,15335,15337,15336,15338,15339,15340,15341,15343,15342,15345,15344,15346,15347,15348,15349,15351,15350,15352,15353,15355,15354,15357,15356,15358,15359,15360,15361,15363,15362,15365,15364,15366,15367,15369,15368,15370,15371,15372,15373,15375,15374,15377,15376,15378,15379,15380,15381,15383,15382,15384,15385,15387,15386,15389,15388,15390,15391,15393,15392,15394,15395,15396,15397,15399,15398,15400,15401,15403,15402,15405,15404,15406,15407,15408,15409,15411,15410,15413,15412,15414,15415,15417,15416,15418,15419,15420,15421,15423,15422,15425,15424,15426,15427,15428,15429,15431,15430,15432,15433,15435,15434,15437,15436,15438,15439,15440,15441,15443,15442,15445,15444,15446,15447,15449,15448,15450,15451,15452,15453,15455,15454,15456,15457,15459,15458,15461,15460,15462,15463,15465,15464,15466,15467,15468,15469,15471,15470,15473,15472,15474,15475,15476,15477,15479,15478,15480,15481,15483,15482,15485,15484,15486,15487,15489,15488,15490,15491,15492,15493,15495,15494,15496,15497,15499,15498,15501,15500,15502,15503,15504,15505,15507,15506,15509,15508,15510,15511,15513,15512,15514,15515,15516,15517,15519,15518,15520,15521,15523,15522,15525,15524,15526,15527,15529,15528,15530,15531,15532,15533,15535,15534,15537,15536,15538,15539,15540,15541,15543,15542,15544,15545,15547,15546,15549,15548,15550,15551,15552,15553,15555,15554,15557,15556,15558,15559,15561,15560,15562,15563,15564,15565,15567,15566,15569,15568,15570,15571,15572,15573,15575,15574,15576,15577,15579,15578,15581,15580,15582,15583,15585,15584,15586,15587,15588,15589,15591,15590,15592,15593,15595,15594,15597,15596,15598,15599,15600,15601,15603,15602,15605,15604,15606,15607,15609,15608,15610,15611,15612,15613,15615,15614,15617,15616,15618,15619,15620,15621,15623,15622,15624,15625,15627,15626,15629,15628,15630,15631,15632,15633,15635,15634,15637,15636,15638,15639,15641,15640,15642,15643,15644,15645,15647,15646,15648,15649,15651,15650,15653,15652,15654,15655,15657,15656,15658,15659,15660,15661,15663,15662,15665,15664,15666,15667,15668,15669,15671,15670,15672,15673,15675,15674,15677,15676,15678,15679,15680,15681,15683,15682,15685,15684,15686,15687,15689,15688,15690,15691,15692,15693,15695,15694,15697,15696,15698,15699,15700,15701,15703,15702,15704,15705,15707,15706,15709,15708,15710,15711,15713,15712,15714,15715,15716,15717,15719,15718,15720,15721,15723,15722,15725,15724,15726,15727,15728,15729,15731,15730,15733,15732,15734,15735,15737,15736,15738,15739,15740,15741,15743,15742,15744,15745,15747,15746,15749,15748,15750,15751,15753,15752,15754,15755,15756,15757,15759,15758,15761,15760,15762,15763,15764,15765,15767,15766,15768,15769,15771,15770,15773,15772,15774,15775,15777,15776,15778,15779,15780,15781,15783,15782,15784,15785,15787,15786,15789,15788,15790,15791,15792,15793,15795,15794,15797,15796,15798,15799,15801,15800,15802,15803,15804,15805,15807,15806,15809,15808,15810,15811,15812,15813,15815,15814,15816,15817,15819,15818,15821,15820,15822,15823,15824,15825,15827,15826,15829,15828,15830,15831,15833,15832,15834,15835,15836,15837,15839,15838,15840,15841,15843,15842,15845,15844,15846,15847,15849,15848,15850,15851,15852,15853,15855,15854,15857,15856,15858,15859,15860,15861,15863,15862,15864,15865,15867,15866,15869,15868,15870,15871,15873,15872,15874,15875,15876,15877,15879,15878,15880,15881,15883,15882,15885,15884,15886,15887,15888,15889,15891,15890,15893,15892,15894,15895,15897,15896,15898,15899,15900,15901,15903,15902,15904,15905,15907,15906,15909,15908,15910,15911,15913,15912,15914,15915,15916,15917,15919,15918,15921,15920,15922,15923,15924,15925,15927,15926,15928,15929,15931,15930,15933,15932,15934,15935,15936,15937,15939,15938,15941,15940,15942,15943,15945,15944,15946,15947,15948,15949,15951,15950,15953,15952,15954,15955,15956,15957,15959,15958,15960,15961,15963,15962,15965,15964,15966,15967,15969,15968,15970,15971,15972,15973,15975,15974,15976,15977,15979,15978,15981,15980,15982,15983,15984,15985,15987,15986,15989,15988,15990,15991,15993,15992,15994,15995,15996,15997,15999,15998,16000,16001,16003,16002,16005,16004,16006,16007,16009,16008,16010,16011,16012,16013,16015,16014,16017,16016,16018,16019,16020,16021,16023,16022,16024,16025,16027,16026,16029,16028,16030,16031,16033,16032,16034,16035,16036,16037,16039,16038,16040,16041,16043,16042,16045,16044,16046,16047,16048,16049,16051,16050,16053,16052,16054,16055,16057,16056,16058,16059,16060,16061,16063,16062,16065,16064,16066,16067,16068,16069,16071,16070,16072,16073,16075,16074,16077,16076,16078,16079,16080,16081,16083,16082,16085,16084,16086,16087,16089,16088,16090,16091,16092,16093,16095,16094,16096,16097,16099,16098,16101,16100,16102,16103,16105,16104,16106,16107,16108,16109,16111,16110,16113,16112,16114,16115,16116,16117,16119,16118,16120,16121,16123,16122,16125,16124,16126,16127,16128,16129,16131,16130,16133,16132,16134,16135,16137,16136,16138,16139,16140,16141,16143,16142,16145,16144,16146,16147,16148,16149,16151,16150,16152,16153,16155,16154,16157,16156,16158,16159,16161,16160,16162,16163,16164,16165,16167,16166,16168,16169,16171,16170,16173,16172,16174,16175,16176,16177,16179,16178,16181,16180,16182,16183,16185,16184,16186,16187,16188,16189,16191,16190,16193,16192,16194,16195,16196,16197,16199,16198,16200,16201,16203,16202,16205,16204,16206,16207,16208,16209,16211,16210,16213,16212,16214,16215,16217,16216,16218,16219,16220,16221,16223,16222,16224,16225,16227,16226,16229,16228,16230,16231,16233,16232,16234,16235,16236,16237,16239,16238,16241,16240,16242,16243,16244,16245,16247,16246,16248,16249,16251,16250,16253,16252,16254,16255,16257,16256,16258,16259,16260,16261,16263,16262,16264,16265,16267,16266,16269,16268,16270,16271,16272,16273,16275,16274,16277,16276,16278,16279,16281,16280,16282,16283,16284,16285,16287,16286,16288,16289,16291,16290,16293,16292,16294,16295,16297,16296,16298,16299,16300,16301,16303,16302,16305,16304,16306,16307,16308,16309,16311,16310,16312,16313,16315,16314,16317,16316,16318,16319,16320,16321,16323,16322,16325,16324,16326,16327,16329,16328,16330,16331,16332,16333,16335,16334,16337,16336,16338,16339,16340,16341,16343,16342,16344,16345,16347,16346,16349,16348,16350,16351,16353,16352,16354,16355,16356,16357,16359,16358,16360,16361,16363,16362,16365,16364,16366,16367,16368,16369,16371,16370,16373,16372,16374,16375,16377,16376,16378,16379,16380,16381,16383,16382,16385,16384,16386,16387,16388,16389,16391,16390,16392,16393,16395,16394,16397,16396,16398,16399,16400,16401,16403,16402,16405,16404,16406,16407,16409,16408,16410,16411,16412,16413,16415,16414,16416,16417,16419,16418,16421,16420,16422,16423,16425,16424,16426,16427,16428,16429,16431,16430,16433,16432,16434,16435,16436,16437,16439,16438,16440,16441,16443,16442,16445,16444,16446,16447,16448,16449,16451,16450,16453,16452,16454,16455,16457,16456,16458,16459,16460,16461,16463,16462,16465,16464,16466,16467,16468,16469,16471,16470,16472,16473,16475,16474,16477,16476,16478,16479,16481,16480,16482,16483,16484,16485,16487,16486,16488,16489,16491,16490,16493,16492,16494,16495,16496,16497,16499,16498,16501,16500,16502,16503,16505,16504,16506,16507,16508,16509,16511,16510,16512,16513,16515,16514,16517,16516,16518,16519,16521,16520,16522,16523,16524,16525,16527,16526,16529,16528,16530,16531,16532,16533,16535,16534,16536,16537,16539,16538,16541,16540,16542,16543,16545,16544,16546,16547,16548,16549,16551,16550,16552,16553,16555,16554,16557,16556,16558,16559,16560,16561,16563,16562,16565,16564,16566,16567,16569,16568,16570,16571,16572,16573,16575,16574,16577,16576,16578,16579,16580,16581,16583,16582,16584,16585,16587,16586,16589,16588,16590,16591,16592,16593,16595,16594,16597,16596,16598,16599,16601,16600,16602,16603,16604,16605,16607,16606,16608,16609,16611,16610,16613,16612,16614,16615,16617,16616,16618,16619,16620,16621,16623,16622,16625,16624,16626,16627,16628,16629,16631,16630,16632,16633,16635,16634,16637,16636,16638,16639,16640,16641,16643,16642,16645,16644,16646,16647,16649,16648,16650,16651,16652,16653,16655,16654,16657,16656,16658,16659,16660,16661,16663,16662,16664,16665,16667,16666,16669,16668,16670,16671,16673,16672,16674,16675,16676,16677,16679,16678,16680,16681,16683,16682,16685,16684,16686,16687,16688,16689,16691,16690,16693,16692,16694,16695,16697,16696,16698,16699,16700,16701,16703,16702,16705,16704,16706,16707,16708,16709,16711,16710,16712,16713,16715,16714,16717,16716,16718,16719,16720,16721,16723,16722,16725,16724,16726,16727,16729,16728,16730,16731,16732,16733,16735,16734,16736,16737,16739,16738,16741,16740,16742,16743,16745,16744,16746,16747,16748,16749,16751,16750,16753,16752,16754,16755,16756,16757,16759,16758,16760,16761,16763,16762,16765,16764,16766,16767,16769,16768,16770,16771,16772,16773,16775,16774,16776,16777,16779,16778,16781,16780,16782,16783,16784,16785,16787,16786,16789,16788,16790,16791,16793,16792,16794,16795,16796,16797,16799,16798,16800,16801,16803,16802,16805,16804,16806,16807,16809,16808,16810,16811,16812,16813,16815,16814,16817,16816,16818,16819,16820,16821,16823,16822,16824,16825,16827,16826,16829,16828,16830,16831,16832,16833,16835,16834,16837,16836,16838,16839,16841,16840,16842,16843,16844,16845,16847,16846,16849,16848,16850,16851,16852,16853,16855,16854,16856,16857,16859,16858,16861,16860,16862,16863,16865,16864,16866,16867,16868,16869,16871,16870,16872,16873,16875,16874,16877,16876,16878,16879,16880,16881,16883,16882,16885,16884,16886,16887,16889,16888,16890,16891,16892,16893,16895,16894,16896,16897,16899,16898,16901,16900,16902,16903,16905,16904,16906,16907,16908,16909,16911,16910,16913,16912,16914,16915,16916,16917,16919,16918,16920,16921,16923,16922,16925,16924,16926,16927,16929,16928,16930,16931,16932,16933,16935,16934,16936,16937,16939,16938,16941,16940,16942,16943,16944,16945,16947,16946,16949,16948,16950,16951,16953,16952,16954,16955,16956,16957,16959,16958,16961,16960,16962,16963,16964,16965,16967,16966,16968,16969,16971,16970,16973,16972,16974,16975,16976,16977,16979,16978,16981,16980,16982,16983,16985,16984,16986,16987,16988,16989,16991,16990,16992,16993,16995,16994,16997,16996,16998,16999,17001,17000,17002,17003,17004,17005,17007,17006,17009,17008,17010,17011,17012,17013,17015,17014,17016,17017,17019,17018,17021,17020,17022,17023,17025,17024,17026,17027,17028,17029,17031,17030,17032,17033,17035,17034,17037,17036,17038,17039,17040,17041,17043,17042,17045,17044,17046,17047,17049,17048,17050,17051,17052,17053,17055,17054,17056,17057,17059,17058,17061,17060,17062,17063,17065,17064,17066,17067,17068,17069,17071,17070,17073,17072,17074,17075,17076,17077,17079,17078,17080,17081,17083,17082,17085,17084,17086,17087,17088,17089,17091,17090,17093,17092,17094,17095,17097,17096,17098,17099,17100,17101,17103,17102,17105,17104,17106,17107,17108,17109,17111,17110,17112,17113,17115,17114,17117,17116,17118,17119,17121,17120,17122,17123,17124,17125,17127,17126,17128,17129,17131,17130,17133,17132,17134,17135,17136,17137,17139,17138,17141,17140,17142,17143,17145,17144,17146,17147,17148,17149,17151,17150,17153,17152,17154,17155,17156,17157,17159,17158,17160,17161,17163,17162,17165,17164,17166,17167,17168,17169,17171,17170,17173,17172,17174,17175,17177,17176,17178,17179,17180,17181,17183,17182,17184,17185,17187,17186,17189,17188,17190,17191,17193,17192,17194,17195,17196,17197,17199,17198,17201,17200,17202,17203,17204,17205,17207,17206,17208,17209,17211,17210,17213,17212,17214,17215,17216,17217,17219,17218,17221,17220,17222,17223,17225,17224,17226,17227,17228,17229,17231,17230,17233,17232,17234,17235,17236,17237,17239,17238,17240,17241,17243,17242,17245,17244,17246,17247,17249,17248,17250,17251,17252,17253,17255,17254,17256,17257,17259,17258,17261,17260,17262,17263,17264,17265,17267,17266,17269,17268,17270,17271,17273,17272,17274,17275,17276,17277,17279,17278,17280,17281,17283,17282,17285,17284,17286,17287,17289,17288,17290,17291,17292,17293,17295,17294,17297,17296,17298,17299,17300,17301,17303,17302,17304,17305,17307,17306,17309,17308,17310,17311,17313,17312,17314,17315,17316,17317,17319,17318,17320,17321,17323,17322,17325,17324,17326,17327,17328,17329,17331,17330,17333,17332,17334,17335,17337,17336,17338,17339,17340,17341,17343,17342,17345,17344,17346,17347,17348,17349,17351,17350,17352,17353,17355,17354,17357,17356,17358,17359,17360,17361,17363,17362,17365,17364,17366,17367,17369,17368,17370,17371,17372,17373,17375,17374,17376,17377,17379,17378,17381,17380,17382,17383,17385,17384,17386,17387,17388,17389,17391,17390,17393,17392,17394,17395,17396,17397,17399,17398,17400,17401,17403,17402,17405,17404,17406,17407,17408,17409,17411,17410,17413,17412,17414,17415,17417,17416,17418,17419,17420,17421,17423,17422,17425,17424,17426,17427,17428,17429,17431,17430,17432,17433,17435,17434,17437,17436,17438,17439,17441,17440,17442,17443,17444,17445,17447,17446,17448,17449,17451,17450,17453,17452,17454,17455,17456,17457,17459,17458,17461,17460,17462,17463,17465,17464,17466,17467,17468,17469,17471,17470,17473,17472,17474,17475,17476,17477,17479,17478,17480,17481,17483,17482,17485,17484,17486,17487,17488,17489,17491,17490,17493,17492,17494,17495,17497,17496,17498,17499,17500,17501,17503,17502,17504,17505,17507,17506,17509,17508,17510,17511,17513,17512,17514,17515,17516,17517,17519,17518,17521,17520,17522,17523,17524,17525,17527,17526,17528,17529,17531,17530,17533,17532,17534,17535,17537,17536,17538,17539,17540,17541,17543,17542,17544,17545,17547,17546,17549,17548,17550,17551,17552,17553,17555,17554,17557,17556,17558,17559,17561,17560,17562,17563,17564,17565,17567,17566,17568,17569,17571,17570,17573,17572,17574,17575,17577,17576,17578,17579,17580,17581,17583,17582,17585,17584,17586,17587,17588,17589,17591,17590,17592,17593,17595,17594,17597,17596,17598,17599,17600,17601,17603,17602,17605,17604,17606,17607,17609,17608,17610,17611,17612,17613,17615,17614,17617,17616,17618,17619,17620,17621,17623,17622,17624,17625,17627,17626,17629,17628,17630,17631,17633,17632,17634,17635,17636,17637,17639,17638,17640,17641,17643,17642,17645,17644,17646,17647,17648,17649,17651,17650,17653,17652,17654,17655,17657,17656,17658,17659,17660,17661,17663,17662,17665,17664,17666,17667,17668,17669,17671,17670,17672,17673,17675,17674,17677,17676,17678,17679,17680,17681,17683,17682,17685,17684,17686,17687,17689,17688,17690,17691,17692,17693,17695,17694,17696,17697,17699,17698,17701,17700,17702,17703,17705,17704,17706,17707,17708,17709,17711,17710,17713,17712,17714,17715,17716,17717,17719,17718,17720,17721,17723,17722,17725,17724,17726,17727,17728,17729,17731,17730,17733,17732,17734,17735,17737,17736,17738,17739,17740,17741,17743,17742,17745,17744,17746,17747,17748,17749,17751,17750,17752,17753,17755,17754,17757,17756,17758,17759,17761,17760,17762,17763,17764,17765,17767,17766,17768,17769,17771,17770,17773,17772,17774,17775,17776,17777,17779,17778,17781,17780,17782,17783,17785,17784,17786,17787,17788,17789,17791,17790,17792,17793,17795,17794,17797,17796,17798,17799,17801,17800,17802,17803,17804,17805,17807,17806,17809,17808,17810,17811,17812,17813,17815,17814,17816,17817,17819,17818,17821,17820,17822,17823,17825,17824,17826,17827,17828,17829,17831,17830,17832,17833,17835,17834,17837,17836,17838,17839,17840,17841,17843,17842,17845,17844,17846,17847,17849,17848,17850,17851,17852,17853,17855,17854,17857,17856,17858,17859,17860,17861,17863,17862,17864,17865,17867,17866,17869,17868,17870,17871,17872,17873,17875,17874,17877,17876,17878,17879,17881,17880,17882,17883,17884,17885,17887,17886,17888,17889,17891,17890,17893,17892,17894,17895,17897,17896,17898,17899,17900,17901,17903,17902,17905,17904,17906,17907,17908,17909,17911,17910,17912,17913,17915,17914,17917,17916,17918,17919,17921,17920,17922,17923,17924,17925,17927,17926,17928,17929,17931,17930,17933,17932,17934,17935,17936,17937,17939,17938,17941,17940,17942,17943,17945,17944,17946,17947,17948,17949,17951,17950,17952,17953,17955,17954,17957,17956,17958,17959,17961,17960,17962,17963,17964,17965,17967,17966,17969,17968,17970,17971,17972,17973,17975,17974,17976,17977,17979,17978,17981,17980,17982,17983,17984,17985,17987,17986,17989,17988,17990,17991,17993,17992,17994,17995,17996,17997,17999,17998,18001,18000,18002,18003,18004,18005,18007,18006,18008,18009,18011,18010,18013,18012,18014,18015,18017,18016,18018,18019,18020,18021,18023,18022,18024,18025,18027,18026,18029,18028,18030,18031,18032,18033,18035,18034,18037,18036,18038,18039,18041,18040,18042,18043,18044,18045,18047,18046,18048,18049,18051,18050,18053,18052,18054,18055,18057,18056,18058,18059,18060,18061,18063,18062,18065,18064,18066,18067,18068,18069,18071,18070,18072,18073,18075,18074,18077,18076,18078,18079,18081,18080,18082,18083,18084,18085,18087,18086,18088,18089,18091,18090,18093,18092,18094,18095,18096,18097,18099,18098,18101,18100,18102,18103,18105,18104,18106,18107,18108,18109,18111,18110,18113,18112,18114,18115,18116,18117,18119,18118,18120,18121,18123,18122,18125,18124,18126,18127,18128,18129,18131,18130,18133,18132,18134,18135,18137,18136,18138,18139,18140,18141,18143,18142,18144,18145,18147,18146,18149,18148,18150,18151,18153,18152,18154,18155,18156,18157,18159,18158,18161,18160,18162,18163,18164,18165,18167,18166,18168,18169,18171,18170,18173,18172,18174,18175,18176,18177,18179,18178,18181,18180,18182,18183,18185,18184,18186,18187,18188,18189,18191,18190,18193,18192,18194,18195,18196,18197,18199,18198,18200,18201,18203,18202,18205,18204,18206,18207,18209,18208,18210,18211,18212,18213,18215,18214,18216,18217,18219,18218,18221,18220,18222,18223,18224,18225,18227,18226,18229,18228,18230,18231,18233,18232,18234,18235,18236,18237,18239,18238,18241,18240,18242,18243,18244,18245,18247,18246,18248,18249,18251,18250,18253,18252,18254,18255,18256,18257,18259,18258,18261,18260,18262,18263,18265,18264,18266,18267,18268,18269,18271,18270,18272,18273,18275,18274,18277,18276,18278,18279,18281,18280,18282,18283,18284,18285,18287,18286,18289,18288,18290,18291,18292,18293,18295,18294,18296,18297,18299,18298,18301,18300,18302,18303,18305,18304,18306,18307,18308,18309,18311,18310,18312,18313,18315,18314,18317,18316,18318,18319,18320,18321,18323,18322,18325,18324,18326,18327,18329,18328,18330,18331,18332,18333,18335,18334,18336,18337,18339,18338,18341,18340,18342,18343,18345,18344,18346,18347,18348,18349,18351,18350,18353,18352,18354,18355,18356,18357,18359,18358,18360,18361,18363,18362,18365,18364,18366,18367,18368,18369,18371,18370,18373,18372,18374,18375,18377,18376,18378,18379,18380,18381,18383,18382,18385,18384,18386,18387,18388,18389,18391,18390,18392,18393,18395,18394,18397,18396,18398,18399,18401,18400,18402,18403,18404,18405,18407,18406,18408,18409,18411,18410,18413,18412,18414,18415,18416,18417,18419,18418,18421,18420,18422,18423,18425,18424,18426,18427,18428,18429,18431,18430,18432,18433,18435,18434,18437,18436,18438,18439,18441,18440,18442,18443,18444,18445,18447,18446,18449,18448,18450,18451,18452,18453,18455,18454,18456,18457,18459,18458,18461,18460,18462,18463,18465,18464,18466,18467,18468,18469,18471,18470,18472,18473,18475,18474,18477,18476,18478,18479,18480,18481,18483,18482,18485,18484,18486,18487,18489,18488,18490,18491,18492,18493,18495,18494,18497,18496,18498,18499,18500,18501,18503,18502,18504,18505,18507,18506,18509,18508,18510,18511,18512,18513,18515,18514,18517,18516,18518,18519,18521,18520,18522,18523,18524,18525,18527,18526,18528,18529,18531,18530,18533,18532,18534,18535,18537,18536,18538,18539,18540,18541,18543,18542,18545,18544,18546,18547,18548,18549,18551,18550,18552,18553,18555,18554,18557,18556,18558,18559,18561,18560,18562,18563,18564,18565,18567,18566,18568,18569,18571,18570,18573,18572,18574,18575,18576,18577,18579,18578,18581,18580,18582,18583,18585,18584,18586,18587,18588,18589,18591,18590,18592,18593,18595,18594,18597,18596,18598,18599,18601,18600,18602,18603,18604,18605,18607,18606,18609,18608,18610,18611,18612,18613,18615,18614,18616,18617,18619,18618,18621,18620,18622,18623,18624,18625,18627,18626,18629,18628,18630,18631,18633,18632,18634,18635,18636,18637,18639,18638,18641,18640,18642,18643,18644,18645,18647,18646,18648,18649,18651,18650,18653,18652,18654,18655,18657,18656,18658,18659,18660,18661,18663,18662,18664,18665,18667,18666,18669,18668,18670,18671,18672,18673,18675,18674,18677,18676,18678,18679,18681,18680,18682,18683,18684,18685,18687,18686,18689,18688,18690,18691,18692,18693,18695,18694,18696,18697,18699,18698,18701,18700,18702,18703,18704,18705,18707,18706,18709,18708,18710,18711,18713,18712,18714,18715,18716,18717,18719,18718,18720,18721,18723,18722,18725,18724,18726,18727,18729,18728,18730,18731,18732,18733,18735,18734,18737,18736,18738,18739,18740,18741,18743,18742,18744,18745,18747,18746,18749,18748,18750,18751,18752,18753,18755,18754,18757,18756,18758,18759,18761,18760,18762,18763,18764,18765,18767,18766,18769,18768,18770,18771,18772,18773,18775,18774,18776,18777,18779,18778,18781,18780,18782,18783,18785,18784,18786,18787,18788,18789,18791,18790,18792,18793,18795,18794,18797,18796,18798,18799,18800,18801,18803,18802,18805,18804,18806,18807,18809,18808,18810,18811,18812,18813,18815,18814,18816,18817,18819,18818,18821,18820,18822,18823,18825,18824,18826,18827,18828,18829,18831,18830,18833,18832,18834,18835,18836,18837,18839,18838,18840,18841,18843,18842,18845,18844,18846,18847,18849,18848,18850,18851,18852,18853,18855,18854,18856,18857,18859,18858,18861,18860,18862,18863,18864,18865,18867,18866,18869,18868,18870,18871,18873,18872,18874,18875,18876,18877,18879,18878,18881,18880,18882,18883,18884,18885,18887,18886,18888,18889,18891,18890,18893,18892,18894,18895,18896,18897,18899,18898,18901,18900,18902,18903,18905,18904,18906,18907,18908,18909,18911,18910,18912,18913,18915,18914,18917,18916,18918,18919,18921,18920,18922,18923,18924,18925,18927,18926,18929,18928,18930,18931,18932,18933,18935,18934,18936,18937,18939,18938,18941,18940,18942,18943,18945,18944,18946,18947,18948,18949,18951,18950,18952,18953,18955,18954,18957,18956,18958,18959,18960,18961,18963,18962,18965,18964,18966,18967,18969,18968,18970,18971,18972,18973,18975,18974,18976,18977,18979,18978,18981,18980,18982,18983,18985,18984,18986,18987,18988,18989,18991,18990,18993,18992,18994,18995,18996,18997,18999,18998,19000,19001,19003,19002,19005,19004,19006,19007,19008,19009,19011,19010,19013,19012,19014,19015,19017,19016,19018,19019,19020,19021,19023,19022,19025,19024,19026,19027,19028,19029,19031,19030,19032,19033,19035,19034,19037,19036,19038,19039,19041,19040,19042,19043,19044,19045,19047,19046,19048,19049,19051,19050,19053,19052,19054,19055,19056,19057,19059,19058,19061,19060,19062,19063,19065,19064,19066,19067,19068,19069,19071,19070,19072,19073,19075,19074,19077,19076,19078,19079,19081,19080,19082,19083,19084,19085,19087,19086,19089,19088,19090,19091,19092,19093,19095,19094,19096,19097,19099,19098,19101,19100,19102,19103,19105,19104,19106,19107,19108,19109,19111,19110,19112,19113,19115,19114,19117,19116,19118,19119,19120,19121,19123,19122,19125,19124,19126,19127,19129,19128,19130,19131,19132,19133,19135,19134,19137,19136,19138,19139,19140,19141,19143,19142,19144,19145,19147,19146,19149,19148,19150,19151,19152,19153,19155,19154,19157,19156,19158,19159,19161,19160,19162,19163,19164,19165,19167,19166,19168,19169,19171,19170,19173,19172,19174,19175,19177,19176,19178,19179,19180,19181,19183,19182,19185,19184,19186,19187,19188,19189,19191,19190,19192,19193,19195,19194,19197,19196,19198,19199,19200,19201,19203,19202,19205,19204,19206,19207,19209,19208,19210,19211,19212,19213,19215,19214,19217,19216,19218,19219,19220,19221,19223,19222,19224,19225,19227,19226,19229,19228,19230,19231,19233,19232,19234,19235,19236,19237,19239,19238,19240,19241,19243,19242,19245,19244,19246,19247,19248,19249,19251,19250,19253,19252,19254,19255,19257,19256,19258,19259,19260,19261,19263,19262,19265,19264,19266,19267,19268,19269,19271,19270,19272,19273,19275,19274,19277,19276,19278,19279,19280,19281,19283,19282,19285,19284,19286,19287,19289,19288,19290,19291,19292,19293,19295,19294,19296,19297,19299,19298,19301,19300,19302,19303,19305,19304,19306,19307,19308,19309,19311,19310,19313,19312,19314,19315,19316,19317,19319,19318,19320,19321,19323,19322,19325,19324,19326,19327,19329,19328,19330,19331,19332,19333,19335,19334,19336,19337,19339,19338,19341,19340,19342,19343,19344,19345,19347,19346,19349,19348,19350,19351,19353,19352,19354,19355,19356,19357,19359,19358,19360,19361,19363,19362,19365,19364,19366,19367,19369,19368,19370,19371,19372,19373,19375,19374,19377,19376,19378,19379,19380,19381,19383,19382,19384,19385,19387,19386,19389,19388,19390,19391,19392,19393,19395,19394,19397,19396,19398,19399,19401,19400,19402,19403,19404,19405,19407,19406,19409,19408,19410,19411,19412,19413,19415,19414,19416,19417,19419,19418,19421,19420,19422,19423,19425,19424,19426,19427,19428,19429,19431,19430,19432,19433,19435,19434,19437,19436,19438,19439,19440,19441,19443,19442,19445,19444,19446,19447,19449,19448,19450,19451,19452,19453,19455,19454,19457,19456,19458,19459,19460,19461,19463,19462,19464,19465,19467,19466,19469,19468,19470,19471,19472,19473,19475,19474,19477,19476,19478,19479,19481,19480,19482,19483,19484,19485,19487,19486,19488,19489,19491,19490,19493,19492,19494,19495,19497,19496,19498,19499,19500,19501,19503,19502,19505,19504,19506,19507,19508,19509,19511,19510,19512,19513,19515,19514,19517,19516,19518,19519,19520,19521,19523,19522,19525,19524,19526,19527,19529,19528,19530,19531,19532,19533,19535,19534,19537,19536,19538,19539,19540,19541,19543,19542,19544,19545,19547,19546,19549,19548,19550,19551,19553,19552,19554,19555,19556,19557,19559,19558,19560,19561,19563,19562,19565,19564,19566,19567,19568,19569,19571,19570,19573,19572,19574,19575,19577,19576,19578,19579,19580,19581,19583,19582,19584,19585,19587,19586,19589,19588,19590,19591,19593,19592,19594,19595,19596,19597,19599,19598,19601,19600,19602,19603,19604,19605,19607,19606,19608,19609,19611,19610,19613,19612,19614,19615,19617,19616,19618,19619,19620,19621,19623,19622,19624,19625,19627,19626,19629,19628,19630,19631,19632,19633,19635,19634,19637,19636,19638,19639,19641,19640,19642,19643,19644,19645,19647,19646,19649,19648,19650,19651,19652,19653,19655,19654,19656,19657,19659,19658,19661,19660,19662,19663,19664,19665,19667,19666,19669,19668,19670,19671,19673,19672,19674,19675,19676,19677,19679,19678,19680,19681,19683,19682,19685,19684,19686,19687,19689,19688,19690,19691,19692,19693,19695,19694,19697,19696,19698,19699,19700,19701,19703,19702,19704,19705,19707,19706,19709,19708,19710,19711,19712,19713,19715,19714,19717,19716,19718,19719,19721,19720,19722,19723,19724,19725,19727,19726,19729,19728,19730,19731,19732,19733,19735,19734,19736,19737,19739,19738,19741,19740,19742,19743,19745,19744,19746,19747,19748,19749,19751,19750,19752,19753,19755,19754,19757,19756,19758,19759,19760,19761,19763,19762,19765,19764,19766,19767,19769,19768,19770,19771,19772,19773,19775,19774,19777,19776,19778,19779,19780,19781,19783,19782,19784,19785,19787,19786,19789,19788,19790,19791,19792,19793,19795,19794,19797,19796,19798,19799,19801,19800,19802,19803,19804,19805,19807,19806,19808,19809,19811,19810,19813,19812,19814,19815,19817,19816,19818,19819,19820,19821,19823,19822,19825,19824,19826,19827,19828,19829,19831,19830,19832,19833,19835,19834,19837,19836,19838,19839,19841,19840,19842,19843,19844,19845,19847,19846,19848,19849,19851,19850,19853,19852,19854,19855,19856,19857,19859,19858,19861,19860,19862,19863,19865,19864,19866,19867,19868,19869,19871,19870,19872,19873,19875,19874,19877,19876,19878,19879,19881,19880,19882,19883,19884,19885,19887,19886,19889,19888,19890,19891,19892,19893,19895,19894,19896,19897,19899,19898,19901,19900,19902,19903,19904,19905,19907,19906,19909,19908,19910,19911,19913,19912,19914,19915,19916,19917,19919,19918,19921,19920,19922,19923,19924,19925,19927,19926,19928,19929,19931,19930,19933,19932,19934,19935,19937,19936,19938,19939,19940,19941,19943,19942,19944,19945,19947,19946,19949,19948,19950,19951,19952,19953,19955,19954,19957,19956,19958,19959,19961,19960,19962,19963,19964,19965,19967,19966,19968,19969,19971,19970,19973,19972,19974,19975,19977,19976,19978,19979,19980,19981,19983,19982,19985,19984,19986,19987,19988,19989,19991,19990,19992,19993,19995,19994,19997,19996,19998,19999,20001,20000,20002,20003,20004,20005,20007,20006,20008,20009,20011,20010,20013,20012,20014,20015,20016,20017,20019,20018,20021,20020,20022,20023,20025,20024,20026,20027,20028,20029,20031,20030,20033,20032,20034,20035,20036,20037,20039,20038,20040,20041,20043,20042,20045,20044,20046,20047,20048,20049,20051,20050,20053,20052,20054,20055,20057,20056,20058,20059,20060,20061,20063,20062,20064,20065,20067,20066,20069,20068,20070,20071,20073,20072,20074,20075,20076,20077,20079,20078,20081,20080,20082,20083,20084,20085,20087,20086,20088,20089,20091,20090,20093,20092,20094,20095,20097,20096,20098,20099,20100,20101,20103,20102,20104,20105,20107,20106,20109,20108,20110,20111,20112,20113,20115,20114,20117,20116,20118,20119,20121,20120,20122,20123,20124,20125,20127,20126,20128,20129,20131,20130,20133,20132,20134,20135,20137,20136,20138,20139,20140,20141,20143,20142,20145,20144,20146,20147,20148,20149,20151,20150,20152,20153,20155,20154,20157,20156,20158,20159,20160,20161,20163,20162,20165,20164,20166,20167,20169,20168,20170,20171,20172,20173,20175,20174,20177,20176,20178,20179,20180,20181,20183,20182,20184,20185,20187,20186,20189,20188,20190,20191,20193,20192,20194,20195,20196,20197,20199,20198,20200,20201,20203,20202,20205,20204,20206,20207,20208,20209,20211,20210,20213,20212,20214,20215,20217,20216,20218,20219,20220,20221,20223,20222,20225,20224,20226,20227,20228,20229,20231,20230,20232,20233,20235,20234,20237,20236,20238,20239,20240,20241,20243,20242,20245,20244,20246,20247,20249,20248,20250,20251,20252,20253,20255,20254,20256,20257,20259,20258,20261,20260,20262,20263,20265,20264,20266,20267,20268,20269,20271,20270,20273,20272,20274,20275,20276,20277,20279,20278,20280,20281,20283,20282,20285,20284,20286,20287,20288,20289,20291,20290,20293,20292,20294,20295,20297,20296,20298,20299,20300,20301,20303,20302,20305,20304,20306,20307,20308,20309,20311,20310,20312,20313,20315,20314,20317,20316,20318,20319,20321,20320,20322,20323,20324,20325,20327,20326,20328,20329,20331,20330,20333,20332,20334,20335,20336,20337,20339,20338,20341,20340,20342,20343,20345,20344,20346,20347,20348,20349,20351,20350,20352,20353,20355,20354,20357,20356,20358,20359,20361,20360,20362,20363,20364,20365,20367,20366,20369,20368,20370,20371,20372,20373,20375,20374,20376,20377,20379,20378,20381,20380,20382,20383,20385,20384,20386,20387,20388,20389,20391,20390,20392,20393,20395,20394,20397,20396,20398,20399,20400,20401,20403,20402,20405,20404,20406,20407,20409,20408,20410,20411,20412,20413,20415,20414,20417,20416,20418,20419,20420,20421,20423,20422,20424,20425,20427,20426,20429,20428,20430,20431,20432,20433,20435,20434,20437,20436,20438,20439,20441,20440,20442,20443,20444,20445,20447,20446,20448,20449,20451,20450,20453,20452,20454,20455,20457,20456,20458,20459,20460,20461,20463,20462,20465,20464,20466,20467,20468,20469,20471,20470,20472,20473,20475,20474,20477,20476,20478,20479,20480,20481,20483,20482,20485,20484,20486,20487,20489,20488,20490,20491,20492,20493,20495,20494,20497,20496,20498,20499,20500,20501,20503,20502,20504,20505,20507,20506,20509,20508,20510,20511,20513,20512,20514,20515,20516,20517,20519,20518,20520,20521,20523,20522,20525,20524,20526,20527,20528,20529,20531,20530,20533,20532,20534,20535,20537,20536,20538,20539,20540,20541,20543,20542,20545,20544,20546,20547,20548,20549,20551,20550,20552,20553,20555,20554,20557,20556,20558,20559,20560,20561,20563,20562,20565,20564,20566,20567,20569,20568,20570,20571,20572,20573,20575,20574,20576,20577,20579,20578,20581,20580,20582,20583,20585,20584,20586,20587,20588,20589,20591,20590,20593,20592,20594,20595,20596,20597,20599,20598,20600,20601,20603,20602,20605,20604,20606,20607,20609,20608,20610,20611,20612,20613,20615,20614,20616,20617,20619,20618,20621,20620,20622,20623,20624,20625,20627,20626,20629,20628,20630,20631,20633,20632,20634,20635,20636,20637,20639,20638,20640,20641,20643,20642,20645,20644,20646,20647,20649,20648,20650,20651,20652,20653,20655,20654,20657,20656,20658,20659,20660,20661,20663,20662,20664,20665,20667,20666,20669,20668,20670,20671,20672,20673,20675,20674,20677,20676,20678,20679,20681,20680,20682,20683,20684,20685,20687,20686,20689,20688,20690,20691,20692,20693,20695,20694,20696,20697,20699,20698,20701,20700,20702,20703,20705,20704,20706,20707,20708,20709,20711,20710,20712,20713,20715,20714,20717,20716,20718,20719,20720,20721,20723,20722,20725,20724,20726,20727,20729,20728,20730,20731,20732,20733,20735,20734,20737,20736,20738,20739,20740,20741,20743,20742,20744,20745,20747,20746,20749,20748,20750,20751,20752,20753,20755,20754,20757,20756,20758,20759,20761,20760,20762,20763,20764,20765,20767,20766,20768,20769,20771,20770,20773,20772,20774,20775,20777,20776,20778,20779,20780,20781,20783,20782,20785,20784,20786,20787,20788,20789,20791,20790,20792,20793,20795,20794,20797,20796,20798,20799,20800,20801,20803,20802,20805,20804,20806,20807,20809,20808,20810,20811,20812,20813,20815,20814,20817,20816,20818,20819,20820,20821,20823,20822,20824,20825,20827,20826,20829,20828,20830,20831,20833,20832,20834,20835,20836,20837,20839,20838,20840,20841,20843,20842,20845,20844,20846,20847,20848,20849,20851,20850,20853,20852,20854,20855,20857,20856,20858,20859,20860,20861,20863,20862,20864,20865,20867,20866,20869,20868,20870,20871,20873,20872,20874,20875,20876,20877,20879,20878,20881,20880,20882,20883,20884,20885,20887,20886,20888,20889,20891,20890,20893,20892,20894,20895,20897,20896,20898,20899,20900,20901,20903,20902,20904,20905,20907,20906,20909,20908,20910,20911,20912,20913,20915,20914,20917,20916,20918,20919,20921,20920,20922,20923,20924,20925,20927,20926,20929,20928,20930,20931,20932,20933,20935,20934,20936,20937,20939,20938,20941,20940,20942,20943,20944,20945,20947,20946,20949,20948,20950,20951,20953,20952,20954,20955,20956,20957,20959,20958,20960,20961,20963,20962,20965,20964,20966,20967,20969,20968,20970,20971,20972,20973,20975,20974,20977,20976,20978,20979,20980,20981,20983,20982,20984,20985,20987,20986,20989,20988,20990,20991,20993,20992,20994,20995,20996,20997,20999,20998,21000,21001,21003,21002,21005,21004,21006,21007,21008,21009,21011,21010,21013,21012,21014,21015,21017,21016,21018,21019,21020,21021,21023,21022,21024,21025,21027,21026,21029,21028,21030,21031,21033,21032,21034,21035,21036,21037,21039,21038,21041,21040,21042,21043,21044,21045,21047,21046,21048,21049,21051,21050,21053,21052,21054,21055,21056,21057,21059,21058,21061,21060,21062,21063,21065,21064,21066,21067,21068,21069,21071,21070,21073,21072,21074,21075,21076,21077,21079,21078,21080,21081,21083,21082,21085,21084,21086,21087,21089,21088,21090,21091,21092,21093,21095,21094,21096,21097,21099,21098,21101,21100,21102,21103,21104,21105,21107,21106,21109,21108,21110,21111,21113,21112,21114,21115,21116,21117,21119,21118,21120,21121,21123,21122,21125,21124,21126,21127,21129,21128,21130,21131,21132,21133,21135,21134,21137,21136,21138,21139,21140,21141,21143,21142,21144,21145,21147,21146,21149,21148,21150,21151,21153,21152,21154,21155,21156,21157,21159,21158,21160,21161,21163,21162,21165,21164,21166,21167,21168,21169,21171,21170,21173,21172,21174,21175,21177,21176,21178,21179,21180,21181,21183,21182,21185,21184,21186,21187,21188,21189,21191,21190,21192,21193,21195,21194,21197,21196,21198,21199,21200,21201,21203,21202,21205,21204,21206,21207,21209,21208,21210,21211,21212,21213,21215,21214,21216,21217,21219,21218,21221,21220,21222,21223,21225,21224,21226,21227,21228,21229,21231,21230,21233,21232,21234,21235,21236,21237,21239,21238,21240,21241,21243,21242,21245,21244,21246,21247,21248,21249,21251,21250,21253,21252,21254,21255,21257,21256,21258,21259,21260,21261,21263,21262,21265,21264,21266,21267,21268,21269,21271,21270,21272,21273,21275,21274,21277,21276,21278,21279,21281,21280,21282,21283,21284,21285,21287,21286,21288,21289,21291,21290,21293,21292,21294,21295,21296,21297,21299,21298,21301,21300,21302,21303,21305,21304,21306,21307,21308,21309,21311,21310,21313,21312,21314,21315,21316,21317,21319,21318,21320,21321,21323,21322,21325,21324,21326,21327,21328,21329,21331,21330,21333,21332,21334,21335,21337,21336,21338,21339,21340,21341,21343,21342,21344,21345,21347,21346,21349,21348,21350,21351,21353,21352,21354,21355,21356,21357,21359,21358,21361,21360,21362,21363,21364,21365,21367,21366,21368,21369,21371,21370,21373,21372,21374,21375,21377,21376,21378,21379,21380,21381,21383,21382,21384,21385,21387,21386,21389,21388,21390,21391,21392,21393,21395,21394,21397,21396,21398,21399,21401,21400,21402,21403,21404,21405,21407,21406,21408,21409,21411,21410,21413,21412,21414,21415,21417,21416,21418,21419,21420,21421,21423,21422,21425,21424,21426,21427,21428,21429,21431,21430,21432,21433,21435,21434,21437,21436,21438,21439,21440,21441,21443,21442,21445,21444,21446,21447,21449,21448,21450,21451,21452,21453,21455,21454,21457,21456,21458,21459,21460,21461,21463,21462,21464,21465,21467,21466,21469,21468,21470,21471,21473,21472,21474,21475,21476,21477,21479,21478,21480,21481,21483,21482,21485,21484,21486,21487,21488,21489,21491,21490,21493,21492,21494,21495,21497,21496,21498,21499,21500,21501,21503,21502,21505,21504,21506,21507,21508,21509,21511,21510,21512,21513,21515,21514,21517,21516,21518,21519,21520,21521,21523,21522,21525,21524,21526,21527,21529,21528,21530,21531,21532,21533,21535,21534,21536,21537,21539,21538,21541,21540,21542,21543,21545,21544,21546,21547,21548,21549,21551,21550,21553,21552,21554,21555,21556,21557,21559,21558,21560,21561,21563,21562,21565,21564,21566,21567,21568,21569,21571,21570,21573,21572,21574,21575,21577,21576,21578,21579,21580,21581,21583,21582,21585,21584,21586,21587,21588,21589,21591,21590,21592,21593,21595,21594,21597,21596,21598,21599,21601,21600,21602,21603,21604,21605,21607,21606,21608,21609,21611,21610,21613,21612,21614,21615,21616,21617,21619,21618,21621,21620,21622,21623,21625,21624,21626,21627,21628,21629,21631,21630,21632,21633,21635,21634,21637,21636,21638,21639,21641,21640,21642,21643,21644,21645,21647,21646,21649,21648,21650,21651,21652,21653,21655,21654,21656,21657,21659,21658,21661,21660,21662,21663,21665,21664,21666,21667,21668,21669,21671,21670,21672,21673,21675,21674,21677,21676,21678,21679,21680,21681,21683,21682,21685,21684,21686,21687,21689,21688,21690,21691,21692,21693,21695,21694,21697,21696,21698,21699,21700,21701,21703,21702,21704,21705,21707,21706,21709,21708,21710,21711,21712,21713,21715,21714,21717,21716,21718,21719,21721,21720,21722,21723,21724,21725,21727,21726,21728,21729,21731,21730,21733,21732,21734,21735,21737,21736,21738,21739,21740,21741,21743,21742,21745,21744,21746,21747,21748,21749,21751,21750,21752,21753,21755,21754,21757,21756,21758,21759,21760,21761,21763,21762,21765,21764,21766,21767,21769,21768,21770,21771,21772,21773,21775,21774,21777,21776,21778,21779,21780,21781,21783,21782,21784,21785,21787,21786,21789,21788,21790,21791,21793,21792,21794,21795,21796,21797,21799,21798,21800,21801,21803,21802,21805,21804,21806,21807,21808,21809,21811,21810,21813,21812,21814,21815,21817,21816,21818,21819,21820,21821,21823,21822,21825,21824,21826,21827,21828,21829,21831,21830,21832,21833,21835,21834,21837,21836,21838,21839,21840,21841,21843,21842,21845,21844,21846,21847,21849,21848,21850,21851,21852,21853,21855,21854,21856,21857,21859,21858,21861,21860,21862,21863,21865,21864,21866,21867,21868,21869,21871,21870,21873,21872,21874,21875,21876,21877,21879,21878,21880,21881,21883,21882,21885,21884,21886,21887,21889,21888,21890,21891,21892,21893,21895,21894,21896,21897,21899,21898,21901,21900,21902,21903,21904,21905,21907,21906,21909,21908,21910,21911,21913,21912,21914,21915,21916,21917,21919,21918,21920,21921,21923,21922,21925,21924,21926,21927,21929,21928,21930,21931,21932,21933,21935,21934,21937,21936,21938,21939,21940,21941,21943,21942,21944,21945,21947,21946,21949,21948,21950,21951,21952,21953,21955,21954,21957,21956,21958,21959,21961,21960,21962,21963,21964,21965,21967,21966,21969,21968,21970,21971,21972,21973,21975,21974,21976,21977,21979,21978,21981,21980,21982,21983,21985,21984,21986,21987,21988,21989,21991,21990,21992,21993,21995,21994,21997,21996,21998,21999,22000,22001,22003,22002,22005,22004,22006,22007,22009,22008,22010,22011,22012,22013,22015,22014,22016,22017,22019,22018,22021,22020,22022,22023,22025,22024,22026,22027,22028,22029,22031,22030,22033,22032,22034,22035,22036,22037,22039,22038,22040,22041,22043,22042,22045,22044,22046,22047,22049,22048,22050,22051,22052,22053,22055,22054,22056,22057,22059,22058,22061,22060,22062,22063,22064,22065,22067,22066,22069,22068,22070,22071,22073,22072,22074,22075,22076,22077,22079,22078,22081,22080,22082,22083,22084,22085,22087,22086,22088,22089,22091,22090,22093,22092,22094,22095,22096,22097,22099,22098,22101,22100,22102,22103,22105,22104,22106,22107,22108,22109,22111,22110,22112,22113,22115,22114,22117,22116,22118,22119,22121,22120,22122,22123,22124,22125,22127,22126,22129,22128,22130,22131,22132,22133,22135,22134,22136,22137,22139,22138,22141,22140,22142,22143,22145,22144,22146,22147,22148,22149,22151,22150,22152,22153,22155,22154,22157,22156,22158,22159,22160,22161,22163,22162,22165,22164,22166,22167,22169,22168,22170,22171,22172,22173,22175,22174,22176,22177,22179,22178,22181,22180,22182,22183,22185,22184,22186,22187,22188,22189,22191,22190,22193,22192,22194,22195,22196,22197,22199,22198,22200,22201,22203,22202,22205,22204,22206,22207,22208,22209,22211,22210,22213,22212,22214,22215,22217,22216,22218,22219,22220,22221,22223,22222,22225,22224,22226,22227,22228,22229,22231,22230,22232,22233,22235,22234,22237,22236,22238,22239,22241,22240,22242,22243,22244,22245,22247,22246,22248,22249,22251,22250,22253,22252,22254,22255,22256,22257,22259,22258,22261,22260,22262,22263,22265,22264,22266,22267,22268,22269,22271,22270,22273,22272,22274,22275,22276,22277,22279,22278,22280,22281,22283,22282,22285,22284,22286,22287,22288,22289,22291,22290,22293,22292,22294,22295,22297,22296,22298,22299,22300,22301,22303,22302,22304,22305,22307,22306,22309,22308,22310,22311,22313,22312,22314,22315,22316,22317,22319,22318,22321,22320,22322,22323,22324,22325,22327,22326,22328,22329,22331,22330,22333,22332,22334,22335,22336,22337,22339,22338,22341,22340,22342,22343,22345,22344,22346,22347,22348,22349,22351,22350,22353,22352,22354,22355,22356,22357,22359,22358,22360,22361,22363,22362,22365,22364,22366,22367,22369,22368,22370,22371,22372,22373,22375,22374,22376,22377,22379,22378,22381,22380,22382,22383,22384,22385,22387,22386,22389,22388,22390,22391,22393,22392,22394,22395,22396,22397,22399,22398,22400,22401,22403,22402,22405,22404,22406,22407,22409,22408,22410,22411,22412,22413,22415,22414,22417,22416,22418,22419,22420,22421,22423,22422,22424,22425,22427,22426,22429,22428,22430,22431,22433,22432,22434,22435,22436,22437,22439,22438,22440,22441,22443,22442,22445,22444,22446,22447,22448,22449,22451,22450,22453,22452,22454,22455,22457,22456,22458,22459,22460,22461,22463,22462,22465,22464,22466,22467,22468,22469,22471,22470,22472,22473,22475,22474,22477,22476,22478,22479,22480,22481,22483,22482,22485,22484,22486,22487,22489,22488,22490,22491,22492,22493,22495,22494,22496,22497,22499,22498,22501,22500,22502,22503,22505,22504,22506,22507,22508,22509,22511,22510,22513,22512,22514,22515,22516,22517,22519,22518,22520,22521,22523,22522,22525,22524,22526,22527,22529,22528,22530,22531,22532,22533,22535,22534,22536,22537,22539,22538,22541,22540,22542,22543,22544,22545,22547,22546,22549,22548,22550,22551,22553,22552,22554,22555,22556,22557,22559,22558,22560,22561,22563,22562,22565,22564,22566,22567,22569,22568,22570,22571,22572,22573,22575,22574,22577,22576,22578,22579,22580,22581,22583,22582,22584,22585,22587,22586,22589,22588,22590,22591,22592,22593,22595,22594,22597,22596,22598,22599,22601,22600,22602,22603,22604,22605,22607,22606,22609,22608,22610,22611,22612,22613,22615,22614,22616,22617,22619,22618,22621,22620,22622,22623,22625,22624,22626,22627,22628,22629,22631,22630,22632,22633,22635,22634,22637,22636,22638,22639,22640,22641,22643,22642,22645,22644,22646,22647,22649,22648,22650,22651,22652,22653,22655,22654,22656,22657,22659,22658,22661,22660,22662,22663,22665,22664,22666,22667,22668,22669,22671,22670,22673,22672,22674,22675,22676,22677,22679,22678,22680,22681,22683,22682,22685,22684,22686,22687,22689,22688,22690,22691,22692,22693,22695,22694,22696,22697,22699,22698,22701,22700,22702,22703,22704,22705,22707,22706,22709,22708,22710,22711,22713,22712,22714,22715,22716,22717,22719,22718,22721,22720,22722,22723,22724,22725,22727,22726,22728,22729,22731,22730,22733,22732,22734,22735,22736,22737,22739,22738,22741,22740,22742,22743,22745,22744,22746,22747,22748,22749,22751,22750,22752,22753,22755,22754,22757,22756,22758,22759,22761,22760,22762,22763,22764,22765,22767,22766,22769,22768,22770,22771,22772,22773,22775,22774,22776,22777,22779,22778,22781,22780,22782,22783,22784,22785,22787,22786,22789,22788,22790,22791,22793,22792,22794,22795,22796,22797,22799,22798,22801,22800,22802,22803,22804,22805,22807,22806,22808,22809,22811,22810,22813,22812,22814,22815,22817,22816,22818,22819,22820,22821,22823,22822,22824,22825,22827,22826,22829,22828,22830,22831,22832,22833,22835,22834,22837,22836,22838,22839,22841,22840,22842,22843,22844,22845,22847,22846,22849,22848,22850,22851,22852,22853,22855,22854,22856,22857,22859,22858,22861,22860,22862,22863,22864,22865,22867,22866,22869,22868,22870,22871,22873,22872,22874,22875,22876,22877,22879,22878,22880,22881,22883,22882,22885,22884,22886,22887,22889,22888,22890,22891,22892,22893,22895,22894,22897,22896,22898,22899,22900,22901,22903,22902,22904,22905,22907,22906,22909,22908,22910,22911,22913,22912,22914,22915,22916,22917,22919,22918,22920,22921,22923,22922,22925,22924,22926,22927,22928,22929,22931,22930,22933,22932,22934,22935,22937,22936,22938,22939,22940,22941,22943,22942,22944,22945,22947,22946,22949,22948,22950,22951,22953,22952,22954,22955,22956,22957,22959,22958,22961,22960,22962,22963,22964,22965,22967,22966,22968,22969,22971,22970,22973,22972,22974,22975,22976,22977,22979,22978,22981,22980,22982,22983,22985,22984,22986,22987,22988,22989,22991,22990,22993,22992,22994,22995,22996,22997,22999,22998,23000,23001,23003,23002,23005,23004,23006,23007,23009,23008,23010,23011,23012,23013,23015,23014,23016,23017,23019,23018,23021,23020,23022,23023,23024,23025,23027,23026,23029,23028,23030,23031,23033,23032,23034,23035,23036,23037,23039,23038,23040,23041,23043,23042,23045,23044,23046,23047,23049,23048,23050,23051,23052,23053,23055,23054,23057,23056,23058,23059,23060,23061,23063,23062,23064,23065,23067,23066,23069,23068,23070,23071,23073,23072,23074,23075,23076,23077,23079,23078,23080,23081,23083,23082,23085,23084,23086,23087,23088,23089,23091,23090,23093,23092,23094,23095,23097,23096,23098,23099,23100,23101,23103,23102,23105,23104,23106,23107,23108,23109,23111,23110,23112,23113,23115,23114,23117,23116,23118,23119,23120,23121,23123,23122,23125,23124,23126,23127,23129,23128,23130,23131,23132,23133,23135,23134,23136,23137,23139,23138,23141,23140,23142,23143,23145,23144,23146,23147,23148,23149,23151,23150,23153,23152,23154,23155,23156,23157,23159,23158,23160,23161,23163,23162,23165,23164,23166,23167,23169,23168,23170,23171,23172,23173,23175,23174,23176,23177,23179,23178,23181,23180,23182,23183,23184,23185,23187,23186,23189,23188,23190,23191,23193,23192,23194,23195,23196,23197,23199,23198,23200,23201,23203,23202,23205,23204,23206,23207,23209,23208,23210,23211,23212,23213,23215,23214,23217,23216,23218,23219,23220,23221,23223,23222,23224,23225,23227,23226,23229,23228,23230,23231,23232,23233,23235,23234,23237,23236,23238,23239,23241,23240,23242,23243,23244,23245,23247,23246,23249,23248,23250,23251,23252,23253,23255,23254,23256,23257,23259,23258,23261,23260,23262,23263,23265,23264,23266,23267,23268,23269,23271,23270,23272,23273,23275,23274,23277,23276,23278,23279,23280,23281,23283,23282,23285,23284,23286,23287,23289,23288,23290,23291,23292,23293,23295,23294,23297,23296,23298,23299,23300,23301,23303,23302,23304,23305,23307,23306,23309,23308,23310,23311,23312,23313,23315,23314,23317,23316,23318,23319,23321,23320,23322,23323,23324,23325,23327,23326,23328,23329,23331,23330,23333,23332,23334,23335,23337,23336,23338,23339,23340,23341,23343,23342,23345,23344,23346,23347,23348,23349,23351,23350,23352,23353,23355,23354,23357,23356,23358,23359,23360,23361,23363,23362,23365,23364,23366,23367,23369,23368,23370,23371,23372,23373,23375,23374,23377,23376,23378,23379,23380,23381,23383,23382,23384,23385,23387,23386,23389,23388,23390,23391,23393,23392,23394,23395,23396,23397,23399,23398,23400,23401,23403,23402,23405,23404,23406,23407,23408,23409,23411,23410,23413,23412,23414,23415,23417,23416,23418,23419,23420,23421,23423,23422,23424,23425,23427,23426,23429,23428,23430,23431,23433,23432,23434,23435,23436,23437,23439,23438,23441,23440,23442,23443,23444,23445,23447,23446,23448,23449,23451,23450,23453,23452,23454,23455,23457,23456,23458,23459,23460,23461,23463,23462,23464,23465,23467,23466,23469,23468,23470,23471,23472,23473,23475,23474,23477,23476,23478,23479,23481,23480,23482,23483,23484,23485,23487,23486,23489,23488,23490,23491,23492,23493,23495,23494,23496,23497,23499,23498,23501,23500,23502,23503,23504,23505,23507,23506,23509,23508,23510,23511,23513,23512,23514,23515,23516,23517,23519,23518,23520,23521,23523,23522,23525,23524,23526,23527,23529,23528,23530,23531,23532,23533,23535,23534,23537,23536,23538,23539,23540,23541,23543,23542,23544,23545,23547,23546,23549,23548,23550,23551,23552,23553,23555,23554,23557,23556,23558,23559,23561,23560,23562,23563,23564,23565,23567,23566,23569,23568,23570,23571,23572,23573,23575,23574,23576,23577,23579,23578,23581,23580,23582,23583,23585,23584,23586,23587,23588,23589,23591,23590,23592,23593,23595,23594,23597,23596,23598,23599,23600,23601,23603,23602,23605,23604,23606,23607,23609,23608,23610,23611,23612,23613,23615,23614,23617,23616,23618,23619,23620,23621,23623,23622,23624,23625,23627,23626,23629,23628,23630,23631,23632,23633,23635,23634,23637,23636,23638,23639,23641,23640,23642,23643,23644,23645,23647,23646,23648,23649,23651,23650,23653,23652,23654,23655,23657,23656,23658,23659,23660,23661,23663,23662,23665,23664,23666,23667,23668,23669,23671,23670,23672,23673,23675,23674,23677,23676,23678,23679,23681,23680,23682,23683,23684,23685,23687,23686,23688,23689,23691,23690,23693,23692,23694,23695,23696,23697,23699,23698,23701,23700,23702,23703,23705,23704,23706,23707,23708,23709,23711,23710,23712,23713,23715,23714,23717,23716,23718,23719,23721,23720,23722,23723,23724,23725,23727,23726,23729,23728,23730,23731,23732,23733,23735,23734,23736,23737,23739,23738,23741,23740,23742,23743,23744,23745,23747,23746,23749,23748,23750,23751,23753,23752,23754,23755,23756,23757,23759,23758,23761,23760,23762,23763,23764,23765,23767,23766,23768,23769,23771,23770,23773,23772,23774,23775,23777,23776,23778,23779,23780,23781,23783,23782,23784,23785,23787,23786,23789,23788,23790,23791,23792,23793,23795,23794,23797,23796,23798,23799,23801,23800,23802,23803,23804,23805,23807,23806,23809,23808,23810,23811,23812,23813,23815,23814,23816,23817,23819,23818,23821,23820,23822,23823,23824,23825,23827,23826,23829,23828,23830,23831,23833,23832,23834,23835,23836,23837,23839,23838,23840,23841,23843,23842,23845,23844,23846,23847,23849,23848,23850,23851,23852,23853,23855,23854,23857,23856,23858,23859,23860,23861,23863,23862,23864,23865,23867,23866,23869,23868,23870,23871,23872,23873,23875,23874,23877,23876,23878,23879,23881,23880,23882,23883,23884,23885,23887,23886,23889,23888,23890,23891,23892,23893,23895,23894,23896,23897,23899,23898,23901,23900,23902,23903,23905,23904,23906,23907,23908,23909,23911,23910,23912,23913,23915,23914,23917,23916,23918,23919,23920,23921,23923,23922,23925,23924,23926,23927,23929,23928,23930,23931,23932,23933,23935,23934,23936,23937,23939,23938,23941,23940,23942,23943,23945,23944,23946,23947,23948,23949,23951,23950,23953,23952,23954,23955,23956,23957,23959,23958,23960,23961,23963,23962,23965,23964,23966,23967,23969,23968,23970,23971,23972,23973,23975,23974,23976,23977,23979,23978,23981,23980,23982,23983,23984,23985,23987,23986,23989,23988,23990,23991,23993,23992,23994,23995,23996,23997,23999,23998,24001,24000,24002,24003,24004,24005,24007,24006,24008,24009,24011,24010,24013,24012,24014,24015,24016,24017,24019,24018,24021,24020,24022,24023,24025,24024,24026,24027,24028,24029,24031,24030,24032,24033,24035,24034,24037,24036,24038,24039,24041,24040,24042,24043,24044,24045,24047,24046,24049,24048,24050,24051,24052,24053,24055,24054,24056,24057,24059,24058,24061,24060,24062,24063,24065,24064,24066,24067,24068,24069,24071,24070,24072,24073,24075,24074,24077,24076,24078,24079,24080,24081,24083,24082,24085,24084,24086,24087,24089,24088,24090,24091,24092,24093,24095,24094,24096,24097,24099,24098,24101,24100,24102,24103,24105,24104,24106,24107,24108,24109,24111,24110,24113,24112,24114,24115,24116,24117,24119,24118,24120,24121,24123,24122,24125,24124,24126,24127,24128,24129,24131,24130,24133,24132,24134,24135,24137,24136,24138,24139,24140,24141,24143,24142,24145,24144,24146,24147,24148,24149,24151,24150,24152,24153,24155,24154,24157,24156,24158,24159,24161,24160,24162,24163,24164,24165,24167,24166,24168,24169,24171,24170,24173,24172,24174,24175,24176,24177,24179,24178,24181,24180,24182,24183,24185,24184,24186,24187,24188,24189,24191,24190,24192,24193,24195,24194,24197,24196,24198,24199,24201,24200,24202,24203,24204,24205,24207,24206,24209,24208,24210,24211,24212,24213,24215,24214,24216,24217,24219,24218,24221,24220,24222,24223,24225,24224,24226,24227,24228,24229,24231,24230,24232,24233,24235,24234,24237,24236,24238,24239,24240,24241,24243,24242,24245,24244,24246,24247,24249,24248,24250,24251,24252,24253,24255,24254,24257,24256,24258,24259,24260,24261,24263,24262,24264,24265,24267,24266,24269,24268,24270,24271,24272,24273,24275,24274,24277,24276,24278,24279,24281,24280,24282,24283,24284,24285,24287,24286,24288,24289,24291,24290,24293,24292,24294,24295,24297,24296,24298,24299,24300,24301,24303,24302,24305,24304,24306,24307,24308,24309,24311,24310,24312,24313,24315,24314,24317,24316,24318,24319,24320,24321,24323,24322,24325,24324,24326,24327,24329,24328,24330,24331,24332,24333,24335,24334,24337,24336,24338,24339,24340,24341,24343,24342,24344,24345,24347,24346,24349,24348,24350,24351,24353,24352,24354,24355,24356,24357,24359,24358,24360,24361,24363,24362,24365,24364,24366,24367,24368,24369,24371,24370,24373,24372,24374,24375,24377,24376,24378,24379,24380,24381,24383,24382,24385,24384,24386,24387,24388,24389,24391,24390,24392,24393,24395,24394,24397,24396,24398,24399,24400,24401,24403,24402,24405,24404,24406,24407,24409,24408,24410,24411,24412,24413,24415,24414,24416,24417,24419,24418,24421,24420,24422,24423,24425,24424,24426,24427,24428,24429,24431,24430,24433,24432,24434,24435,24436,24437,24439,24438,24440,24441,24443,24442,24445,24444,24446,24447,24449,24448,24450,24451,24452,24453,24455,24454,24456,24457,24459,24458,24461,24460,24462,24463,24464,24465,24467,24466,24469,24468,24470,24471,24473,24472,24474,24475,24476,24477,24479,24478,24480,24481,24483,24482,24485,24484,24486,24487,24489,24488,24490,24491,24492,24493,24495,24494,24497,24496,24498,24499,24500,24501,24503,24502,24504,24505,24507,24506,24509,24508,24510,24511,24512,24513,24515,24514,24517,24516,24518,24519,24521,24520,24522,24523,24524,24525,24527,24526,24529,24528,24530,24531,24532,24533,24535,24534,24536,24537,24539,24538,24541,24540,24542,24543,24545,24544,24546,24547,24548,24549,24551,24550,24552,24553,24555,24554,24557,24556,24558,24559,24560,24561,24563,24562,24565,24564,24566,24567,24569,24568,24570,24571,24572,24573,24575,24574,24576,24577,24579,24578,24581,24580,24582,24583,24585,24584,24586,24587,24588,24589,24591,24590,24593,24592,24594,24595,24596,24597,24599,24598,24600,24601,24603,24602,24605,24604,24606,24607,24609,24608,24610,24611,24612,24613,24615,24614,24616,24617,24619,24618,24621,24620,24622,24623,24624,24625,24627,24626,24629,24628,24630,24631,24633,24632,24634,24635,24636,24637,24639,24638,24641,24640,24642,24643,24644,24645,24647,24646,24648,24649,24651,24650,24653,24652,24654,24655,24656,24657,24659,24658,24661,24660,24662,24663,24665,24664,24666,24667,24668,24669,24671,24670,24672,24673,24675,24674,24677,24676,24678,24679,24681,24680,24682,24683,24684,24685,24687,24686,24689,24688,24690,24691,24692,24693,24695,24694,24696,24697,24699,24698,24701,24700,24702,24703,24705,24704,24706,24707,24708,24709,24711,24710,24712,24713,24715,24714,24717,24716,24718,24719,24720,24721,24723,24722,24725,24724,24726,24727,24729,24728,24730,24731,24732,24733,24735,24734,24736,24737,24739,24738,24741,24740,24742,24743,24745,24744,24746,24747,24748,24749,24751,24750,24753,24752,24754,24755,24756,24757,24759,24758,24760,24761,24763,24762,24765,24764,24766,24767,24768,24769,24771,24770,24773,24772,24774,24775,24777,24776,24778,24779,24780,24781,24783,24782,24785,24784,24786,24787,24788,24789,24791,24790,24792,24793,24795,24794,24797,24796,24798,24799,24801,24800,24802,24803,24804,24805,24807,24806,24808,24809,24811,24810,24813,24812,24814,24815,24816,24817,24819,24818,24821,24820,24822,24823,24825,24824,24826,24827,24828,24829,24831,24830,24833,24832,24834,24835,24836,24837,24839,24838,24840,24841,24843,24842,24845,24844,24846,24847,24848,24849,24851,24850,24853,24852,24854,24855,24857,24856,24858,24859,24860,24861,24863,24862,24864,24865,24867,24866,24869,24868,24870,24871,24873,24872,24874,24875,24876,24877,24879,24878,24881,24880,24882,24883,24884,24885,24887,24886,24888,24889,24891,24890,24893,24892,24894,24895,24896,24897,24899,24898,24901,24900,24902,24903,24905,24904,24906,24907,24908,24909,24911,24910,24913,24912,24914,24915,24916,24917,24919,24918,24920,24921,24923,24922,24925,24924,24926,24927,24929,24928,24930,24931,24932,24933,24935,24934,24936,24937,24939,24938,24941,24940,24942,24943,24944,24945,24947,24946,24949,24948,24950,24951,24953,24952,24954,24955,24956,24957,24959,24958,24960,24961,24963,24962,24965,24964,24966,24967,24969,24968,24970,24971,24972,24973,24975,24974,24977,24976,24978,24979,24980,24981,24983,24982,24984,24985,24987,24986,24989,24988,24990,24991,24993,24992,24994,24995,24996,24997,24999,24998,25000,25001,25003,25002,25005,25004,25006,25007,25008,25009,25011,25010,25013,25012,25014,25015,25017,25016,25018,25019,25020,25021,25023,25022,25025,25024,25026,25027,25028,25029,25031,25030,25032,25033,25035,25034,25037,25036,25038,25039,25040,25041,25043,25042,25045,25044,25046,25047,25049,25048,25050,25051,25052,25053,25055,25054,25056,25057,25059,25058,25061,25060,25062,25063,25065,25064,25066,25067,25068,25069,25071,25070,25073,25072,25074,25075,25076,25077,25079,25078,25080,25081,25083,25082,25085,25084,25086,25087,25089,25088,25090,25091,25092,25093,25095,25094,25096,25097,25099,25098,25101,25100,25102,25103,25104,25105,25107,25106,25109,25108,25110,25111,25113,25112,25114,25115,25116,25117,25119,25118,25120,25121,25123,25122,25125,25124,25126,25127,25129,25128,25130,25131,25132,25133,25135,25134,25137,25136,25138,25139,25140,25141,25143,25142,25144,25145,25147,25146,25149,25148,25150,25151,25152,25153,25155,25154,25157,25156,25158,25159,25161,25160,25162,25163,25164,25165,25167,25166,25169,25168,25170,25171,25172,25173,25175,25174,25176,25177,25179,25178,25181,25180,25182,25183,25185,25184,25186,25187,25188,25189,25191,25190,25192,25193,25195,25194,25197,25196,25198,25199,25200,25201,25203,25202,25205,25204,25206,25207,25209,25208,25210,25211,25212,25213,25215,25214,25216,25217,25219,25218,25221,25220,25222,25223,25225,25224,25226,25227,25228,25229,25231,25230,25233,25232,25234,25235,25236,25237,25239,25238,25240,25241,25243,25242,25245,25244,25246,25247,25249,25248,25250,25251,25252,25253,25255,25254,25256,25257,25259,25258,25261,25260,25262,25263,25264,25265,25267,25266,25269,25268,25270,25271,25273,25272,25274,25275,25276,25277,25279,25278,25281,25280,25282,25283,25284,25285,25287,25286,25288,25289,25291,25290,25293,25292,25294,25295,25296,25297,25299,25298,25301,25300,25302,25303,25305,25304,25306,25307,25308,25309,25311,25310,25312,25313,25315,25314,25317,25316,25318,25319,25321,25320,25322,25323,25324,25325,25327,25326,25329,25328,25330,25331,25332,25333,25335,25334,25336,25337,25339,25338,25341,25340,25342,25343,25344,25345,25347,25346,25349,25348,25350,25351,25353,25352,25354,25355,25356,25357,25359,25358,25361,25360,25362,25363,25364,25365,25367,25366,25368,25369,25371,25370,25373,25372,25374,25375,25377,25376,25378,25379,25380,25381,25383,25382,25384,25385,25387,25386,25389,25388,25390,25391,25392,25393,25395,25394,25397,25396,25398,25399,25401,25400,25402,25403,25404,25405,25407,25406,25409,25408,25410,25411,25412,25413,25415,25414,25416,25417,25419,25418,25421,25420,25422,25423,25424,25425,25427,25426,25429,25428,25430,25431,25433,25432,25434,25435,25436,25437,25439,25438,25440,25441,25443,25442,25445,25444,25446,25447,25449,25448,25450,25451,25452,25453,25455,25454,25457,25456,25458,25459,25460,25461,25463,25462,25464,25465,25467,25466,25469,25468,25470,25471,25473,25472,25474,25475,25476,25477,25479,25478,25480,25481,25483,25482,25485,25484,25486,25487,25488,25489,25491,25490,25493,25492,25494,25495,25497,25496,25498,25499,25500,25501,25503,25502,25504,25505,25507,25506,25509,25508,25510,25511,25513,25512,25514,25515,25516,25517,25519,25518,25521,25520,25522,25523,25524,25525,25527,25526,25528,25529,25531,25530,25533,25532,25534,25535,25536,25537,25539,25538,25541,25540,25542,25543,25545,25544,25546,25547,25548,25549,25551,25550,25553,25552,25554,25555,25556,25557,25559,25558,25560,25561,25563,25562,25565,25564,25566,25567,25569,25568,25570,25571,25572,25573,25575,25574,25576,25577,25579,25578,25581,25580,25582,25583,25584,25585,25587,25586,25589,25588,25590,25591,25593,25592,25594,25595,25596,25597,25599,25598,25601,25600,25602,25603,25604,25605,25607,25606,25608,25609,25611,25610,25613,25612,25614,25615,25616,25617,25619,25618,25621,25620,25622,25623,25625,25624,25626,25627,25628,25629,25631,25630,25632,25633,25635,25634,25637,25636,25638,25639,25641,25640,25642,25643,25644,25645,25647,25646,25649,25648,25650,25651,25652,25653,25655,25654,25656,25657,25659,25658,25661,25660,25662,25663,25664,25665,25667,25666,25669,25668,25670,25671,25673,25672,25674,25675,25676,25677,25679,25678,25681,25680,25682,25683,25684,25685,25687,25686,25688,25689,25691,25690,25693,25692,25694,25695,25697,25696,25698,25699,25700,25701,25703,25702,25704,25705,25707,25706,25709,25708,25710,25711,25712,25713,25715,25714,25717,25716,25718,25719,25721,25720,25722,25723,25724,25725,25727,25726,25728,25729,25731,25730,25733,25732,25734,25735,25737,25736,25738,25739,25740,25741,25743,25742,25745,25744,25746,25747,25748,25749,25751,25750,25752,25753,25755,25754,25757,25756,25758,25759,25761,25760,25762,25763,25764,25765,25767,25766,25768,25769,25771,25770,25773,25772,25774,25775,25776,25777,25779,25778,25781,25780,25782,25783,25785,25784,25786,25787,25788,25789,25791,25790,25793,25792,25794,25795,25796,25797,25799,25798,25800,25801,25803,25802,25805,25804,25806,25807,25808,25809,25811,25810,25813,25812,25814,25815,25817,25816,25818,25819,25820,25821,25823,25822,25824,25825,25827,25826,25829,25828,25830,25831,25833,25832,25834,25835,25836,25837,25839,25838,25841,25840,25842,25843,25844,25845,25847,25846,25848,25849,25851,25850,25853,25852,25854,25855,25856,25857,25859,25858,25861,25860,25862,25863,25865,25864,25866,25867,25868,25869,25871,25870,25873,25872,25874,25875,25876,25877,25879,25878,25880,25881,25883,25882,25885,25884,25886,25887,25889,25888,25890,25891,25892,25893,25895,25894,25896,25897,25899,25898,25901,25900,25902,25903,25904,25905,25907,25906,25909,25908,25910,25911,25913,25912,25914,25915,25916,25917,25919,25918,25921,25920,25922,25923,25924,25925,25927,25926,25928,25929,25931,25930,25933,25932,25934,25935,25936,25937,25939,25938,25941,25940,25942,25943,25945,25944,25946,25947,25948,25949,25951,25950,25952,25953,25955,25954,25957,25956,25958,25959,25961,25960,25962,25963,25964,25965,25967,25966,25969,25968,25970,25971,25972,25973,25975,25974,25976,25977,25979,25978,25981,25980,25982,25983,25985,25984,25986,25987,25988,25989,25991,25990,25992,25993,25995,25994,25997,25996,25998,25999,26000,26001,26003,26002,26005,26004,26006,26007,26009,26008,26010,26011,26012,26013,26015,26014,26016,26017,26019,26018,26021,26020,26022,26023,26025,26024,26026,26027,26028,26029,26031,26030,26033,26032,26034,26035,26036,26037,26039,26038,26040,26041,26043,26042,26045,26044,26046,26047,26048,26049,26051,26050,26053,26052,26054,26055,26057,26056,26058,26059,26060,26061,26063,26062,26065,26064,26066,26067,26068,26069,26071,26070,26072,26073,26075,26074,26077,26076,26078,26079,26081,26080,26082,26083,26084,26085,26087,26086,26088,26089,26091,26090,26093,26092,26094,26095,26096,26097,26099,26098,26101,26100,26102,26103,26105,26104,26106,26107,26108,26109,26111,26110,26112,26113,26115,26114,26117,26116,26118,26119,26121,26120,26122,26123,26124,26125,26127,26126,26129,26128,26130,26131,26132,26133,26135,26134,26136,26137,26139,26138,26141,26140,26142,26143,26145,26144,26146,26147,26148,26149,26151,26150,26152,26153,26155,26154,26157,26156,26158,26159,26160,26161,26163,26162,26165,26164,26166,26167,26169,26168,26170,26171,26172,26173,26175,26174,26177,26176,26178,26179,26180,26181,26183,26182,26184,26185,26187,26186,26189,26188,26190,26191,26192,26193,26195,26194,26197,26196,26198,26199,26201,26200,26202,26203,26204,26205,26207,26206,26208,26209,26211,26210,26213,26212,26214,26215,26217,26216,26218,26219,26220,26221,26223,26222,26225,26224,26226,26227,26228,26229,26231,26230,26232,26233,26235,26234,26237,26236,26238,26239,26241,26240,26242,26243,26244,26245,26247,26246,26248,26249,26251,26250,26253,26252,26254,26255,26256,26257,26259,26258,26261,26260,26262,26263,26265,26264,26266,26267,26268,26269,26271,26270,26272,26273,26275,26274,26277,26276,26278,26279,26281,26280,26282,26283,26284,26285,26287,26286,26289,26288,26290,26291,26292,26293,26295,26294,26296,26297,26299,26298,26301,26300,26302,26303,26304,26305,26307,26306,26309,26308,26310,26311,26313,26312,26314,26315,26316,26317,26319,26318,26321,26320,26322,26323,26324,26325,26327,26326,26328,26329,26331,26330,26333,26332,26334,26335,26337,26336,26338,26339,26340,26341,26343,26342,26344,26345,26347,26346,26349,26348,26350,26351,26352,26353,26355,26354,26357,26356,26358,26359,26361,26360,26362,26363,26364,26365,26367,26366,26369,26368,26370,26371,26372,26373,26375,26374,26376,26377,26379,26378,26381,26380,26382,26383,26384,26385,26387,26386,26389,26388,26390,26391,26393,26392,26394,26395,26396,26397,26399,26398,26400,26401,26403,26402,26405,26404,26406,26407,26409,26408,26410,26411,26412,26413,26415,26414,26417,26416,26418,26419,26420,26421,26423,26422,26424,26425,26427,26426,26429,26428,26430,26431,26432,26433,26435,26434,26437,26436,26438,26439,26441,26440,26442,26443,26444,26445,26447,26446,26449,26448,26450,26451,26452,26453,26455,26454,26456,26457,26459,26458,26461,26460,26462,26463,26465,26464,26466,26467,26468,26469,26471,26470,26472,26473,26475,26474,26477,26476,26478,26479,26480,26481,26483,26482,26485,26484,26486,26487,26489,26488,26490,26491,26492,26493,26495,26494,26496,26497,26499,26498,26501,26500,26502,26503,26505,26504,26506,26507,26508,26509,26511,26510,26513,26512,26514,26515,26516,26517,26519,26518,26520,26521,26523,26522,26525,26524,26526,26527,26529,26528,26530,26531,26532,26533,26535,26534,26536,26537,26539,26538,26541,26540,26542,26543,26544,26545,26547,26546,26549,26548,26550,26551,26553,26552,26554,26555,26556,26557,26559,26558,26561,26560,26562,26563,26564,26565,26567,26566,26568,26569,26571,26570,26573,26572,26574,26575,26576,26577,26579,26578,26581,26580,26582,26583,26585,26584,26586,26587,26588,26589,26591,26590,26592,26593,26595,26594,26597,26596,26598,26599,26601,26600,26602,26603,26604,26605,26607,26606,26609,26608,26610,26611,26612,26613,26615,26614,26616,26617,26619,26618,26621,26620,26622,26623,26625,26624,26626,26627,26628,26629,26631,26630,26632,26633,26635,26634,26637,26636,26638,26639,26640,26641,26643,26642,26645,26644,26646,26647,26649,26648,26650,26651,26652,26653,26655,26654,26656,26657,26659,26658,26661,26660,26662,26663,26665,26664,26666,26667,26668,26669,26671,26670,26673,26672,26674,26675,26676,26677,26679,26678,26680,26681,26683,26682,26685,26684,26686,26687,26688,26689,26691,26690,26693,26692,26694,26695,26697,26696,26698,26699,26700,26701,26703,26702,26705,26704,26706,26707,26708,26709,26711,26710,26712,26713,26715,26714,26717,26716,26718,26719,26721,26720,26722,26723,26724,26725,26727,26726,26728,26729,26731,26730,26733,26732,26734,26735,26736,26737,26739,26738,26741,26740,26742,26743,26745,26744,26746,26747,26748,26749,26751,26750,26752,26753,26755,26754,26757,26756,26758,26759,26761,26760,26762,26763,26764,26765,26767,26766,26769,26768,26770,26771,26772,26773,26775,26774,26776,26777,26779,26778,26781,26780,26782,26783,26785,26784,26786,26787,26788,26789,26791,26790,26792,26793,26795,26794,26797,26796,26798,26799,26800,26801,26803,26802,26805,26804,26806,26807,26809,26808,26810,26811,26812,26813,26815,26814,26817,26816,26818,26819,26820,26821,26823,26822,26824,26825,26827,26826,26829,26828,26830,26831,26832,26833,26835,26834,26837,26836,26838,26839,26841,26840,26842,26843,26844,26845,26847,26846,26848,26849,26851,26850,26853,26852,26854,26855,26857,26856,26858,26859,26860,26861,26863,26862,26865,26864,26866,26867,26868,26869,26871,26870,26872,26873,26875,26874,26877,26876,26878,26879,26880,26881,26883,26882,26885,26884,26886,26887,26889,26888,26890,26891,26892,26893,26895,26894,26897,26896,26898,26899,26900,26901,26903,26902,26904,26905,26907,26906,26909,26908,26910,26911,26913,26912,26914,26915,26916,26917,26919,26918,26920,26921,26923,26922,26925,26924,26926,26927,26928,26929,26931,26930,26933,26932,26934,26935,26937,26936,26938,26939,26940,26941,26943,26942,26945,26944,26946,26947,26948,26949,26951,26950,26952,26953,26955,26954,26957,26956,26958,26959,26960,26961,26963,26962,26965,26964,26966,26967,26969,26968,26970,26971,26972,26973,26975,26974,26976,26977,26979,26978,26981,26980,26982,26983,26985,26984,26986,26987,26988,26989,26991,26990,26993,26992,26994,26995,26996,26997,26999,26998,27000,27001,27003,27002,27005,27004,27006,27007,27009,27008,27010,27011,27012,27013,27015,27014,27016,27017,27019,27018,27021,27020,27022,27023,27024,27025,27027,27026,27029,27028,27030,27031,27033,27032,27034,27035,27036,27037,27039,27038,27040,27041,27043,27042,27045,27044,27046,27047,27049,27048,27050,27051,27052,27053,27055,27054,27057,27056,27058,27059,27060,27061,27063,27062,27064,27065,27067,27066,27069,27068,27070,27071,27072,27073,27075,27074,27077,27076,27078,27079,27081,27080,27082,27083,27084,27085,27087,27086,27089,27088,27090,27091,27092,27093,27095,27094,27096,27097,27099,27098,27101,27100,27102,27103,27105,27104,27106,27107,27108,27109,27111,27110,27112,27113,27115,27114,27117,27116,27118,27119,27120,27121,27123,27122,27125,27124,27126,27127,27129,27128,27130,27131,27132,27133,27135,27134,27136,27137,27139,27138,27141,27140,27142,27143,27145,27144,27146,27147,27148,27149,27151,27150,27153,27152,27154,27155,27156,27157,27159,27158,27160,27161,27163,27162,27165,27164,27166,27167,27169,27168,27170,27171,27172,27173,27175,27174,27176,27177,27179,27178,27181,27180,27182,27183,27184,27185,27187,27186,27189,27188,27190,27191,27193,27192,27194,27195,27196,27197,27199,27198,27201,27200,27202,27203,27204,27205,27207,27206,27208,27209,27211,27210,27213,27212,27214,27215,27216,27217,27219,27218,27221,27220,27222,27223,27225,27224,27226,27227,27228,27229,27231,27230,27232,27233,27235,27234,27237,27236,27238,27239,27241,27240,27242,27243,27244,27245,27247,27246,27249,27248,27250,27251,27252,27253,27255,27254,27256,27257,27259,27258,27261,27260,27262,27263,27265,27264,27266,27267,27268,27269,27271,27270,27272,27273,27275,27274,27277,27276,27278,27279,27280,27281,27283,27282,27285,27284,27286,27287,27289,27288,27290,27291,27292,27293,27295,27294,27296,27297,27299,27298,27301,27300,27302,27303,27305,27304,27306,27307,27308,27309,27311,27310,27313,27312,27314,27315,27316,27317,27319,27318,27320,27321,27323,27322,27325,27324,27326,27327,27328,27329,27331,27330,27333,27332,27334,27335,27337,27336,27338,27339,27340,27341,27343,27342,27345,27344,27346,27347,27348,27349,27351,27350,27352,27353,27355,27354,27357,27356,27358,27359,27361,27360,27362,27363,27364,27365,27367,27366,27368,27369,27371,27370,27373,27372,27374,27375,27376,27377,27379,27378,27381,27380,27382,27383,27385,27384,27386,27387,27388,27389,27391,27390,27393,27392,27394,27395,27396,27397,27399,27398,27400,27401,27403,27402,27405,27404,27406,27407,27408,27409,27411,27410,27413,27412,27414,27415,27417,27416,27418,27419,27420,27421,27423,27422,27424,27425,27427,27426,27429,27428,27430,27431,27433,27432,27434,27435,27436,27437,27439,27438,27441,27440,27442,27443,27444,27445,27447,27446,27448,27449,27451,27450,27453,27452,27454,27455,27456,27457,27459,27458,27461,27460,27462,27463,27465,27464,27466,27467,27468,27469,27471,27470,27473,27472,27474,27475,27476,27477,27479,27478,27480,27481,27483,27482,27485,27484,27486,27487,27489,27488,27490,27491,27492,27493,27495,27494,27496,27497,27499,27498,27501,27500,27502,27503,27504,27505,27507,27506,27509,27508,27510,27511,27513,27512,27514,27515,27516,27517,27519,27518,27520,27521,27523,27522,27525,27524,27526,27527,27529,27528,27530,27531,27532,27533,27535,27534,27537,27536,27538,27539,27540,27541,27543,27542,27544,27545,27547,27546,27549,27548,27550,27551,27553,27552,27554,27555,27556,27557,27559,27558,27560,27561,27563,27562,27565,27564,27566,27567,27568,27569,27571,27570,27573,27572,27574,27575,27577,27576,27578,27579,27580,27581,27583,27582,27585,27584,27586,27587,27588,27589,27591,27590,27592,27593,27595,27594,27597,27596,27598,27599,27600,27601,27603,27602,27605,27604,27606,27607,27609,27608,27610,27611,27612,27613,27615,27614,27616,27617,27619,27618,27621,27620,27622,27623,27625,27624,27626,27627,27628,27629,27631,27630,27633,27632,27634,27635,27636,27637,27639,27638,27640,27641,27643,27642,27645,27644,27646,27647,27648,27649,27651,27650,27653,27652,27654,27655,27657,27656,27658,27659,27660,27661,27663,27662,27665,27664,27666,27667,27668,27669,27671,27670,27672,27673,27675,27674,27677,27676,27678,27679,27681,27680,27682,27683,27684,27685,27687,27686,27688,27689,27691,27690,27693,27692,27694,27695,27696,27697,27699,27698,27701,27700,27702,27703,27705,27704,27706,27707,27708,27709,27711,27710,27713,27712,27714,27715,27716,27717,27719,27718,27720,27721,27723,27722,27725,27724,27726,27727,27728,27729,27731,27730,27733,27732,27734,27735,27737,27736,27738,27739,27740,27741,27743,27742,27744,27745,27747,27746,27749,27748,27750,27751,27753,27752,27754,27755,27756,27757,27759,27758,27761,27760,27762,27763,27764,27765,27767,27766,27768,27769,27771,27770,27773,27772,27774,27775,27777,27776,27778,27779,27780,27781,27783,27782,27784,27785,27787,27786,27789,27788,27790,27791,27792,27793,27795,27794,27797,27796,27798,27799,27801,27800,27802,27803,27804,27805,27807,27806,27808,27809,27811,27810,27813,27812,27814,27815,27817,27816,27818,27819,27820,27821,27823,27822,27825,27824,27826,27827,27828,27829,27831,27830,27832,27833,27835,27834,27837,27836,27838,27839,27840,27841,27843,27842,27845,27844,27846,27847,27849,27848,27850,27851,27852,27853,27855,27854,27857,27856,27858,27859,27860,27861,27863,27862,27864,27865,27867,27866,27869,27868,27870,27871,27873,27872,27874,27875,27876,27877,27879,27878,27880,27881,27883,27882,27885,27884,27886,27887,27888,27889,27891,27890,27893,27892,27894,27895,27897,27896,27898,27899,27900,27901,27903,27902,27905,27904,27906,27907,27908,27909,27911,27910,27912,27913,27915,27914,27917,27916,27918,27919,27920,27921,27923,27922,27925,27924,27926,27927,27929,27928,27930,27931,27932,27933,27935,27934,27936,27937,27939,27938,27941,27940,27942,27943,27945,27944,27946,27947,27948,27949,27951,27950,27953,27952,27954,27955,27956,27957,27959,27958,27960,27961,27963,27962,27965,27964,27966,27967,27968,27969,27971,27970,27973,27972,27974,27975,27977,27976,27978,27979,27980,27981,27983,27982,27985,27984,27986,27987,27988,27989,27991,27990,27992,27993,27995,27994,27997,27996,27998,27999,28001,28000,28002,28003,28004,28005,28007,28006,28008,28009,28011,28010,28013,28012,28014,28015,28016,28017,28019,28018,28021,28020,28022,28023,28025,28024,28026,28027,28028,28029,28031,28030,28032,28033,28035,28034,28037,28036,28038,28039,28041,28040,28042,28043,28044,28045,28047,28046,28049,28048,28050,28051,28052,28053,28055,28054,28056,28057,28059,28058,28061,28060,28062,28063,28065,28064,28066,28067,28068,28069,28071,28070,28072,28073,28075,28074,28077,28076,28078,28079,28080,28081,28083,28082,28085,28084,28086,28087,28089,28088,28090,28091,28092,28093,28095,28094,28097,28096,28098,28099,28100,28101,28103,28102,28104,28105,28107,28106,28109,28108,28110,28111,28112,28113,28115,28114,28117,28116,28118,28119,28121,28120,28122,28123,28124,28125,28127,28126,28128,28129,28131,28130,28133,28132,28134,28135,28137,28136,28138,28139,28140,28141,28143,28142,28145,28144,28146,28147,28148,28149,28151,28150,28152,28153,28155,28154,28157,28156,28158,28159,28161,28160,28162,28163,28164,28165,28167,28166,28168,28169,28171,28170,28173,28172,28174,28175,28176,28177,28179,28178,28181,28180,28182,28183,28185,28184,28186,28187,28188,28189,28191,28190,28192,28193,28195,28194,28197,28196,28198,28199,28201,28200,28202,28203,28204,28205,28207,28206,28209,28208,28210,28211,28212,28213,28215,28214,28216,28217,28219,28218,28221,28220,28222,28223,28224,28225,28227,28226,28229,28228,28230,28231,28233,28232,28234,28235,28236,28237,28239,28238,28241,28240,28242,28243,28244,28245,28247,28246,28248,28249,28251,28250,28253,28252,28254,28255,28257,28256,28258,28259,28260,28261,28263,28262,28264,28265,28267,28266,28269,28268,28270,28271,28272,28273,28275,28274,28277,28276,28278,28279,28281,28280,28282,28283,28284,28285,28287,28286,28288,28289,28291,28290,28293,28292,28294,28295,28297,28296,28298,28299,28300,28301,28303,28302,28305,28304,28306,28307,28308,28309,28311,28310,28312,28313,28315,28314,28317,28316,28318,28319,28321,28320,28322,28323,28324,28325,28327,28326,28328,28329,28331,28330,28333,28332,28334,28335,28336,28337,28339,28338,28341,28340,28342,28343,28345,28344,28346,28347,28348,28349,28351,28350,28353,28352,28354,28355,28356,28357,28359,28358,28360,28361,28363,28362,28365,28364,28366,28367,28368,28369,28371,28370,28373,28372,28374,28375,28377,28376,28378,28379,28380,28381,28383,28382,28384,28385,28387,28386,28389,28388,28390,28391,28393,28392,28394,28395,28396,28397,28399,28398,28401,28400,28402,28403,28404,28405,28407,28406,28408,28409,28411,28410,28413,28412,28414,28415,28416,28417,28419,28418,28421,28420,28422,28423,28425,28424,28426,28427,28428,28429,28431,28430,28433,28432,28434,28435,28436,28437,28439,28438,28440,28441,28443,28442,28445,28444,28446,28447,28449,28448,28450,28451,28452,28453,28455,28454,28456,28457,28459,28458,28461,28460,28462,28463,28464,28465,28467,28466,28469,28468,28470,28471,28473,28472,28474,28475,28476,28477,28479,28478,28481,28480,28482,28483,28484,28485,28487,28486,28488,28489,28491,28490,28493,28492,28494,28495,28496,28497,28499,28498,28501,28500,28502,28503,28505,28504,28506,28507,28508,28509,28511,28510,28512,28513,28515,28514,28517,28516,28518,28519,28521,28520,28522,28523,28524,28525,28527,28526,28529,28528,28530,28531,28532,28533,28535,28534,28536,28537,28539,28538,28541,28540,28542,28543,28545,28544,28546,28547,28548,28549,28551,28550,28552,28553,28555,28554,28557,28556,28558,28559,28560,28561,28563,28562,28565,28564,28566,28567,28569,28568,28570,28571,28572,28573,28575,28574,28576,28577,28579,28578,28581,28580,28582,28583,28585,28584,28586,28587,28588,28589,28591,28590,28593,28592,28594,28595,28596,28597,28599,28598,28600,28601,28603,28602,28605,28604,28606,28607,28608,28609,28611,28610,28613,28612,28614,28615,28617,28616,28618,28619,28620,28621,28623,28622,28625,28624,28626,28627,28628,28629,28631,28630,28632,28633,28635,28634,28637,28636,28638,28639,28641,28640,28642,28643,28644,28645,28647,28646,28648,28649,28651,28650,28653,28652,28654,28655,28656,28657,28659,28658,28661,28660,28662,28663,28665,28664,28666,28667,28668,28669,28671,28670,28673,28672,28674,28675,28676,28677,28679,28678,28680,28681,28683,28682,28685,28684,28686,28687,28688,28689,28691,28690,28693,28692,28694,28695,28697,28696,28698,28699,28700,28701,28703,28702,28704,28705,28707,28706,28709,28708,28710,28711,28713,28712,28714,28715,28716,28717,28719,28718,28721,28720,28722,28723,28724,28725,28727,28726,28728,28729,28731,28730,28733,28732,28734,28735,28736,28737,28739,28738,28741,28740,28742,28743,28745,28744,28746,28747,28748,28749,28751,28750,28753,28752,28754,28755,28756,28757,28759,28758,28760,28761,28763,28762,28765,28764,28766,28767,28769,28768,28770,28771,28772,28773,28775,28774,28776,28777,28779,28778,28781,28780,28782,28783,28784,28785,28787,28786,28789,28788,28790,28791,28793,28792,28794,28795,28796,28797,28799,28798,28800,28801,28803,28802,28805,28804,28806,28807,28809,28808,28810,28811,28812,28813,28815,28814,28817,28816,28818,28819,28820,28821,28823,28822,28824,28825,28827,28826,28829,28828,28830,28831,28833,28832,28834,28835,28836,28837,28839,28838,28840,28841,28843,28842,28845,28844,28846,28847,28848,28849,28851,28850,28853,28852,28854,28855,28857,28856,28858,28859,28860,28861,28863,28862,28865,28864,28866,28867,28868,28869,28871,28870,28872,28873,28875,28874,28877,28876,28878,28879,28880,28881,28883,28882,28885,28884,28886,28887,28889,28888,28890,28891,28892,28893,28895,28894,28896,28897,28899,28898,28901,28900,28902,28903,28905,28904,28906,28907,28908,28909,28911,28910,28913,28912,28914,28915,28916,28917,28919,28918,28920,28921,28923,28922,28925,28924,28926,28927,28928,28929,28931,28930,28933,28932,28934,28935,28937,28936,28938,28939,28940,28941,28943,28942,28945,28944,28946,28947,28948,28949,28951,28950,28952,28953,28955,28954,28957,28956,28958,28959,28961,28960,28962,28963,28964,28965,28967,28966,28968,28969,28971,28970,28973,28972,28974,28975,28976,28977,28979,28978,28981,28980,28982,28983,28985,28984,28986,28987,28988,28989,28991,28990,28993,28992,28994,28995,28996,28997,28999,28998,29000,29001,29003,29002,29005,29004,29006,29007,29008,29009,29011,29010,29013,29012,29014,29015,29017,29016,29018,29019,29020,29021,29023,29022,29024,29025,29027,29026,29029,29028,29030,29031,29033,29032,29034,29035,29036,29037,29039,29038,29041,29040,29042,29043,29044,29045,29047,29046,29048,29049,29051,29050,29053,29052,29054,29055,29057,29056,29058,29059,29060,29061,29063,29062,29064,29065,29067,29066,29069,29068,29070,29071,29072,29073,29075,29074,29077,29076,29078,29079,29081,29080,29082,29083,29084,29085,29087,29086,29088,29089,29091,29090,29093,29092,29094,29095,29097,29096,29098,29099,29100,29101,29103,29102,29105,29104,29106,29107,29108,29109,29111,29110,29112,29113,29115,29114,29117,29116,29118,29119,29120,29121,29123,29122,29125,29124,29126,29127,29129,29128,29130,29131,29132,29133,29135,29134,29137,29136,29138,29139,29140,29141,29143,29142,29144,29145,29147,29146,29149,29148,29150,29151,29153,29152,29154,29155,29156,29157,29159,29158,29160,29161,29163,29162,29165,29164,29166,29167,29168,29169,29171,29170,29173,29172,29174,29175,29177,29176,29178,29179,29180,29181,29183,29182,29184,29185,29187,29186,29189,29188,29190,29191,29193,29192,29194,29195,29196,29197,29199,29198,29201,29200,29202,29203,29204,29205,29207,29206,29208,29209,29211,29210,29213,29212,29214,29215,29217,29216,29218,29219,29220,29221,29223,29222,29224,29225,29227,29226,29229,29228,29230,29231,29232,29233,29235,29234,29237,29236,29238,29239,29241,29240,29242,29243,29244,29245,29247,29246,29249,29248,29250,29251,29252,29253,29255,29254,29256,29257,29259,29258,29261,29260,29262,29263,29264,29265,29267,29266,29269,29268,29270,29271,29273,29272,29274,29275,29276,29277,29279,29278,29280,29281,29283,29282,29285,29284,29286,29287,29289,29288,29290,29291,29292,29293,29295,29294,29297,29296,29298,29299,29300,29301,29303,29302,29304,29305,29307,29306,29309,29308,29310,29311,29313,29312,29314,29315,29316,29317,29319,29318,29320,29321,29323,29322,29325,29324,29326,29327,29328,29329,29331,29330,29333,29332,29334,29335,29337,29336,29338,29339,29340,29341,29343,29342,29344,29345,29347,29346,29349,29348,29350,29351,29353,29352,29354,29355,29356,29357,29359,29358,29361,29360,29362,29363,29364,29365,29367,29366,29368,29369,29371,29370,29373,29372,29374,29375,29376,29377,29379,29378,29381,29380,29382,29383,29385,29384,29386,29387,29388,29389,29391,29390,29393,29392,29394,29395,29396,29397,29399,29398,29400,29401,29403,29402,29405,29404,29406,29407,29409,29408,29410,29411,29412,29413,29415,29414,29416,29417,29419,29418,29421,29420,29422,29423,29424,29425,29427,29426,29429,29428,29430,29431,29433,29432,29434,29435,29436,29437,29439,29438,29441,29440,29442,29443,29444,29445,29447,29446,29448,29449,29451,29450,29453,29452,29454,29455,29456,29457,29459,29458,29461,29460,29462,29463,29465,29464,29466,29467,29468,29469,29471,29470,29472,29473,29475,29474,29477,29476,29478,29479,29481,29480,29482,29483,29484,29485,29487,29486,29489,29488,29490,29491,29492,29493,29495,29494,29496,29497,29499,29498,29501,29500,29502,29503,29504,29505,29507,29506,29509,29508,29510,29511,29513,29512,29514,29515,29516,29517,29519,29518,29521,29520,29522,29523,29524,29525,29527,29526,29528,29529,29531,29530,29533,29532,29534,29535,29537,29536,29538,29539,29540,29541,29543,29542,29544,29545,29547,29546,29549,29548,29550,29551,29552,29553,29555,29554,29557,29556,29558,29559,29561,29560,29562,29563,29564,29565,29567,29566,29568,29569,29571,29570,29573,29572,29574,29575,29577,29576,29578,29579,29580,29581,29583,29582,29585,29584,29586,29587,29588,29589,29591,29590,29592,29593,29595,29594,29597,29596,29598,29599,29601,29600,29602,29603,29604,29605,29607,29606,29608,29609,29611,29610,29613,29612,29614,29615,29616,29617,29619,29618,29621,29620,29622,29623,29625,29624,29626,29627,29628,29629,29631,29630,29633,29632,29634,29635,29636,29637,29639,29638,29640,29641,29643,29642,29645,29644,29646,29647,29648,29649,29651,29650,29653,29652,29654,29655,29657,29656,29658,29659,29660,29661,29663,29662,29664,29665,29667,29666,29669,29668,29670,29671,29673,29672,29674,29675,29676,29677,29679,29678,29681,29680,29682,29683,29684,29685,29687,29686,29688,29689,29691,29690,29693,29692,29694,29695,29696,29697,29699,29698,29701,29700,29702,29703,29705,29704,29706,29707,29708,29709,29711,29710,29713,29712,29714,29715,29716,29717,29719,29718,29720,29721,29723,29722,29725,29724,29726,29727,29729,29728,29730,29731,29732,29733,29735,29734,29736,29737,29739,29738,29741,29740,29742,29743,29744,29745,29747,29746,29749,29748,29750,29751,29753,29752,29754,29755,29756,29757,29759,29758,29761,29760,29762,29763,29764,29765,29767,29766,29768,29769,29771,29770,29773,29772,29774,29775,29776,29777,29779,29778,29781,29780,29782,29783,29785,29784,29786,29787,29788,29789,29791,29790,29792,29793,29795,29794,29797,29796,29798,29799,29801,29800,29802,29803,29804,29805,29807,29806,29809,29808,29810,29811,29812,29813,29815,29814,29816,29817,29819,29818,29821,29820,29822,29823,29825,29824,29826,29827,29828,29829,29831,29830,29832,29833,29835,29834,29837,29836,29838,29839,29840,29841,29843,29842,29845,29844,29846,29847,29849,29848,29850,29851,29852,29853,29855,29854,29856,29857,29859,29858,29861,29860,29862,29863,29865,29864,29866,29867,29868,29869,29871,29870,29873,29872,29874,29875,29876,29877,29879,29878,29880,29881,29883,29882,29885,29884,29886,29887,29888,29889,29891,29890,29893,29892,29894,29895,29897,29896,29898,29899,29900,29901,29903,29902,29905,29904,29906,29907,29908,29909,29911,29910,29912,29913,29915,29914,29917,29916,29918,29919,29921,29920,29922,29923,29924,29925,29927,29926,29928,29929,29931,29930,29933,29932,29934,29935,29936,29937,29939,29938,29941,29940,29942,29943,29945,29944,29946,29947,29948,29949,29951,29950,29953,29952,29954,29955,29956,29957,29959,29958,29960,29961,29963,29962,29965,29964,29966,29967,29968,29969,29971,29970,29973,29972,29974,29975,29977,29976,29978,29979,29980,29981,29983,29982,29984,29985,29987,29986,29989,29988,29990,29991,29993,29992,29994,29995,29996,29997,29999,29998,30001,30000,30002,30003,30004,30005,30007,30006,30008,30009,30011,30010,30013,30012,30014,30015,30016,30017,30019,30018,30021,30020,30022,30023,30025,30024,30026,30027,30028,30029,30031,30030,30033,30032,30034,30035,30036,30037,30039,30038,30040,30041,30043,30042,30045,30044,30046,30047,30049,30048,30050,30051,30052,30053,30055,30054,30056,30057,30059,30058,30061,30060,30062,30063,30064,30065,30067,30066,30069,30068,30070,30071,30073,30072,30074,30075,30076,30077,30079,30078,30080,30081,30083,30082,30085,30084,30086,30087,30089,30088,30090,30091,30092,30093,30095,30094,30097,30096,30098,30099,30100,30101,30103,30102,30104,30105,30107,30106,30109,30108,30110,30111,30113,30112,30114,30115,30116,30117,30119,30118,30120,30121,30123,30122,30125,30124,30126,30127,30128,30129,30131,30130,30133,30132,30134,30135,30137,30136,30138,30139,30140,30141,30143,30142,30145,30144,30146,30147,30148,30149,30151,30150,30152,30153,30155,30154,30157,30156,30158,30159,30160,30161,30163,30162,30165,30164,30166,30167,30169,30168,30170,30171,30172,30173,30175,30174,30176,30177,30179,30178,30181,30180,30182,30183,30185,30184,30186,30187,30188,30189,30191,30190,30193,30192,30194,30195,30196,30197,30199,30198,30200,30201,30203,30202,30205,30204,30206,30207,30209,30208,30210,30211,30212,30213,30215,30214,30216,30217,30219,30218,30221,30220,30222,30223,30224,30225,30227,30226,30229,30228,30230,30231,30233,30232,30234,30235,30236,30237,30239,30238,30240,30241,30243,30242,30245,30244,30246,30247,30249,30248,30250,30251,30252,30253,30255,30254,30257,30256,30258,30259,30260,30261,30263,30262,30264,30265,30267,30266,30269,30268,30270,30271,30272,30273,30275,30274,30277,30276,30278,30279,30281,30280,30282,30283,30284,30285,30287,30286,30289,30288,30290,30291,30292,30293,30295,30294,30296,30297,30299,30298,30301,30300,30302,30303,30305,30304,30306,30307,30308,30309,30311,30310,30312,30313,30315,30314,30317,30316,30318,30319,30320,30321,30323,30322,30325,30324,30326,30327,30329,30328,30330,30331,30332,30333,30335,30334,30336,30337,30339,30338,30341,30340,30342,30343,30345,30344,30346,30347,30348,30349,30351,30350,30353,30352,30354,30355,30356,30357,30359,30358,30360,30361,30363,30362,30365,30364,30366,30367,30369,30368,30370,30371,30372,30373,30375,30374,30376,30377,30379,30378,30381,30380,30382,30383,30384,30385,30387,30386,30389,30388,30390,30391,30393,30392,30394,30395,30396,30397,30399,30398,30401,30400,30402,30403,30404,30405,30407,30406,30408,30409,30411,30410,30413,30412,30414,30415,30416,30417,30419,30418,30421,30420,30422,30423,30425,30424,30426,30427,30428,30429,30431,30430,30432,30433,30435,30434,30437,30436,30438,30439,30441,30440,30442,30443,30444,30445,30447,30446,30449,30448,30450,30451,30452,30453,30455,30454,30456,30457,30459,30458,30461,30460,30462,30463,30464,30465,30467,30466,30469,30468,30470,30471,30473,30472,30474,30475,30476,30477,30479,30478,30481,30480,30482,30483,30484,30485,30487,30486,30488,30489,30491,30490,30493,30492,30494,30495,30497,30496,30498,30499,30500,30501,30503,30502,30504,30505,30507,30506,30509,30508,30510,30511,30512,30513,30515,30514,30517,30516,30518,30519,30521,30520,30522,30523,30524,30525,30527,30526,30529,30528,30530,30531,30532,30533,30535,30534,30536,30537,30539,30538,30541,30540,30542,30543,30544,30545,30547,30546,30549,30548,30550,30551,30553,30552,30554,30555,30556,30557,30559,30558,30560,30561,30563,30562,30565,30564,30566,30567,30569,30568,30570,30571,30572,30573,30575,30574,30577,30576,30578,30579,30580,30581,30583,30582,30584,30585,30587,30586,30589,30588,30590,30591,30593,30592,30594,30595,30596,30597,30599,30598,30600,30601,30603,30602,30605,30604,30606,30607,30608,30609,30611,30610,30613,30612,30614,30615,30617,30616,30618,30619,30620,30621,30623,30622,30624,30625,30627,30626,30629,30628,30630,30631,30633,30632,30634,30635,30636,30637,30639,30638,30641,30640,30642,30643,30644,30645,30647,30646,30648,30649,30651,30650,30653,30652,30654,30655,30656,30657,30659,30658,30661,30660,30662,30663,30665,30664,30666,30667,30668,30669,30671,30670,30673,30672,30674,30675,30676,30677,30679,30678,30680,30681,30683,30682,30685,30684,30686,30687,30689,30688,30690,30691,30692,30693,30695,30694,30696,30697,30699,30698,30701,30700,30702,30703,30704,30705,30707,30706,30709,30708,30710,30711,30713,30712,30714,30715,30716,30717,30719,30718,30720,30721,30723,30722,30725,30724,30726,30727,30729,30728,30730,30731,30732,30733,30735,30734,30737,30736,30738,30739,30740,30741,30743,30742,30744,30745,30747,30746,30749,30748,30750,30751,30753,30752,30754,30755,30756,30757,30759,30758,30760,30761,30763,30762,30765,30764,30766,30767,30768,30769,30771,30770,30773,30772,30774,30775,30777,30776,30778,30779,30780,30781,30783,30782,30785,30784,30786,30787,30788,30789,30791,30790,30792,30793,30795,30794,30797,30796,30798,30799,30800,30801,30803,30802,30805,30804,30806,30807,30809,30808,30810,30811,30812,30813,30815,30814,30816,30817,30819,30818,30821,30820,30822,30823,30825,30824,30826,30827,30828,30829,30831,30830,30833,30832,30834,30835,30836,30837,30839,30838,30840,30841,30843,30842,30845,30844,30846,30847,30849,30848,30850,30851,30852,30853,30855,30854,30856,30857,30859,30858,30861,30860,30862,30863,30864,30865,30867,30866,30869,30868,30870,30871,30873,30872,30874,30875,30876,30877,30879,30878,30880,30881,30883,30882,30885,30884,30886,30887,30889,30888,30890,30891,30892,30893,30895,30894,30897,30896,30898,30899,30900,30901,30903,30902,30904,30905,30907,30906,30909,30908,30910,30911,30912,30913,30915,30914,30917,30916,30918,30919,30921,30920,30922,30923,30924,30925,30927,30926,30929,30928,30930,30931,30932,30933,30935,30934,30936,30937,30939,30938,30941,30940,30942,30943,30945,30944,30946,30947,30948,30949,30951,30950,30952,30953,30955,30954,30957,30956,30958,30959,30960,30961,30963,30962,30965,30964,30966,30967,30969,30968,30970,30971,30972,30973,30975,30974,30977,30976,30978,30979,30980,30981,30983,30982,30984,30985,30987,30986,30989,30988,30990,30991,30992,30993,30995,30994,30997,30996,30998,30999,31001,31000,31002,31003,31004,31005,31007,31006,31008,31009,31011,31010,31013,31012,31014,31015,31017,31016,31018,31019,31020,31021,31023,31022,31025,31024,31026,31027,31028,31029,31031,31030,31032,31033,31035,31034,31037,31036,31038,31039,31040,31041,31043,31042,31045,31044,31046,31047,31049,31048,31050,31051,31052,31053,31055,31054,31057,31056,31058,31059,31060,31061,31063,31062,31064,31065,31067,31066,31069,31068,31070,31071,31073,31072,31074,31075,31076,31077,31079,31078,31080,31081,31083,31082,31085,31084,31086,31087,31088,31089,31091,31090,31093,31092,31094,31095,31097,31096,31098,31099,31100,31101,31103,31102,31104,31105,31107,31106,31109,31108,31110,31111,31113,31112,31114,31115,31116,31117,31119,31118,31121,31120,31122,31123,31124,31125,31127,31126,31128,31129,31131,31130,31133,31132,31134,31135,31137,31136,31138,31139,31140,31141,31143,31142,31144,31145,31147,31146,31149,31148,31150,31151,31152,31153,31155,31154,31157,31156,31158,31159,31161,31160,31162,31163,31164,31165,31167,31166,31169,31168,31170,31171,31172,31173,31175,31174,31176,31177,31179,31178,31181,31180,31182,31183,31184,31185,31187,31186,31189,31188,31190,31191,31193,31192,31194,31195,31196,31197,31199,31198,31200,31201,31203,31202,31205,31204,31206,31207,31209,31208,31210,31211,31212,31213,31215,31214,31217,31216,31218,31219,31220,31221,31223,31222,31224,31225,31227,31226,31229,31228,31230,31231,31233,31232,31234,31235,31236,31237,31239,31238,31240,31241,31243,31242,31245,31244,31246,31247,31248,31249,31251,31250,31253,31252,31254,31255,31257,31256,31258,31259,31260,31261,31263,31262,31264,31265,31267,31266,31269,31268,31270,31271,31273,31272,31274,31275,31276,31277,31279,31278,31281,31280,31282,31283,31284,31285,31287,31286,31288,31289,31291,31290,31293,31292,31294,31295,31296,31297,31299,31298,31301,31300,31302,31303,31305,31304,31306,31307,31308,31309,31311,31310,31313,31312,31314,31315,31316,31317,31319,31318,31320,31321,31323,31322,31325,31324,31326,31327,31329,31328,31330,31331,31332,31333,31335,31334,31336,31337,31339,31338,31341,31340,31342,31343,31344,31345,31347,31346,31349,31348,31350,31351,31353,31352,31354,31355,31356,31357,31359,31358,31360,31361,31363,31362,31365,31364,31366,31367,31369,31368,31370,31371,31372,31373,31375,31374,31377,31376,31378,31379,31380,31381,31383,31382,31384,31385,31387,31386,31389,31388,31390,31391,31393,31392,31394,31395,31396,31397,31399,31398,31400,31401,31403,31402,31405,31404,31406,31407,31408,31409,31411,31410,31413,31412,31414,31415,31417,31416,31418,31419,31420,31421,31423,31422,31425,31424,31426,31427,31428,31429,31431,31430,31432,31433,31435,31434,31437,31436,31438,31439,31440,31441,31443,31442,31445,31444,31446,31447,31449,31448,31450,31451,31452,31453,31455,31454,31456,31457,31459,31458,31461,31460,31462,31463,31465,31464,31466,31467,31468,31469,31471,31470,31473,31472,31474,31475,31476,31477,31479,31478,31480,31481,31483,31482,31485,31484,31486,31487,31488,31489,31491,31490,31493,31492,31494,31495,31497,31496,31498,31499,31500,31501,31503,31502,31505,31504,31506,31507,31508,31509,31511,31510,31512,31513,31515,31514,31517,31516,31518,31519,31521,31520,31522,31523,31524,31525,31527,31526,31528,31529,31531,31530,31533,31532,31534,31535,31536,31537,31539,31538,31541,31540,31542,31543,31545,31544,31546,31547,31548,31549,31551,31550,31553,31552,31554,31555,31556,31557,31559,31558,31560,31561,31563,31562,31565,31564,31566,31567,31568,31569,31571,31570,31573,31572,31574,31575,31577,31576,31578,31579,31580,31581,31583,31582,31584,31585,31587,31586,31589,31588,31590,31591,31593,31592,31594,31595,31596,31597,31599,31598,31601,31600,31602,31603,31604,31605,31607,31606,31608,31609,31611,31610,31613,31612,31614,31615,31617,31616,31618,31619,31620,31621,31623,31622,31624,31625,31627,31626,31629,31628,31630,31631,31632,31633,31635,31634,31637,31636,31638,31639,31641,31640,31642,31643,31644,31645,31647,31646,31648,31649,31651,31650,31653,31652,31654,31655,31657,31656,31658,31659,31660,31661,31663,31662,31665,31664,31666,31667,31668,31669,31671,31670,31672,31673,31675,31674,31677,31676,31678,31679,31680,31681,31683,31682,31685,31684,31686,31687,31689,31688,31690,31691,31692,31693,31695,31694,31697,31696,31698,31699,31700,31701,31703,31702,31704,31705,31707,31706,31709,31708,31710,31711,31713,31712,31714,31715,31716,31717,31719,31718,31720,31721,31723,31722,31725,31724,31726,31727,31728,31729,31731,31730,31733,31732,31734,31735,31737,31736,31738,31739,31740,31741,31743,31742,31745,31744,31746,31747,31748,31749,31751,31750,31752,31753,31755,31754,31757,31756,31758,31759,31760,31761,31763,31762,31765,31764,31766,31767,31769,31768,31770,31771,31772,31773,31775,31774,31776,31777,31779,31778,31781,31780,31782,31783,31785,31784,31786,31787,31788,31789,31791,31790,31793,31792,31794,31795,31796,31797,31799,31798,31800,31801,31803,31802,31805,31804,31806,31807,31808,31809,31811,31810,31813,31812,31814,31815,31817,31816,31818,31819,31820,31821,31823,31822,31825,31824,31826,31827,31828,31829,31831,31830,31832,31833,31835,31834,31837,31836,31838,31839,31841,31840,31842,31843,31844,31845,31847,31846,31848,31849,31851,31850,31853,31852,31854,31855,31856,31857,31859,31858,31861,31860,31862,31863,31865,31864,31866,31867,31868,31869,31871,31870,31872,31873,31875,31874,31877,31876,31878,31879,31881,31880,31882,31883,31884,31885,31887,31886,31889,31888,31890,31891,31892,31893,31895,31894,31896,31897,31899,31898,31901,31900,31902,31903,31905,31904,31906,31907,31908,31909,31911,31910,31912,31913,31915,31914,31917,31916,31918,31919,31920,31921,31923,31922,31925,31924,31926,31927,31929,31928,31930,31931,31932,31933,31935,31934,31937,31936,31938,31939,31940,31941,31943,31942,31944,31945,31947,31946,31949,31948,31950,31951,31952,31953,31955,31954,31957,31956,31958,31959,31961,31960,31962,31963,31964,31965,31967,31966,31968,31969,31971,31970,31973,31972,31974,31975,31977,31976,31978,31979,31980,31981,31983,31982,31985,31984,31986,31987,31988,31989,31991,31990,31992,31993,31995,31994,31997,31996,31998,31999,32000,32001,32003,32002,32005,32004,32006,32007,32009,32008,32010,32011,32012,32013,32015,32014,32017,32016,32018,32019,32020,32021,32023,32022,32024,32025,32027,32026,32029,32028,32030,32031,32033,32032,32034,32035,32036,32037,32039,32038,32040,32041,32043,32042,32045,32044,32046,32047,32048,32049,32051,32050,32053,32052,32054,32055,32057,32056,32058,32059,32060,32061,32063,32062,32065,32064,32066,32067,32068,32069,32071,32070,32072,32073,32075,32074,32077,32076,32078,32079,32080,32081,32083,32082,32085,32084,32086,32087,32089,32088,32090,32091,32092,32093,32095,32094,32096,32097,32099,32098,32101,32100,32102,32103,32105,32104,32106,32107,32108,32109,32111,32110,32113,32112,32114,32115,32116,32117,32119,32118,32120,32121,32123,32122,32125,32124,32126,32127,32129,32128,32130,32131,32132,32133,32135,32134,32136,32137,32139,32138,32141,32140,32142,32143,32144,32145,32147,32146,32149,32148,32150,32151,32153,32152,32154,32155,32156,32157,32159,32158,32160,32161,32163,32162,32165,32164,32166,32167,32169,32168,32170,32171,32172,32173,32175,32174,32177,32176,32178,32179,32180,32181,32183,32182,32184,32185,32187,32186,32189,32188,32190,32191,32192,32193,32195,32194,32197,32196,32198,32199,32201,32200,32202,32203,32204,32205,32207,32206,32209,32208,32210,32211,32212,32213,32215,32214,32216,32217,32219,32218,32221,32220,32222,32223,32225,32224,32226,32227,32228,32229,32231,32230,32232,32233,32235,32234,32237,32236,32238,32239,32240,32241,32243,32242,32245,32244,32246,32247,32249,32248,32250,32251,32252,32253,32255,32254,32256,32257,32259,32258,32261,32260,32262,32263,32265,32264,32266,32267,32268,32269,32271,32270,32273,32272,32274,32275,32276,32277,32279,32278,32280,32281,32283,32282,32285,32284,32286,32287,32289,32288,32290,32291,32292,32293,32295,32294,32296,32297,32299,32298,32301,32300,32302,32303,32304,32305,32307,32306,32309,32308,32310,32311,32313,32312,32314,32315,32316,32317,32319,32318,32321,32320,32322,32323,32324,32325,32327,32326,32328,32329,32331,32330,32333,32332,32334,32335,32336,32337,32339,32338,32341,32340,32342,32343,32345,32344,32346,32347,32348,32349,32351,32350,32352,32353,32355,32354,32357,32356,32358,32359,32361,32360,32362,32363,32364,32365,32367,32366,32369,32368,32370,32371,32372,32373,32375,32374,32376,32377,32379,32378,32381,32380,32382,32383,32385,32384,32386,32387,32388,32389,32391,32390,32392,32393,32395,32394,32397,32396,32398,32399,32400,32401,32403,32402,32405,32404,32406,32407,32409,32408,32410,32411,32412,32413,32415,32414,32416,32417,32419,32418,32421,32420,32422,32423,32425,32424,32426,32427,32428,32429,32431,32430,32433,32432,32434,32435,32436,32437,32439,32438,32440,32441,32443,32442,32445,32444,32446,32447,32448,32449,32451,32450,32453,32452,32454,32455,32457,32456,32458,32459,32460,32461,32463,32462,32465,32464,32466,32467,32468,32469,32471,32470,32472,32473,32475,32474,32477,32476,32478,32479,32481,32480,32482,32483,32484,32485,32487,32486,32488,32489,32491,32490,32493,32492,32494,32495,32496,32497,32499,32498,32501,32500,32502,32503,32505,32504,32506,32507,32508,32509,32511,32510,32513,32512,32514,32515,32516,32517,32519,32518,32520,32521,32523,32522,32525,32524,32526,32527,32528,32529,32531,32530,32533,32532,32534,32535,32537,32536,32538,32539,32540,32541,32543,32542,32544,32545,32547,32546,32549,32548,32550,32551,32553,32552,32554,32555,32556,32557,32559,32558,32561,32560,32562,32563,32564,32565,32567,32566,32568,32569,32571,32570,32573,32572,32574,32575,32576,32577,32579,32578,32581,32580,32582,32583,32585,32584,32586,32587,32588,32589,32591,32590,32593,32592,32594,32595,32596,32597,32599,32598,32600,32601,32603,32602,32605,32604,32606,32607,32609,32608,32610,32611,32612,32613,32615,32614,32616,32617,32619,32618,32621,32620,32622,32623,32624,32625,32627,32626,32629,32628,32630,32631,32633,32632,32634,32635,32636,32637,32639,32638,32640,32641,32643,32642,32645,32644,32646,32647,32649,32648,32650,32651,32652,32653,32655,32654,32657,32656,32658,32659,32660,32661,32663,32662,32664,32665,32667,32666,32669,32668,32670,32671,32673,32672,32674,32675,32676,32677,32679,32678,32680,32681,32683,32682,32685,32684,32686,32687,32688,32689,32691,32690,32693,32692,32694,32695,32697,32696,32698,32699,32700,32701,32703,32702,32705,32704,32706,32707,32708,32709,32711,32710,32712,32713,32715,32714,32717,32716,32718,32719,32720,32721,32723,32722,32725,32724,32726,32727,32729,32728,32730,32731,32732,32733,32735,32734,32736,32737,32739,32738,32741,32740,32742,32743,32745,32744,32746,32747,32748,32749,32751,32750,32753,32752,32754,32755,32756,32757,32759,32758,32760,32761,32763,32762,32765,32764,32766,32767,32769,32768,32770,32771,32772,32773,32775,32774,32776,32777,32779,32778,32781,32780,32782,32783,32784,32785,32787,32786,32789,32788,32790,32791,32793,32792,32794,32795,32796,32797,32799,32798,32800,32801,32803,32802,32805,32804,32806,32807,32809,32808,32810,32811,32812,32813,32815,32814,32817,32816,32818,32819,32820,32821,32823,32822,32824,32825,32827,32826,32829,32828,32830,32831,32832,32833,32835,32834,32837,32836,32838,32839,32841,32840,32842,32843,32844,32845,32847,32846,32849,32848,32850,32851,32852,32853,32855,32854,32856,32857,32859,32858,32861,32860,32862,32863,32865,32864,32866,32867,32868,32869,32871,32870,32872,32873,32875,32874,32877,32876,32878,32879,32880,32881,32883,32882,32885,32884,32886,32887,32889,32888,32890,32891,32892,32893,32895,32894,32896,32897,32899,32898,32901,32900,32902,32903,32905,32904,32906,32907,32908,32909,32911,32910,32913,32912,32914,32915,32916,32917,32919,32918,32920,32921,32923,32922,32925,32924,32926,32927,32929,32928,32930,32931,32932,32933,32935,32934,32936,32937,32939,32938,32941,32940,32942,32943,32944,32945,32947,32946,32949,32948,32950,32951,32953,32952,32954,32955,32956,32957,32959,32958,32961,32960,32962,32963,32964,32965,32967,32966,32968,32969,32971,32970,32973,32972,32974,32975,32976,32977,32979,32978,32981,32980,32982,32983,32985,32984,32986,32987,32988,32989,32991,32990,32992,32993,32995,32994,32997,32996,32998,32999,33001,33000,33002,33003,33004,33005,33007,33006,33009,33008,33010,33011,33012,33013,33015,33014,33016,33017,33019,33018,33021,33020,33022,33023,33024,33025,33027,33026,33029,33028,33030,33031,33033,33032,33034,33035,33036,33037,33039,33038,33041,33040,33042,33043,33044,33045,33047,33046,33048,33049,33051,33050,33053,33052,33054,33055,33057,33056,33058,33059,33060,33061,33063,33062,33064,33065,33067,33066,33069,33068,33070,33071,33072,33073,33075,33074,33077,33076,33078,33079,33081,33080,33082,33083,33084,33085,33087,33086,33089,33088,33090,33091,33092,33093,33095,33094,33096,33097,33099,33098,33101,33100,33102,33103,33104,33105,33107,33106,33109,33108,33110,33111,33113,33112,33114,33115,33116,33117,33119,33118,33120,33121,33123,33122,33125,33124,33126,33127,33129,33128,33130,33131,33132,33133,33135,33134,33137,33136,33138,33139,33140,33141,33143,33142,33144,33145,33147,33146,33149,33148,33150,33151,33153,33152,33154,33155,33156,33157,33159,33158,33160,33161,33163,33162,33165,33164,33166,33167,33168,33169,33171,33170,33173,33172,33174,33175,33177,33176,33178,33179,33180,33181,33183,33182,33184,33185,33187,33186,33189,33188,33190,33191,33193,33192,33194,33195,33196,33197,33199,33198,33201,33200,33202,33203,33204,33205,33207,33206,33208,33209,33211,33210,33213,33212,33214,33215,33216,33217,33219,33218,33221,33220,33222,33223,33225,33224,33226,33227,33228,33229,33231,33230,33233,33232,33234,33235,33236,33237,33239,33238,33240,33241,33243,33242,33245,33244,33246,33247,33249,33248,33250,33251,33252,33253,33255,33254,33256,33257,33259,33258,33261,33260,33262,33263,33264,33265,33267,33266,33269,33268,33270,33271,33273,33272,33274,33275,33276,33277,33279,33278,33280,33281,33283,33282,33285,33284,33286,33287,33289,33288,33290,33291,33292,33293,33295,33294,33297,33296,33298,33299,33300,33301,33303,33302,33304,33305,33307,33306,33309,33308,33310,33311,33313,33312,33314,33315,33316,33317,33319,33318,33320,33321,33323,33322,33325,33324,33326,33327,33328,33329,33331,33330,33333,33332,33334,33335,33337,33336,33338,33339,33340,33341,33343,33342,33345,33344,33346,33347,33348,33349,33351,33350,33352,33353,33355,33354,33357,33356,33358,33359,33360,33361,33363,33362,33365,33364,33366,33367,33369,33368,33370,33371,33372,33373,33375,33374,33376,33377,33379,33378,33381,33380,33382,33383,33385,33384,33386,33387,33388,33389,33391,33390,33393,33392,33394,33395,33396,33397,33399,33398,33400,33401,33403,33402,33405,33404,33406,33407,33409,33408,33410,33411,33412,33413,33415,33414,33416,33417,33419,33418,33421,33420,33422,33423,33424,33425,33427,33426,33429,33428,33430,33431,33433,33432,33434,33435,33436,33437,33439,33438,33440,33441,33443,33442,33445,33444,33446,33447,33449,33448,33450,33451,33452,33453,33455,33454,33457,33456,33458,33459,33460,33461,33463,33462,33464,33465,33467,33466,33469,33468,33470,33471,33472,33473,33475,33474,33477,33476,33478,33479,33481,33480,33482,33483,33484,33485,33487,33486,33489,33488,33490,33491,33492,33493,33495,33494,33496,33497,33499,33498,33501,33500,33502,33503,33505,33504,33506,33507,33508,33509,33511,33510,33512,33513,33515,33514,33517,33516,33518,33519,33520,33521,33523,33522,33525,33524,33526,33527,33529,33528,33530,33531,33532,33533,33535,33534,33537,33536,33538,33539,33540,33541,33543,33542,33544,33545,33547,33546,33549,33548,33550,33551,33552,33553,33555,33554,33557,33556,33558,33559,33561,33560,33562,33563,33564,33565,33567,33566,33568,33569,33571,33570,33573,33572,33574,33575,33577,33576,33578,33579,33580,33581,33583,33582,33585,33584,33586,33587,33588,33589,33591,33590,33592,33593,33595,33594,33597,33596,33598,33599,33600,33601,33603,33602,33605,33604,33606,33607,33609,33608,33610,33611,33612,33613,33615,33614,33617,33616,33618,33619,33620,33621,33623,33622,33624,33625,33627,33626,33629,33628,33630,33631,33633,33632,33634,33635,33636,33637,33639,33638,33640,33641,33643,33642,33645,33644,33646,33647,33648,33649,33651,33650,33653,33652,33654,33655,33657,33656,33658,33659,33660,33661,33663,33662,33664,33665,33667,33666,33669,33668,33670,33671,33673,33672,33674,33675,33676,33677,33679,33678,33681,33680,33682,33683,33684,33685,33687,33686,33688,33689,33691,33690,33693,33692,33694,33695,33697,33696,33698,33699,33700,33701,33703,33702,33704,33705,33707,33706,33709,33708,33710,33711,33712,33713,33715,33714,33717,33716,33718,33719,33721,33720,33722,33723,33724,33725,33727,33726,33729,33728,33730,33731,33732,33733,33735,33734,33736,33737,33739,33738,33741,33740,33742,33743,33744,33745,33747,33746,33749,33748,33750,33751,33753,33752,33754,33755,33756,33757,33759,33758,33760,33761,33763,33762,33765,33764,33766,33767,33769,33768,33770,33771,33772,33773,33775,33774,33777,33776,33778,33779,33780,33781,33783,33782,33784,33785,33787,33786,33789,33788,33790,33791,33792,33793,33795,33794,33797,33796,33798,33799,33801,33800,33802,33803,33804,33805,33807,33806,33809,33808,33810,33811,33812,33813,33815,33814,33816,33817,33819,33818,33821,33820,33822,33823,33825,33824,33826,33827,33828,33829,33831,33830,33832,33833,33835,33834,33837,33836,33838,33839,33840,33841,33843,33842,33845,33844,33846,33847,33849,33848,33850,33851,33852,33853,33855,33854,33857,33856,33858,33859,33860,33861,33863,33862,33864,33865,33867,33866,33869,33868,33870,33871,33872,33873,33875,33874,33877,33876,33878,33879,33881,33880,33882,33883,33884,33885,33887,33886,33888,33889,33891,33890,33893,33892,33894,33895,33897,33896,33898,33899,33900,33901,33903,33902,33905,33904,33906,33907,33908,33909,33911,33910,33912,33913,33915,33914,33917,33916,33918,33919,33921,33920,33922,33923,33924,33925,33927,33926,33928,33929,33931,33930,33933,33932,33934,33935,33936,33937,33939,33938,33941,33940,33942,33943,33945,33944,33946,33947,33948,33949,33951,33950,33952,33953,33955,33954,33957,33956,33958,33959,33961,33960,33962,33963,33964,33965,33967,33966,33969,33968,33970,33971,33972,33973,33975,33974,33976,33977,33979,33978,33981,33980,33982,33983,33984,33985,33987,33986,33989,33988,33990,33991,33993,33992,33994,33995,33996,33997,33999,33998,34001,34000,34002,34003,34004,34005,34007,34006,34008,34009,34011,34010,34013,34012,34014,34015,34017,34016,34018,34019,34020,34021,34023,34022,34024,34025,34027,34026,34029,34028,34030,34031,34032,34033,34035,34034,34037,34036,34038,34039,34041,34040,34042,34043,34044,34045,34047,34046,34049,34048,34050,34051,34052,34053,34055,34054,34056,34057,34059,34058,34061,34060,34062,34063,34064,34065,34067,34066,34069,34068,34070,34071,34073,34072,34074,34075,34076,34077,34079,34078,34080,34081,34083,34082,34085,34084,34086,34087,34089,34088,34090,34091,34092,34093,34095,34094,34097,34096,34098,34099,34100,34101,34103,34102,34104,34105,34107,34106,34109,34108,34110,34111,34112,34113,34115,34114,34117,34116,34118,34119,34121,34120,34122,34123,34124,34125,34127,34126,34129,34128,34130,34131,34132,34133,34135,34134,34136,34137,34139,34138,34141,34140,34142,34143,34145,34144,34146,34147,34148,34149,34151,34150,34152,34153,34155,34154,34157,34156,34158,34159,34160,34161,34163,34162,34165,34164,34166,34167,34169,34168,34170,34171,34172,34173,34175,34174,34176,34177,34179,34178,34181,34180,34182,34183,34185,34184,34186,34187,34188,34189,34191,34190,34193,34192,34194,34195,34196,34197,34199,34198,34200,34201,34203,34202,34205,34204,34206,34207,34209,34208,34210,34211,34212,34213,34215,34214,34216,34217,34219,34218,34221,34220,34222,34223,34224,34225,34227,34226,34229,34228,34230,34231,34233,34232,34234,34235,34236,34237,34239,34238,34241,34240,34242,34243,34244,34245,34247,34246,34248,34249,34251,34250,34253,34252,34254,34255,34256,34257,34259,34258,34261,34260,34262,34263,34265,34264,34266,34267,34268,34269,34271,34270,34272,34273,34275,34274,34277,34276,34278,34279,34281,34280,34282,34283,34284,34285,34287,34286,34289,34288,34290,34291,34292,34293,34295,34294,34296,34297,34299,34298,34301,34300,34302,34303,34305,34304,34306,34307,34308,34309,34311,34310,34312,34313,34315,34314,34317,34316,34318,34319,34320,34321,34323,34322,34325,34324,34326,34327,34329,34328,34330,34331,34332,34333,34335,34334,34336,34337,34339,34338,34341,34340,34342,34343,34345,34344,34346,34347,34348,34349,34351,34350,34353,34352,34354,34355,34356,34357,34359,34358,34360,34361,34363,34362,34365,34364,34366,34367,34368,34369,34371,34370,34373,34372,34374,34375,34377,34376,34378,34379,34380,34381,34383,34382,34385,34384,34386,34387,34388,34389,34391,34390,34392,34393,34395,34394,34397,34396,34398,34399,34401,34400,34402,34403,34404,34405,34407,34406,34408,34409,34411,34410,34413,34412,34414,34415,34416,34417,34419,34418,34421,34420,34422,34423,34425,34424,34426,34427,34428,34429,34431,34430,34432,34433,34435,34434,34437,34436,34438,34439,34441,34440,34442,34443,34444,34445,34447,34446,34449,34448,34450,34451,34452,34453,34455,34454,34456,34457,34459,34458,34461,34460,34462,34463,34465,34464,34466,34467,34468,34469,34471,34470,34472,34473,34475,34474,34477,34476,34478,34479,34480,34481,34483,34482,34485,34484,34486,34487,34489,34488,34490,34491,34492,34493,34495,34494,34497,34496,34498,34499,34500,34501,34503,34502,34504,34505,34507,34506,34509,34508,34510,34511,34512,34513,34515,34514,34517,34516,34518,34519,34521,34520,34522,34523,34524,34525,34527,34526,34528,34529,34531,34530,34533,34532,34534,34535,34537,34536,34538,34539,34540,34541,34543,34542,34545,34544,34546,34547,34548,34549,34551,34550,34552,34553,34555,34554,34557,34556,34558,34559,34560,34561,34563,34562,34565,34564,34566,34567,34569,34568,34570,34571,34572,34573,34575,34574,34577,34576,34578,34579,34580,34581,34583,34582,34584,34585,34587,34586,34589,34588,34590,34591,34593,34592,34594,34595,34596,34597,34599,34598,34600,34601,34603,34602,34605,34604,34606,34607,34608,34609,34611,34610,34613,34612,34614,34615,34617,34616,34618,34619,34620,34621,34623,34622,34625,34624,34626,34627,34628,34629,34631,34630,34632,34633,34635,34634,34637,34636,34638,34639,34640,34641,34643,34642,34645,34644,34646,34647,34649,34648,34650,34651,34652,34653,34655,34654,34656,34657,34659,34658,34661,34660,34662,34663,34665,34664,34666,34667,34668,34669,34671,34670,34673,34672,34674,34675,34676,34677,34679,34678,34680,34681,34683,34682,34685,34684,34686,34687,34689,34688,34690,34691,34692,34693,34695,34694,34696,34697,34699,34698,34701,34700,34702,34703,34704,34705,34707,34706,34709,34708,34710,34711,34713,34712,34714,34715,34716,34717,34719,34718,34720,34721,34723,34722,34725,34724,34726,34727,34729,34728,34730,34731,34732,34733,34735,34734,34737,34736,34738,34739,34740,34741,34743,34742,34744,34745,34747,34746,34749,34748,34750,34751,34752,34753,34755,34754,34757,34756,34758,34759,34761,34760,34762,34763,34764,34765,34767,34766,34769,34768,34770,34771,34772,34773,34775,34774,34776,34777,34779,34778,34781,34780,34782,34783,34785,34784,34786,34787,34788,34789,34791,34790,34792,34793,34795,34794,34797,34796,34798,34799,34800,34801,34803,34802,34805,34804,34806,34807,34809,34808,34810,34811,34812,34813,34815,34814,34816,34817,34819,34818,34821,34820,34822,34823,34825,34824,34826,34827,34828,34829,34831,34830,34833,34832,34834,34835,34836,34837,34839,34838,34840,34841,34843,34842,34845,34844,34846,34847,34849,34848,34850,34851,34852,34853,34855,34854,34856,34857,34859,34858,34861,34860,34862,34863,34864,34865,34867,34866,34869,34868,34870,34871,34873,34872,34874,34875,34876,34877,34879,34878,34881,34880,34882,34883,34884,34885,34887,34886,34888,34889,34891,34890,34893,34892,34894,34895,34896,34897,34899,34898,34901,34900,34902,34903,34905,34904,34906,34907,34908,34909,34911,34910,34912,34913,34915,34914,34917,34916,34918,34919,34921,34920,34922,34923,34924,34925,34927,34926,34929,34928,34930,34931,34932,34933,34935,34934,34936,34937,34939,34938,34941,34940,34942,34943,34945,34944,34946,34947,34948,34949,34951,34950,34952,34953,34955,34954,34957,34956,34958,34959,34960,34961,34963,34962,34965,34964,34966,34967,34969,34968,34970,34971,34972,34973,34975,34974,34976,34977,34979,34978,34981,34980,34982,34983,34985,34984,34986,34987,34988,34989,34991,34990,34993,34992,34994,34995,34996,34997,34999,34998,35000,35001,35003,35002,35005,35004,35006,35007,35008,35009,35011,35010,35013,35012,35014,35015,35017,35016,35018,35019,35020,35021,35023,35022,35025,35024,35026,35027,35028,35029,35031,35030,35032,35033,35035,35034,35037,35036,35038,35039,35041,35040,35042,35043,35044,35045,35047,35046,35048,35049,35051,35050,35053,35052,35054,35055,35056,35057,35059,35058,35061,35060,35062,35063,35065,35064,35066,35067,35068,35069,35071,35070,35073,35072,35074,35075,35076,35077,35079,35078,35080,35081,35083,35082,35085,35084,35086,35087,35088,35089,35091,35090,35093,35092,35094,35095,35097,35096,35098,35099,35100,35101,35103,35102,35104,35105,35107,35106,35109,35108,35110,35111,35113,35112,35114,35115,35116,35117,35119,35118,35121,35120,35122,35123,35124,35125,35127,35126,35128,35129,35131,35130,35133,35132,35134,35135,35136,35137,35139,35138,35141,35140,35142,35143,35145,35144,35146,35147,35148,35149,35151,35150,35153,35152,35154,35155,35156,35157,35159,35158,35160,35161,35163,35162,35165,35164,35166,35167,35169,35168,35170,35171,35172,35173,35175,35174,35176,35177,35179,35178,35181,35180,35182,35183,35184,35185,35187,35186,35189,35188,35190,35191,35193,35192,35194,35195,35196,35197,35199,35198,35200,35201,35203,35202,35205,35204,35206,35207,35209,35208,35210,35211,35212,35213,35215,35214,35217,35216,35218,35219,35220,35221,35223,35222,35224,35225,35227,35226,35229,35228,35230,35231,35233,35232,35234,35235,35236,35237,35239,35238,35240,35241,35243,35242,35245,35244,35246,35247,35248,35249,35251,35250,35253,35252,35254,35255,35257,35256,35258,35259,35260,35261,35263,35262,35265,35264,35266,35267,35268,35269,35271,35270,35272,35273,35275,35274,35277,35276,35278,35279,35280,35281,35283,35282,35285,35284,35286,35287,35289,35288,35290,35291,35292,35293,35295,35294,35296,35297,35299,35298,35301,35300,35302,35303,35305,35304,35306,35307,35308,35309,35311,35310,35313,35312,35314,35315,35316,35317,35319,35318,35320,35321,35323,35322,35325,35324,35326,35327,35329,35328,35330,35331,35332,35333,35335,35334,35336,35337,35339,35338,35341,35340,35342,35343,35344,35345,35347,35346,35349,35348,35350,35351,35353,35352,35354,35355,35356,35357,35359,35358,35360,35361,35363,35362,35365,35364,35366,35367,35369,35368,35370,35371,35372,35373,35375,35374,35377,35376,35378,35379,35380,35381,35383,35382,35384,35385,35387,35386,35389,35388,35390,35391,35392,35393,35395,35394,35397,35396,35398,35399,35401,35400,35402,35403,35404,35405,35407,35406,35409,35408,35410,35411,35412,35413,35415,35414,35416,35417,35419,35418,35421,35420,35422,35423,35425,35424,35426,35427,35428,35429,35431,35430,35432,35433,35435,35434,35437,35436,35438,35439,35440,35441,35443,35442,35445,35444,35446,35447,35449,35448,35450,35451,35452,35453,35455,35454,35456,35457,35459,35458,35461,35460,35462,35463,35465,35464,35466,35467,35468,35469,35471,35470,35473,35472,35474,35475,35476,35477,35479,35478,35480,35481,35483,35482,35485,35484,35486,35487,35489,35488,35490,35491,35492,35493,35495,35494,35496,35497,35499,35498,35501,35500,35502,35503,35504,35505,35507,35506,35509,35508,35510,35511,35513,35512,35514,35515,35516,35517,35519,35518,35521,35520,35522,35523,35524,35525,35527,35526,35528,35529,35531,35530,35533,35532,35534,35535,35536,35537,35539,35538,35541,35540,35542,35543,35545,35544,35546,35547,35548,35549,35551,35550,35552,35553,35555,35554,35557,35556,35558,35559,35561,35560,35562,35563,35564,35565,35567,35566,35569,35568,35570,35571,35572,35573,35575,35574,35576,35577,35579,35578,35581,35580,35582,35583,35584,35585,35587,35586,35589,35588,35590,35591,35593,35592,35594,35595,35596,35597,35599,35598,35601,35600,35602,35603,35604,35605,35607,35606,35608,35609,35611,35610,35613,35612,35614,35615,35617,35616,35618,35619,35620,35621,35623,35622,35624,35625,35627,35626,35629,35628,35630,35631,35632,35633,35635,35634,35637,35636,35638,35639,35641,35640,35642,35643,35644,35645,35647,35646,35649,35648,35650,35651,35652,35653,35655,35654,35656,35657,35659,35658,35661,35660,35662,35663,35664,35665,35667,35666,35669,35668,35670,35671,35673,35672,35674,35675,35676,35677,35679,35678,35680,35681,35683,35682,35685,35684,35686,35687,35689,35688,35690,35691,35692,35693,35695,35694,35697,35696,35698,35699,35700,35701,35703,35702,35704,35705,35707,35706,35709,35708,35710,35711,35713,35712,35714,35715,35716,35717,35719,35718,35720,35721,35723,35722,35725,35724,35726,35727,35728,35729,35731,35730,35733,35732,35734,35735,35737,35736,35738,35739,35740,35741,35743,35742,35744,35745,35747,35746,35749,35748,35750,35751,35753,35752,35754,35755,35756,35757,35759,35758,35761,35760,35762,35763,35764,35765,35767,35766,35768,35769,35771,35770,35773,35772,35774,35775,35776,35777,35779,35778,35781,35780,35782,35783,35785,35784,35786,35787,35788,35789,35791,35790,35793,35792,35794,35795,35796,35797,35799,35798,35800,35801,35803,35802,35805,35804,35806,35807,35809,35808,35810,35811,35812,35813,35815,35814,35816,35817,35819,35818,35821,35820,35822,35823,35824,35825,35827,35826,35829,35828,35830,35831,35833,35832,35834,35835,35836,35837,35839,35838,35841,35840,35842,35843,35844,35845,35847,35846,35848,35849,35851,35850,35853,35852,35854,35855,35856,35857,35859,35858,35861,35860,35862,35863,35865,35864,35866,35867,35868,35869,35871,35870,35872,35873,35875,35874,35877,35876,35878,35879,35881,35880,35882,35883,35884,35885,35887,35886,35889,35888,35890,35891,35892,35893,35895,35894,35896,35897,35899,35898,35901,35900,35902,35903,35904,35905,35907,35906,35909,35908,35910,35911,35913,35912,35914,35915,35916,35917,35919,35918,35921,35920,35922,35923,35924,35925,35927,35926,35928,35929,35931,35930,35933,35932,35934,35935,35937,35936,35938,35939,35940,35941,35943,35942,35944,35945,35947,35946,35949,35948,35950,35951,35952,35953,35955,35954,35957,35956,35958,35959,35961,35960,35962,35963,35964,35965,35967,35966,35968,35969,35971,35970,35973,35972,35974,35975,35977,35976,35978,35979,35980,35981,35983,35982,35985,35984,35986,35987,35988,35989,35991,35990,35992,35993,35995,35994,35997,35996,35998,35999,36001,36000,36002,36003,36004,36005,36007,36006,36008,36009,36011,36010,36013,36012,36014,36015,36016,36017,36019,36018,36021,36020,36022,36023,36025,36024,36026,36027,36028,36029,36031,36030,36033,36032,36034,36035,36036,36037,36039,36038,36040,36041,36043,36042,36045,36044,36046,36047,36048,36049,36051,36050,36053,36052,36054,36055,36057,36056,36058,36059,36060,36061,36063,36062,36064,36065,36067,36066,36069,36068,36070,36071,36073,36072,36074,36075,36076,36077,36079,36078,36081,36080,36082,36083,36084,36085,36087,36086,36088,36089,36091,36090,36093,36092,36094,36095,36096,36097,36099,36098,36101,36100,36102,36103,36105,36104,36106,36107,36108,36109,36111,36110,36113,36112,36114,36115,36116,36117,36119,36118,36120,36121,36123,36122,36125,36124,36126,36127,36129,36128,36130,36131,36132,36133,36135,36134,36136,36137,36139,36138,36141,36140,36142,36143,36144,36145,36147,36146,36149,36148,36150,36151,36153,36152,36154,36155,36156,36157,36159,36158,36161,36160,36162,36163,36164,36165,36167,36166,36168,36169,36171,36170,36173,36172,36174,36175,36176,36177,36179,36178,36181,36180,36182,36183,36185,36184,36186,36187,36188,36189,36191,36190,36192,36193,36195,36194,36197,36196,36198,36199,36201,36200,36202,36203,36204,36205,36207,36206,36209,36208,36210,36211,36212,36213,36215,36214,36216,36217,36219,36218,36221,36220,36222,36223,36225,36224,36226,36227,36228,36229,36231,36230,36232,36233,36235,36234,36237,36236,36238,36239,36240,36241,36243,36242,36245,36244,36246,36247,36249,36248,36250,36251,36252,36253,36255,36254,36256,36257,36259,36258,36261,36260,36262,36263,36265,36264,36266,36267,36268,36269,36271,36270,36273,36272,36274,36275,36276,36277,36279,36278,36280,36281,36283,36282,36285,36284,36286,36287,36288,36289,36291,36290,36293,36292,36294,36295,36297,36296,36298,36299,36300,36301,36303,36302,36305,36304,36306,36307,36308,36309,36311,36310,36312,36313,36315,36314,36317,36316,36318,36319,36321,36320,36322,36323,36324,36325,36327,36326,36328,36329,36331,36330,36333,36332,36334,36335,36336,36337,36339,36338,36341,36340,36342,36343,36345,36344,36346,36347,36348,36349,36351,36350,36352,36353,36355,36354,36357,36356,36358,36359,36361,36360,36362,36363,36364,36365,36367,36366,36369,36368,36370,36371,36372,36373,36375,36374,36376,36377,36379,36378,36381,36380,36382,36383,36385,36384,36386,36387,36388,36389,36391,36390,36392,36393,36395,36394,36397,36396,36398,36399,36400,36401,36403,36402,36405,36404,36406,36407,36409,36408,36410,36411,36412,36413,36415,36414,36417,36416,36418,36419,36420,36421,36423,36422,36424,36425,36427,36426,36429,36428,36430,36431,36432,36433,36435,36434,36437,36436,36438,36439,36441,36440,36442,36443,36444,36445,36447,36446,36448,36449,36451,36450,36453,36452,36454,36455,36457,36456,36458,36459,36460,36461,36463,36462,36465,36464,36466,36467,36468,36469,36471,36470,36472,36473,36475,36474,36477,36476,36478,36479,36481,36480,36482,36483,36484,36485,36487,36486,36488,36489,36491,36490,36493,36492,36494,36495,36496,36497,36499,36498,36501,36500,36502,36503,36505,36504,36506,36507,36508,36509,36511,36510,36512,36513,36515,36514,36517,36516,36518,36519,36521,36520,36522,36523,36524,36525,36527,36526,36529,36528,36530,36531,36532,36533,36535,36534,36536,36537,36539,36538,36541,36540,36542,36543,36544,36545,36547,36546,36549,36548,36550,36551,36553,36552,36554,36555,36556,36557,36559,36558,36561,36560,36562,36563,36564,36565,36567,36566,36568,36569,36571,36570,36573,36572,36574,36575,36577,36576,36578,36579,36580,36581,36583,36582,36584,36585,36587,36586,36589,36588,36590,36591,36592,36593,36595,36594,36597,36596,36598,36599,36601,36600,36602,36603,36604,36605,36607,36606,36609,36608,36610,36611,36612,36613,36615,36614,36616,36617,36619,36618,36621,36620,36622,36623,36624,36625,36627,36626,36629,36628,36630,36631,36633,36632,36634,36635,36636,36637,36639,36638,36640,36641,36643,36642,36645,36644,36646,36647,36649,36648,36650,36651,36652,36653,36655,36654,36657,36656,36658,36659,36660,36661,36663,36662,36664,36665,36667,36666,36669,36668,36670,36671,36672,36673,36675,36674,36677,36676,36678,36679,36681,36680,36682,36683,36684,36685,36687,36686,36689,36688,36690,36691,36692,36693,36695,36694,36696,36697,36699,36698,36701,36700,36702,36703,36705,36704,36706,36707,36708,36709,36711,36710,36712,36713,36715,36714,36717,36716,36718,36719,36720,36721,36723,36722,36725,36724,36726,36727,36729,36728,36730,36731,36732,36733,36735,36734,36736,36737,36739,36738,36741,36740,36742,36743,36745,36744,36746,36747,36748,36749,36751,36750,36753,36752,36754,36755,36756,36757,36759,36758,36760,36761,36763,36762,36765,36764,36766,36767,36769,36768,36770,36771,36772,36773,36775,36774,36776,36777,36779,36778,36781,36780,36782,36783,36784,36785,36787,36786,36789,36788,36790,36791,36793,36792,36794,36795,36796,36797,36799,36798,36801,36800,36802,36803,36804,36805,36807,36806,36808,36809,36811,36810,36813,36812,36814,36815,36816,36817,36819,36818,36821,36820,36822,36823,36825,36824,36826,36827,36828,36829,36831,36830,36832,36833,36835,36834,36837,36836,36838,36839,36841,36840,36842,36843,36844,36845,36847,36846,36849,36848,36850,36851,36852,36853,36855,36854,36856,36857,36859,36858,36861,36860,36862,36863,36864,36865,36867,36866,36869,36868,36870,36871,36873,36872,36874,36875,36876,36877,36879,36878,36881,36880,36882,36883,36884,36885,36887,36886,36888,36889,36891,36890,36893,36892,36894,36895,36897,36896,36898,36899,36900,36901,36903,36902,36904,36905,36907,36906,36909,36908,36910,36911,36912,36913,36915,36914,36917,36916,36918,36919,36921,36920,36922,36923,36924,36925,36927,36926,36929,36928,36930,36931,36932,36933,36935,36934,36936,36937,36939,36938,36941,36940,36942,36943,36944,36945,36947,36946,36949,36948,36950,36951,36953,36952,36954,36955,36956,36957,36959,36958,36960,36961,36963,36962,36965,36964,36966,36967,36969,36968,36970,36971,36972,36973,36975,36974,36977,36976,36978,36979,36980,36981,36983,36982,36984,36985,36987,36986,36989,36988,36990,36991,36993,36992,36994,36995,36996,36997,36999,36998,37000,37001,37003,37002,37005,37004,37006,37007,37008,37009,37011,37010,37013,37012,37014,37015,37017,37016,37018,37019,37020,37021,37023,37022,37024,37025,37027,37026,37029,37028,37030,37031,37033,37032,37034,37035,37036,37037,37039,37038,37041,37040,37042,37043,37044,37045,37047,37046,37048,37049,37051,37050,37053,37052,37054,37055,37056,37057,37059,37058,37061,37060,37062,37063,37065,37064,37066,37067,37068,37069,37071,37070,37073,37072,37074,37075,37076,37077,37079,37078,37080,37081,37083,37082,37085,37084,37086,37087,37089,37088,37090,37091,37092,37093,37095,37094,37096,37097,37099,37098,37101,37100,37102,37103,37104,37105,37107,37106,37109,37108,37110,37111,37113,37112,37114,37115,37116,37117,37119,37118,37121,37120,37122,37123,37124,37125,37127,37126,37128,37129,37131,37130,37133,37132,37134,37135,37136,37137,37139,37138,37141,37140,37142,37143,37145,37144,37146,37147,37148,37149,37151,37150,37152,37153,37155,37154,37157,37156,37158,37159,37161,37160,37162,37163,37164,37165,37167,37166,37169,37168,37170,37171,37172,37173,37175,37174,37176,37177,37179,37178,37181,37180,37182,37183,37184,37185,37187,37186,37189,37188,37190,37191,37193,37192,37194,37195,37196,37197,37199,37198,37201,37200,37202,37203,37204,37205,37207,37206,37208,37209,37211,37210,37213,37212,37214,37215,37217,37216,37218,37219,37220,37221,37223,37222,37224,37225,37227,37226,37229,37228,37230,37231,37232,37233,37235,37234,37237,37236,37238,37239,37241,37240,37242,37243,37244,37245,37247,37246,37248,37249,37251,37250,37253,37252,37254,37255,37257,37256,37258,37259,37260,37261,37263,37262,37265,37264,37266,37267,37268,37269,37271,37270,37272,37273,37275,37274,37277,37276,37278,37279,37281,37280,37282,37283,37284,37285,37287,37286,37288,37289,37291,37290,37293,37292,37294,37295,37296,37297,37299,37298,37301,37300,37302,37303,37305,37304,37306,37307,37308,37309,37311,37310,37313,37312,37314,37315,37316,37317,37319,37318,37320,37321,37323,37322,37325,37324,37326,37327,37328,37329,37331,37330,37333,37332,37334,37335,37337,37336,37338,37339,37340,37341,37343,37342,37344,37345,37347,37346,37349,37348,37350,37351,37353,37352,37354,37355,37356,37357,37359,37358,37361,37360,37362,37363,37364,37365,37367,37366,37368,37369,37371,37370,37373,37372,37374,37375,37377,37376,37378,37379,37380,37381,37383,37382,37384,37385,37387,37386,37389,37388,37390,37391,37392,37393,37395,37394,37397,37396,37398,37399,37401,37400,37402,37403,37404,37405,37407,37406,37408,37409,37411,37410,37413,37412,37414,37415,37417,37416,37418,37419,37420,37421,37423,37422,37425,37424,37426,37427,37428,37429,37431,37430,37432,37433,37435,37434,37437,37436,37438,37439,37440,37441,37443,37442,37445,37444,37446,37447,37449,37448,37450,37451,37452,37453,37455,37454,37457,37456,37458,37459,37460,37461,37463,37462,37464,37465,37467,37466,37469,37468,37470,37471,37473,37472,37474,37475,37476,37477,37479,37478,37480,37481,37483,37482,37485,37484,37486,37487,37488,37489,37491,37490,37493,37492,37494,37495,37497,37496,37498,37499,37500,37501,37503,37502,37504,37505,37507,37506,37509,37508,37510,37511,37513,37512,37514,37515,37516,37517,37519,37518,37521,37520,37522,37523,37524,37525,37527,37526,37528,37529,37531,37530,37533,37532,37534,37535,37537,37536,37538,37539,37540,37541,37543,37542,37544,37545,37547,37546,37549,37548,37550,37551,37552,37553,37555,37554,37557,37556,37558,37559,37561,37560,37562,37563,37564,37565,37567,37566,37569,37568,37570,37571,37572,37573,37575,37574,37576,37577,37579,37578,37581,37580,37582,37583,37584,37585,37587,37586,37589,37588,37590,37591,37593,37592,37594,37595,37596,37597,37599,37598,37600,37601,37603,37602,37605,37604,37606,37607,37609,37608,37610,37611,37612,37613,37615,37614,37617,37616,37618,37619,37620,37621,37623,37622,37624,37625,37627,37626,37629,37628,37630,37631,37632,37633,37635,37634,37637,37636,37638,37639,37641,37640,37642,37643,37644,37645,37647,37646,37649,37648,37650,37651,37652,37653,37655,37654,37656,37657,37659,37658,37661,37660,37662,37663,37665,37664,37666,37667,37668,37669,37671,37670,37672,37673,37675,37674,37677,37676,37678,37679,37680,37681,37683,37682,37685,37684,37686,37687,37689,37688,37690,37691,37692,37693,37695,37694,37697,37696,37698,37699,37700,37701,37703,37702,37704,37705,37707,37706,37709,37708,37710,37711,37712,37713,37715,37714,37717,37716,37718,37719,37721,37720,37722,37723,37724,37725,37727,37726,37728,37729,37731,37730,37733,37732,37734,37735,37737,37736,37738,37739,37740,37741,37743,37742,37745,37744,37746,37747,37748,37749,37751,37750,37752,37753,37755,37754,37757,37756,37758,37759,37761,37760,37762,37763,37764,37765,37767,37766,37768,37769,37771,37770,37773,37772,37774,37775,37776,37777,37779,37778,37781,37780,37782,37783,37785,37784,37786,37787,37788,37789,37791,37790,37792,37793,37795,37794,37797,37796,37798,37799,37801,37800,37802,37803,37804,37805,37807,37806,37809,37808,37810,37811,37812,37813,37815,37814,37816,37817,37819,37818,37821,37820,37822,37823,37824,37825,37827,37826,37829,37828,37830,37831,37833,37832,37834,37835,37836,37837,37839,37838,37841,37840,37842,37843,37844,37845,37847,37846,37848,37849,37851,37850,37853,37852,37854,37855,37857,37856,37858,37859,37860,37861,37863,37862,37864,37865,37867,37866,37869,37868,37870,37871,37872,37873,37875,37874,37877,37876,37878,37879,37881,37880,37882,37883,37884,37885,37887,37886,37889,37888,37890,37891,37892,37893,37895,37894,37896,37897,37899,37898,37901,37900,37902,37903,37904,37905,37907,37906,37909,37908,37910,37911,37913,37912,37914,37915,37916,37917,37919,37918,37920,37921,37923,37922,37925,37924,37926,37927,37929,37928,37930,37931,37932,37933,37935,37934,37937,37936,37938,37939,37940,37941,37943,37942,37944,37945,37947,37946,37949,37948,37950,37951,37952,37953,37955,37954,37957,37956,37958,37959,37961,37960,37962,37963,37964,37965,37967,37966,37969,37968,37970,37971,37972,37973,37975,37974,37976,37977,37979,37978,37981,37980,37982,37983,37985,37984,37986,37987,37988,37989,37991,37990,37992,37993,37995,37994,37997,37996,37998,37999,38000,38001,38003,38002,38005,38004,38006,38007,38009,38008,38010,38011,38012,38013,38015,38014,38016,38017,38019,38018,38021,38020,38022,38023,38025,38024,38026,38027,38028,38029,38031,38030,38033,38032,38034,38035,38036,38037,38039,38038,38040,38041,38043,38042,38045,38044,38046,38047,38049,38048,38050,38051,38052,38053,38055,38054,38056,38057,38059,38058,38061,38060,38062,38063,38064,38065,38067,38066,38069,38068,38070,38071,38073,38072,38074,38075,38076,38077,38079,38078,38081,38080,38082,38083,38084,38085,38087,38086,38088,38089,38091,38090,38093,38092,38094,38095,38096,38097,38099,38098,38101,38100,38102,38103,38105,38104,38106,38107,38108,38109,38111,38110,38112,38113,38115,38114,38117,38116,38118,38119,38121,38120,38122,38123,38124,38125,38127,38126,38129,38128,38130,38131,38132,38133,38135,38134,38136,38137,38139,38138,38141,38140,38142,38143,38144,38145,38147,38146,38149,38148,38150,38151,38153,38152,38154,38155,38156,38157,38159,38158,38161,38160,38162,38163,38164,38165,38167,38166,38168,38169,38171,38170,38173,38172,38174,38175,38177,38176,38178,38179,38180,38181,38183,38182,38184,38185,38187,38186,38189,38188,38190,38191,38192,38193,38195,38194,38197,38196,38198,38199,38201,38200,38202,38203,38204,38205,38207,38206,38209,38208,38210,38211,38212,38213,38215,38214,38216,38217,38219,38218,38221,38220,38222,38223,38224,38225,38227,38226,38229,38228,38230,38231,38233,38232,38234,38235,38236,38237,38239,38238,38240,38241,38243,38242,38245,38244,38246,38247,38249,38248,38250,38251,38252,38253,38255,38254,38257,38256,38258,38259,38260,38261,38263,38262,38264,38265,38267,38266,38269,38268,38270,38271,38273,38272,38274,38275,38276,38277,38279,38278,38280,38281,38283,38282,38285,38284,38286,38287,38288,38289,38291,38290,38293,38292,38294,38295,38297,38296,38298,38299,38300,38301,38303,38302,38304,38305,38307,38306,38309,38308,38310,38311,38313,38312,38314,38315,38316,38317,38319,38318,38321,38320,38322,38323,38324,38325,38327,38326,38328,38329,38331,38330,38333,38332,38334,38335,38336,38337,38339,38338,38341,38340,38342,38343,38345,38344,38346,38347,38348,38349,38351,38350,38353,38352,38354,38355,38356,38357,38359,38358,38360,38361,38363,38362,38365,38364,38366,38367,38369,38368,38370,38371,38372,38373,38375,38374,38376,38377,38379,38378,38381,38380,38382,38383,38384,38385,38387,38386,38389,38388,38390,38391,38393,38392,38394,38395,38396,38397,38399,38398,38400,38401,38403,38402,38405,38404,38406,38407,38409,38408,38410,38411,38412,38413,38415,38414,38417,38416,38418,38419,38420,38421,38423,38422,38424,38425,38427,38426,38429,38428,38430,38431,38433,38432,38434,38435,38436,38437,38439,38438,38440,38441,38443,38442,38445,38444,38446,38447,38448,38449,38451,38450,38453,38452,38454,38455,38457,38456,38458,38459,38460,38461,38463,38462,38465,38464,38466,38467,38468,38469,38471,38470,38472,38473,38475,38474,38477,38476,38478,38479,38480,38481,38483,38482,38485,38484,38486,38487,38489,38488,38490,38491,38492,38493,38495,38494,38496,38497,38499,38498,38501,38500,38502,38503,38505,38504,38506,38507,38508,38509,38511,38510,38513,38512,38514,38515,38516,38517,38519,38518,38520,38521,38523,38522,38525,38524,38526,38527,38529,38528,38530,38531,38532,38533,38535,38534,38536,38537,38539,38538,38541,38540,38542,38543,38544,38545,38547,38546,38549,38548,38550,38551,38553,38552,38554,38555,38556,38557,38559,38558,38560,38561,38563,38562,38565,38564,38566,38567,38569,38568,38570,38571,38572,38573,38575,38574,38577,38576,38578,38579,38580,38581,38583,38582,38584,38585,38587,38586,38589,38588,38590,38591,38592,38593,38595,38594,38597,38596,38598,38599,38601,38600,38602,38603,38604,38605,38607,38606,38609,38608,38610,38611,38612,38613,38615,38614,38616,38617,38619,38618,38621,38620,38622,38623,38625,38624,38626,38627,38628,38629,38631,38630,38632,38633,38635,38634,38637,38636,38638,38639,38640,38641,38643,38642,38645,38644,38646,38647,38649,38648,38650,38651,38652,38653,38655,38654,38657,38656,38658,38659,38660,38661,38663,38662,38664,38665,38667,38666,38669,38668,38670,38671,38672,38673,38675,38674,38677,38676,38678,38679,38681,38680,38682,38683,38684,38685,38687,38686,38688,38689,38691,38690,38693,38692,38694,38695,38697,38696,38698,38699,38700,38701,38703,38702,38705,38704,38706,38707,38708,38709,38711,38710,38712,38713,38715,38714,38717,38716,38718,38719,38720,38721,38723,38722,38725,38724,38726,38727,38729,38728,38730,38731,38732,38733,38735,38734,38737,38736,38738,38739,38740,38741,38743,38742,38744,38745,38747,38746,38749,38748,38750,38751,38753,38752,38754,38755,38756,38757,38759,38758,38760,38761,38763,38762,38765,38764,38766,38767,38768,38769,38771,38770,38773,38772,38774,38775,38777,38776,38778,38779,38780,38781,38783,38782,38784,38785,38787,38786,38789,38788,38790,38791,38793,38792,38794,38795,38796,38797,38799,38798,38801,38800,38802,38803,38804,38805,38807,38806,38808,38809,38811,38810,38813,38812,38814,38815,38817,38816,38818,38819,38820,38821,38823,38822,38824,38825,38827,38826,38829,38828,38830,38831,38832,38833,38835,38834,38837,38836,38838,38839,38841,38840,38842,38843,38844,38845,38847,38846,38849,38848,38850,38851,38852,38853,38855,38854,38856,38857,38859,38858,38861,38860,38862,38863,38864,38865,38867,38866,38869,38868,38870,38871,38873,38872,38874,38875,38876,38877,38879,38878,38880,38881,38883,38882,38885,38884,38886,38887,38889,38888,38890,38891,38892,38893,38895,38894,38897,38896,38898,38899,38900,38901,38903,38902,38904,38905,38907,38906,38909,38908,38910,38911,38913,38912,38914,38915,38916,38917,38919,38918,38920,38921,38923,38922,38925,38924,38926,38927,38928,38929,38931,38930,38933,38932,38934,38935,38937,38936,38938,38939,38940,38941,38943,38942,38944,38945,38947,38946,38949,38948,38950,38951,38953,38952,38954,38955,38956,38957,38959,38958,38961,38960,38962,38963,38964,38965,38967,38966,38968,38969,38971,38970,38973,38972,38974,38975,38976,38977,38979,38978,38981,38980,38982,38983,38985,38984,38986,38987,38988,38989,38991,38990,38993,38992,38994,38995,38996,38997,38999,38998,39000,39001,39003,39002,39005,39004,39006,39007,39009,39008,39010,39011,39012,39013,39015,39014,39016,39017,39019,39018,39021,39020,39022,39023,39024,39025,39027,39026,39029,39028,39030,39031,39033,39032,39034,39035,39036,39037,39039,39038,39040,39041,39043,39042,39045,39044,39046,39047,39049,39048,39050,39051,39052,39053,39055,39054,39057,39056,39058,39059,39060,39061,39063,39062,39064,39065,39067,39066,39069,39068,39070,39071,39073,39072,39074,39075,39076,39077,39079,39078,39080,39081,39083,39082,39085,39084,39086,39087,39088,39089,39091,39090,39093,39092,39094,39095,39097,39096,39098,39099,39100,39101,39103,39102,39105,39104,39106,39107,39108,39109,39111,39110,39112,39113,39115,39114,39117,39116,39118,39119,39120,39121,39123,39122,39125,39124,39126,39127,39129,39128,39130,39131,39132,39133,39135,39134,39136,39137,39139,39138,39141,39140,39142,39143,39145,39144,39146,39147,39148,39149,39151,39150,39153,39152,39154,39155,39156,39157,39159,39158,39160,39161,39163,39162,39165,39164,39166,39167,39168,39169,39171,39170,39173,39172,39174,39175,39177,39176,39178,39179,39180,39181,39183,39182,39185,39184,39186,39187,39188,39189,39191,39190,39192,39193,39195,39194,39197,39196,39198,39199,39201,39200,39202,39203,39204,39205,39207,39206,39208,39209,39211,39210,39213,39212,39214,39215,39216,39217,39219,39218,39221,39220,39222,39223,39225,39224,39226,39227,39228,39229,39231,39230,39233,39232,39234,39235,39236,39237,39239,39238,39240,39241,39243,39242,39245,39244,39246,39247,39248,39249,39251,39250,39253,39252,39254,39255,39257,39256,39258,39259,39260,39261,39263,39262,39264,39265,39267,39266,39269,39268,39270,39271,39273,39272,39274,39275,39276,39277,39279,39278,39281,39280,39282,39283,39284,39285,39287,39286,39288,39289,39291,39290,39293,39292,39294,39295,39297,39296,39298,39299,39300,39301,39303,39302,39304,39305,39307,39306,39309,39308,39310,39311,39312,39313,39315,39314,39317,39316,39318,39319,39321,39320,39322,39323,39324,39325,39327,39326,39328,39329,39331,39330,39333,39332,39334,39335,39337,39336,39338,39339,39340,39341,39343,39342,39345,39344,39346,39347,39348,39349,39351,39350,39352,39353,39355,39354,39357,39356,39358,39359,39360,39361,39363,39362,39365,39364,39366,39367,39369,39368,39370,39371,39372,39373,39375,39374,39377,39376,39378,39379,39380,39381,39383,39382,39384,39385,39387,39386,39389,39388,39390,39391,39393,39392,39394,39395,39396,39397,39399,39398,39400,39401,39403,39402,39405,39404,39406,39407,39408,39409,39411,39410,39413,39412,39414,39415,39417,39416,39418,39419,39420,39421,39423,39422,39424,39425,39427,39426,39429,39428,39430,39431,39433,39432,39434,39435,39436,39437,39439,39438,39441,39440,39442,39443,39444,39445,39447,39446,39448,39449,39451,39450,39453,39452,39454,39455,39457,39456,39458,39459,39460,39461,39463,39462,39464,39465,39467,39466,39469,39468,39470,39471,39472,39473,39475,39474,39477,39476,39478,39479,39481,39480,39482,39483,39484,39485,39487,39486,39489,39488,39490,39491,39492,39493,39495,39494,39496,39497,39499,39498,39501,39500,39502,39503,39504,39505,39507,39506,39509,39508,39510,39511,39513,39512,39514,39515,39516,39517,39519,39518,39520,39521,39523,39522,39525,39524,39526,39527,39529,39528,39530,39531,39532,39533,39535,39534,39537,39536,39538,39539,39540,39541,39543,39542,39544,39545,39547,39546,39549,39548,39550,39551,39553,39552,39554,39555,39556,39557,39559,39558,39560,39561,39563,39562,39565,39564,39566,39567,39568,39569,39571,39570,39573,39572,39574,39575,39577,39576,39578,39579,39580,39581,39583,39582,39584,39585,39587,39586,39589,39588,39590,39591,39593,39592,39594,39595,39596,39597,39599,39598,39601,39600,39602,39603,39604,39605,39607,39606,39608,39609,39611,39610,39613,39612,39614,39615,39616,39617,39619,39618,39621,39620,39622,39623,39625,39624,39626,39627,39628,39629,39631,39630,39633,39632,39634,39635,39636,39637,39639,39638,39640,39641,39643,39642,39645,39644,39646,39647,39649,39648,39650,39651,39652,39653,39655,39654,39656,39657,39659,39658,39661,39660,39662,39663,39664,39665,39667,39666,39669,39668,39670,39671,39673,39672,39674,39675,39676,39677,39679,39678,39681,39680,39682,39683,39684,39685,39687,39686,39688,39689,39691,39690,39693,39692,39694,39695,39696,39697,39699,39698,39701,39700,39702,39703,39705,39704,39706,39707,39708,39709,39711,39710,39712,39713,39715,39714,39717,39716,39718,39719,39721,39720,39722,39723,39724,39725,39727,39726,39729,39728,39730,39731,39732,39733,39735,39734,39736,39737,39739,39738,39741,39740,39742,39743,39744,39745,39747,39746,39749,39748,39750,39751,39753,39752,39754,39755,39756,39757,39759,39758,39761,39760,39762,39763,39764,39765,39767,39766,39768,39769,39771,39770,39773,39772,39774,39775,39777,39776,39778,39779,39780,39781,39783,39782,39784,39785,39787,39786,39789,39788,39790,39791,39792,39793,39795,39794,39797,39796,39798,39799,39801,39800,39802,39803,39804,39805,39807,39806,39808,39809,39811,39810,39813,39812,39814,39815,39817,39816,39818,39819,39820,39821,39823,39822,39825,39824,39826,39827,39828,39829,39831,39830,39832,39833,39835,39834,39837,39836,39838,39839,39841,39840,39842,39843,39844,39845,39847,39846,39848,39849,39851,39850,39853,39852,39854,39855,39856,39857,39859,39858,39861,39860,39862,39863,39865,39864,39866,39867,39868,39869,39871,39870,39873,39872,39874,39875,39876,39877,39879,39878,39880,39881,39883,39882,39885,39884,39886,39887,39888,39889,39891,39890,39893,39892,39894,39895,39897,39896,39898,39899,39900,39901,39903,39902,39904,39905,39907,39906,39909,39908,39910,39911,39913,39912,39914,39915,39916,39917,39919,39918,39921,39920,39922,39923,39924,39925,39927,39926,39928,39929,39931,39930,39933,39932,39934,39935,39936,39937,39939,39938,39941,39940,39942,39943,39945,39944,39946,39947,39948,39949,39951,39950,39953,39952,39954,39955,39956,39957,39959,39958,39960,39961,39963,39962,39965,39964,39966,39967,39969,39968,39970,39971,39972,39973,39975,39974,39976,39977,39979,39978,39981,39980,39982,39983,39984,39985,39987,39986,39989,39988,39990,39991,39993,39992,39994,39995,39996,39997,39999,39998,40001,40000,40002,40003,40004,40005,40007,40006,40008,40009,40011,40010,40013,40012,40014,40015,40016,40017,40019,40018,40021,40020,40022,40023,40025,40024,40026,40027,40028,40029,40031,40030,40032,40033,40035,40034,40037,40036,40038,40039,40041,40040,40042,40043,40044,40045,40047,40046,40049,40048,40050,40051,40052,40053,40055,40054,40056,40057,40059,40058,40061,40060,40062,40063,40065,40064,40066,40067,40068,40069,40071,40070,40072,40073,40075,40074,40077,40076,40078,40079,40080,40081,40083,40082,40085,40084,40086,40087,40089,40088,40090,40091,40092,40093,40095,40094,40096,40097,40099,40098,40101,40100,40102,40103,40105,40104,40106,40107,40108,40109,40111,40110,40113,40112,40114,40115,40116,40117,40119,40118,40120,40121,40123,40122,40125,40124,40126,40127,40128,40129,40131,40130,40133,40132,40134,40135,40137,40136,40138,40139,40140,40141,40143,40142,40145,40144,40146,40147,40148,40149,40151,40150,40152,40153,40155,40154,40157,40156,40158,40159,40161,40160,40162,40163,40164,40165,40167,40166,40168,40169,40171,40170,40173,40172,40174,40175,40176,40177,40179,40178,40181,40180,40182,40183,40185,40184,40186,40187,40188,40189,40191,40190,40193,40192,40194,40195,40196,40197,40199,40198,40200,40201,40203,40202,40205,40204,40206,40207,40208,40209,40211,40210,40213,40212,40214,40215,40217,40216,40218,40219,40220,40221,40223,40222,40224,40225,40227,40226,40229,40228,40230,40231,40233,40232,40234,40235,40236,40237,40239,40238,40241,40240,40242,40243,40244,40245,40247,40246,40248,40249,40251,40250,40253,40252,40254,40255,40256,40257,40259,40258,40261,40260,40262,40263,40265,40264,40266,40267,40268,40269,40271,40270,40273,40272,40274,40275,40276,40277,40279,40278,40280,40281,40283,40282,40285,40284,40286,40287,40289,40288,40290,40291,40292,40293,40295,40294,40296,40297,40299,40298,40301,40300,40302,40303,40304,40305,40307,40306,40309,40308,40310,40311,40313,40312,40314,40315,40316,40317,40319,40318,40320,40321,40323,40322,40325,40324,40326,40327,40329,40328,40330,40331,40332,40333,40335,40334,40337,40336,40338,40339,40340,40341,40343,40342,40344,40345,40347,40346,40349,40348,40350,40351,40353,40352,40354,40355,40356,40357,40359,40358,40360,40361,40363,40362,40365,40364,40366,40367,40368,40369,40371,40370,40373,40372,40374,40375,40377,40376,40378,40379,40380,40381,40383,40382,40385,40384,40386,40387,40388,40389,40391,40390,40392,40393,40395,40394,40397,40396,40398,40399,40400,40401,40403,40402,40405,40404,40406,40407,40409,40408,40410,40411,40412,40413,40415,40414,40416,40417,40419,40418,40421,40420,40422,40423,40425,40424,40426,40427,40428,40429,40431,40430,40433,40432,40434,40435,40436,40437,40439,40438,40440,40441,40443,40442,40445,40444,40446,40447,40449,40448,40450,40451,40452,40453,40455,40454,40456,40457,40459,40458,40461,40460,40462,40463,40464,40465,40467,40466,40469,40468,40470,40471,40473,40472,40474,40475,40476,40477,40479,40478,40480,40481,40483,40482,40485,40484,40486,40487,40489,40488,40490,40491,40492,40493,40495,40494,40497,40496,40498,40499,40500,40501,40503,40502,40504,40505,40507,40506,40509,40508,40510,40511,40512,40513,40515,40514,40517,40516,40518,40519,40521,40520,40522,40523,40524,40525,40527,40526,40529,40528,40530,40531,40532,40533,40535,40534,40536,40537,40539,40538,40541,40540,40542,40543,40545,40544,40546,40547,40548,40549,40551,40550,40552,40553,40555,40554,40557,40556,40558,40559,40560,40561,40563,40562,40565,40564,40566,40567,40569,40568,40570,40571,40572,40573,40575,40574,40576,40577,40579,40578,40581,40580,40582,40583,40585,40584,40586,40587,40588,40589,40591,40590,40593,40592,40594,40595,40596,40597,40599,40598,40600,40601,40603,40602,40605,40604,40606,40607,40609,40608,40610,40611,40612,40613,40615,40614,40616,40617,40619,40618,40621,40620,40622,40623,40624,40625,40627,40626,40629,40628,40630,40631,40633,40632,40634,40635,40636,40637,40639,40638,40641,40640,40642,40643,40644,40645,40647,40646,40648,40649,40651,40650,40653,40652,40654,40655,40656,40657,40659,40658,40661,40660,40662,40663,40665,40664,40666,40667,40668,40669,40671,40670,40672,40673,40675,40674,40677,40676,40678,40679,40681,40680,40682,40683,40684,40685,40687,40686,40689,40688,40690,40691,40692,40693,40695,40694,40696,40697,40699,40698,40701,40700,40702,40703,40704,40705,40707,40706,40709,40708,40710,40711,40713,40712,40714,40715,40716,40717,40719,40718,40721,40720,40722,40723,40724,40725,40727,40726,40728,40729,40731,40730,40733,40732,40734,40735,40737,40736,40738,40739,40740,40741,40743,40742,40744,40745,40747,40746,40749,40748,40750,40751,40752,40753,40755,40754,40757,40756,40758,40759,40761,40760,40762,40763,40764,40765,40767,40766,40769,40768,40770,40771,40772,40773,40775,40774,40776,40777,40779,40778,40781,40780,40782,40783,40784,40785,40787,40786,40789,40788,40790,40791,40793,40792,40794,40795,40796,40797,40799,40798,40800,40801,40803,40802,40805,40804,40806,40807,40809,40808,40810,40811,40812,40813,40815,40814,40817,40816,40818,40819,40820,40821,40823,40822,40824,40825,40827,40826,40829,40828,40830,40831,40833,40832,40834,40835,40836,40837,40839,40838,40840,40841,40843,40842,40845,40844,40846,40847,40848,40849,40851,40850,40853,40852,40854,40855,40857,40856,40858,40859,40860,40861,40863,40862,40864,40865,40867,40866,40869,40868,40870,40871,40873,40872,40874,40875,40876,40877,40879,40878,40881,40880,40882,40883,40884,40885,40887,40886,40888,40889,40891,40890,40893,40892,40894,40895,40896,40897,40899,40898,40901,40900,40902,40903,40905,40904,40906,40907,40908,40909,40911,40910,40913,40912,40914,40915,40916,40917,40919,40918,40920,40921,40923,40922,40925,40924,40926,40927,40929,40928,40930,40931,40932,40933,40935,40934,40936,40937,40939,40938,40941,40940,40942,40943,40944,40945,40947,40946,40949,40948,40950,40951,40953,40952,40954,40955,40956,40957,40959,40958,40960,40961,40963,40962,40965,40964,40966,40967,40969,40968,40970,40971,40972,40973,40975,40974,40977,40976,40978,40979,40980,40981,40983,40982,40984,40985,40987,40986,40989,40988,40990,40991,40993,40992,40994,40995,40996,40997,40999,40998,41000,41001,41003,41002,41005,41004,41006,41007,41008,41009,41011,41010,41013,41012,41014,41015,41017,41016,41018,41019,41020,41021,41023,41022,41025,41024,41026,41027,41028,41029,41031,41030,41032,41033,41035,41034,41037,41036,41038,41039,41040,41041,41043,41042,41045,41044,41046,41047,41049,41048,41050,41051,41052,41053,41055,41054,41056,41057,41059,41058,41061,41060,41062,41063,41065,41064,41066,41067,41068,41069,41071,41070,41073,41072,41074,41075,41076,41077,41079,41078,41080,41081,41083,41082,41085,41084,41086,41087,41089,41088,41090,41091,41092,41093,41095,41094,41096,41097,41099,41098,41101,41100,41102,41103,41104,41105,41107,41106,41109,41108,41110,41111,41113,41112,41114,41115,41116,41117,41119,41118,41120,41121,41123,41122,41125,41124,41126,41127,41129,41128,41130,41131,41132,41133,41135,41134,41137,41136,41138,41139,41140,41141,41143,41142,41144,41145,41147,41146,41149,41148,41150,41151,41152,41153,41155,41154,41157,41156,41158,41159,41161,41160,41162,41163,41164,41165,41167,41166,41169,41168,41170,41171,41172,41173,41175,41174,41176,41177,41179,41178,41181,41180,41182,41183,41185,41184,41186,41187,41188,41189,41191,41190,41192,41193,41195,41194,41197,41196,41198,41199,41200,41201,41203,41202,41205,41204,41206,41207,41209,41208,41210,41211,41212,41213,41215,41214,41217,41216,41218,41219,41220,41221,41223,41222,41224,41225,41227,41226,41229,41228,41230,41231,41232,41233,41235,41234,41237,41236,41238,41239,41241,41240,41242,41243,41244,41245,41247,41246,41248,41249,41251,41250,41253,41252,41254,41255,41257,41256,41258,41259,41260,41261,41263,41262,41265,41264,41266,41267,41268,41269,41271,41270,41272,41273,41275,41274,41277,41276,41278,41279,41280,41281,41283,41282,41285,41284,41286,41287,41289,41288,41290,41291,41292,41293,41295,41294,41297,41296,41298,41299,41300,41301,41303,41302,41304,41305,41307,41306,41309,41308,41310,41311,41313,41312,41314,41315,41316,41317,41319,41318,41320,41321,41323,41322,41325,41324,41326,41327,41328,41329,41331,41330,41333,41332,41334,41335,41337,41336,41338,41339,41340,41341,41343,41342,41344,41345,41347,41346,41349,41348,41350,41351,41353,41352,41354,41355,41356,41357,41359,41358,41361,41360,41362,41363,41364,41365,41367,41366,41368,41369,41371,41370,41373,41372,41374,41375,41377,41376,41378,41379,41380,41381,41383,41382,41384,41385,41387,41386,41389,41388,41390,41391,41392,41393,41395,41394,41397,41396,41398,41399,41401,41400,41402,41403,41404,41405,41407,41406,41409,41408,41410,41411,41412,41413,41415,41414,41416,41417,41419,41418,41421,41420,41422,41423,41424,41425,41427,41426,41429,41428,41430,41431,41433,41432,41434,41435,41436,41437,41439,41438,41440,41441,41443,41442,41445,41444,41446,41447,41449,41448,41450,41451,41452,41453,41455,41454,41457,41456,41458,41459,41460,41461,41463,41462,41464,41465,41467,41466,41469,41468,41470,41471,41473,41472,41474,41475,41476,41477,41479,41478,41480,41481,41483,41482,41485,41484,41486,41487,41488,41489,41491,41490,41493,41492,41494,41495,41497,41496,41498,41499,41500,41501,41503,41502,41504,41505,41507,41506,41509,41508,41510,41511,41513,41512,41514,41515,41516,41517,41519,41518,41521,41520,41522,41523,41524,41525,41527,41526,41528,41529,41531,41530,41533,41532,41534,41535,41536,41537,41539,41538,41541,41540,41542,41543,41545,41544,41546,41547,41548,41549,41551,41550,41553,41552,41554,41555,41556,41557,41559,41558,41560,41561,41563,41562,41565,41564,41566,41567,41569,41568,41570,41571,41572,41573,41575,41574,41576,41577,41579,41578,41581,41580,41582,41583,41584,41585,41587,41586,41589,41588,41590,41591,41593,41592,41594,41595,41596,41597,41599,41598,41600,41601,41603,41602,41605,41604,41606,41607,41609,41608,41610,41611,41612,41613,41615,41614,41617,41616,41618,41619,41620,41621,41623,41622,41624,41625,41627,41626,41629,41628,41630,41631,41633,41632,41634,41635,41636,41637,41639,41638,41640,41641,41643,41642,41645,41644,41646,41647,41648,41649,41651,41650,41653,41652,41654,41655,41657,41656,41658,41659,41660,41661,41663,41662,41665,41664,41666,41667,41668,41669,41671,41670,41672,41673,41675,41674,41677,41676,41678,41679,41680,41681,41683,41682,41685,41684,41686,41687,41689,41688,41690,41691,41692,41693,41695,41694,41696,41697,41699,41698,41701,41700,41702,41703,41705,41704,41706,41707,41708,41709,41711,41710,41713,41712,41714,41715,41716,41717,41719,41718,41720,41721,41723,41722,41725,41724,41726,41727,41728,41729,41731,41730,41733,41732,41734,41735,41737,41736,41738,41739,41740,41741,41743,41742,41745,41744,41746,41747,41748,41749,41751,41750,41752,41753,41755,41754,41757,41756,41758,41759,41761,41760,41762,41763,41764,41765,41767,41766,41768,41769,41771,41770,41773,41772,41774,41775,41776,41777,41779,41778,41781,41780,41782,41783,41785,41784,41786,41787,41788,41789,41791,41790,41793,41792,41794,41795,41796,41797,41799,41798,41800,41801,41803,41802,41805,41804,41806,41807,41808,41809,41811,41810,41813,41812,41814,41815,41817,41816,41818,41819,41820,41821,41823,41822,41824,41825,41827,41826,41829,41828,41830,41831,41833,41832,41834,41835,41836,41837,41839,41838,41841,41840,41842,41843,41844,41845,41847,41846,41848,41849,41851,41850,41853,41852,41854,41855,41857,41856,41858,41859,41860,41861,41863,41862,41864,41865,41867,41866,41869,41868,41870,41871,41872,41873,41875,41874,41877,41876,41878,41879,41881,41880,41882,41883,41884,41885,41887,41886,41888,41889,41891,41890,41893,41892,41894,41895,41897,41896,41898,41899,41900,41901,41903,41902,41905,41904,41906,41907,41908,41909,41911,41910,41912,41913,41915,41914,41917,41916,41918,41919,41920,41921,41923,41922,41925,41924,41926,41927,41929,41928,41930,41931,41932,41933,41935,41934,41937,41936,41938,41939,41940,41941,41943,41942,41944,41945,41947,41946,41949,41948,41950,41951,41953,41952,41954,41955,41956,41957,41959,41958,41960,41961,41963,41962,41965,41964,41966,41967,41968,41969,41971,41970,41973,41972,41974,41975,41977,41976,41978,41979,41980,41981,41983,41982,41985,41984,41986,41987,41988,41989,41991,41990,41992,41993,41995,41994,41997,41996,41998,41999,42000,42001,42003,42002,42005,42004,42006,42007,42009,42008,42010,42011,42012,42013,42015,42014,42016,42017,42019,42018,42021,42020,42022,42023,42025,42024,42026,42027,42028,42029,42031,42030,42033,42032,42034,42035,42036,42037,42039,42038,42040,42041,42043,42042,42045,42044,42046,42047,42048,42049,42051,42050,42053,42052,42054,42055,42057,42056,42058,42059,42060,42061,42063,42062,42065,42064,42066,42067,42068,42069,42071,42070,42072,42073,42075,42074,42077,42076,42078,42079,42081,42080,42082,42083,42084,42085,42087,42086,42088,42089,42091,42090,42093,42092,42094,42095,42096,42097,42099,42098,42101,42100,42102,42103,42105,42104,42106,42107,42108,42109,42111,42110,42112,42113,42115,42114,42117,42116,42118,42119,42121,42120,42122,42123,42124,42125,42127,42126,42129,42128,42130,42131,42132,42133,42135,42134,42136,42137,42139,42138,42141,42140,42142,42143,42145,42144,42146,42147,42148,42149,42151,42150,42152,42153,42155,42154,42157,42156,42158,42159,42160,42161,42163,42162,42165,42164,42166,42167,42169,42168,42170,42171,42172,42173,42175,42174,42177,42176,42178,42179,42180,42181,42183,42182,42184,42185,42187,42186,42189,42188,42190,42191,42192,42193,42195,42194,42197,42196,42198,42199,42201,42200,42202,42203,42204,42205,42207,42206,42208,42209,42211,42210,42213,42212,42214,42215,42217,42216,42218,42219,42220,42221,42223,42222,42225,42224,42226,42227,42228,42229,42231,42230,42232,42233,42235,42234,42237,42236,42238,42239,42240,42241,42243,42242,42245,42244,42246,42247,42249,42248,42250,42251,42252,42253,42255,42254,42257,42256,42258,42259,42260,42261,42263,42262,42264,42265,42267,42266,42269,42268,42270,42271,42273,42272,42274,42275,42276,42277,42279,42278,42280,42281,42283,42282,42285,42284,42286,42287,42288,42289,42291,42290,42293,42292,42294,42295,42297,42296,42298,42299,42300,42301,42303,42302,42305,42304,42306,42307,42308,42309,42311,42310,42312,42313,42315,42314,42317,42316,42318,42319,42320,42321,42323,42322,42325,42324,42326,42327,42329,42328,42330,42331,42332,42333,42335,42334,42336,42337,42339,42338,42341,42340,42342,42343,42345,42344,42346,42347,42348,42349,42351,42350,42353,42352,42354,42355,42356,42357,42359,42358,42360,42361,42363,42362,42365,42364,42366,42367,42369,42368,42370,42371,42372,42373,42375,42374,42376,42377,42379,42378,42381,42380,42382,42383,42384,42385,42387,42386,42389,42388,42390,42391,42393,42392,42394,42395,42396,42397,42399,42398,42400,42401,42403,42402,42405,42404,42406,42407,42409,42408,42410,42411,42412,42413,42415,42414,42417,42416,42418,42419,42420,42421,42423,42422,42424,42425,42427,42426,42429,42428,42430,42431,42432,42433,42435,42434,42437,42436,42438,42439,42441,42440,42442,42443,42444,42445,42447,42446,42449,42448,42450,42451,42452,42453,42455,42454,42456,42457,42459,42458,42461,42460,42462,42463,42465,42464,42466,42467,42468,42469,42471,42470,42472,42473,42475,42474,42477,42476,42478,42479,42480,42481,42483,42482,42485,42484,42486,42487,42489,42488,42490,42491,42492,42493,42495,42494,42496,42497,42499,42498,42501,42500,42502,42503,42505,42504,42506,42507,42508,42509,42511,42510,42513,42512,42514,42515,42516,42517,42519,42518,42520,42521,42523,42522,42525,42524,42526,42527,42529,42528,42530,42531,42532,42533,42535,42534,42536,42537,42539,42538,42541,42540,42542,42543,42544,42545,42547,42546,42549,42548,42550,42551,42553,42552,42554,42555,42556,42557,42559,42558,42561,42560,42562,42563,42564,42565,42567,42566,42568,42569,42571,42570,42573,42572,42574,42575,42576,42577,42579,42578,42581,42580,42582,42583,42585,42584,42586,42587,42588,42589,42591,42590,42592,42593,42595,42594,42597,42596,42598,42599,42601,42600,42602,42603,42604,42605,42607,42606,42609,42608,42610,42611,42612,42613,42615,42614,42616,42617,42619,42618,42621,42620,42622,42623,42625,42624,42626,42627,42628,42629,42631,42630,42632,42633,42635,42634,42637,42636,42638,42639,42640,42641,42643,42642,42645,42644,42646,42647,42649,42648,42650,42651,42652,42653,42655,42654,42656,42657,42659,42658,42661,42660,42662,42663,42665,42664,42666,42667,42668,42669,42671,42670,42673,42672,42674,42675,42676,42677,42679,42678,42680,42681,42683,42682,42685,42684,42686,42687,42688,42689,42691,42690,42693,42692,42694,42695,42697,42696,42698,42699,42700,42701,42703,42702,42705,42704,42706,42707,42708,42709,42711,42710,42712,42713,42715,42714,42717,42716,42718,42719,42721,42720,42722,42723,42724,42725,42727,42726,42728,42729,42731,42730,42733,42732,42734,42735,42736,42737,42739,42738,42741,42740,42742,42743,42745,42744,42746,42747,42748,42749,42751,42750,42753,42752,42754,42755,42756,42757,42759,42758,42760,42761,42763,42762,42765,42764,42766,42767,42768,42769,42771,42770,42773,42772,42774,42775,42777,42776,42778,42779,42780,42781,42783,42782,42784,42785,42787,42786,42789,42788,42790,42791,42793,42792,42794,42795,42796,42797,42799,42798,42801,42800,42802,42803,42804,42805,42807,42806,42808,42809,42811,42810,42813,42812,42814,42815,42816,42817,42819,42818,42821,42820,42822,42823,42825,42824,42826,42827,42828,42829,42831,42830,42833,42832,42834,42835,42836,42837,42839,42838,42840,42841,42843,42842,42845,42844,42846,42847,42849,42848,42850,42851,42852,42853,42855,42854,42856,42857,42859,42858,42861,42860,42862,42863,42864,42865,42867,42866,42869,42868,42870,42871,42873,42872,42874,42875,42876,42877,42879,42878,42880,42881,42883,42882,42885,42884,42886,42887,42889,42888,42890,42891,42892,42893,42895,42894,42897,42896,42898,42899,42900,42901,42903,42902,42904,42905,42907,42906,42909,42908,42910,42911,42913,42912,42914,42915,42916,42917,42919,42918,42920,42921,42923,42922,42925,42924,42926,42927,42928,42929,42931,42930,42933,42932,42934,42935,42937,42936,42938,42939,42940,42941,42943,42942,42945,42944,42946,42947,42948,42949,42951,42950,42952,42953,42955,42954,42957,42956,42958,42959,42960,42961,42963,42962,42965,42964,42966,42967,42969,42968,42970,42971,42972,42973,42975,42974,42976,42977,42979,42978,42981,42980,42982,42983,42985,42984,42986,42987,42988,42989,42991,42990,42993,42992,42994,42995,42996,42997,42999,42998,43000,43001,43003,43002,43005,43004,43006,43007,43009,43008,43010,43011,43012,43013,43015,43014,43016,43017,43019,43018,43021,43020,43022,43023,43024,43025,43027,43026,43029,43028,43030,43031,43033,43032,43034,43035,43036,43037,43039,43038,43040,43041,43043,43042,43045,43044,43046,43047,43049,43048,43050,43051,43052,43053,43055,43054,43057,43056,43058,43059,43060,43061,43063,43062,43064,43065,43067,43066,43069,43068,43070,43071,43072,43073,43075,43074,43077,43076,43078,43079,43081,43080,43082,43083,43084,43085,43087,43086,43089,43088,43090,43091,43092,43093,43095,43094,43096,43097,43099,43098,43101,43100,43102,43103,43105,43104,43106,43107,43108,43109,43111,43110,43112,43113,43115,43114,43117,43116,43118,43119,43120,43121,43123,43122,43125,43124,43126,43127,43129,43128,43130,43131,43132,43133,43135,43134,43136,43137,43139,43138,43141,43140,43142,43143,43145,43144,43146,43147,43148,43149,43151,43150,43153,43152,43154,43155,43156,43157,43159,43158,43160,43161,43163,43162,43165,43164,43166,43167,43169,43168,43170,43171,43172,43173,43175,43174,43176,43177,43179,43178,43181,43180,43182,43183,43184,43185,43187,43186,43189,43188,43190,43191,43193,43192,43194,43195,43196,43197,43199,43198,43201,43200,43202,43203,43204,43205,43207,43206,43208,43209,43211,43210,43213,43212,43214,43215,43216,43217,43219,43218,43221,43220,43222,43223,43225,43224,43226,43227,43228,43229,43231,43230,43232,43233,43235,43234,43237,43236,43238,43239,43241,43240,43242,43243,43244,43245,43247,43246,43249,43248,43250,43251,43252,43253,43255,43254,43256,43257,43259,43258,43261,43260,43262,43263,43264,43265,43267,43266,43269,43268,43270,43271,43273,43272,43274,43275,43276,43277,43279,43278,43281,43280,43282,43283,43284,43285,43287,43286,43288,43289,43291,43290,43293,43292,43294,43295,43297,43296,43298,43299,43300,43301,43303,43302,43304,43305,43307,43306,43309,43308,43310,43311,43312,43313,43315,43314,43317,43316,43318,43319,43321,43320,43322,43323,43324,43325,43327,43326,43329,43328,43330,43331,43332,43333,43335,43334,43336,43337,43339,43338,43341,43340,43342,43343,43344,43345,43347,43346,43349,43348,43350,43351,43353,43352,43354,43355,43356,43357,43359,43358,43360,43361,43363,43362,43365,43364,43366,43367,43369,43368,43370,43371,43372,43373,43375,43374,43377,43376,43378,43379,43380,43381,43383,43382,43384,43385,43387,43386,43389,43388,43390,43391,43393,43392,43394,43395,43396,43397,43399,43398,43400,43401,43403,43402,43405,43404,43406,43407,43408,43409,43411,43410,43413,43412,43414,43415,43417,43416,43418,43419,43420,43421,43423,43422,43424,43425,43427,43426,43429,43428,43430,43431,43433,43432,43434,43435,43436,43437,43439,43438,43441,43440,43442,43443,43444,43445,43447,43446,43448,43449,43451,43450,43453,43452,43454,43455,43456,43457,43459,43458,43461,43460,43462,43463,43465,43464,43466,43467,43468,43469,43471,43470,43473,43472,43474,43475,43476,43477,43479,43478,43480,43481,43483,43482,43485,43484,43486,43487,43489,43488,43490,43491,43492,43493,43495,43494,43496,43497,43499,43498,43501,43500,43502,43503,43504,43505,43507,43506,43509,43508,43510,43511,43513,43512,43514,43515,43516,43517,43519,43518,43520,43521,43523,43522,43525,43524,43526,43527,43529,43528,43530,43531,43532,43533,43535,43534,43537,43536,43538,43539,43540,43541,43543,43542,43544,43545,43547,43546,43549,43548,43550,43551,43553,43552,43554,43555,43556,43557,43559,43558,43560,43561,43563,43562,43565,43564,43566,43567,43568,43569,43571,43570,43573,43572,43574,43575,43577,43576,43578,43579,43580,43581,43583,43582,43585,43584,43586,43587,43588,43589,43591,43590,43592,43593,43595,43594,43597,43596,43598,43599,43600,43601,43603,43602,43605,43604,43606,43607,43609,43608,43610,43611,43612,43613,43615,43614,43616,43617,43619,43618,43621,43620,43622,43623,43625,43624,43626,43627,43628,43629,43631,43630,43633,43632,43634,43635,43636,43637,43639,43638,43640,43641,43643,43642,43645,43644,43646,43647,43649,43648,43650,43651,43652,43653,43655,43654,43656,43657,43659,43658,43661,43660,43662,43663,43664,43665,43667,43666,43669,43668,43670,43671,43673,43672,43674,43675,43676,43677,43679,43678,43680,43681,43683,43682,43685,43684,43686,43687,43689,43688,43690,43691,43692,43693,43695,43694,43697,43696,43698,43699,43700,43701,43703,43702,43704,43705,43707,43706,43709,43708,43710,43711,43712,43713,43715,43714,43717,43716,43718,43719,43721,43720,43722,43723,43724,43725,43727,43726,43729,43728,43730,43731,43732,43733,43735,43734,43736,43737,43739,43738,43741,43740,43742,43743,43745,43744,43746,43747,43748,43749,43751,43750,43752,43753,43755,43754,43757,43756,43758,43759,43760,43761,43763,43762,43765,43764,43766,43767,43769,43768,43770,43771,43772,43773,43775,43774,43777,43776,43778,43779,43780,43781,43783,43782,43784,43785,43787,43786,43789,43788,43790,43791,43792,43793,43795,43794,43797,43796,43798,43799,43801,43800,43802,43803,43804,43805,43807,43806,43808,43809,43811,43810,43813,43812,43814,43815,43817,43816,43818,43819,43820,43821,43823,43822,43825,43824,43826,43827,43828,43829,43831,43830,43832,43833,43835,43834,43837,43836,43838,43839,43840,43841,43843,43842,43845,43844,43846,43847,43849,43848,43850,43851,43852,43853,43855,43854,43857,43856,43858,43859,43860,43861,43863,43862,43864,43865,43867,43866,43869,43868,43870,43871,43873,43872,43874,43875,43876,43877,43879,43878,43880,43881,43883,43882,43885,43884,43886,43887,43888,43889,43891,43890,43893,43892,43894,43895,43897,43896,43898,43899,43900,43901,43903,43902,43904,43905,43907,43906,43909,43908,43910,43911,43913,43912,43914,43915,43916,43917,43919,43918,43921,43920,43922,43923,43924,43925,43927,43926,43928,43929,43931,43930,43933,43932,43934,43935,43937,43936,43938,43939,43940,43941,43943,43942,43944,43945,43947,43946,43949,43948,43950,43951,43952,43953,43955,43954,43957,43956,43958,43959,43961,43960,43962,43963,43964,43965,43967,43966,43969,43968,43970,43971,43972,43973,43975,43974,43976,43977,43979,43978,43981,43980,43982,43983,43984,43985,43987,43986,43989,43988,43990,43991,43993,43992,43994,43995,43996,43997,43999,43998,44000,44001,44003,44002,44005,44004,44006,44007,44009,44008,44010,44011,44012,44013,44015,44014,44017,44016,44018,44019,44020,44021,44023,44022,44024,44025,44027,44026,44029,44028,44030,44031,44032,44033,44035,44034,44037,44036,44038,44039,44041,44040,44042,44043,44044,44045,44047,44046,44049,44048,44050,44051,44052,44053,44055,44054,44056,44057,44059,44058,44061,44060,44062,44063,44065,44064,44066,44067,44068,44069,44071,44070,44072,44073,44075,44074,44077,44076,44078,44079,44080,44081,44083,44082,44085,44084,44086,44087,44089,44088,44090,44091,44092,44093,44095,44094,44097,44096,44098,44099,44100,44101,44103,44102,44104,44105,44107,44106,44109,44108,44110,44111,44112,44113,44115,44114,44117,44116,44118,44119,44121,44120,44122,44123,44124,44125,44127,44126,44128,44129,44131,44130,44133,44132,44134,44135,44137,44136,44138,44139,44140,44141,44143,44142,44145,44144,44146,44147,44148,44149,44151,44150,44152,44153,44155,44154,44157,44156,44158,44159,44161,44160,44162,44163,44164,44165,44167,44166,44168,44169,44171,44170,44173,44172,44174,44175,44176,44177,44179,44178,44181,44180,44182,44183,44185,44184,44186,44187,44188,44189,44191,44190,44192,44193,44195,44194,44197,44196,44198,44199,44201,44200,44202,44203,44204,44205,44207,44206,44209,44208,44210,44211,44212,44213,44215,44214,44216,44217,44219,44218,44221,44220,44222,44223,44224,44225,44227,44226,44229,44228,44230,44231,44233,44232,44234,44235,44236,44237,44239,44238,44241,44240,44242,44243,44244,44245,44247,44246,44248,44249,44251,44250,44253,44252,44254,44255,44257,44256,44258,44259,44260,44261,44263,44262,44264,44265,44267,44266,44269,44268,44270,44271,44272,44273,44275,44274,44277,44276,44278,44279,44281,44280,44282,44283,44284,44285,44287,44286,44289,44288,44290,44291,44292,44293,44295,44294,44296,44297,44299,44298,44301,44300,44302,44303,44304,44305,44307,44306,44309,44308,44310,44311,44313,44312,44314,44315,44316,44317,44319,44318,44320,44321,44323,44322,44325,44324,44326,44327,44329,44328,44330,44331,44332,44333,44335,44334,44337,44336,44338,44339,44340,44341,44343,44342,44344,44345,44347,44346,44349,44348,44350,44351,44352,44353,44355,44354,44357,44356,44358,44359,44361,44360,44362,44363,44364,44365,44367,44366,44369,44368,44370,44371,44372,44373,44375,44374,44376,44377,44379,44378,44381,44380,44382,44383,44385,44384,44386,44387,44388,44389,44391,44390,44392,44393,44395,44394,44397,44396,44398,44399,44400,44401,44403,44402,44405,44404,44406,44407,44409,44408,44410,44411,44412,44413,44415,44414,44416,44417,44419,44418,44421,44420,44422,44423,44425,44424,44426,44427,44428,44429,44431,44430,44433,44432,44434,44435,44436,44437,44439,44438,44440,44441,44443,44442,44445,44444,44446,44447,44449,44448,44450,44451,44452,44453,44455,44454,44456,44457,44459,44458,44461,44460,44462,44463,44464,44465,44467,44466,44469,44468,44470,44471,44473,44472,44474,44475,44476,44477,44479,44478,44481,44480,44482,44483,44484,44485,44487,44486,44488,44489,44491,44490,44493,44492,44494,44495,44496,44497,44499,44498,44501,44500,44502,44503,44505,44504,44506,44507,44508,44509,44511,44510,44512,44513,44515,44514,44517,44516,44518,44519,44521,44520,44522,44523,44524,44525,44527,44526,44529,44528,44530,44531,44532,44533,44535,44534,44536,44537,44539,44538,44541,44540,44542,44543,44545,44544,44546,44547,44548,44549,44551,44550,44552,44553,44555,44554,44557,44556,44558,44559,44560,44561,44563,44562,44565,44564,44566,44567,44569,44568,44570,44571,44572,44573,44575,44574,44576,44577,44579,44578,44581,44580,44582,44583,44585,44584,44586,44587,44588,44589,44591,44590,44593,44592,44594,44595,44596,44597,44599,44598,44600,44601,44603,44602,44605,44604,44606,44607,44608,44609,44611,44610,44613,44612,44614,44615,44617,44616,44618,44619,44620,44621,44623,44622,44625,44624,44626,44627,44628,44629,44631,44630,44632,44633,44635,44634,44637,44636,44638,44639,44641,44640,44642,44643,44644,44645,44647,44646,44648,44649,44651,44650,44653,44652,44654,44655,44656,44657,44659,44658,44661,44660,44662,44663,44665,44664,44666,44667,44668,44669,44671,44670,44672,44673,44675,44674,44677,44676,44678,44679,44681,44680,44682,44683,44684,44685,44687,44686,44689,44688,44690,44691,44692,44693,44695,44694,44696,44697,44699,44698,44701,44700,44702,44703,44705,44704,44706,44707,44708,44709,44711,44710,44712,44713,44715,44714,44717,44716,44718,44719,44720,44721,44723,44722,44725,44724,44726,44727,44729,44728,44730,44731,44732,44733,44735,44734,44737,44736,44738,44739,44740,44741,44743,44742,44744,44745,44747,44746,44749,44748,44750,44751,44752,44753,44755,44754,44757,44756,44758,44759,44761,44760,44762,44763,44764,44765,44767,44766,44768,44769,44771,44770,44773,44772,44774,44775,44777,44776,44778,44779,44780,44781,44783,44782,44785,44784,44786,44787,44788,44789,44791,44790,44792,44793,44795,44794,44797,44796,44798,44799,44800,44801,44803,44802,44805,44804,44806,44807,44809,44808,44810,44811,44812,44813,44815,44814,44817,44816,44818,44819,44820,44821,44823,44822,44824,44825,44827,44826,44829,44828,44830,44831,44833,44832,44834,44835,44836,44837,44839,44838,44840,44841,44843,44842,44845,44844,44846,44847,44848,44849,44851,44850,44853,44852,44854,44855,44857,44856,44858,44859,44860,44861,44863,44862,44865,44864,44866,44867,44868,44869,44871,44870,44872,44873,44875,44874,44877,44876,44878,44879,44880,44881,44883,44882,44885,44884,44886,44887,44889,44888,44890,44891,44892,44893,44895,44894,44896,44897,44899,44898,44901,44900,44902,44903,44905,44904,44906,44907,44908,44909,44911,44910,44913,44912,44914,44915,44916,44917,44919,44918,44920,44921,44923,44922,44925,44924,44926,44927,44929,44928,44930,44931,44932,44933,44935,44934,44936,44937,44939,44938,44941,44940,44942,44943,44944,44945,44947,44946,44949,44948,44950,44951,44953,44952,44954,44955,44956,44957,44959,44958,44960,44961,44963,44962,44965,44964,44966,44967,44969,44968,44970,44971,44972,44973,44975,44974,44977,44976,44978,44979,44980,44981,44983,44982,44984,44985,44987,44986,44989,44988,44990,44991,44992,44993,44995,44994,44997,44996,44998,44999,45001,45000,45002,45003,45004,45005,45007,45006,45009,45008,45010,45011,45012,45013,45015,45014,45016,45017,45019,45018,45021,45020,45022,45023,45025,45024,45026,45027,45028,45029,45031,45030,45032,45033,45035,45034,45037,45036,45038,45039,45040,45041,45043,45042,45045,45044,45046,45047,45049,45048,45050,45051,45052,45053,45055,45054,45057,45056,45058,45059,45060,45061,45063,45062,45064,45065,45067,45066,45069,45068,45070,45071,45072,45073,45075,45074,45077,45076,45078,45079,45081,45080,45082,45083,45084,45085,45087,45086,45088,45089,45091,45090,45093,45092,45094,45095,45097,45096,45098,45099,45100,45101,45103,45102,45105,45104,45106,45107,45108,45109,45111,45110,45112,45113,45115,45114,45117,45116,45118,45119,45120,45121,45123,45122,45125,45124,45126,45127,45129,45128,45130,45131,45132,45133,45135,45134,45137,45136,45138,45139,45140,45141,45143,45142,45144,45145,45147,45146,45149,45148,45150,45151,45153,45152,45154,45155,45156,45157,45159,45158,45160,45161,45163,45162,45165,45164,45166,45167,45168,45169,45171,45170,45173,45172,45174,45175,45177,45176,45178,45179,45180,45181,45183,45182,45184,45185,45187,45186,45189,45188,45190,45191,45193,45192,45194,45195,45196,45197,45199,45198,45201,45200,45202,45203,45204,45205,45207,45206,45208,45209,45211,45210,45213,45212,45214,45215,45217,45216,45218,45219,45220,45221,45223,45222,45224,45225,45227,45226,45229,45228,45230,45231,45232,45233,45235,45234,45237,45236,45238,45239,45241,45240,45242,45243,45244,45245,45247,45246,45249,45248,45250,45251,45252,45253,45255,45254,45256,45257,45259,45258,45261,45260,45262,45263,45264,45265,45267,45266,45269,45268,45270,45271,45273,45272,45274,45275,45276,45277,45279,45278,45280,45281,45283,45282,45285,45284,45286,45287,45289,45288,45290,45291,45292,45293,45295,45294,45297,45296,45298,45299,45300,45301,45303,45302,45304,45305,45307,45306,45309,45308,45310,45311,45312,45313,45315,45314,45317,45316,45318,45319,45321,45320,45322,45323,45324,45325,45327,45326,45329,45328,45330,45331,45332,45333,45335,45334,45336,45337,45339,45338,45341,45340,45342,45343,45345,45344,45346,45347,45348,45349,45351,45350,45352,45353,45355,45354,45357,45356,45358,45359,45360,45361,45363,45362,45365,45364,45366,45367,45369,45368,45370,45371,45372,45373,45375,45374,45377,45376,45378,45379,45380,45381,45383,45382,45384,45385,45387,45386,45389,45388,45390,45391,45392,45393,45395,45394,45397,45396,45398,45399,45401,45400,45402,45403,45404,45405,45407,45406,45408,45409,45411,45410,45413,45412,45414,45415,45417,45416,45418,45419,45420,45421,45423,45422,45425,45424,45426,45427,45428,45429,45431,45430,45432,45433,45435,45434,45437,45436,45438,45439,45441,45440,45442,45443,45444,45445,45447,45446,45448,45449,45451,45450,45453,45452,45454,45455,45456,45457,45459,45458,45461,45460,45462,45463,45465,45464,45466,45467,45468,45469,45471,45470,45472,45473,45475,45474,45477,45476,45478,45479,45481,45480,45482,45483,45484,45485,45487,45486,45489,45488,45490,45491,45492,45493,45495,45494,45496,45497,45499,45498,45501,45500,45502,45503,45504,45505,45507,45506,45509,45508,45510,45511,45513,45512,45514,45515,45516,45517,45519,45518,45521,45520,45522,45523,45524,45525,45527,45526,45528,45529,45531,45530,45533,45532,45534,45535,45537,45536,45538,45539,45540,45541,45543,45542,45544,45545,45547,45546,45549,45548,45550,45551,45552,45553,45555,45554,45557,45556,45558,45559,45561,45560,45562,45563,45564,45565,45567,45566,45568,45569,45571,45570,45573,45572,45574,45575,45577,45576,45578,45579,45580,45581,45583,45582,45585,45584,45586,45587,45588,45589,45591,45590,45592,45593,45595,45594,45597,45596,45598,45599,45601,45600,45602,45603,45604,45605,45607,45606,45608,45609,45611,45610,45613,45612,45614,45615,45616,45617,45619,45618,45621,45620,45622,45623,45625,45624,45626,45627,45628,45629,45631,45630,45633,45632,45634,45635,45636,45637,45639,45638,45640,45641,45643,45642,45645,45644,45646,45647,45648,45649,45651,45650,45653,45652,45654,45655,45657,45656,45658,45659,45660,45661,45663,45662,45664,45665,45667,45666,45669,45668,45670,45671,45673,45672,45674,45675,45676,45677,45679,45678,45681,45680,45682,45683,45684,45685,45687,45686,45688,45689,45691,45690,45693,45692,45694,45695,45697,45696,45698,45699,45700,45701,45703,45702,45704,45705,45707,45706,45709,45708,45710,45711,45712,45713,45715,45714,45717,45716,45718,45719,45721,45720,45722,45723,45724,45725,45727,45726,45728,45729,45731,45730,45733,45732,45734,45735,45737,45736,45738,45739,45740,45741,45743,45742,45745,45744,45746,45747,45748,45749,45751,45750,45752,45753,45755,45754,45757,45756,45758,45759,45760,45761,45763,45762,45765,45764,45766,45767,45769,45768,45770,45771,45772,45773,45775,45774,45777,45776,45778,45779,45780,45781,45783,45782,45784,45785,45787,45786,45789,45788,45790,45791,45793,45792,45794,45795,45796,45797,45799,45798,45800,45801,45803,45802,45805,45804,45806,45807,45808,45809,45811,45810,45813,45812,45814,45815,45817,45816,45818,45819,45820,45821,45823,45822,45825,45824,45826,45827,45828,45829,45831,45830,45832,45833,45835,45834,45837,45836,45838,45839,45840,45841,45843,45842,45845,45844,45846,45847,45849,45848,45850,45851,45852,45853,45855,45854,45856,45857,45859,45858,45861,45860,45862,45863,45865,45864,45866,45867,45868,45869,45871,45870,45873,45872,45874,45875,45876,45877,45879,45878,45880,45881,45883,45882,45885,45884,45886,45887,45888,45889,45891,45890,45893,45892,45894,45895,45897,45896,45898,45899,45900,45901,45903,45902,45905,45904,45906,45907,45908,45909,45911,45910,45912,45913,45915,45914,45917,45916,45918,45919,45921,45920,45922,45923,45924,45925,45927,45926,45928,45929,45931,45930,45933,45932,45934,45935,45936,45937,45939,45938,45941,45940,45942,45943,45945,45944,45946,45947,45948,45949,45951,45950,45952,45953,45955,45954,45957,45956,45958,45959,45961,45960,45962,45963,45964,45965,45967,45966,45969,45968,45970,45971,45972,45973,45975,45974,45976,45977,45979,45978,45981,45980,45982,45983,45985,45984,45986,45987,45988,45989,45991,45990,45992,45993,45995,45994,45997,45996,45998,45999,46000,46001,46003,46002,46005,46004,46006,46007,46009,46008,46010,46011,46012,46013,46015,46014,46017,46016,46018,46019,46020,46021,46023,46022,46024,46025,46027,46026,46029,46028,46030,46031,46032,46033,46035,46034,46037,46036,46038,46039,46041,46040,46042,46043,46044,46045,46047,46046,46048,46049,46051,46050,46053,46052,46054,46055,46057,46056,46058,46059,46060,46061,46063,46062,46065,46064,46066,46067,46068,46069,46071,46070,46072,46073,46075,46074,46077,46076,46078,46079,46080,46081,46083,46082,46085,46084,46086,46087,46089,46088,46090,46091,46092,46093,46095,46094,46097,46096,46098,46099,46100,46101,46103,46102,46104,46105,46107,46106,46109,46108,46110,46111,46113,46112,46114,46115,46116,46117,46119,46118,46120,46121,46123,46122,46125,46124,46126,46127,46128,46129,46131,46130,46133,46132,46134,46135,46137,46136,46138,46139,46140,46141,46143,46142,46145,46144,46146,46147,46148,46149,46151,46150,46152,46153,46155,46154,46157,46156,46158,46159,46160,46161,46163,46162,46165,46164,46166,46167,46169,46168,46170,46171,46172,46173,46175,46174,46176,46177,46179,46178,46181,46180,46182,46183,46185,46184,46186,46187,46188,46189,46191,46190,46193,46192,46194,46195,46196,46197,46199,46198,46200,46201,46203,46202,46205,46204,46206,46207,46209,46208,46210,46211,46212,46213,46215,46214,46216,46217,46219,46218,46221,46220,46222,46223,46224,46225,46227,46226,46229,46228,46230,46231,46233,46232,46234,46235,46236,46237,46239,46238,46240,46241,46243,46242,46245,46244,46246,46247,46249,46248,46250,46251,46252,46253,46255,46254,46257,46256,46258,46259,46260,46261,46263,46262,46264,46265,46267,46266,46269,46268,46270,46271,46272,46273,46275,46274,46277,46276,46278,46279,46281,46280,46282,46283,46284,46285,46287,46286,46289,46288,46290,46291,46292,46293,46295,46294,46296,46297,46299,46298,46301,46300,46302,46303,46305,46304,46306,46307,46308,46309,46311,46310,46312,46313,46315,46314,46317,46316,46318,46319,46320,46321,46323,46322,46325,46324,46326,46327,46329,46328,46330,46331,46332,46333,46335,46334,46337,46336,46338,46339,46340,46341,46343,46342,46344,46345,46347,46346,46349,46348,46350,46351,46352,46353,46355,46354,46357,46356,46358,46359,46361,46360,46362,46363,46364,46365,46367,46366,46368,46369,46371,46370,46373,46372,46374,46375,46377,46376,46378,46379,46380,46381,46383,46382,46385,46384,46386,46387,46388,46389,46391,46390,46392,46393,46395,46394,46397,46396,46398,46399,46400,46401,46403,46402,46405,46404,46406,46407,46409,46408,46410,46411,46412,46413,46415,46414,46417,46416,46418,46419,46420,46421,46423,46422,46424,46425,46427,46426,46429,46428,46430,46431,46433,46432,46434,46435,46436,46437,46439,46438,46440,46441,46443,46442,46445,46444,46446,46447,46448,46449,46451,46450,46453,46452,46454,46455,46457,46456,46458,46459,46460,46461,46463,46462,46464,46465,46467,46466,46469,46468,46470,46471,46473,46472,46474,46475,46476,46477,46479,46478,46481,46480,46482,46483,46484,46485,46487,46486,46488,46489,46491,46490,46493,46492,46494,46495,46497,46496,46498,46499,46500,46501,46503,46502,46504,46505,46507,46506,46509,46508,46510,46511,46512,46513,46515,46514,46517,46516,46518,46519,46521,46520,46522,46523,46524,46525,46527,46526,46529,46528,46530,46531,46532,46533,46535,46534,46536,46537,46539,46538,46541,46540,46542,46543,46544,46545,46547,46546,46549,46548,46550,46551,46553,46552,46554,46555,46556,46557,46559,46558,46560,46561,46563,46562,46565,46564,46566,46567,46569,46568,46570,46571,46572,46573,46575,46574,46577,46576,46578,46579,46580,46581,46583,46582,46584,46585,46587,46586,46589,46588,46590,46591,46593,46592,46594,46595,46596,46597,46599,46598,46600,46601,46603,46602,46605,46604,46606,46607,46608,46609,46611,46610,46613,46612,46614,46615,46617,46616,46618,46619,46620,46621,46623,46622,46624,46625,46627,46626,46629,46628,46630,46631,46633,46632,46634,46635,46636,46637,46639,46638,46641,46640,46642,46643,46644,46645,46647,46646,46648,46649,46651,46650,46653,46652,46654,46655,46656,46657,46659,46658,46661,46660,46662,46663,46665,46664,46666,46667,46668,46669,46671,46670,46673,46672,46674,46675,46676,46677,46679,46678,46680,46681,46683,46682,46685,46684,46686,46687,46689,46688,46690,46691,46692,46693,46695,46694,46696,46697,46699,46698,46701,46700,46702,46703,46704,46705,46707,46706,46709,46708,46710,46711,46713,46712,46714,46715,46716,46717,46719,46718,46720,46721,46723,46722,46725,46724,46726,46727,46729,46728,46730,46731,46732,46733,46735,46734,46737,46736,46738,46739,46740,46741,46743,46742,46744,46745,46747,46746,46749,46748,46750,46751,46753,46752,46754,46755,46756,46757,46759,46758,46760,46761,46763,46762,46765,46764,46766,46767,46768,46769,46771,46770,46773,46772,46774,46775,46777,46776,46778,46779,46780,46781,46783,46782,46785,46784,46786,46787,46788,46789,46791,46790,46792,46793,46795,46794,46797,46796,46798,46799,46800,46801,46803,46802,46805,46804,46806,46807,46809,46808,46810,46811,46812,46813,46815,46814,46816,46817,46819,46818,46821,46820,46822,46823,46825,46824,46826,46827,46828,46829,46831,46830,46833,46832,46834,46835,46836,46837,46839,46838,46840,46841,46843,46842,46845,46844,46846,46847,46848,46849,46851,46850,46853,46852,46854,46855,46857,46856,46858,46859,46860,46861,46863,46862,46865,46864,46866,46867,46868,46869,46871,46870,46872,46873,46875,46874,46877,46876,46878,46879,46881,46880,46882,46883,46884,46885,46887,46886,46888,46889,46891,46890,46893,46892,46894,46895,46896,46897,46899,46898,46901,46900,46902,46903,46905,46904,46906,46907,46908,46909,46911,46910,46913,46912,46914,46915,46916,46917,46919,46918,46920,46921,46923,46922,46925,46924,46926,46927,46928,46929,46931,46930,46933,46932,46934,46935,46937,46936,46938,46939,46940,46941,46943,46942,46944,46945,46947,46946,46949,46948,46950,46951,46953,46952,46954,46955,46956,46957,46959,46958,46961,46960,46962,46963,46964,46965,46967,46966,46968,46969,46971,46970,46973,46972,46974,46975,46977,46976,46978,46979,46980,46981,46983,46982,46984,46985,46987,46986,46989,46988,46990,46991,46992,46993,46995,46994,46997,46996,46998,46999,47001,47000,47002,47003,47004,47005,47007,47006,47008,47009,47011,47010,47013,47012,47014,47015,47017,47016,47018,47019,47020,47021,47023,47022,47025,47024,47026,47027,47028,47029,47031,47030,47032,47033,47035,47034,47037,47036,47038,47039,47040,47041,47043,47042,47045,47044,47046,47047,47049,47048,47050,47051,47052,47053,47055,47054,47057,47056,47058,47059,47060,47061,47063,47062,47064,47065,47067,47066,47069,47068,47070,47071,47073,47072,47074,47075,47076,47077,47079,47078,47080,47081,47083,47082,47085,47084,47086,47087,47088,47089,47091,47090,47093,47092,47094,47095,47097,47096,47098,47099,47100,47101,47103,47102,47104,47105,47107,47106,47109,47108,47110,47111,47113,47112,47114,47115,47116,47117,47119,47118,47121,47120,47122,47123,47124,47125,47127,47126,47128,47129,47131,47130,47133,47132,47134,47135,47137,47136,47138,47139,47140,47141,47143,47142,47144,47145,47147,47146,47149,47148,47150,47151,47152,47153,47155,47154,47157,47156,47158,47159,47161,47160,47162,47163,47164,47165,47167,47166,47169,47168,47170,47171,47172,47173,47175,47174,47176,47177,47179,47178,47181,47180,47182,47183,47184,47185,47187,47186,47189,47188,47190,47191,47193,47192,47194,47195,47196,47197,47199,47198,47200,47201,47203,47202,47205,47204,47206,47207,47209,47208,47210,47211,47212,47213,47215,47214,47217,47216,47218,47219,47220,47221,47223,47222,47224,47225,47227,47226,47229,47228,47230,47231,47233,47232,47234,47235,47236,47237,47239,47238,47240,47241,47243,47242,47245,47244,47246,47247,47248,47249,47251,47250,47253,47252,47254,47255,47257,47256,47258,47259,47260,47261,47263,47262,47264,47265,47267,47266,47269,47268,47270,47271,47273,47272,47274,47275,47276,47277,47279,47278,47281,47280,47282,47283,47284,47285,47287,47286,47288,47289,47291,47290,47293,47292,47294,47295,47296,47297,47299,47298,47301,47300,47302,47303,47305,47304,47306,47307,47308,47309,47311,47310,47313,47312,47314,47315,47316,47317,47319,47318,47320,47321,47323,47322,47325,47324,47326,47327,47329,47328,47330,47331,47332,47333,47335,47334,47336,47337,47339,47338,47341,47340,47342,47343,47344,47345,47347,47346,47349,47348,47350,47351,47353,47352,47354,47355,47356,47357,47359,47358,47361,47360,47362,47363,47364,47365,47367,47366,47368,47369,47371,47370,47373,47372,47374,47375,47376,47377,47379,47378,47381,47380,47382,47383,47385,47384,47386,47387,47388,47389,47391,47390,47392,47393,47395,47394,47397,47396,47398,47399,47401,47400,47402,47403,47404,47405,47407,47406,47409,47408,47410,47411,47412,47413,47415,47414,47416,47417,47419,47418,47421,47420,47422,47423,47424,47425,47427,47426,47429,47428,47430,47431,47433,47432,47434,47435,47436,47437,47439,47438,47441,47440,47442,47443,47444,47445,47447,47446,47448,47449,47451,47450,47453,47452,47454,47455,47457,47456,47458,47459,47460,47461,47463,47462,47464,47465,47467,47466,47469,47468,47470,47471,47472,47473,47475,47474,47477,47476,47478,47479,47481,47480,47482,47483,47484,47485,47487,47486,47488,47489,47491,47490,47493,47492,47494,47495,47497,47496,47498,47499,47500,47501,47503,47502,47505,47504,47506,47507,47508,47509,47511,47510,47512,47513,47515,47514,47517,47516,47518,47519,47521,47520,47522,47523,47524,47525,47527,47526,47528,47529,47531,47530,47533,47532,47534,47535,47536,47537,47539,47538,47541,47540,47542,47543,47545,47544,47546,47547,47548,47549,47551,47550,47553,47552,47554,47555,47556,47557,47559,47558,47560,47561,47563,47562,47565,47564,47566,47567,47568,47569,47571,47570,47573,47572,47574,47575,47577,47576,47578,47579,47580,47581,47583,47582,47584,47585,47587,47586,47589,47588,47590,47591,47593,47592,47594,47595,47596,47597,47599,47598,47601,47600,47602,47603,47604,47605,47607,47606,47608,47609,47611,47610,47613,47612,47614,47615,47617,47616,47618,47619,47620,47621,47623,47622,47624,47625,47627,47626,47629,47628,47630,47631,47632,47633,47635,47634,47637,47636,47638,47639,47641,47640,47642,47643,47644,47645,47647,47646,47648,47649,47651,47650,47653,47652,47654,47655,47657,47656,47658,47659,47660,47661,47663,47662,47665,47664,47666,47667,47668,47669,47671,47670,47672,47673,47675,47674,47677,47676,47678,47679,47680,47681,47683,47682,47685,47684,47686,47687,47689,47688,47690,47691,47692,47693,47695,47694,47697,47696,47698,47699,47700,47701,47703,47702,47704,47705,47707,47706,47709,47708,47710,47711,47713,47712,47714,47715,47716,47717,47719,47718,47720,47721,47723,47722,47725,47724,47726,47727,47728,47729,47731,47730,47733,47732,47734,47735,47737,47736,47738,47739,47740,47741,47743,47742,47744,47745,47747,47746,47749,47748,47750,47751,47753,47752,47754,47755,47756,47757,47759,47758,47761,47760,47762,47763,47764,47765,47767,47766,47768,47769,47771,47770,47773,47772,47774,47775,47777,47776,47778,47779,47780,47781,47783,47782,47784,47785,47787,47786,47789,47788,47790,47791,47792,47793,47795,47794,47797,47796,47798,47799,47801,47800,47802,47803,47804,47805,47807,47806,47809,47808,47810,47811,47812,47813,47815,47814,47816,47817,47819,47818,47821,47820,47822,47823,47824,47825,47827,47826,47829,47828,47830,47831,47833,47832,47834,47835,47836,47837,47839,47838,47840,47841,47843,47842,47845,47844,47846,47847,47849,47848,47850,47851,47852,47853,47855,47854,47857,47856,47858,47859,47860,47861,47863,47862,47864,47865,47867,47866,47869,47868,47870,47871,47872,47873,47875,47874,47877,47876,47878,47879,47881,47880,47882,47883,47884,47885,47887,47886,47889,47888,47890,47891,47892,47893,47895,47894,47896,47897,47899,47898,47901,47900,47902,47903,47905,47904,47906,47907,47908,47909,47911,47910,47912,47913,47915,47914,47917,47916,47918,47919,47920,47921,47923,47922,47925,47924,47926,47927,47929,47928,47930,47931,47932,47933,47935,47934,47937,47936,47938,47939,47940,47941,47943,47942,47944,47945,47947,47946,47949,47948,47950,47951,47952,47953,47955,47954,47957,47956,47958,47959,47961,47960,47962,47963,47964,47965,47967,47966,47968,47969,47971,47970,47973,47972,47974,47975,47977,47976,47978,47979,47980,47981,47983,47982,47985,47984,47986,47987,47988,47989,47991,47990,47992,47993,47995,47994,47997,47996,47998,47999,48001,48000,48002,48003,48004,48005,48007,48006,48008,48009,48011,48010,48013,48012,48014,48015,48016,48017,48019,48018,48021,48020,48022,48023,48025,48024,48026,48027,48028,48029,48031,48030,48032,48033,48035,48034,48037,48036,48038,48039,48041,48040,48042,48043,48044,48045,48047,48046,48049,48048,48050,48051,48052,48053,48055,48054,48056,48057,48059,48058,48061,48060,48062,48063,48064,48065,48067,48066,48069,48068,48070,48071,48073,48072,48074,48075,48076,48077,48079,48078,48081,48080,48082,48083,48084,48085,48087,48086,48088,48089,48091,48090,48093,48092,48094,48095,48097,48096,48098,48099,48100,48101,48103,48102,48104,48105,48107,48106,48109,48108,48110,48111,48112,48113,48115,48114,48117,48116,48118,48119,48121,48120,48122,48123,48124,48125,48127,48126,48129,48128,48130,48131,48132,48133,48135,48134,48136,48137,48139,48138,48141,48140,48142,48143,48144,48145,48147,48146,48149,48148,48150,48151,48153,48152,48154,48155,48156,48157,48159,48158,48160,48161,48163,48162,48165,48164,48166,48167,48169,48168,48170,48171,48172,48173,48175,48174,48177,48176,48178,48179,48180,48181,48183,48182,48184,48185,48187,48186,48189,48188,48190,48191,48192,48193,48195,48194,48197,48196,48198,48199,48201,48200,48202,48203,48204,48205,48207,48206,48209,48208,48210,48211,48212,48213,48215,48214,48216,48217,48219,48218,48221,48220,48222,48223,48225,48224,48226,48227,48228,48229,48231,48230,48232,48233,48235,48234,48237,48236,48238,48239,48240,48241,48243,48242,48245,48244,48246,48247,48249,48248,48250,48251,48252,48253,48255,48254,48256,48257,48259,48258,48261,48260,48262,48263,48265,48264,48266,48267,48268,48269,48271,48270,48273,48272,48274,48275,48276,48277,48279,48278,48280,48281,48283,48282,48285,48284,48286,48287,48289,48288,48290,48291,48292,48293,48295,48294,48296,48297,48299,48298,48301,48300,48302,48303,48304,48305,48307,48306,48309,48308,48310,48311,48313,48312,48314,48315,48316,48317,48319,48318,48321,48320,48322,48323,48324,48325,48327,48326,48328,48329,48331,48330,48333,48332,48334,48335,48336,48337,48339,48338,48341,48340,48342,48343,48345,48344,48346,48347,48348,48349,48351,48350,48352,48353,48355,48354,48357,48356,48358,48359,48361,48360,48362,48363,48364,48365,48367,48366,48369,48368,48370,48371,48372,48373,48375,48374,48376,48377,48379,48378,48381,48380,48382,48383,48384,48385,48387,48386,48389,48388,48390,48391,48393,48392,48394,48395,48396,48397,48399,48398,48401,48400,48402,48403,48404,48405,48407,48406,48408,48409,48411,48410,48413,48412,48414,48415,48417,48416,48418,48419,48420,48421,48423,48422,48424,48425,48427,48426,48429,48428,48430,48431,48432,48433,48435,48434,48437,48436,48438,48439,48441,48440,48442,48443,48444,48445,48447,48446,48449,48448,48450,48451,48452,48453,48455,48454,48456,48457,48459,48458,48461,48460,48462,48463,48464,48465,48467,48466,48469,48468,48470,48471,48473,48472,48474,48475,48476,48477,48479,48478,48480,48481,48483,48482,48485,48484,48486,48487,48489,48488,48490,48491,48492,48493,48495,48494,48497,48496,48498,48499,48500,48501,48503,48502,48504,48505,48507,48506,48509,48508,48510,48511,48513,48512,48514,48515,48516,48517,48519,48518,48520,48521,48523,48522,48525,48524,48526,48527,48528,48529,48531,48530,48533,48532,48534,48535,48537,48536,48538,48539,48540,48541,48543,48542,48544,48545,48547,48546,48549,48548,48550,48551,48553,48552,48554,48555,48556,48557,48559,48558,48561,48560,48562,48563,48564,48565,48567,48566,48568,48569,48571,48570,48573,48572,48574,48575,48576,48577,48579,48578,48581,48580,48582,48583,48585,48584,48586,48587,48588,48589,48591,48590,48593,48592,48594,48595,48596,48597,48599,48598,48600,48601,48603,48602,48605,48604,48606,48607,48609,48608,48610,48611,48612,48613,48615,48614,48616,48617,48619,48618,48621,48620,48622,48623,48624,48625,48627,48626,48629,48628,48630,48631,48633,48632,48634,48635,48636,48637,48639,48638,48640,48641,48643,48642,48645,48644,48646,48647,48649,48648,48650,48651,48652,48653,48655,48654,48657,48656,48658,48659,48660,48661,48663,48662,48664,48665,48667,48666,48669,48668,48670,48671,48673,48672,48674,48675,48676,48677,48679,48678,48680,48681,48683,48682,48685,48684,48686,48687,48688,48689,48691,48690,48693,48692,48694,48695,48697,48696,48698,48699,48700,48701,48703,48702,48705,48704,48706,48707,48708,48709,48711,48710,48712,48713,48715,48714,48717,48716,48718,48719,48720,48721,48723,48722,48725,48724,48726,48727,48729,48728,48730,48731,48732,48733,48735,48734,48736,48737,48739,48738,48741,48740,48742,48743,48745,48744,48746,48747,48748,48749,48751,48750,48753,48752,48754,48755,48756,48757,48759,48758,48760,48761,48763,48762,48765,48764,48766,48767,48769,48768,48770,48771,48772,48773,48775,48774,48776,48777,48779,48778,48781,48780,48782,48783,48784,48785,48787,48786,48789,48788,48790,48791,48793,48792,48794,48795,48796,48797,48799,48798,48800,48801,48803,48802,48805,48804,48806,48807,48809,48808,48810,48811,48812,48813,48815,48814,48817,48816,48818,48819,48820,48821,48823,48822,48824,48825,48827,48826,48829,48828,48830,48831,48832,48833,48835,48834,48837,48836,48838,48839,48841,48840,48842,48843,48844,48845,48847,48846,48849,48848,48850,48851,48852,48853,48855,48854,48856,48857,48859,48858,48861,48860,48862,48863,48865,48864,48866,48867,48868,48869,48871,48870,48872,48873,48875,48874,48877,48876,48878,48879,48880,48881,48883,48882,48885,48884,48886,48887,48889,48888,48890,48891,48892,48893,48895,48894,48897,48896,48898,48899,48900,48901,48903,48902,48904,48905,48907,48906,48909,48908,48910,48911,48912,48913,48915,48914,48917,48916,48918,48919,48921,48920,48922,48923,48924,48925,48927,48926,48928,48929,48931,48930,48933,48932,48934,48935,48937,48936,48938,48939,48940,48941,48943,48942,48945,48944,48946,48947,48948,48949,48951,48950,48952,48953,48955,48954,48957,48956,48958,48959,48960,48961,48963,48962,48965,48964,48966,48967,48969,48968,48970,48971,48972,48973,48975,48974,48977,48976,48978,48979,48980,48981,48983,48982,48984,48985,48987,48986,48989,48988,48990,48991,48993,48992,48994,48995,48996,48997,48999,48998,49000,49001,49003,49002,49005,49004,49006,49007,49008,49009,49011,49010,49013,49012,49014,49015,49017,49016,49018,49019,49020,49021,49023,49022,49024,49025,49027,49026,49029,49028,49030,49031,49033,49032,49034,49035,49036,49037,49039,49038,49041,49040,49042,49043,49044,49045,49047,49046,49048,49049,49051,49050,49053,49052,49054,49055,49057,49056,49058,49059,49060,49061,49063,49062,49064,49065,49067,49066,49069,49068,49070,49071,49072,49073,49075,49074,49077,49076,49078,49079,49081,49080,49082,49083,49084,49085,49087,49086,49089,49088,49090,49091,49092,49093,49095,49094,49096,49097,49099,49098,49101,49100,49102,49103,49104,49105,49107,49106,49109,49108,49110,49111,49113,49112,49114,49115,49116,49117,49119,49118,49120,49121,49123,49122,49125,49124,49126,49127,49129,49128,49130,49131,49132,49133,49135,49134,49137,49136,49138,49139,49140,49141,49143,49142,49144,49145,49147,49146,49149,49148,49150,49151,49152,49153,49155,49154,49157,49156,49158,49159,49161,49160,49162,49163,49164,49165,49167,49166,49169,49168,49170,49171,49172,49173,49175,49174,49176,49177,49179,49178,49181,49180,49182,49183,49185,49184,49186,49187,49188,49189,49191,49190,49192,49193,49195,49194,49197,49196,49198,49199,49200,49201,49203,49202,49205,49204,49206,49207,49209,49208,49210,49211,49212,49213,49215,49214,49217,49216,49218,49219,49220,49221,49223,49222,49224,49225,49227,49226,49229,49228,49230,49231,49232,49233,49235,49234,49237,49236,49238,49239,49241,49240,49242,49243,49244,49245,49247,49246,49248,49249,49251,49250,49253,49252,49254,49255,49257,49256,49258,49259,49260,49261,49263,49262,49265,49264,49266,49267,49268,49269,49271,49270,49272,49273,49275,49274,49277,49276,49278,49279,49281,49280,49282,49283,49284,49285,49287,49286,49288,49289,49291,49290,49293,49292,49294,49295,49296,49297,49299,49298,49301,49300,49302,49303,49305,49304,49306,49307,49308,49309,49311,49310,49312,49313,49315,49314,49317,49316,49318,49319,49321,49320,49322,49323,49324,49325,49327,49326,49329,49328,49330,49331,49332,49333,49335,49334,49336,49337,49339,49338,49341,49340,49342,49343,49344,49345,49347,49346,49349,49348,49350,49351,49353,49352,49354,49355,49356,49357,49359,49358,49361,49360,49362,49363,49364,49365,49367,49366,49368,49369,49371,49370,49373,49372,49374,49375,49377,49376,49378,49379,49380,49381,49383,49382,49384,49385,49387,49386,49389,49388,49390,49391,49392,49393,49395,49394,49397,49396,49398,49399,49401,49400,49402,49403,49404,49405,49407,49406,49409,49408,49410,49411,49412,49413,49415,49414,49416,49417,49419,49418,49421,49420,49422,49423,49424,49425,49427,49426,49429,49428,49430,49431,49433,49432,49434,49435,49436,49437,49439,49438,49440,49441,49443,49442,49445,49444,49446,49447,49449,49448,49450,49451,49452,49453,49455,49454,49457,49456,49458,49459,49460,49461,49463,49462,49464,49465,49467,49466,49469,49468,49470,49471,49472,49473,49475,49474,49477,49476,49478,49479,49481,49480,49482,49483,49484,49485,49487,49486,49489,49488,49490,49491,49492,49493,49495,49494,49496,49497,49499,49498,49501,49500,49502,49503,49505,49504,49506,49507,49508,49509,49511,49510,49512,49513,49515,49514,49517,49516,49518,49519,49520,49521,49523,49522,49525,49524,49526,49527,49529,49528,49530,49531,49532,49533,49535,49534,49536,49537,49539,49538,49541,49540,49542,49543,49545,49544,49546,49547,49548,49549,49551,49550,49553,49552,49554,49555,49556,49557,49559,49558,49560,49561,49563,49562,49565,49564,49566,49567,49569,49568,49570,49571,49572,49573,49575,49574,49576,49577,49579,49578,49581,49580,49582,49583,49584,49585,49587,49586,49589,49588,49590,49591,49593,49592,49594,49595,49596,49597,49599,49598,49601,49600,49602,49603,49604,49605,49607,49606,49608,49609,49611,49610,49613,49612,49614,49615,49616,49617,49619,49618,49621,49620,49622,49623,49625,49624,49626,49627,49628,49629,49631,49630,49632,49633,49635,49634,49637,49636,49638,49639,49641,49640,49642,49643,49644,49645,49647,49646,49649,49648,49650,49651,49652,49653,49655,49654,49656,49657,49659,49658,49661,49660,49662,49663,49665,49664,49666,49667,49668,49669,49671,49670,49672,49673,49675,49674,49677,49676,49678,49679,49680,49681,49683,49682,49685,49684,49686,49687,49689,49688,49690,49691,49692,49693,49695,49694,49696,49697,49699,49698,49701,49700,49702,49703,49705,49704,49706,49707,49708,49709,49711,49710,49713,49712,49714,49715,49716,49717,49719,49718,49720,49721,49723,49722,49725,49724,49726,49727,49728,49729,49731,49730,49733,49732,49734,49735,49737,49736,49738,49739,49740,49741,49743,49742,49745,49744,49746,49747,49748,49749,49751,49750,49752,49753,49755,49754,49757,49756,49758,49759,49761,49760,49762,49763,49764,49765,49767,49766,49768,49769,49771,49770,49773,49772,49774,49775,49776,49777,49779,49778,49781,49780,49782,49783,49785,49784,49786,49787,49788,49789,49791,49790,49792,49793,49795,49794,49797,49796,49798,49799,49801,49800,49802,49803,49804,49805,49807,49806,49809,49808,49810,49811,49812,49813,49815,49814,49816,49817,49819,49818,49821,49820,49822,49823,49825,49824,49826,49827,49828,49829,49831,49830,49832,49833,49835,49834,49837,49836,49838,49839,49840,49841,49843,49842,49845,49844,49846,49847,49849,49848,49850,49851,49852,49853,49855,49854,49857,49856,49858,49859,49860,49861,49863,49862,49864,49865,49867,49866,49869,49868,49870,49871,49872,49873,49875,49874,49877,49876,49878,49879,49881,49880,49882,49883,49884,49885,49887,49886,49888,49889,49891,49890,49893,49892,49894,49895,49897,49896,49898,49899,49900,49901,49903,49902,49905,49904,49906,49907,49908,49909,49911,49910,49912,49913,49915,49914,49917,49916,49918,49919,49920,49921,49923,49922,49925,49924,49926,49927,49929,49928,49930,49931,49932,49933,49935,49934,49937,49936,49938,49939,49940,49941,49943,49942,49944,49945,49947,49946,49949,49948,49950,49951,49953,49952,49954,49955,49956,49957,49959,49958,49960,49961,49963,49962,49965,49964,49966,49967,49968,49969,49971,49970,49973,49972,49974,49975,49977,49976,49978,49979,49980,49981,49983,49982,49985,49984,49986,49987,49988,49989,49991,49990,49992,49993,49995,49994,49997,49996,49998,49999,50000,50001,50003,50002,50005,50004,50006,50007,50009,50008,50010,50011,50012,50013,50015,50014,50016,50017,50019,50018,50021,50020,50022,50023,50025,50024,50026,50027,50028,50029,50031,50030,50033,50032,50034,50035,50036,50037,50039,50038,50040,50041,50043,50042,50045,50044,50046,50047,50049,50048,50050,50051,50052,50053,50055,50054,50056,50057,50059,50058,50061,50060,50062,50063,50064,50065,50067,50066,50069,50068,50070,50071,50073,50072,50074,50075,50076,50077,50079,50078,50080,50081,50083,50082,50085,50084,50086,50087,50089,50088,50090,50091,50092,50093,50095,50094,50097,50096,50098,50099,50100,50101,50103,50102,50104,50105,50107,50106,50109,50108,50110,50111,50112,50113,50115,50114,50117,50116,50118,50119,50121,50120,50122,50123,50124,50125,50127,50126,50129,50128,50130,50131,50132,50133,50135,50134,50136,50137,50139,50138,50141,50140,50142,50143,50145,50144,50146,50147,50148,50149,50151,50150,50152,50153,50155,50154,50157,50156,50158,50159,50160,50161,50163,50162,50165,50164,50166,50167,50169,50168,50170,50171,50172,50173,50175,50174,50177,50176,50178,50179,50180,50181,50183,50182,50184,50185,50187,50186,50189,50188,50190,50191,50192,50193,50195,50194,50197,50196,50198,50199,50201,50200,50202,50203,50204,50205,50207,50206,50208,50209,50211,50210,50213,50212,50214,50215,50217,50216,50218,50219,50220,50221,50223,50222,50225,50224,50226,50227,50228,50229,50231,50230,50232,50233,50235,50234,50237,50236,50238,50239,50240,50241,50243,50242,50245,50244,50246,50247,50249,50248,50250,50251,50252,50253,50255,50254,50257,50256,50258,50259,50260,50261,50263,50262,50264,50265,50267,50266,50269,50268,50270,50271,50273,50272,50274,50275,50276,50277,50279,50278,50280,50281,50283,50282,50285,50284,50286,50287,50288,50289,50291,50290,50293,50292,50294,50295,50297,50296,50298,50299,50300,50301,50303,50302,50304,50305,50307,50306,50309,50308,50310,50311,50313,50312,50314,50315,50316,50317,50319,50318,50321,50320,50322,50323,50324,50325,50327,50326,50328,50329,50331,50330,50333,50332,50334,50335,50337,50336,50338,50339,50340,50341,50343,50342,50344,50345,50347,50346,50349,50348,50350,50351,50352,50353,50355,50354,50357,50356,50358,50359,50361,50360,50362,50363,50364,50365,50367,50366,50369,50368,50370,50371,50372,50373,50375,50374,50376,50377,50379,50378,50381,50380,50382,50383,50384,50385,50387,50386,50389,50388,50390,50391,50393,50392,50394,50395,50396,50397,50399,50398,50400,50401,50403,50402,50405,50404,50406,50407,50409,50408,50410,50411,50412,50413,50415,50414,50417,50416,50418,50419,50420,50421,50423,50422,50424,50425,50427,50426,50429,50428,50430,50431,50432,50433,50435,50434,50437,50436,50438,50439,50441,50440,50442,50443,50444,50445,50447,50446,50449,50448,50450,50451,50452,50453,50455,50454,50456,50457,50459,50458,50461,50460,50462,50463,50465,50464,50466,50467,50468,50469,50471,50470,50472,50473,50475,50474,50477,50476,50478,50479,50480,50481,50483,50482,50485,50484,50486,50487,50489,50488,50490,50491,50492,50493,50495,50494,50497,50496,50498,50499,50500,50501,50503,50502,50504,50505,50507,50506,50509,50508,50510,50511,50512,50513,50515,50514,50517,50516,50518,50519,50521,50520,50522,50523,50524,50525,50527,50526,50528,50529,50531,50530,50533,50532,50534,50535,50537,50536,50538,50539,50540,50541,50543,50542,50545,50544,50546,50547,50548,50549,50551,50550,50552,50553,50555,50554,50557,50556,50558,50559,50561,50560,50562,50563,50564,50565,50567,50566,50568,50569,50571,50570,50573,50572,50574,50575,50576,50577,50579,50578,50581,50580,50582,50583,50585,50584,50586,50587,50588,50589,50591,50590,50592,50593,50595,50594,50597,50596,50598,50599,50601,50600,50602,50603,50604,50605,50607,50606,50609,50608,50610,50611,50612,50613,50615,50614,50616,50617,50619,50618,50621,50620,50622,50623,50624,50625,50627,50626,50629,50628,50630,50631,50633,50632,50634,50635,50636,50637,50639,50638,50641,50640,50642,50643,50644,50645,50647,50646,50648,50649,50651,50650,50653,50652,50654,50655,50657,50656,50658,50659,50660,50661,50663,50662,50664,50665,50667,50666,50669,50668,50670,50671,50672,50673,50675,50674,50677,50676,50678,50679,50681,50680,50682,50683,50684,50685,50687,50686,50688,50689,50691,50690,50693,50692,50694,50695,50697,50696,50698,50699,50700,50701,50703,50702,50705,50704,50706,50707,50708,50709,50711,50710,50712,50713,50715,50714,50717,50716,50718,50719,50721,50720,50722,50723,50724,50725,50727,50726,50728,50729,50731,50730,50733,50732,50734,50735,50736,50737,50739,50738,50741,50740,50742,50743,50745,50744,50746,50747,50748,50749,50751,50750,50753,50752,50754,50755,50756,50757,50759,50758,50760,50761,50763,50762,50765,50764,50766,50767,50768,50769,50771,50770,50773,50772,50774,50775,50777,50776,50778,50779,50780,50781,50783,50782,50784,50785,50787,50786,50789,50788,50790,50791,50793,50792,50794,50795,50796,50797,50799,50798,50801,50800,50802,50803,50804,50805,50807,50806,50808,50809,50811,50810,50813,50812,50814,50815,50817,50816,50818,50819,50820,50821,50823,50822,50824,50825,50827,50826,50829,50828,50830,50831,50832,50833,50835,50834,50837,50836,50838,50839,50841,50840,50842,50843,50844,50845,50847,50846,50848,50849,50851,50850,50853,50852,50854,50855,50857,50856,50858,50859,50860,50861,50863,50862,50865,50864,50866,50867,50868,50869,50871,50870,50872,50873,50875,50874,50877,50876,50878,50879,50880,50881,50883,50882,50885,50884,50886,50887,50889,50888,50890,50891,50892,50893,50895,50894,50897,50896,50898,50899,50900,50901,50903,50902,50904,50905,50907,50906,50909,50908,50910,50911,50913,50912,50914,50915,50916,50917,50919,50918,50920,50921,50923,50922,50925,50924,50926,50927,50928,50929,50931,50930,50933,50932,50934,50935,50937,50936,50938,50939,50940,50941,50943,50942,50945,50944,50946,50947,50948,50949,50951,50950,50952,50953,50955,50954,50957,50956,50958,50959,50960,50961,50963,50962,50965,50964,50966,50967,50969,50968,50970,50971,50972,50973,50975,50974,50976,50977,50979,50978,50981,50980,50982,50983,50985,50984,50986,50987,50988,50989,50991,50990,50993,50992,50994,50995,50996,50997,50999,50998,51000,51001,51003,51002,51005,51004,51006,51007,51008,51009,51011,51010,51013,51012,51014,51015,51017,51016,51018,51019,51020,51021,51023,51022,51025,51024,51026,51027,51028,51029,51031,51030,51032,51033,51035,51034,51037,51036,51038,51039,51041,51040,51042,51043,51044,51045,51047,51046,51048,51049,51051,51050,51053,51052,51054,51055,51056,51057,51059,51058,51061,51060,51062,51063,51065,51064,51066,51067,51068,51069,51071,51070,51072,51073,51075,51074,51077,51076,51078,51079,51081,51080,51082,51083,51084,51085,51087,51086,51089,51088,51090,51091,51092,51093,51095,51094,51096,51097,51099,51098,51101,51100,51102,51103,51105,51104,51106,51107,51108,51109,51111,51110,51112,51113,51115,51114,51117,51116,51118,51119,51120,51121,51123,51122,51125,51124,51126,51127,51129,51128,51130,51131,51132,51133,51135,51134,51137,51136,51138,51139,51140,51141,51143,51142,51144,51145,51147,51146,51149,51148,51150,51151,51152,51153,51155,51154,51157,51156,51158,51159,51161,51160,51162,51163,51164,51165,51167,51166,51168,51169,51171,51170,51173,51172,51174,51175,51177,51176,51178,51179,51180,51181,51183,51182,51185,51184,51186,51187,51188,51189,51191,51190,51192,51193,51195,51194,51197,51196,51198,51199,51201,51200,51202,51203,51204,51205,51207,51206,51208,51209,51211,51210,51213,51212,51214,51215,51216,51217,51219,51218,51221,51220,51222,51223,51225,51224,51226,51227,51228,51229,51231,51230,51232,51233,51235,51234,51237,51236,51238,51239,51241,51240,51242,51243,51244,51245,51247,51246,51249,51248,51250,51251,51252,51253,51255,51254,51256,51257,51259,51258,51261,51260,51262,51263,51264,51265,51267,51266,51269,51268,51270,51271,51273,51272,51274,51275,51276,51277,51279,51278,51281,51280,51282,51283,51284,51285,51287,51286,51288,51289,51291,51290,51293,51292,51294,51295,51297,51296,51298,51299,51300,51301,51303,51302,51304,51305,51307,51306,51309,51308,51310,51311,51312,51313,51315,51314,51317,51316,51318,51319,51321,51320,51322,51323,51324,51325,51327,51326,51328,51329,51331,51330,51333,51332,51334,51335,51337,51336,51338,51339,51340,51341,51343,51342,51345,51344,51346,51347,51348,51349,51351,51350,51352,51353,51355,51354,51357,51356,51358,51359,51361,51360,51362,51363,51364,51365,51367,51366,51368,51369,51371,51370,51373,51372,51374,51375,51376,51377,51379,51378,51381,51380,51382,51383,51385,51384,51386,51387,51388,51389,51391,51390,51393,51392,51394,51395,51396,51397,51399,51398,51400,51401,51403,51402,51405,51404,51406,51407,51408,51409,51411,51410,51413,51412,51414,51415,51417,51416,51418,51419,51420,51421,51423,51422,51424,51425,51427,51426,51429,51428,51430,51431,51433,51432,51434,51435,51436,51437,51439,51438,51441,51440,51442,51443,51444,51445,51447,51446,51448,51449,51451,51450,51453,51452,51454,51455,51456,51457,51459,51458,51461,51460,51462,51463,51465,51464,51466,51467,51468,51469,51471,51470,51473,51472,51474,51475,51476,51477,51479,51478,51480,51481,51483,51482,51485,51484,51486,51487,51489,51488,51490,51491,51492,51493,51495,51494,51496,51497,51499,51498,51501,51500,51502,51503,51504,51505,51507,51506,51509,51508,51510,51511,51513,51512,51514,51515,51516,51517,51519,51518,51521,51520,51522,51523,51524,51525,51527,51526,51528,51529,51531,51530,51533,51532,51534,51535,51536,51537,51539,51538,51541,51540,51542,51543,51545,51544,51546,51547,51548,51549,51551,51550,51552,51553,51555,51554,51557,51556,51558,51559,51561,51560,51562,51563,51564,51565,51567,51566,51569,51568,51570,51571,51572,51573,51575,51574,51576,51577,51579,51578,51581,51580,51582,51583,51585,51584,51586,51587,51588,51589,51591,51590,51592,51593,51595,51594,51597,51596,51598,51599,51600,51601,51603,51602,51605,51604,51606,51607,51609,51608,51610,51611,51612,51613,51615,51614,51616,51617,51619,51618,51621,51620,51622,51623,51625,51624,51626,51627,51628,51629,51631,51630,51633,51632,51634,51635,51636,51637,51639,51638,51640,51641,51643,51642,51645,51644,51646,51647,51648,51649,51651,51650,51653,51652,51654,51655,51657,51656,51658,51659,51660,51661,51663,51662,51665,51664,51666,51667,51668,51669,51671,51670,51672,51673,51675,51674,51677,51676,51678,51679,51681,51680,51682,51683,51684,51685,51687,51686,51688,51689,51691,51690,51693,51692,51694,51695,51696,51697,51699,51698,51701,51700,51702,51703,51705,51704,51706,51707,51708,51709,51711,51710,51712,51713,51715,51714,51717,51716,51718,51719,51721,51720,51722,51723,51724,51725,51727,51726,51729,51728,51730,51731,51732,51733,51735,51734,51736,51737,51739,51738,51741,51740,51742,51743,51745,51744,51746,51747,51748,51749,51751,51750,51752,51753,51755,51754,51757,51756,51758,51759,51760,51761,51763,51762,51765,51764,51766,51767,51769,51768,51770,51771,51772,51773,51775,51774,51777,51776,51778,51779,51780,51781,51783,51782,51784,51785,51787,51786,51789,51788,51790,51791,51792,51793,51795,51794,51797,51796,51798,51799,51801,51800,51802,51803,51804,51805,51807,51806,51808,51809,51811,51810,51813,51812,51814,51815,51817,51816,51818,51819,51820,51821,51823,51822,51825,51824,51826,51827,51828,51829,51831,51830,51832,51833,51835,51834,51837,51836,51838,51839,51841,51840,51842,51843,51844,51845,51847,51846,51848,51849,51851,51850,51853,51852,51854,51855,51856,51857,51859,51858,51861,51860,51862,51863,51865,51864,51866,51867,51868,51869,51871,51870,51872,51873,51875,51874,51877,51876,51878,51879,51881,51880,51882,51883,51884,51885,51887,51886,51889,51888,51890,51891,51892,51893,51895,51894,51896,51897,51899,51898,51901,51900,51902,51903,51904,51905,51907,51906,51909,51908,51910,51911,51913,51912,51914,51915,51916,51917,51919,51918,51921,51920,51922,51923,51924,51925,51927,51926,51928,51929,51931,51930,51933,51932,51934,51935,51937,51936,51938,51939,51940,51941,51943,51942,51944,51945,51947,51946,51949,51948,51950,51951,51952,51953,51955,51954,51957,51956,51958,51959,51961,51960,51962,51963,51964,51965,51967,51966,51969,51968,51970,51971,51972,51973,51975,51974,51976,51977,51979,51978,51981,51980,51982,51983,51984,51985,51987,51986,51989,51988,51990,51991,51993,51992,51994,51995,51996,51997,51999,51998,52000,52001,52003,52002,52005,52004,52006,52007,52009,52008,52010,52011,52012,52013,52015,52014,52017,52016,52018,52019,52020,52021,52023,52022,52024,52025,52027,52026,52029,52028,52030,52031,52032,52033,52035,52034,52037,52036,52038,52039,52041,52040,52042,52043,52044,52045,52047,52046,52049,52048,52050,52051,52052,52053,52055,52054,52056,52057,52059,52058,52061,52060,52062,52063,52065,52064,52066,52067,52068,52069,52071,52070,52072,52073,52075,52074,52077,52076,52078,52079,52080,52081,52083,52082,52085,52084,52086,52087,52089,52088,52090,52091,52092,52093,52095,52094,52096,52097,52099,52098,52101,52100,52102,52103,52105,52104,52106,52107,52108,52109,52111,52110,52113,52112,52114,52115,52116,52117,52119,52118,52120,52121,52123,52122,52125,52124,52126,52127,52129,52128,52130,52131,52132,52133,52135,52134,52136,52137,52139,52138,52141,52140,52142,52143,52144,52145,52147,52146,52149,52148,52150,52151,52153,52152,52154,52155,52156,52157,52159,52158,52161,52160,52162,52163,52164,52165,52167,52166,52168,52169,52171,52170,52173,52172,52174,52175,52176,52177,52179,52178,52181,52180,52182,52183,52185,52184,52186,52187,52188,52189,52191,52190,52192,52193,52195,52194,52197,52196,52198,52199,52201,52200,52202,52203,52204,52205,52207,52206,52209,52208,52210,52211,52212,52213,52215,52214,52216,52217,52219,52218,52221,52220,52222,52223,52224,52225,52227,52226,52229,52228,52230,52231,52233,52232,52234,52235,52236,52237,52239,52238,52241,52240,52242,52243,52244,52245,52247,52246,52248,52249,52251,52250,52253,52252,52254,52255,52257,52256,52258,52259,52260,52261,52263,52262,52264,52265,52267,52266,52269,52268,52270,52271,52272,52273,52275,52274,52277,52276,52278,52279,52281,52280,52282,52283,52284,52285,52287,52286,52289,52288,52290,52291,52292,52293,52295,52294,52296,52297,52299,52298,52301,52300,52302,52303,52304,52305,52307,52306,52309,52308,52310,52311,52313,52312,52314,52315,52316,52317,52319,52318,52320,52321,52323,52322,52325,52324,52326,52327,52329,52328,52330,52331,52332,52333,52335,52334,52337,52336,52338,52339,52340,52341,52343,52342,52344,52345,52347,52346,52349,52348,52350,52351,52353,52352,52354,52355,52356,52357,52359,52358,52360,52361,52363,52362,52365,52364,52366,52367,52368,52369,52371,52370,52373,52372,52374,52375,52377,52376,52378,52379,52380,52381,52383,52382,52384,52385,52387,52386,52389,52388,52390,52391,52393,52392,52394,52395,52396,52397,52399,52398,52401,52400,52402,52403,52404,52405,52407,52406,52408,52409,52411,52410,52413,52412,52414,52415,52416,52417,52419,52418,52421,52420,52422,52423,52425,52424,52426,52427,52428,52429,52431,52430,52433,52432,52434,52435,52436,52437,52439,52438,52440,52441,52443,52442,52445,52444,52446,52447,52449,52448,52450,52451,52452,52453,52455,52454,52456,52457,52459,52458,52461,52460,52462,52463,52464,52465,52467,52466,52469,52468,52470,52471,52473,52472,52474,52475,52476,52477,52479,52478,52481,52480,52482,52483,52484,52485,52487,52486,52488,52489,52491,52490,52493,52492,52494,52495,52496,52497,52499,52498,52501,52500,52502,52503,52505,52504,52506,52507,52508,52509,52511,52510,52512,52513,52515,52514,52517,52516,52518,52519,52521,52520,52522,52523,52524,52525,52527,52526,52529,52528,52530,52531,52532,52533,52535,52534,52536,52537,52539,52538,52541,52540,52542,52543,52544,52545,52547,52546,52549,52548,52550,52551,52553,52552,52554,52555,52556,52557,52559,52558,52561,52560,52562,52563,52564,52565,52567,52566,52568,52569,52571,52570,52573,52572,52574,52575,52577,52576,52578,52579,52580,52581,52583,52582,52584,52585,52587,52586,52589,52588,52590,52591,52592,52593,52595,52594,52597,52596,52598,52599,52601,52600,52602,52603,52604,52605,52607,52606,52608,52609,52611,52610,52613,52612,52614,52615,52617,52616,52618,52619,52620,52621,52623,52622,52625,52624,52626,52627,52628,52629,52631,52630,52632,52633,52635,52634,52637,52636,52638,52639,52641,52640,52642,52643,52644,52645,52647,52646,52648,52649,52651,52650,52653,52652,52654,52655,52656,52657,52659,52658,52661,52660,52662,52663,52665,52664,52666,52667,52668,52669,52671,52670,52673,52672,52674,52675,52676,52677,52679,52678,52680,52681,52683,52682,52685,52684,52686,52687,52688,52689,52691,52690,52693,52692,52694,52695,52697,52696,52698,52699,52700,52701,52703,52702,52704,52705,52707,52706,52709,52708,52710,52711,52713,52712,52714,52715,52716,52717,52719,52718,52721,52720,52722,52723,52724,52725,52727,52726,52728,52729,52731,52730,52733,52732,52734,52735,52737,52736,52738,52739,52740,52741,52743,52742,52744,52745,52747,52746,52749,52748,52750,52751,52752,52753,52755,52754,52757,52756,52758,52759,52761,52760,52762,52763,52764,52765,52767,52766,52768,52769,52771,52770,52773,52772,52774,52775,52777,52776,52778,52779,52780,52781,52783,52782,52785,52784,52786,52787,52788,52789,52791,52790,52792,52793,52795,52794,52797,52796,52798,52799,52800,52801,52803,52802,52805,52804,52806,52807,52809,52808,52810,52811,52812,52813,52815,52814,52817,52816,52818,52819,52820,52821,52823,52822,52824,52825,52827,52826,52829,52828,52830,52831,52833,52832,52834,52835,52836,52837,52839,52838,52840,52841,52843,52842,52845,52844,52846,52847,52848,52849,52851,52850,52853,52852,52854,52855,52857,52856,52858,52859,52860,52861,52863,52862,52864,52865,52867,52866,52869,52868,52870,52871,52873,52872,52874,52875,52876,52877,52879,52878,52881,52880,52882,52883,52884,52885,52887,52886,52888,52889,52891,52890,52893,52892,52894,52895,52897,52896,52898,52899,52900,52901,52903,52902,52904,52905,52907,52906,52909,52908,52910,52911,52912,52913,52915,52914,52917,52916,52918,52919,52921,52920,52922,52923,52924,52925,52927,52926,52929,52928,52930,52931,52932,52933,52935,52934,52936,52937,52939,52938,52941,52940,52942,52943,52944,52945,52947,52946,52949,52948,52950,52951,52953,52952,52954,52955,52956,52957,52959,52958,52960,52961,52963,52962,52965,52964,52966,52967,52969,52968,52970,52971,52972,52973,52975,52974,52977,52976,52978,52979,52980,52981,52983,52982,52984,52985,52987,52986,52989,52988,52990,52991,52992,52993,52995,52994,52997,52996,52998,52999,53001,53000,53002,53003,53004,53005,53007,53006,53009,53008,53010,53011,53012,53013,53015,53014,53016,53017,53019,53018,53021,53020,53022,53023,53025,53024,53026,53027,53028,53029,53031,53030,53032,53033,53035,53034,53037,53036,53038,53039,53040,53041,53043,53042,53045,53044,53046,53047,53049,53048,53050,53051,53052,53053,53055,53054,53057,53056,53058,53059,53060,53061,53063,53062,53064,53065,53067,53066,53069,53068,53070,53071,53072,53073,53075,53074,53077,53076,53078,53079,53081,53080,53082,53083,53084,53085,53087,53086,53088,53089,53091,53090,53093,53092,53094,53095,53097,53096,53098,53099,53100,53101,53103,53102,53105,53104,53106,53107,53108,53109,53111,53110,53112,53113,53115,53114,53117,53116,53118,53119,53121,53120,53122,53123,53124,53125,53127,53126,53128,53129,53131,53130,53133,53132,53134,53135,53136,53137,53139,53138,53141,53140,53142,53143,53145,53144,53146,53147,53148,53149,53151,53150,53152,53153,53155,53154,53157,53156,53158,53159,53161,53160,53162,53163,53164,53165,53167,53166,53169,53168,53170,53171,53172,53173,53175,53174,53176,53177,53179,53178,53181,53180,53182,53183,53184,53185,53187,53186,53189,53188,53190,53191,53193,53192,53194,53195,53196,53197,53199,53198,53201,53200,53202,53203,53204,53205,53207,53206,53208,53209,53211,53210,53213,53212,53214,53215,53217,53216,53218,53219,53220,53221,53223,53222,53224,53225,53227,53226,53229,53228,53230,53231,53232,53233,53235,53234,53237,53236,53238,53239,53241,53240,53242,53243,53244,53245,53247,53246,53249,53248,53250,53251,53252,53253,53255,53254,53256,53257,53259,53258,53261,53260,53262,53263,53264,53265,53267,53266,53269,53268,53270,53271,53273,53272,53274,53275,53276,53277,53279,53278,53280,53281,53283,53282,53285,53284,53286,53287,53289,53288,53290,53291,53292,53293,53295,53294,53297,53296,53298,53299,53300,53301,53303,53302,53304,53305,53307,53306,53309,53308,53310,53311,53312,53313,53315,53314,53317,53316,53318,53319,53321,53320,53322,53323,53324,53325,53327,53326,53329,53328,53330,53331,53332,53333,53335,53334,53336,53337,53339,53338,53341,53340,53342,53343,53345,53344,53346,53347,53348,53349,53351,53350,53352,53353,53355,53354,53357,53356,53358,53359,53360,53361,53363,53362,53365,53364,53366,53367,53369,53368,53370,53371,53372,53373,53375,53374,53376,53377,53379,53378,53381,53380,53382,53383,53385,53384,53386,53387,53388,53389,53391,53390,53393,53392,53394,53395,53396,53397,53399,53398,53400,53401,53403,53402,53405,53404,53406,53407,53409,53408,53410,53411,53412,53413,53415,53414,53416,53417,53419,53418,53421,53420,53422,53423,53424,53425,53427,53426,53429,53428,53430,53431,53433,53432,53434,53435,53436,53437,53439,53438,53441,53440,53442,53443,53444,53445,53447,53446,53448,53449,53451,53450,53453,53452,53454,53455,53456,53457,53459,53458,53461,53460,53462,53463,53465,53464,53466,53467,53468,53469,53471,53470,53472,53473,53475,53474,53477,53476,53478,53479,53481,53480,53482,53483,53484,53485,53487,53486,53489,53488,53490,53491,53492,53493,53495,53494,53496,53497,53499,53498,53501,53500,53502,53503,53504,53505,53507,53506,53509,53508,53510,53511,53513,53512,53514,53515,53516,53517,53519,53518,53521,53520,53522,53523,53524,53525,53527,53526,53528,53529,53531,53530,53533,53532,53534,53535,53537,53536,53538,53539,53540,53541,53543,53542,53544,53545,53547,53546,53549,53548,53550,53551,53552,53553,53555,53554,53557,53556,53558,53559,53561,53560,53562,53563,53564,53565,53567,53566,53569,53568,53570,53571,53572,53573,53575,53574,53576,53577,53579,53578,53581,53580,53582,53583,53584,53585,53587,53586,53589,53588,53590,53591,53593,53592,53594,53595,53596,53597,53599,53598,53600,53601,53603,53602,53605,53604,53606,53607,53609,53608,53610,53611,53612,53613,53615,53614,53617,53616,53618,53619,53620,53621,53623,53622,53624,53625,53627,53626,53629,53628,53630,53631,53633,53632,53634,53635,53636,53637,53639,53638,53640,53641,53643,53642,53645,53644,53646,53647,53648,53649,53651,53650,53653,53652,53654,53655,53657,53656,53658,53659,53660,53661,53663,53662,53664,53665,53667,53666,53669,53668,53670,53671,53673,53672,53674,53675,53676,53677,53679,53678,53681,53680,53682,53683,53684,53685,53687,53686,53688,53689,53691,53690,53693,53692,53694,53695,53696,53697,53699,53698,53701,53700,53702,53703,53705,53704,53706,53707,53708,53709,53711,53710,53713,53712,53714,53715,53716,53717,53719,53718,53720,53721,53723,53722,53725,53724,53726,53727,53729,53728,53730,53731,53732,53733,53735,53734,53736,53737,53739,53738,53741,53740,53742,53743,53744,53745,53747,53746,53749,53748,53750,53751,53753,53752,53754,53755,53756,53757,53759,53758,53760,53761,53763,53762,53765,53764,53766,53767,53769,53768,53770,53771,53772,53773,53775,53774,53777,53776,53778,53779,53780,53781,53783,53782,53784,53785,53787,53786,53789,53788,53790,53791,53793,53792,53794,53795,53796,53797,53799,53798,53800,53801,53803,53802,53805,53804,53806,53807,53808,53809,53811,53810,53813,53812,53814,53815,53817,53816,53818,53819,53820,53821,53823,53822,53825,53824,53826,53827,53828,53829,53831,53830,53832,53833,53835,53834,53837,53836,53838,53839,53840,53841,53843,53842,53845,53844,53846,53847,53849,53848,53850,53851,53852,53853,53855,53854,53856,53857,53859,53858,53861,53860,53862,53863,53865,53864,53866,53867,53868,53869,53871,53870,53873,53872,53874,53875,53876,53877,53879,53878,53880,53881,53883,53882,53885,53884,53886,53887,53889,53888,53890,53891,53892,53893,53895,53894,53896,53897,53899,53898,53901,53900,53902,53903,53904,53905,53907,53906,53909,53908,53910,53911,53913,53912,53914,53915,53916,53917,53919,53918,53920,53921,53923,53922,53925,53924,53926,53927,53929,53928,53930,53931,53932,53933,53935,53934,53937,53936,53938,53939,53940,53941,53943,53942,53944,53945,53947,53946,53949,53948,53950,53951,53952,53953,53955,53954,53957,53956,53958,53959,53961,53960,53962,53963,53964,53965,53967,53966,53969,53968,53970,53971,53972,53973,53975,53974,53976,53977,53979,53978,53981,53980,53982,53983,53985,53984,53986,53987,53988,53989,53991,53990,53992,53993,53995,53994,53997,53996,53998,53999,54000,54001,54003,54002,54005,54004,54006,54007,54009,54008,54010,54011,54012,54013,54015,54014,54017,54016,54018,54019,54020,54021,54023,54022,54024,54025,54027,54026,54029,54028,54030,54031,54032,54033,54035,54034,54037,54036,54038,54039,54041,54040,54042,54043,54044,54045,54047,54046,54048,54049,54051,54050,54053,54052,54054,54055,54057,54056,54058,54059,54060,54061,54063,54062,54065,54064,54066,54067,54068,54069,54071,54070,54072,54073,54075,54074,54077,54076,54078,54079,54080,54081,54083,54082,54085,54084,54086,54087,54089,54088,54090,54091,54092,54093,54095,54094,54097,54096,54098,54099,54100,54101,54103,54102,54104,54105,54107,54106,54109,54108,54110,54111,54113,54112,54114,54115,54116,54117,54119,54118,54120,54121,54123,54122,54125,54124,54126,54127,54128,54129,54131,54130,54133,54132,54134,54135,54137,54136,54138,54139,54140,54141,54143,54142,54144,54145,54147,54146,54149,54148,54150,54151,54153,54152,54154,54155,54156,54157,54159,54158,54161,54160,54162,54163,54164,54165,54167,54166,54168,54169,54171,54170,54173,54172,54174,54175,54177,54176,54178,54179,54180,54181,54183,54182,54184,54185,54187,54186,54189,54188,54190,54191,54192,54193,54195,54194,54197,54196,54198,54199,54201,54200,54202,54203,54204,54205,54207,54206,54209,54208,54210,54211,54212,54213,54215,54214,54216,54217,54219,54218,54221,54220,54222,54223,54224,54225,54227,54226,54229,54228,54230,54231,54233,54232,54234,54235,54236,54237,54239,54238,54240,54241,54243,54242,54245,54244,54246,54247,54249,54248,54250,54251,54252,54253,54255,54254,54257,54256,54258,54259,54260,54261,54263,54262,54264,54265,54267,54266,54269,54268,54270,54271,54272,54273,54275,54274,54277,54276,54278,54279,54281,54280,54282,54283,54284,54285,54287,54286,54289,54288,54290,54291,54292,54293,54295,54294,54296,54297,54299,54298,54301,54300,54302,54303,54305,54304,54306,54307,54308,54309,54311,54310,54312,54313,54315,54314,54317,54316,54318,54319,54320,54321,54323,54322,54325,54324,54326,54327,54329,54328,54330,54331,54332,54333,54335,54334,54337,54336,54338,54339,54340,54341,54343,54342,54344,54345,54347,54346,54349,54348,54350,54351,54352,54353,54355,54354,54357,54356,54358,54359,54361,54360,54362,54363,54364,54365,54367,54366,54368,54369,54371,54370,54373,54372,54374,54375,54377,54376,54378,54379,54380,54381,54383,54382,54385,54384,54386,54387,54388,54389,54391,54390,54392,54393,54395,54394,54397,54396,54398,54399,54401,54400,54402,54403,54404,54405,54407,54406,54408,54409,54411,54410,54413,54412,54414,54415,54416,54417,54419,54418,54421,54420,54422,54423,54425,54424,54426,54427,54428,54429,54431,54430,54432,54433,54435,54434,54437,54436,54438,54439,54441,54440,54442,54443,54444,54445,54447,54446,54449,54448,54450,54451,54452,54453,54455,54454,54456,54457,54459,54458,54461,54460,54462,54463,54464,54465,54467,54466,54469,54468,54470,54471,54473,54472,54474,54475,54476,54477,54479,54478,54481,54480,54482,54483,54484,54485,54487,54486,54488,54489,54491,54490,54493,54492,54494,54495,54497,54496,54498,54499,54500,54501,54503,54502,54504,54505,54507,54506,54509,54508,54510,54511,54512,54513,54515,54514,54517,54516,54518,54519,54521,54520,54522,54523,54524,54525,54527,54526,54529,54528,54530,54531,54532,54533,54535,54534,54536,54537,54539,54538,54541,54540,54542,54543,54544,54545,54547,54546,54549,54548,54550,54551,54553,54552,54554,54555,54556,54557,54559,54558,54560,54561,54563,54562,54565,54564,54566,54567,54569,54568,54570,54571,54572,54573,54575,54574,54577,54576,54578,54579,54580,54581,54583,54582,54584,54585,54587,54586,54589,54588,54590,54591,54592,54593,54595,54594,54597,54596,54598,54599,54601,54600,54602,54603,54604,54605,54607,54606,54609,54608,54610,54611,54612,54613,54615,54614,54616,54617,54619,54618,54621,54620,54622,54623,54625,54624,54626,54627,54628,54629,54631,54630,54632,54633,54635,54634,54637,54636,54638,54639,54640,54641,54643,54642,54645,54644,54646,54647,54649,54648,54650,54651,54652,54653,54655,54654,54656,54657,54659,54658,54661,54660,54662,54663,54665,54664,54666,54667,54668,54669,54671,54670,54673,54672,54674,54675,54676,54677,54679,54678,54680,54681,54683,54682,54685,54684,54686,54687,54689,54688,54690,54691,54692,54693,54695,54694,54696,54697,54699,54698,54701,54700,54702,54703,54704,54705,54707,54706,54709,54708,54710,54711,54713,54712,54714,54715,54716,54717,54719,54718,54721,54720,54722,54723,54724,54725,54727,54726,54728,54729,54731,54730,54733,54732,54734,54735,54736,54737,54739,54738,54741,54740,54742,54743,54745,54744,54746,54747,54748,54749,54751,54750,54752,54753,54755,54754,54757,54756,54758,54759,54761,54760,54762,54763,54764,54765,54767,54766,54769,54768,54770,54771,54772,54773,54775,54774,54776,54777,54779,54778,54781,54780,54782,54783,54785,54784,54786,54787,54788,54789,54791,54790,54792,54793,54795,54794,54797,54796,54798,54799,54800,54801,54803,54802,54805,54804,54806,54807,54809,54808,54810,54811,54812,54813,54815,54814,54816,54817,54819,54818,54821,54820,54822,54823,54825,54824,54826,54827,54828,54829,54831,54830,54833,54832,54834,54835,54836,54837,54839,54838,54840,54841,54843,54842,54845,54844,54846,54847,54848,54849,54851,54850,54853,54852,54854,54855,54857,54856,54858,54859,54860,54861,54863,54862,54865,54864,54866,54867,54868,54869,54871,54870,54872,54873,54875,54874,54877,54876,54878,54879,54881,54880,54882,54883,54884,54885,54887,54886,54888,54889,54891,54890,54893,54892,54894,54895,54896,54897,54899,54898,54901,54900,54902,54903,54905,54904,54906,54907,54908,54909,54911,54910,54912,54913,54915,54914,54917,54916,54918,54919,54921,54920,54922,54923,54924,54925,54927,54926,54929,54928,54930,54931,54932,54933,54935,54934,54936,54937,54939,54938,54941,54940,54942,54943,54945,54944,54946,54947,54948,54949,54951,54950,54952,54953,54955,54954,54957,54956,54958,54959,54960,54961,54963,54962,54965,54964,54966,54967,54969,54968,54970,54971,54972,54973,54975,54974,54977,54976,54978,54979,54980,54981,54983,54982,54984,54985,54987,54986,54989,54988,54990,54991,54992,54993,54995,54994,54997,54996,54998,54999,55001,55000,55002,55003,55004,55005,55007,55006,55008,55009,55011,55010,55013,55012,55014,55015,55017,55016,55018,55019,55020,55021,55023,55022,55025,55024,55026,55027,55028,55029,55031,55030,55032,55033,55035,55034,55037,55036,55038,55039,55040,55041,55043,55042,55045,55044,55046,55047,55049,55048,55050,55051,55052,55053,55055,55054,55057,55056,55058,55059,55060,55061,55063,55062,55064,55065,55067,55066,55069,55068,55070,55071,55073,55072,55074,55075,55076,55077,55079,55078,55080,55081,55083,55082,55085,55084,55086,55087,55088,55089,55091,55090,55093,55092,55094,55095,55097,55096,55098,55099,55100,55101,55103,55102,55105,55104,55106,55107,55108,55109,55111,55110,55112,55113,55115,55114,55117,55116,55118,55119,55120,55121,55123,55122,55125,55124,55126,55127,55129,55128,55130,55131,55132,55133,55135,55134,55136,55137,55139,55138,55141,55140,55142,55143,55145,55144,55146,55147,55148,55149,55151,55150,55153,55152,55154,55155,55156,55157,55159,55158,55160,55161,55163,55162,55165,55164,55166,55167,55169,55168,55170,55171,55172,55173,55175,55174,55176,55177,55179,55178,55181,55180,55182,55183,55184,55185,55187,55186,55189,55188,55190,55191,55193,55192,55194,55195,55196,55197,55199,55198,55200,55201,55203,55202,55205,55204,55206,55207,55209,55208,55210,55211,55212,55213,55215,55214,55217,55216,55218,55219,55220,55221,55223,55222,55224,55225,55227,55226,55229,55228,55230,55231,55232,55233,55235,55234,55237,55236,55238,55239,55241,55240,55242,55243,55244,55245,55247,55246,55249,55248,55250,55251,55252,55253,55255,55254,55256,55257,55259,55258,55261,55260,55262,55263,55265,55264,55266,55267,55268,55269,55271,55270,55272,55273,55275,55274,55277,55276,55278,55279,55280,55281,55283,55282,55285,55284,55286,55287,55289,55288,55290,55291,55292,55293,55295,55294,55296,55297,55299,55298,55301,55300,55302,55303,55305,55304,55306,55307,55308,55309,55311,55310,55313,55312,55314,55315,55316,55317,55319,55318,55320,55321,55323,55322,55325,55324,55326,55327,55329,55328,55330,55331,55332,55333,55335,55334,55336,55337,55339,55338,55341,55340,55342,55343,55344,55345,55347,55346,55349,55348,55350,55351,55353,55352,55354,55355,55356,55357,55359,55358,55361,55360,55362,55363,55364,55365,55367,55366,55368,55369,55371,55370,55373,55372,55374,55375,55376,55377,55379,55378,55381,55380,55382,55383,55385,55384,55386,55387,55388,55389,55391,55390,55392,55393,55395,55394,55397,55396,55398,55399,55401,55400,55402,55403,55404,55405,55407,55406,55409,55408,55410,55411,55412,55413,55415,55414,55416,55417,55419,55418,55421,55420,55422,55423,55425,55424,55426,55427,55428,55429,55431,55430,55432,55433,55435,55434,55437,55436,55438,55439,55440,55441,55443,55442,55445,55444,55446,55447,55449,55448,55450,55451,55452,55453,55455,55454,55456,55457,55459,55458,55461,55460,55462,55463,55465,55464,55466,55467,55468,55469,55471,55470,55473,55472,55474,55475,55476,55477,55479,55478,55480,55481,55483,55482,55485,55484,55486,55487,55488,55489,55491,55490,55493,55492,55494,55495,55497,55496,55498,55499,55500,55501,55503,55502,55505,55504,55506,55507,55508,55509,55511,55510,55512,55513,55515,55514,55517,55516,55518,55519,55521,55520,55522,55523,55524,55525,55527,55526,55528,55529,55531,55530,55533,55532,55534,55535,55536,55537,55539,55538,55541,55540,55542,55543,55545,55544,55546,55547,55548,55549,55551,55550,55553,55552,55554,55555,55556,55557,55559,55558,55560,55561,55563,55562,55565,55564,55566,55567,55568,55569,55571,55570,55573,55572,55574,55575,55577,55576,55578,55579,55580,55581,55583,55582,55584,55585,55587,55586,55589,55588,55590,55591,55593,55592,55594,55595,55596,55597,55599,55598,55601,55600,55602,55603,55604,55605,55607,55606,55608,55609,55611,55610,55613,55612,55614,55615,55616,55617,55619,55618,55621,55620,55622,55623,55625,55624,55626,55627,55628,55629,55631,55630,55633,55632,55634,55635,55636,55637,55639,55638,55640,55641,55643,55642,55645,55644,55646,55647,55649,55648,55650,55651,55652,55653,55655,55654,55656,55657,55659,55658,55661,55660,55662,55663,55664,55665,55667,55666,55669,55668,55670,55671,55673,55672,55674,55675,55676,55677,55679,55678,55680,55681,55683,55682,55685,55684,55686,55687,55689,55688,55690,55691,55692,55693,55695,55694,55697,55696,55698,55699,55700,55701,55703,55702,55704,55705,55707,55706,55709,55708,55710,55711,55713,55712,55714,55715,55716,55717,55719,55718,55720,55721,55723,55722,55725,55724,55726,55727,55728,55729,55731,55730,55733,55732,55734,55735,55737,55736,55738,55739,55740,55741,55743,55742,55745,55744,55746,55747,55748,55749,55751,55750,55752,55753,55755,55754,55757,55756,55758,55759,55760,55761,55763,55762,55765,55764,55766,55767,55769,55768,55770,55771,55772,55773,55775,55774,55776,55777,55779,55778,55781,55780,55782,55783,55785,55784,55786,55787,55788,55789,55791,55790,55793,55792,55794,55795,55796,55797,55799,55798,55800,55801,55803,55802,55805,55804,55806,55807,55809,55808,55810,55811,55812,55813,55815,55814,55816,55817,55819,55818,55821,55820,55822,55823,55824,55825,55827,55826,55829,55828,55830,55831,55833,55832,55834,55835,55836,55837,55839,55838,55840,55841,55843,55842,55845,55844,55846,55847,55849,55848,55850,55851,55852,55853,55855,55854,55857,55856,55858,55859,55860,55861,55863,55862,55864,55865,55867,55866,55869,55868,55870,55871,55872,55873,55875,55874,55877,55876,55878,55879,55881,55880,55882,55883,55884,55885,55887,55886,55889,55888,55890,55891,55892,55893,55895,55894,55896,55897,55899,55898,55901,55900,55902,55903,55905,55904,55906,55907,55908,55909,55911,55910,55912,55913,55915,55914,55917,55916,55918,55919,55920,55921,55923,55922,55925,55924,55926,55927,55929,55928,55930,55931,55932,55933,55935,55934,55936,55937,55939,55938,55941,55940,55942,55943,55945,55944,55946,55947,55948,55949,55951,55950,55953,55952,55954,55955,55956,55957,55959,55958,55960,55961,55963,55962,55965,55964,55966,55967,55969,55968,55970,55971,55972,55973,55975,55974,55976,55977,55979,55978,55981,55980,55982,55983,55984,55985,55987,55986,55989,55988,55990,55991,55993,55992,55994,55995,55996,55997,55999,55998,56001,56000,56002,56003,56004,56005,56007,56006,56008,56009,56011,56010,56013,56012,56014,56015,56016,56017,56019,56018,56021,56020,56022,56023,56025,56024,56026,56027,56028,56029,56031,56030,56032,56033,56035,56034,56037,56036,56038,56039,56041,56040,56042,56043,56044,56045,56047,56046,56049,56048,56050,56051,56052,56053,56055,56054,56056,56057,56059,56058,56061,56060,56062,56063,56064,56065,56067,56066,56069,56068,56070,56071,56073,56072,56074,56075,56076,56077,56079,56078,56081,56080,56082,56083,56084,56085,56087,56086,56088,56089,56091,56090,56093,56092,56094,56095,56097,56096,56098,56099,56100,56101,56103,56102,56104,56105,56107,56106,56109,56108,56110,56111,56112,56113,56115,56114,56117,56116,56118,56119,56121,56120,56122,56123,56124,56125,56127,56126,56129,56128,56130,56131,56132,56133,56135,56134,56136,56137,56139,56138,56141,56140,56142,56143,56144,56145,56147,56146,56149,56148,56150,56151,56153,56152,56154,56155,56156,56157,56159,56158,56160,56161,56163,56162,56165,56164,56166,56167,56169,56168,56170,56171,56172,56173,56175,56174,56177,56176,56178,56179,56180,56181,56183,56182,56184,56185,56187,56186,56189,56188,56190,56191,56193,56192,56194,56195,56196,56197,56199,56198,56200,56201,56203,56202,56205,56204,56206,56207,56208,56209,56211,56210,56213,56212,56214,56215,56217,56216,56218,56219,56220,56221,56223,56222,56224,56225,56227,56226,56229,56228,56230,56231,56233,56232,56234,56235,56236,56237,56239,56238,56241,56240,56242,56243,56244,56245,56247,56246,56248,56249,56251,56250,56253,56252,56254,56255,56256,56257,56259,56258,56261,56260,56262,56263,56265,56264,56266,56267,56268,56269,56271,56270,56273,56272,56274,56275,56276,56277,56279,56278,56280,56281,56283,56282,56285,56284,56286,56287,56289,56288,56290,56291,56292,56293,56295,56294,56296,56297,56299,56298,56301,56300,56302,56303,56304,56305,56307,56306,56309,56308,56310,56311,56313,56312,56314,56315,56316,56317,56319,56318,56321,56320,56322,56323,56324,56325,56327,56326,56328,56329,56331,56330,56333,56332,56334,56335,56336,56337,56339,56338,56341,56340,56342,56343,56345,56344,56346,56347,56348,56349,56351,56350,56352,56353,56355,56354,56357,56356,56358,56359,56361,56360,56362,56363,56364,56365,56367,56366,56369,56368,56370,56371,56372,56373,56375,56374,56376,56377,56379,56378,56381,56380,56382,56383,56384,56385,56387,56386,56389,56388,56390,56391,56393,56392,56394,56395,56396,56397,56399,56398,56401,56400,56402,56403,56404,56405,56407,56406,56408,56409,56411,56410,56413,56412,56414,56415,56417,56416,56418,56419,56420,56421,56423,56422,56424,56425,56427,56426,56429,56428,56430,56431,56432,56433,56435,56434,56437,56436,56438,56439,56441,56440,56442,56443,56444,56445,56447,56446,56448,56449,56451,56450,56453,56452,56454,56455,56457,56456,56458,56459,56460,56461,56463,56462,56465,56464,56466,56467,56468,56469,56471,56470,56472,56473,56475,56474,56477,56476,56478,56479,56481,56480,56482,56483,56484,56485,56487,56486,56488,56489,56491,56490,56493,56492,56494,56495,56496,56497,56499,56498,56501,56500,56502,56503,56505,56504,56506,56507,56508,56509,56511,56510,56513,56512,56514,56515,56516,56517,56519,56518,56520,56521,56523,56522,56525,56524,56526,56527,56528,56529,56531,56530,56533,56532,56534,56535,56537,56536,56538,56539,56540,56541,56543,56542,56544,56545,56547,56546,56549,56548,56550,56551,56553,56552,56554,56555,56556,56557,56559,56558,56561,56560,56562,56563,56564,56565,56567,56566,56568,56569,56571,56570,56573,56572,56574,56575,56576,56577,56579,56578,56581,56580,56582,56583,56585,56584,56586,56587,56588,56589,56591,56590,56593,56592,56594,56595,56596,56597,56599,56598,56600,56601,56603,56602,56605,56604,56606,56607,56609,56608,56610,56611,56612,56613,56615,56614,56616,56617,56619,56618,56621,56620,56622,56623,56624,56625,56627,56626,56629,56628,56630,56631,56633,56632,56634,56635,56636,56637,56639,56638,56641,56640,56642,56643,56644,56645,56647,56646,56648,56649,56651,56650,56653,56652,56654,56655,56656,56657,56659,56658,56661,56660,56662,56663,56665,56664,56666,56667,56668,56669,56671,56670,56672,56673,56675,56674,56677,56676,56678,56679,56681,56680,56682,56683,56684,56685,56687,56686,56689,56688,56690,56691,56692,56693,56695,56694,56696,56697,56699,56698,56701,56700,56702,56703,56705,56704,56706,56707,56708,56709,56711,56710,56712,56713,56715,56714,56717,56716,56718,56719,56720,56721,56723,56722,56725,56724,56726,56727,56729,56728,56730,56731,56732,56733,56735,56734,56736,56737,56739,56738,56741,56740,56742,56743,56745,56744,56746,56747,56748,56749,56751,56750,56753,56752,56754,56755,56756,56757,56759,56758,56760,56761,56763,56762,56765,56764,56766,56767,56768,56769,56771,56770,56773,56772,56774,56775,56777,56776,56778,56779,56780,56781,56783,56782,56785,56784,56786,56787,56788,56789,56791,56790,56792,56793,56795,56794,56797,56796,56798,56799,56801,56800,56802,56803,56804,56805,56807,56806,56808,56809,56811,56810,56813,56812,56814,56815,56816,56817,56819,56818,56821,56820,56822,56823,56825,56824,56826,56827,56828,56829,56831,56830,56832,56833,56835,56834,56837,56836,56838,56839,56841,56840,56842,56843,56844,56845,56847,56846,56849,56848,56850,56851,56852,56853,56855,56854,56856,56857,56859,56858,56861,56860,56862,56863,56865,56864,56866,56867,56868,56869,56871,56870,56872,56873,56875,56874,56877,56876,56878,56879,56880,56881,56883,56882,56885,56884,56886,56887,56889,56888,56890,56891,56892,56893,56895,56894,56897,56896,56898,56899,56900,56901,56903,56902,56904,56905,56907,56906,56909,56908,56910,56911,56912,56913,56915,56914,56917,56916,56918,56919,56921,56920,56922,56923,56924,56925,56927,56926,56928,56929,56931,56930,56933,56932,56934,56935,56937,56936,56938,56939,56940,56941,56943,56942,56945,56944,56946,56947,56948,56949,56951,56950,56952,56953,56955,56954,56957,56956,56958,56959,56961,56960,56962,56963,56964,56965,56967,56966,56968,56969,56971,56970,56973,56972,56974,56975,56976,56977,56979,56978,56981,56980,56982,56983,56985,56984,56986,56987,56988,56989,56991,56990,56992,56993,56995,56994,56997,56996,56998,56999,57001,57000,57002,57003,57004,57005,57007,57006,57009,57008,57010,57011,57012,57013,57015,57014,57016,57017,57019,57018,57021,57020,57022,57023,57024,57025,57027,57026,57029,57028,57030,57031,57033,57032,57034,57035,57036,57037,57039,57038,57041,57040,57042,57043,57044,57045,57047,57046,57048,57049,57051,57050,57053,57052,57054,57055,57057,57056,57058,57059,57060,57061,57063,57062,57064,57065,57067,57066,57069,57068,57070,57071,57072,57073,57075,57074,57077,57076,57078,57079,57081,57080,57082,57083,57084,57085,57087,57086,57089,57088,57090,57091,57092,57093,57095,57094,57096,57097,57099,57098,57101,57100,57102,57103,57104,57105,57107,57106,57109,57108,57110,57111,57113,57112,57114,57115,57116,57117,57119,57118,57120,57121,57123,57122,57125,57124,57126,57127,57129,57128,57130,57131,57132,57133,57135,57134,57137,57136,57138,57139,57140,57141,57143,57142,57144,57145,57147,57146,57149,57148,57150,57151,57152,57153,57155,57154,57157,57156,57158,57159,57161,57160,57162,57163,57164,57165,57167,57166,57169,57168,57170,57171,57172,57173,57175,57174,57176,57177,57179,57178,57181,57180,57182,57183,57185,57184,57186,57187,57188,57189,57191,57190,57192,57193,57195,57194,57197,57196,57198,57199,57200,57201,57203,57202,57205,57204,57206,57207,57209,57208,57210,57211,57212,57213,57215,57214,57216,57217,57219,57218,57221,57220,57222,57223,57225,57224,57226,57227,57228,57229,57231,57230,57233,57232,57234,57235,57236,57237,57239,57238,57240,57241,57243,57242,57245,57244,57246,57247,57249,57248,57250,57251,57252,57253,57255,57254,57256,57257,57259,57258,57261,57260,57262,57263,57264,57265,57267,57266,57269,57268,57270,57271,57273,57272,57274,57275,57276,57277,57279,57278,57281,57280,57282,57283,57284,57285,57287,57286,57288,57289,57291,57290,57293,57292,57294,57295,57296,57297,57299,57298,57301,57300,57302,57303,57305,57304,57306,57307,57308,57309,57311,57310,57312,57313,57315,57314,57317,57316,57318,57319,57321,57320,57322,57323,57324,57325,57327,57326,57329,57328,57330,57331,57332,57333,57335,57334,57336,57337,57339,57338,57341,57340,57342,57343,57345,57344,57346,57347,57348,57349,57351,57350,57352,57353,57355,57354,57357,57356,57358,57359,57360,57361,57363,57362,57365,57364,57366,57367,57369,57368,57370,57371,57372,57373,57375,57374,57376,57377,57379,57378,57381,57380,57382,57383,57385,57384,57386,57387,57388,57389,57391,57390,57393,57392,57394,57395,57396,57397,57399,57398,57400,57401,57403,57402,57405,57404,57406,57407,57408,57409,57411,57410,57413,57412,57414,57415,57417,57416,57418,57419,57420,57421,57423,57422,57425,57424,57426,57427,57428,57429,57431,57430,57432,57433,57435,57434,57437,57436,57438,57439,57441,57440,57442,57443,57444,57445,57447,57446,57448,57449,57451,57450,57453,57452,57454,57455,57456,57457,57459,57458,57461,57460,57462,57463,57465,57464,57466,57467,57468,57469,57471,57470,57472,57473,57475,57474,57477,57476,57478,57479,57481,57480,57482,57483,57484,57485,57487,57486,57489,57488,57490,57491,57492,57493,57495,57494,57496,57497,57499,57498,57501,57500,57502,57503,57505,57504,57506,57507,57508,57509,57511,57510,57512,57513,57515,57514,57517,57516,57518,57519,57520,57521,57523,57522,57525,57524,57526,57527,57529,57528,57530,57531,57532,57533,57535,57534,57537,57536,57538,57539,57540,57541,57543,57542,57544,57545,57547,57546,57549,57548,57550,57551,57552,57553,57555,57554,57557,57556,57558,57559,57561,57560,57562,57563,57564,57565,57567,57566,57568,57569,57571,57570,57573,57572,57574,57575,57577,57576,57578,57579,57580,57581,57583,57582,57585,57584,57586,57587,57588,57589,57591,57590,57592,57593,57595,57594,57597,57596,57598,57599,57600,57601,57603,57602,57605,57604,57606,57607,57609,57608,57610,57611,57612,57613,57615,57614,57617,57616,57618,57619,57620,57621,57623,57622,57624,57625,57627,57626,57629,57628,57630,57631,57633,57632,57634,57635,57636,57637,57639,57638,57640,57641,57643,57642,57645,57644,57646,57647,57648,57649,57651,57650,57653,57652,57654,57655,57657,57656,57658,57659,57660,57661,57663,57662,57665,57664,57666,57667,57668,57669,57671,57670,57672,57673,57675,57674,57677,57676,57678,57679,57680,57681,57683,57682,57685,57684,57686,57687,57689,57688,57690,57691,57692,57693,57695,57694,57696,57697,57699,57698,57701,57700,57702,57703,57705,57704,57706,57707,57708,57709,57711,57710,57713,57712,57714,57715,57716,57717,57719,57718,57720,57721,57723,57722,57725,57724,57726,57727,57729,57728,57730,57731,57732,57733,57735,57734,57736,57737,57739,57738,57741,57740,57742,57743,57744,57745,57747,57746,57749,57748,57750,57751,57753,57752,57754,57755,57756,57757,57759,57758,57760,57761,57763,57762,57765,57764,57766,57767,57769,57768,57770,57771,57772,57773,57775,57774,57777,57776,57778,57779,57780,57781,57783,57782,57784,57785,57787,57786,57789,57788,57790,57791,57792,57793,57795,57794,57797,57796,57798,57799,57801,57800,57802,57803,57804,57805,57807,57806,57809,57808,57810,57811,57812,57813,57815,57814,57816,57817,57819,57818,57821,57820,57822,57823,57825,57824,57826,57827,57828,57829,57831,57830,57832,57833,57835,57834,57837,57836,57838,57839,57840,57841,57843,57842,57845,57844,57846,57847,57849,57848,57850,57851,57852,57853,57855,57854,57856,57857,57859,57858,57861,57860,57862,57863,57865,57864,57866,57867,57868,57869,57871,57870,57873,57872,57874,57875,57876,57877,57879,57878,57880,57881,57883,57882,57885,57884,57886,57887,57889,57888,57890,57891,57892,57893,57895,57894,57896,57897,57899,57898,57901,57900,57902,57903,57904,57905,57907,57906,57909,57908,57910,57911,57913,57912,57914,57915,57916,57917,57919,57918,57921,57920,57922,57923,57924,57925,57927,57926,57928,57929,57931,57930,57933,57932,57934,57935,57936,57937,57939,57938,57941,57940,57942,57943,57945,57944,57946,57947,57948,57949,57951,57950,57952,57953,57955,57954,57957,57956,57958,57959,57961,57960,57962,57963,57964,57965,57967,57966,57969,57968,57970,57971,57972,57973,57975,57974,57976,57977,57979,57978,57981,57980,57982,57983,57985,57984,57986,57987,57988,57989,57991,57990,57992,57993,57995,57994,57997,57996,57998,57999,58000,58001,58003,58002,58005,58004,58006,58007,58009,58008,58010,58011,58012,58013,58015,58014,58016,58017,58019,58018,58021,58020,58022,58023,58025,58024,58026,58027,58028,58029,58031,58030,58033,58032,58034,58035,58036,58037,58039,58038,58040,58041,58043,58042,58045,58044,58046,58047,58048,58049,58051,58050,58053,58052,58054,58055,58057,58056,58058,58059,58060,58061,58063,58062,58065,58064,58066,58067,58068,58069,58071,58070,58072,58073,58075,58074,58077,58076,58078,58079,58081,58080,58082,58083,58084,58085,58087,58086,58088,58089,58091,58090,58093,58092,58094,58095,58096,58097,58099,58098,58101,58100,58102,58103,58105,58104,58106,58107,58108,58109,58111,58110,58113,58112,58114,58115,58116,58117,58119,58118,58120,58121,58123,58122,58125,58124,58126,58127,58128,58129,58131,58130,58133,58132,58134,58135,58137,58136,58138,58139,58140,58141,58143,58142,58144,58145,58147,58146,58149,58148,58150,58151,58153,58152,58154,58155,58156,58157,58159,58158,58161,58160,58162,58163,58164,58165,58167,58166,58168,58169,58171,58170,58173,58172,58174,58175,58176,58177,58179,58178,58181,58180,58182,58183,58185,58184,58186,58187,58188,58189,58191,58190,58193,58192,58194,58195,58196,58197,58199,58198,58200,58201,58203,58202,58205,58204,58206,58207,58209,58208,58210,58211,58212,58213,58215,58214,58216,58217,58219,58218,58221,58220,58222,58223,58224,58225,58227,58226,58229,58228,58230,58231,58233,58232,58234,58235,58236,58237,58239,58238,58240,58241,58243,58242,58245,58244,58246,58247,58249,58248,58250,58251,58252,58253,58255,58254,58257,58256,58258,58259,58260,58261,58263,58262,58264,58265,58267,58266,58269,58268,58270,58271,58273,58272,58274,58275,58276,58277,58279,58278,58280,58281,58283,58282,58285,58284,58286,58287,58288,58289,58291,58290,58293,58292,58294,58295,58297,58296,58298,58299,58300,58301,58303,58302,58305,58304,58306,58307,58308,58309,58311,58310,58312,58313,58315,58314,58317,58316,58318,58319,58320,58321,58323,58322,58325,58324,58326,58327,58329,58328,58330,58331,58332,58333,58335,58334,58336,58337,58339,58338,58341,58340,58342,58343,58345,58344,58346,58347,58348,58349,58351,58350,58353,58352,58354,58355,58356,58357,58359,58358,58360,58361,58363,58362,58365,58364,58366,58367,58368,58369,58371,58370,58373,58372,58374,58375,58377,58376,58378,58379,58380,58381,58383,58382,58385,58384,58386,58387,58388,58389,58391,58390,58392,58393,58395,58394,58397,58396,58398,58399,58401,58400,58402,58403,58404,58405,58407,58406,58408,58409,58411,58410,58413,58412,58414,58415,58416,58417,58419,58418,58421,58420,58422,58423,58425,58424,58426,58427,58428,58429,58431,58430,58433,58432,58434,58435,58436,58437,58439,58438,58440,58441,58443,58442,58445,58444,58446,58447,58448,58449,58451,58450,58453,58452,58454,58455,58457,58456,58458,58459,58460,58461,58463,58462,58464,58465,58467,58466,58469,58468,58470,58471,58473,58472,58474,58475,58476,58477,58479,58478,58481,58480,58482,58483,58484,58485,58487,58486,58488,58489,58491,58490,58493,58492,58494,58495,58497,58496,58498,58499,58500,58501,58503,58502,58504,58505,58507,58506,58509,58508,58510,58511,58512,58513,58515,58514,58517,58516,58518,58519,58521,58520,58522,58523,58524,58525,58527,58526,58528,58529,58531,58530,58533,58532,58534,58535,58537,58536,58538,58539,58540,58541,58543,58542,58545,58544,58546,58547,58548,58549,58551,58550,58552,58553,58555,58554,58557,58556,58558,58559,58560,58561,58563,58562,58565,58564,58566,58567,58569,58568,58570,58571,58572,58573,58575,58574,58577,58576,58578,58579,58580,58581,58583,58582,58584,58585,58587,58586,58589,58588,58590,58591,58593,58592,58594,58595,58596,58597,58599,58598,58600,58601,58603,58602,58605,58604,58606,58607,58608,58609,58611,58610,58613,58612,58614,58615,58617,58616,58618,58619,58620,58621,58623,58622,58625,58624,58626,58627,58628,58629,58631,58630,58632,58633,58635,58634,58637,58636,58638,58639,58640,58641,58643,58642,58645,58644,58646,58647,58649,58648,58650,58651,58652,58653,58655,58654,58656,58657,58659,58658,58661,58660,58662,58663,58665,58664,58666,58667,58668,58669,58671,58670,58673,58672,58674,58675,58676,58677,58679,58678,58680,58681,58683,58682,58685,58684,58686,58687,58688,58689,58691,58690,58693,58692,58694,58695,58697,58696,58698,58699,58700,58701,58703,58702,58705,58704,58706,58707,58708,58709,58711,58710,58712,58713,58715,58714,58717,58716,58718,58719,58721,58720,58722,58723,58724,58725,58727,58726,58728,58729,58731,58730,58733,58732,58734,58735,58736,58737,58739,58738,58741,58740,58742,58743,58745,58744,58746,58747,58748,58749,58751,58750,58752,58753,58755,58754,58757,58756,58758,58759,58761,58760,58762,58763,58764,58765,58767,58766,58769,58768,58770,58771,58772,58773,58775,58774,58776,58777,58779,58778,58781,58780,58782,58783,58785,58784,58786,58787,58788,58789,58791,58790,58792,58793,58795,58794,58797,58796,58798,58799,58800,58801,58803,58802,58805,58804,58806,58807,58809,58808,58810,58811,58812,58813,58815,58814,58817,58816,58818,58819,58820,58821,58823,58822,58824,58825,58827,58826,58829,58828,58830,58831,58832,58833,58835,58834,58837,58836,58838,58839,58841,58840,58842,58843,58844,58845,58847,58846,58848,58849,58851,58850,58853,58852,58854,58855,58857,58856,58858,58859,58860,58861,58863,58862,58865,58864,58866,58867,58868,58869,58871,58870,58872,58873,58875,58874,58877,58876,58878,58879,58881,58880,58882,58883,58884,58885,58887,58886,58888,58889,58891,58890,58893,58892,58894,58895,58896,58897,58899,58898,58901,58900,58902,58903,58905,58904,58906,58907,58908,58909,58911,58910,58912,58913,58915,58914,58917,58916,58918,58919,58921,58920,58922,58923,58924,58925,58927,58926,58929,58928,58930,58931,58932,58933,58935,58934,58936,58937,58939,58938,58941,58940,58942,58943,58944,58945,58947,58946,58949,58948,58950,58951,58953,58952,58954,58955,58956,58957,58959,58958,58961,58960,58962,58963,58964,58965,58967,58966,58968,58969,58971,58970,58973,58972,58974,58975,58977,58976,58978,58979,58980,58981,58983,58982,58984,58985,58987,58986,58989,58988,58990,58991,58992,58993,58995,58994,58997,58996,58998,58999,59001,59000,59002,59003,59004,59005,59007,59006,59008,59009,59011,59010,59013,59012,59014,59015,59017,59016,59018,59019,59020,59021,59023,59022,59025,59024,59026,59027,59028,59029,59031,59030,59032,59033,59035,59034,59037,59036,59038,59039,59041,59040,59042,59043,59044,59045,59047,59046,59048,59049,59051,59050,59053,59052,59054,59055,59056,59057,59059,59058,59061,59060,59062,59063,59065,59064,59066,59067,59068,59069,59071,59070,59073,59072,59074,59075,59076,59077,59079,59078,59080,59081,59083,59082,59085,59084,59086,59087,59088,59089,59091,59090,59093,59092,59094,59095,59097,59096,59098,59099,59100,59101,59103,59102,59104,59105,59107,59106,59109,59108,59110,59111,59113,59112,59114,59115,59116,59117,59119,59118,59121,59120,59122,59123,59124,59125,59127,59126,59128,59129,59131,59130,59133,59132,59134,59135,59136,59137,59139,59138,59141,59140,59142,59143,59145,59144,59146,59147,59148,59149,59151,59150,59153,59152,59154,59155,59156,59157,59159,59158,59160,59161,59163,59162,59165,59164,59166,59167,59169,59168,59170,59171,59172,59173,59175,59174,59176,59177,59179,59178,59181,59180,59182,59183,59184,59185,59187,59186,59189,59188,59190,59191,59193,59192,59194,59195,59196,59197,59199,59198,59201,59200,59202,59203,59204,59205,59207,59206,59208,59209,59211,59210,59213,59212,59214,59215,59216,59217,59219,59218,59221,59220,59222,59223,59225,59224,59226,59227,59228,59229,59231,59230,59232,59233,59235,59234,59237,59236,59238,59239,59241,59240,59242,59243,59244,59245,59247,59246,59249,59248,59250,59251,59252,59253,59255,59254,59256,59257,59259,59258,59261,59260,59262,59263,59265,59264,59266,59267,59268,59269,59271,59270,59272,59273,59275,59274,59277,59276,59278,59279,59280,59281,59283,59282,59285,59284,59286,59287,59289,59288,59290,59291,59292,59293,59295,59294,59296,59297,59299,59298,59301,59300,59302,59303,59305,59304,59306,59307,59308,59309,59311,59310,59313,59312,59314,59315,59316,59317,59319,59318,59320,59321,59323,59322,59325,59324,59326,59327,59328,59329,59331,59330,59333,59332,59334,59335,59337,59336,59338,59339,59340,59341,59343,59342,59345,59344,59346,59347,59348,59349,59351,59350,59352,59353,59355,59354,59357,59356,59358,59359,59361,59360,59362,59363,59364,59365,59367,59366,59368,59369,59371,59370,59373,59372,59374,59375,59376,59377,59379,59378,59381,59380,59382,59383,59385,59384,59386,59387,59388,59389,59391,59390,59392,59393,59395,59394,59397,59396,59398,59399,59401,59400,59402,59403,59404,59405,59407,59406,59409,59408,59410,59411,59412,59413,59415,59414,59416,59417,59419,59418,59421,59420,59422,59423,59425,59424,59426,59427,59428,59429,59431,59430,59432,59433,59435,59434,59437,59436,59438,59439,59440,59441,59443,59442,59445,59444,59446,59447,59449,59448,59450,59451,59452,59453,59455,59454,59457,59456,59458,59459,59460,59461,59463,59462,59464,59465,59467,59466,59469,59468,59470,59471,59472,59473,59475,59474,59477,59476,59478,59479,59481,59480,59482,59483,59484,59485,59487,59486,59488,59489,59491,59490,59493,59492,59494,59495,59497,59496,59498,59499,59500,59501,59503,59502,59505,59504,59506,59507,59508,59509,59511,59510,59512,59513,59515,59514,59517,59516,59518,59519,59521,59520,59522,59523,59524,59525,59527,59526,59528,59529,59531,59530,59533,59532,59534,59535,59536,59537,59539,59538,59541,59540,59542,59543,59545,59544,59546,59547,59548,59549,59551,59550,59552,59553,59555,59554,59557,59556,59558,59559,59561,59560,59562,59563,59564,59565,59567,59566,59569,59568,59570,59571,59572,59573,59575,59574,59576,59577,59579,59578,59581,59580,59582,59583,59584,59585,59587,59586,59589,59588,59590,59591,59593,59592,59594,59595,59596,59597,59599,59598,59601,59600,59602,59603,59604,59605,59607,59606,59608,59609,59611,59610,59613,59612,59614,59615,59617,59616,59618,59619,59620,59621,59623,59622,59624,59625,59627,59626,59629,59628,59630,59631,59632,59633,59635,59634,59637,59636,59638,59639,59641,59640,59642,59643,59644,59645,59647,59646,59649,59648,59650,59651,59652,59653,59655,59654,59656,59657,59659,59658,59661,59660,59662,59663,59664,59665,59667,59666,59669,59668,59670,59671,59673,59672,59674,59675,59676,59677,59679,59678,59680,59681,59683,59682,59685,59684,59686,59687,59689,59688,59690,59691,59692,59693,59695,59694,59697,59696,59698,59699,59700,59701,59703,59702,59704,59705,59707,59706,59709,59708,59710,59711,59712,59713,59715,59714,59717,59716,59718,59719,59721,59720,59722,59723,59724,59725,59727,59726,59729,59728,59730,59731,59732,59733,59735,59734,59736,59737,59739,59738,59741,59740,59742,59743,59745,59744,59746,59747,59748,59749,59751,59750,59752,59753,59755,59754,59757,59756,59758,59759,59760,59761,59763,59762,59765,59764,59766,59767,59769,59768,59770,59771,59772,59773,59775,59774,59776,59777,59779,59778,59781,59780,59782,59783,59785,59784,59786,59787,59788,59789,59791,59790,59793,59792,59794,59795,59796,59797,59799,59798,59800,59801,59803,59802,59805,59804,59806,59807,59809,59808,59810,59811,59812,59813,59815,59814,59816,59817,59819,59818,59821,59820,59822,59823,59824,59825,59827,59826,59829,59828,59830,59831,59833,59832,59834,59835,59836,59837,59839,59838,59841,59840,59842,59843,59844,59845,59847,59846,59848,59849,59851,59850,59853,59852,59854,59855,59856,59857,59859,59858,59861,59860,59862,59863,59865,59864,59866,59867,59868,59869,59871,59870,59872,59873,59875,59874,59877,59876,59878,59879,59881,59880,59882,59883,59884,59885,59887,59886,59889,59888,59890,59891,59892,59893,59895,59894,59896,59897,59899,59898,59901,59900,59902,59903,59905,59904,59906,59907,59908,59909,59911,59910,59912,59913,59915,59914,59917,59916,59918,59919,59920,59921,59923,59922,59925,59924,59926,59927,59929,59928,59930,59931,59932,59933,59935,59934,59936,59937,59939,59938,59941,59940,59942,59943,59945,59944,59946,59947,59948,59949,59951,59950,59953,59952,59954,59955,59956,59957,59959,59958,59960,59961,59963,59962,59965,59964,59966,59967,59968,59969,59971,59970,59973,59972,59974,59975,59977,59976,59978,59979,59980,59981,59983,59982,59985,59984,59986,59987,59988,59989,59991,59990,59992,59993,59995,59994,59997,59996,59998,59999,60001,60000,60002,60003,60004,60005,60007,60006,60008,60009,60011,60010,60013,60012,60014,60015,60016,60017,60019,60018,60021,60020,60022,60023,60025,60024,60026,60027,60028,60029,60031,60030,60032,60033,60035,60034,60037,60036,60038,60039,60041,60040,60042,60043,60044,60045,60047,60046,60049,60048,60050,60051,60052,60053,60055,60054,60056,60057,60059,60058,60061,60060,60062,60063,60065,60064,60066,60067,60068,60069,60071,60070,60072,60073,60075,60074,60077,60076,60078,60079,60080,60081,60083,60082,60085,60084,60086,60087,60089,60088,60090,60091,60092,60093,60095,60094,60097,60096,60098,60099,60100,60101,60103,60102,60104,60105,60107,60106,60109,60108,60110,60111,60112,60113,60115,60114,60117,60116,60118,60119,60121,60120,60122,60123,60124,60125,60127,60126,60128,60129,60131,60130,60133,60132,60134,60135,60137,60136,60138,60139,60140,60141,60143,60142,60145,60144,60146,60147,60148,60149,60151,60150,60152,60153,60155,60154,60157,60156,60158,60159,60160,60161,60163,60162,60165,60164,60166,60167,60169,60168,60170,60171,60172,60173,60175,60174,60177,60176,60178,60179,60180,60181,60183,60182,60184,60185,60187,60186,60189,60188,60190,60191,60193,60192,60194,60195,60196,60197,60199,60198,60200,60201,60203,60202,60205,60204,60206,60207,60208,60209,60211,60210,60213,60212,60214,60215,60217,60216,60218,60219,60220,60221,60223,60222,60225,60224,60226,60227,60228,60229,60231,60230,60232,60233,60235,60234,60237,60236,60238,60239,60240,60241,60243,60242,60245,60244,60246,60247,60249,60248,60250,60251,60252,60253,60255,60254,60256,60257,60259,60258,60261,60260,60262,60263,60265,60264,60266,60267,60268,60269,60271,60270,60273,60272,60274,60275,60276,60277,60279,60278,60280,60281,60283,60282,60285,60284,60286,60287,60289,60288,60290,60291,60292,60293,60295,60294,60296,60297,60299,60298,60301,60300,60302,60303,60304,60305,60307,60306,60309,60308,60310,60311,60313,60312,60314,60315,60316,60317,60319,60318,60320,60321,60323,60322,60325,60324,60326,60327,60329,60328,60330,60331,60332,60333,60335,60334,60337,60336,60338,60339,60340,60341,60343,60342,60344,60345,60347,60346,60349,60348,60350,60351,60352,60353,60355,60354,60357,60356,60358,60359,60361,60360,60362,60363,60364,60365,60367,60366,60369,60368,60370,60371,60372,60373,60375,60374,60376,60377,60379,60378,60381,60380,60382,60383,60385,60384,60386,60387,60388,60389,60391,60390,60392,60393,60395,60394,60397,60396,60398,60399,60400,60401,60403,60402,60405,60404,60406,60407,60409,60408,60410,60411,60412,60413,60415,60414,60417,60416,60418,60419,60420,60421,60423,60422,60424,60425,60427,60426,60429,60428,60430,60431,60432,60433,60435,60434,60437,60436,60438,60439,60441,60440,60442,60443,60444,60445,60447,60446,60448,60449,60451,60450,60453,60452,60454,60455,60457,60456,60458,60459,60460,60461,60463,60462,60465,60464,60466,60467,60468,60469,60471,60470,60472,60473,60475,60474,60477,60476,60478,60479,60480,60481,60483,60482,60485,60484,60486,60487,60489,60488,60490,60491,60492,60493,60495,60494,60497,60496,60498,60499,60500,60501,60503,60502,60504,60505,60507,60506,60509,60508,60510,60511,60513,60512,60514,60515,60516,60517,60519,60518,60520,60521,60523,60522,60525,60524,60526,60527,60528,60529,60531,60530,60533,60532,60534,60535,60537,60536,60538,60539,60540,60541,60543,60542,60544,60545,60547,60546,60549,60548,60550,60551,60553,60552,60554,60555,60556,60557,60559,60558,60561,60560,60562,60563,60564,60565,60567,60566,60568,60569,60571,60570,60573,60572,60574,60575,60577,60576,60578,60579,60580,60581,60583,60582,60584,60585,60587,60586,60589,60588,60590,60591,60592,60593,60595,60594,60597,60596,60598,60599,60601,60600,60602,60603,60604,60605,60607,60606,60609,60608,60610,60611,60612,60613,60615,60614,60616,60617,60619,60618,60621,60620,60622,60623,60624,60625,60627,60626,60629,60628,60630,60631,60633,60632,60634,60635,60636,60637,60639,60638,60640,60641,60643,60642,60645,60644,60646,60647,60649,60648,60650,60651,60652,60653,60655,60654,60657,60656,60658,60659,60660,60661,60663,60662,60664,60665,60667,60666,60669,60668,60670,60671,60672,60673,60675,60674,60677,60676,60678,60679,60681,60680,60682,60683,60684,60685,60687,60686,60689,60688,60690,60691,60692,60693,60695,60694,60696,60697,60699,60698,60701,60700,60702,60703,60705,60704,60706,60707,60708,60709,60711,60710,60712,60713,60715,60714,60717,60716,60718,60719,60720,60721,60723,60722,60725,60724,60726,60727,60729,60728,60730,60731,60732,60733,60735,60734,60737,60736,60738,60739,60740,60741,60743,60742,60744,60745,60747,60746,60749,60748,60750,60751,60752,60753,60755,60754,60757,60756,60758,60759,60761,60760,60762,60763,60764,60765,60767,60766,60768,60769,60771,60770,60773,60772,60774,60775,60777,60776,60778,60779,60780,60781,60783,60782,60785,60784,60786,60787,60788,60789,60791,60790,60792,60793,60795,60794,60797,60796,60798,60799,60801,60800,60802,60803,60804,60805,60807,60806,60808,60809,60811,60810,60813,60812,60814,60815,60816,60817,60819,60818,60821,60820,60822,60823,60825,60824,60826,60827,60828,60829,60831,60830,60832,60833,60835,60834,60837,60836,60838,60839,60841,60840,60842,60843,60844,60845,60847,60846,60849,60848,60850,60851,60852,60853,60855,60854,60856,60857,60859,60858,60861,60860,60862,60863,60864,60865,60867,60866,60869,60868,60870,60871,60873,60872,60874,60875,60876,60877,60879,60878,60881,60880,60882,60883,60884,60885,60887,60886,60888,60889,60891,60890,60893,60892,60894,60895,60897,60896,60898,60899,60900,60901,60903,60902,60904,60905,60907,60906,60909,60908,60910,60911,60912,60913,60915,60914,60917,60916,60918,60919,60921,60920,60922,60923,60924,60925,60927,60926,60928,60929,60931,60930,60933,60932,60934,60935,60937,60936,60938,60939,60940,60941,60943,60942,60945,60944,60946,60947,60948,60949,60951,60950,60952,60953,60955,60954,60957,60956,60958,60959,60961,60960,60962,60963,60964,60965,60967,60966,60968,60969,60971,60970,60973,60972,60974,60975,60976,60977,60979,60978,60981,60980,60982,60983,60985,60984,60986,60987,60988,60989,60991,60990,60993,60992,60994,60995,60996,60997,60999,60998,61000,61001,61003,61002,61005,61004,61006,61007,61008,61009,61011,61010,61013,61012,61014,61015,61017,61016,61018,61019,61020,61021,61023,61022,61024,61025,61027,61026,61029,61028,61030,61031,61033,61032,61034,61035,61036,61037,61039,61038,61041,61040,61042,61043,61044,61045,61047,61046,61048,61049,61051,61050,61053,61052,61054,61055,61057,61056,61058,61059,61060,61061,61063,61062,61064,61065,61067,61066,61069,61068,61070,61071,61072,61073,61075,61074,61077,61076,61078,61079,61081,61080,61082,61083,61084,61085,61087,61086,61088,61089,61091,61090,61093,61092,61094,61095,61097,61096,61098,61099,61100,61101,61103,61102,61105,61104,61106,61107,61108,61109,61111,61110,61112,61113,61115,61114,61117,61116,61118,61119,61120,61121,61123,61122,61125,61124,61126,61127,61129,61128,61130,61131,61132,61133,61135,61134,61137,61136,61138,61139,61140,61141,61143,61142,61144,61145,61147,61146,61149,61148,61150,61151,61153,61152,61154,61155,61156,61157,61159,61158,61160,61161,61163,61162,61165,61164,61166,61167,61168,61169,61171,61170,61173,61172,61174,61175,61177,61176,61178,61179,61180,61181,61183,61182,61185,61184,61186,61187,61188,61189,61191,61190,61192,61193,61195,61194,61197,61196,61198,61199,61200,61201,61203,61202,61205,61204,61206,61207,61209,61208,61210,61211,61212,61213,61215,61214,61216,61217,61219,61218,61221,61220,61222,61223,61225,61224,61226,61227,61228,61229,61231,61230,61233,61232,61234,61235,61236,61237,61239,61238,61240,61241,61243,61242,61245,61244,61246,61247,61248,61249,61251,61250,61253,61252,61254,61255,61257,61256,61258,61259,61260,61261,61263,61262,61265,61264,61266,61267,61268,61269,61271,61270,61272,61273,61275,61274,61277,61276,61278,61279,61281,61280,61282,61283,61284,61285,61287,61286,61288,61289,61291,61290,61293,61292,61294,61295,61296,61297,61299,61298,61301,61300,61302,61303,61305,61304,61306,61307,61308,61309,61311,61310,61312,61313,61315,61314,61317,61316,61318,61319,61321,61320,61322,61323,61324,61325,61327,61326,61329,61328,61330,61331,61332,61333,61335,61334,61336,61337,61339,61338,61341,61340,61342,61343,61345,61344,61346,61347,61348,61349,61351,61350,61352,61353,61355,61354,61357,61356,61358,61359,61360,61361,61363,61362,61365,61364,61366,61367,61369,61368,61370,61371,61372,61373,61375,61374,61377,61376,61378,61379,61380,61381,61383,61382,61384,61385,61387,61386,61389,61388,61390,61391,61392,61393,61395,61394,61397,61396,61398,61399,61401,61400,61402,61403,61404,61405,61407,61406,61408,61409,61411,61410,61413,61412,61414,61415,61417,61416,61418,61419,61420,61421,61423,61422,61425,61424,61426,61427,61428,61429,61431,61430,61432,61433,61435,61434,61437,61436,61438,61439,61440,61441,61443,61442,61445,61444,61446,61447,61449,61448,61450,61451,61452,61453,61455,61454,61457,61456,61458,61459,61460,61461,61463,61462,61464,61465,61467,61466,61469,61468,61470,61471,61473,61472,61474,61475,61476,61477,61479,61478,61480,61481,61483,61482,61485,61484,61486,61487,61488,61489,61491,61490,61493,61492,61494,61495,61497,61496,61498,61499,61500,61501,61503,61502,61505,61504,61506,61507,61508,61509,61511,61510,61512,61513,61515,61514,61517,61516,61518,61519,61520,61521,61523,61522,61525,61524,61526,61527,61529,61528,61530,61531,61532,61533,61535,61534,61536,61537,61539,61538,61541,61540,61542,61543,61545,61544,61546,61547,61548,61549,61551,61550,61553,61552,61554,61555,61556,61557,61559,61558,61560,61561,61563,61562,61565,61564,61566,61567,61569,61568,61570,61571,61572,61573,61575,61574,61576,61577,61579,61578,61581,61580,61582,61583,61584,61585,61587,61586,61589,61588,61590,61591,61593,61592,61594,61595,61596,61597,61599,61598,61600,61601,61603,61602,61605,61604,61606,61607,61609,61608,61610,61611,61612,61613,61615,61614,61617,61616,61618,61619,61620,61621,61623,61622,61624,61625,61627,61626,61629,61628,61630,61631,61632,61633,61635,61634,61637,61636,61638,61639,61641,61640,61642,61643,61644,61645,61647,61646,61649,61648,61650,61651,61652,61653,61655,61654,61656,61657,61659,61658,61661,61660,61662,61663,61665,61664,61666,61667,61668,61669,61671,61670,61672,61673,61675,61674,61677,61676,61678,61679,61680,61681,61683,61682,61685,61684,61686,61687,61689,61688,61690,61691,61692,61693,61695,61694,61697,61696,61698,61699,61700,61701,61703,61702,61704,61705,61707,61706,61709,61708,61710,61711,61712,61713,61715,61714,61717,61716,61718,61719,61721,61720,61722,61723,61724,61725,61727,61726,61728,61729,61731,61730,61733,61732,61734,61735,61737,61736,61738,61739,61740,61741,61743,61742,61745,61744,61746,61747,61748,61749,61751,61750,61752,61753,61755,61754,61757,61756,61758,61759,61760,61761,61763,61762,61765,61764,61766,61767,61769,61768,61770,61771,61772,61773,61775,61774,61777,61776,61778,61779,61780,61781,61783,61782,61784,61785,61787,61786,61789,61788,61790,61791,61793,61792,61794,61795,61796,61797,61799,61798,61800,61801,61803,61802,61805,61804,61806,61807,61808,61809,61811,61810,61813,61812,61814,61815,61817,61816,61818,61819,61820,61821,61823,61822,61824,61825,61827,61826,61829,61828,61830,61831,61833,61832,61834,61835,61836,61837,61839,61838,61841,61840,61842,61843,61844,61845,61847,61846,61848,61849,61851,61850,61853,61852,61854,61855,61857,61856,61858,61859,61860,61861,61863,61862,61864,61865,61867,61866,61869,61868,61870,61871,61872,61873,61875,61874,61877,61876,61878,61879,61881,61880,61882,61883,61884,61885,61887,61886,61889,61888,61890,61891,61892,61893,61895,61894,61896,61897,61899,61898,61901,61900,61902,61903,61904,61905,61907,61906,61909,61908,61910,61911,61913,61912,61914,61915,61916,61917,61919,61918,61920,61921,61923,61922,61925,61924,61926,61927,61929,61928,61930,61931,61932,61933,61935,61934,61937,61936,61938,61939,61940,61941,61943,61942,61944,61945,61947,61946,61949,61948,61950,61951,61953,61952,61954,61955,61956,61957,61959,61958,61960,61961,61963,61962,61965,61964,61966,61967,61968,61969,61971,61970,61973,61972,61974,61975,61977,61976,61978,61979,61980,61981,61983,61982,61984,61985,61987,61986,61989,61988,61990,61991,61993,61992,61994,61995,61996,61997,61999,61998,62001,62000,62002,62003,62004,62005,62007,62006,62008,62009,62011,62010,62013,62012,62014,62015,62016,62017,62019,62018,62021,62020,62022,62023,62025,62024,62026,62027,62028,62029,62031,62030,62033,62032,62034,62035,62036,62037,62039,62038,62040,62041,62043,62042,62045,62044,62046,62047,62049,62048,62050,62051,62052,62053,62055,62054,62056,62057,62059,62058,62061,62060,62062,62063,62064,62065,62067,62066,62069,62068,62070,62071,62073,62072,62074,62075,62076,62077,62079,62078,62080,62081,62083,62082,62085,62084,62086,62087,62089,62088,62090,62091,62092,62093,62095,62094,62097,62096,62098,62099,62100,62101,62103,62102,62104,62105,62107,62106,62109,62108,62110,62111,62113,62112,62114,62115,62116,62117,62119,62118,62120,62121,62123,62122,62125,62124,62126,62127,62128,62129,62131,62130,62133,62132,62134,62135,62137,62136,62138,62139,62140,62141,62143,62142,62145,62144,62146,62147,62148,62149,62151,62150,62152,62153,62155,62154,62157,62156,62158,62159,62160,62161,62163,62162,62165,62164,62166,62167,62169,62168,62170,62171,62172,62173,62175,62174,62176,62177,62179,62178,62181,62180,62182,62183,62185,62184,62186,62187,62188,62189,62191,62190,62193,62192,62194,62195,62196,62197,62199,62198,62200,62201,62203,62202,62205,62204,62206,62207,62208,62209,62211,62210,62213,62212,62214,62215,62217,62216,62218,62219,62220,62221,62223,62222,62225,62224,62226,62227,62228,62229,62231,62230,62232,62233,62235,62234,62237,62236,62238,62239,62241,62240,62242,62243,62244,62245,62247,62246,62248,62249,62251,62250,62253,62252,62254,62255,62256,62257,62259,62258,62261,62260,62262,62263,62265,62264,62266,62267,62268,62269,62271,62270,62273,62272,62274,62275,62276,62277,62279,62278,62280,62281,62283,62282,62285,62284,62286,62287,62288,62289,62291,62290,62293,62292,62294,62295,62297,62296,62298,62299,62300,62301,62303,62302,62304,62305,62307,62306,62309,62308,62310,62311,62313,62312,62314,62315,62316,62317,62319,62318,62321,62320,62322,62323,62324,62325,62327,62326,62328,62329,62331,62330,62333,62332,62334,62335,62337,62336,62338,62339,62340,62341,62343,62342,62344,62345,62347,62346,62349,62348,62350,62351,62352,62353,62355,62354,62357,62356,62358,62359,62361,62360,62362,62363,62364,62365,62367,62366,62368,62369,62371,62370,62373,62372,62374,62375,62377,62376,62378,62379,62380,62381,62383,62382,62385,62384,62386,62387,62388,62389,62391,62390,62392,62393,62395,62394,62397,62396,62398,62399,62400,62401,62403,62402,62405,62404,62406,62407,62409,62408,62410,62411,62412,62413,62415,62414,62417,62416,62418,62419,62420,62421,62423,62422,62424,62425,62427,62426,62429,62428,62430,62431,62433,62432,62434,62435,62436,62437,62439,62438,62440,62441,62443,62442,62445,62444,62446,62447,62448,62449,62451,62450,62453,62452,62454,62455,62457,62456,62458,62459,62460,62461,62463,62462,62465,62464,62466,62467,62468,62469,62471,62470,62472,62473,62475,62474,62477,62476,62478,62479,62480,62481,62483,62482,62485,62484,62486,62487,62489,62488,62490,62491,62492,62493,62495,62494,62496,62497,62499,62498,62501,62500,62502,62503,62505,62504,62506,62507,62508,62509,62511,62510,62513,62512,62514,62515,62516,62517,62519,62518,62520,62521,62523,62522,62525,62524,62526,62527,62528,62529,62531,62530,62533,62532,62534,62535,62537,62536,62538,62539,62540,62541,62543,62542,62545,62544,62546,62547,62548,62549,62551,62550,62552,62553,62555,62554,62557,62556,62558,62559,62561,62560,62562,62563,62564,62565,62567,62566,62568,62569,62571,62570,62573,62572,62574,62575,62576,62577,62579,62578,62581,62580,62582,62583,62585,62584,62586,62587,62588,62589,62591,62590,62592,62593,62595,62594,62597,62596,62598,62599,62601,62600,62602,62603,62604,62605,62607,62606,62609,62608,62610,62611,62612,62613,62615,62614,62616,62617,62619,62618,62621,62620,62622,62623,62625,62624,62626,62627,62628,62629,62631,62630,62632,62633,62635,62634,62637,62636,62638,62639,62640,62641,62643,62642,62645,62644,62646,62647,62649,62648,62650,62651,62652,62653,62655,62654,62657,62656,62658,62659,62660,62661,62663,62662,62664,62665,62667,62666,62669,62668,62670,62671,62672,62673,62675,62674,62677,62676,62678,62679,62681,62680,62682,62683,62684,62685,62687,62686,62688,62689,62691,62690,62693,62692,62694,62695,62697,62696,62698,62699,62700,62701,62703,62702,62705,62704,62706,62707,62708,62709,62711,62710,62712,62713,62715,62714,62717,62716,62718,62719,62720,62721,62723,62722,62725,62724,62726,62727,62729,62728,62730,62731,62732,62733,62735,62734,62737,62736,62738,62739,62740,62741,62743,62742,62744,62745,62747,62746,62749,62748,62750,62751,62753,62752,62754,62755,62756,62757,62759,62758,62760,62761,62763,62762,62765,62764,62766,62767,62768,62769,62771,62770,62773,62772,62774,62775,62777,62776,62778,62779,62780,62781,62783,62782,62785,62784,62786,62787,62788,62789,62791,62790,62792,62793,62795,62794,62797,62796,62798,62799,62800,62801,62803,62802,62805,62804,62806,62807,62809,62808,62810,62811,62812,62813,62815,62814,62816,62817,62819,62818,62821,62820,62822,62823,62825,62824,62826,62827,62828,62829,62831,62830,62833,62832,62834,62835,62836,62837,62839,62838,62840,62841,62843,62842,62845,62844,62846,62847,62849,62848,62850,62851,62852,62853,62855,62854,62856,62857,62859,62858,62861,62860,62862,62863,62864,62865,62867,62866,62869,62868,62870,62871,62873,62872,62874,62875,62876,62877,62879,62878,62880,62881,62883,62882,62885,62884,62886,62887,62889,62888,62890,62891,62892,62893,62895,62894,62897,62896,62898,62899,62900,62901,62903,62902,62904,62905,62907,62906,62909,62908,62910,62911,62912,62913,62915,62914,62917,62916,62918,62919,62921,62920,62922,62923,62924,62925,62927,62926,62929,62928,62930,62931,62932,62933,62935,62934,62936,62937,62939,62938,62941,62940,62942,62943,62945,62944,62946,62947,62948,62949,62951,62950,62952,62953,62955,62954,62957,62956,62958,62959,62960,62961,62963,62962,62965,62964,62966,62967,62969,62968,62970,62971,62972,62973,62975,62974,62976,62977,62979,62978,62981,62980,62982,62983,62985,62984,62986,62987,62988,62989,62991,62990,62993,62992,62994,62995,62996,62997,62999,62998,63000,63001,63003,63002,63005,63004,63006,63007,63009,63008,63010,63011,63012,63013,63015,63014,63016,63017,63019,63018,63021,63020,63022,63023,63024,63025,63027,63026,63029,63028,63030,63031,63033,63032,63034,63035,63036,63037,63039,63038,63041,63040,63042,63043,63044,63045,63047,63046,63048,63049,63051,63050,63053,63052,63054,63055,63056,63057,63059,63058,63061,63060,63062,63063,63065,63064,63066,63067,63068,63069,63071,63070,63072,63073,63075,63074,63077,63076,63078,63079,63081,63080,63082,63083,63084,63085,63087,63086,63089,63088,63090,63091,63092,63093,63095,63094,63096,63097,63099,63098,63101,63100,63102,63103,63105,63104,63106,63107,63108,63109,63111,63110,63112,63113,63115,63114,63117,63116,63118,63119,63120,63121,63123,63122,63125,63124,63126,63127,63129,63128,63130,63131,63132,63133,63135,63134,63136,63137,63139,63138,63141,63140,63142,63143,63145,63144,63146,63147,63148,63149,63151,63150,63153,63152,63154,63155,63156,63157,63159,63158,63160,63161,63163,63162,63165,63164,63166,63167,63168,63169,63171,63170,63173,63172,63174,63175,63177,63176,63178,63179,63180,63181,63183,63182,63185,63184,63186,63187,63188,63189,63191,63190,63192,63193,63195,63194,63197,63196,63198,63199,63201,63200,63202,63203,63204,63205,63207,63206,63208,63209,63211,63210,63213,63212,63214,63215,63216,63217,63219,63218,63221,63220,63222,63223,63225,63224,63226,63227,63228,63229,63231,63230,63233,63232,63234,63235,63236,63237,63239,63238,63240,63241,63243,63242,63245,63244,63246,63247,63248,63249,63251,63250,63253,63252,63254,63255,63257,63256,63258,63259,63260,63261,63263,63262,63264,63265,63267,63266,63269,63268,63270,63271,63273,63272,63274,63275,63276,63277,63279,63278,63281,63280,63282,63283,63284,63285,63287,63286,63288,63289,63291,63290,63293,63292,63294,63295,63296,63297,63299,63298,63301,63300,63302,63303,63305,63304,63306,63307,63308,63309,63311,63310,63313,63312,63314,63315,63316,63317,63319,63318,63320,63321,63323,63322,63325,63324,63326,63327,63329,63328,63330,63331,63332,63333,63335,63334,63336,63337,63339,63338,63341,63340,63342,63343,63344,63345,63347,63346,63349,63348,63350,63351,63353,63352,63354,63355,63356,63357,63359,63358,63360,63361,63363,63362,63365,63364,63366,63367,63369,63368,63370,63371,63372,63373,63375,63374,63377,63376,63378,63379,63380,63381,63383,63382,63384,63385,63387,63386,63389,63388,63390,63391,63393,63392,63394,63395,63396,63397,63399,63398,63400,63401,63403,63402,63405,63404,63406,63407,63408,63409,63411,63410,63413,63412,63414,63415,63417,63416,63418,63419,63420,63421,63423,63422,63425,63424,63426,63427,63428,63429,63431,63430,63432,63433,63435,63434,63437,63436,63438,63439,63440,63441,63443,63442,63445,63444,63446,63447,63449,63448,63450,63451,63452,63453,63455,63454,63456,63457,63459,63458,63461,63460,63462,63463,63465,63464,63466,63467,63468,63469,63471,63470,63473,63472,63474,63475,63476,63477,63479,63478,63480,63481,63483,63482,63485,63484,63486,63487,63489,63488,63490,63491,63492,63493,63495,63494,63496,63497,63499,63498,63501,63500,63502,63503,63504,63505,63507,63506,63509,63508,63510,63511,63513,63512,63514,63515,63516,63517,63519,63518,63520,63521,63523,63522,63525,63524,63526,63527,63529,63528,63530,63531,63532,63533,63535,63534,63537,63536,63538,63539,63540,63541,63543,63542,63544,63545,63547,63546,63549,63548,63550,63551,63552,63553,63555,63554,63557,63556,63558,63559,63561,63560,63562,63563,63564,63565,63567,63566,63569,63568,63570,63571,63572,63573,63575,63574,63576,63577,63579,63578,63581,63580,63582,63583,63585,63584,63586,63587,63588,63589,63591,63590,63592,63593,63595,63594,63597,63596,63598,63599,63600,63601,63603,63602,63605,63604,63606,63607,63609,63608,63610,63611,63612,63613,63615,63614,63616,63617,63619,63618,63621,63620,63622,63623,63625,63624,63626,63627,63628,63629,63631,63630,63633,63632,63634,63635,63636,63637,63639,63638,63640,63641,63643,63642,63645,63644,63646,63647,63649,63648,63650,63651,63652,63653,63655,63654,63656,63657,63659,63658,63661,63660,63662,63663,63664,63665,63667,63666,63669,63668,63670,63671,63673,63672,63674,63675,63676,63677,63679,63678,63681,63680,63682,63683,63684,63685,63687,63686,63688,63689,63691,63690,63693,63692,63694,63695,63696,63697,63699,63698,63701,63700,63702,63703,63705,63704,63706,63707,63708,63709,63711,63710,63712,63713,63715,63714,63717,63716,63718,63719,63721,63720,63722,63723,63724,63725,63727,63726,63729,63728,63730,63731,63732,63733,63735,63734,63736,63737,63739,63738,63741,63740,63742,63743,63744,63745,63747,63746,63749,63748,63750,63751,63753,63752,63754,63755,63756,63757,63759,63758,63761,63760,63762,63763,63764,63765,63767,63766,63768,63769,63771,63770,63773,63772,63774,63775,63777,63776,63778,63779,63780,63781,63783,63782,63784,63785,63787,63786,63789,63788,63790,63791,63792,63793,63795,63794,63797,63796,63798,63799,63801,63800,63802,63803,63804,63805,63807,63806,63809,63808,63810,63811,63812,63813,63815,63814,63816,63817,63819,63818,63821,63820,63822,63823,63824,63825,63827,63826,63829,63828,63830,63831,63833,63832,63834,63835,63836,63837,63839,63838,63840,63841,63843,63842,63845,63844,63846,63847,63849,63848,63850,63851,63852,63853,63855,63854,63857,63856,63858,63859,63860,63861,63863,63862,63864,63865,63867,63866,63869,63868,63870,63871,63873,63872,63874,63875,63876,63877,63879,63878,63880,63881,63883,63882,63885,63884,63886,63887,63888,63889,63891,63890,63893,63892,63894,63895,63897,63896,63898,63899,63900,63901,63903,63902,63904,63905,63907,63906,63909,63908,63910,63911,63913,63912,63914,63915,63916,63917,63919,63918,63921,63920,63922,63923,63924,63925,63927,63926,63928,63929,63931,63930,63933,63932,63934,63935,63936,63937,63939,63938,63941,63940,63942,63943,63945,63944,63946,63947,63948,63949,63951,63950,63953,63952,63954,63955,63956,63957,63959,63958,63960,63961,63963,63962,63965,63964,63966,63967,63969,63968,63970,63971,63972,63973,63975,63974,63976,63977,63979,63978,63981,63980,63982,63983,63984,63985,63987,63986,63989,63988,63990,63991,63993,63992,63994,63995,63996,63997,63999,63998,64000,64001,64003,64002,64005,64004,64006,64007,64009,64008,64010,64011,64012,64013,64015,64014,64017,64016,64018,64019,64020,64021,64023,64022,64024,64025,64027,64026,64029,64028,64030,64031,64033,64032,64034,64035,64036,64037,64039,64038,64040,64041,64043,64042,64045,64044,64046,64047,64048,64049,64051,64050,64053,64052,64054,64055,64057,64056,64058,64059,64060,64061,64063,64062,64065,64064,64066,64067,64068,64069,64071,64070,64072,64073,64075,64074,64077,64076,64078,64079,64080,64081,64083,64082,64085,64084,64086,64087,64089,64088,64090,64091,64092,64093,64095,64094,64096,64097,64099,64098,64101,64100,64102,64103,64105,64104,64106,64107,64108,64109,64111,64110,64113,64112,64114,64115,64116,64117,64119,64118,64120,64121,64123,64122,64125,64124,64126,64127,64129,64128,64130,64131,64132,64133,64135,64134,64136,64137,64139,64138,64141,64140,64142,64143,64144,64145,64147,64146,64149,64148,64150,64151,64153,64152,64154,64155,64156,64157,64159,64158,64160,64161,64163,64162,64165,64164,64166,64167,64169,64168,64170,64171,64172,64173,64175,64174,64177,64176,64178,64179,64180,64181,64183,64182,64184,64185,64187,64186,64189,64188,64190,64191,64192,64193,64195,64194,64197,64196,64198,64199,64201,64200,64202,64203,64204,64205,64207,64206,64209,64208,64210,64211,64212,64213,64215,64214,64216,64217,64219,64218,64221,64220,64222,64223,64225,64224,64226,64227,64228,64229,64231,64230,64232,64233,64235,64234,64237,64236,64238,64239,64240,64241,64243,64242,64245,64244,64246,64247,64249,64248,64250,64251,64252,64253,64255,64254,64257,64256,64258,64259,64260,64261,64263,64262,64264,64265,64267,64266,64269,64268,64270,64271,64272,64273,64275,64274,64277,64276,64278,64279,64281,64280,64282,64283,64284,64285,64287,64286,64288,64289,64291,64290,64293,64292,64294,64295,64297,64296,64298,64299,64300,64301,64303,64302,64305,64304,64306,64307,64308,64309,64311,64310,64312,64313,64315,64314,64317,64316,64318,64319,64320,64321,64323,64322,64325,64324,64326,64327,64329,64328,64330,64331,64332,64333,64335,64334,64337,64336,64338,64339,64340,64341,64343,64342,64344,64345,64347,64346,64349,64348,64350,64351,64353,64352,64354,64355,64356,64357,64359,64358,64360,64361,64363,64362,64365,64364,64366,64367,64368,64369,64371,64370,64373,64372,64374,64375,64377,64376,64378,64379,64380,64381,64383,64382,64384,64385,64387,64386,64389,64388,64390,64391,64393,64392,64394,64395,64396,64397,64399,64398,64401,64400,64402,64403,64404,64405,64407,64406,64408,64409,64411,64410,64413,64412,64414,64415,64417,64416,64418,64419,64420,64421,64423,64422,64424,64425,64427,64426,64429,64428,64430,64431,64432,64433,64435,64434,64437,64436,64438,64439,64441,64440,64442,64443,64444,64445,64447,64446,64449,64448,64450,64451,64452,64453,64455,64454,64456,64457,64459,64458,64461,64460,64462,64463,64464,64465,64467,64466,64469,64468,64470,64471,64473,64472,64474,64475,64476,64477,64479,64478,64480,64481,64483,64482,64485,64484,64486,64487,64489,64488,64490,64491,64492,64493,64495,64494,64497,64496,64498,64499,64500,64501,64503,64502,64504,64505,64507,64506,64509,64508,64510,64511,64512,64513,64515,64514,64517,64516,64518,64519,64521,64520,64522,64523,64524,64525,64527,64526,64529,64528,64530,64531,64532,64533,64535,64534,64536,64537,64539,64538,64541,64540,64542,64543,64545,64544,64546,64547,64548,64549,64551,64550,64552,64553,64555,64554,64557,64556,64558,64559,64560,64561,64563,64562,64565,64564,64566,64567,64569,64568,64570,64571,64572,64573,64575,64574,64577,64576,64578,64579,64580,64581,64583,64582,64584,64585,64587,64586,64589,64588,64590,64591,64592,64593,64595,64594,64597,64596,64598,64599,64601,64600,64602,64603,64604,64605,64607,64606,64608,64609,64611,64610,64613,64612,64614,64615,64617,64616,64618,64619,64620,64621,64623,64622,64625,64624,64626,64627,64628,64629,64631,64630,64632,64633,64635,64634,64637,64636,64638,64639,64641,64640,64642,64643,64644,64645,64647,64646,64648,64649,64651,64650,64653,64652,64654,64655,64656,64657,64659,64658,64661,64660,64662,64663,64665,64664,64666,64667,64668,64669,64671,64670,64672,64673,64675,64674,64677,64676,64678,64679,64681,64680,64682,64683,64684,64685,64687,64686,64689,64688,64690,64691,64692,64693,64695,64694,64696,64697,64699,64698,64701,64700,64702,64703,64704,64705,64707,64706,64709,64708,64710,64711,64713,64712,64714,64715,64716,64717,64719,64718,64721,64720,64722,64723,64724,64725,64727,64726,64728,64729,64731,64730,64733,64732,64734,64735,64737,64736,64738,64739,64740,64741,64743,64742,64744,64745,64747,64746,64749,64748,64750,64751,64752,64753,64755,64754,64757,64756,64758,64759,64761,64760,64762,64763,64764,64765,64767,64766,64769,64768,64770,64771,64772,64773,64775,64774,64776,64777,64779,64778,64781,64780,64782,64783,64784,64785,64787,64786,64789,64788,64790,64791,64793,64792,64794,64795,64796,64797,64799,64798,64800,64801,64803,64802,64805,64804,64806,64807,64809,64808,64810,64811,64812,64813,64815,64814,64817,64816,64818,64819,64820,64821,64823,64822,64824,64825,64827,64826,64829,64828,64830,64831,64832,64833,64835,64834,64837,64836,64838,64839,64841,64840,64842,64843,64844,64845,64847,64846,64849,64848,64850,64851,64852,64853,64855,64854,64856,64857,64859,64858,64861,64860,64862,64863,64865,64864,64866,64867,64868,64869,64871,64870,64872,64873,64875,64874,64877,64876,64878,64879,64880,64881,64883,64882,64885,64884,64886,64887,64889,64888,64890,64891,64892,64893,64895,64894,64896,64897,64899,64898,64901,64900,64902,64903,64905,64904,64906,64907,64908,64909,64911,64910,64913,64912,64914,64915,64916,64917,64919,64918,64920,64921,64923,64922,64925,64924,64926,64927,64929,64928,64930,64931,64932,64933,64935,64934,64936,64937,64939,64938,64941,64940,64942,64943,64944,64945,64947,64946,64949,64948,64950,64951,64953,64952,64954,64955,64956,64957,64959,64958,64961,64960,64962,64963,64964,64965,64967,64966,64968,64969,64971,64970,64973,64972,64974,64975,64976,64977,64979,64978,64981,64980,64982,64983,64985,64984,64986,64987,64988,64989,64991,64990,64992,64993,64995,64994,64997,64996,64998,64999,65001,65000,65002,65003,65004,65005,65007,65006,65009,65008,65010,65011,65012,65013,65015,65014,65016,65017,65019,65018,65021,65020,65022,65023,65025,65024,65026,65027,65028,65029,65031,65030,65032,65033,65035,65034,65037,65036,65038,65039,65040,65041,65043,65042,65045,65044,65046,65047,65049,65048,65050,65051,65052,65053,65055,65054,65056,65057,65059,65058,65061,65060,65062,65063,65065,65064,65066,65067,65068,65069,65071,65070,65073,65072,65074,65075,65076,65077,65079,65078,65080,65081,65083,65082,65085,65084,65086,65087,65088,65089,65091,65090,65093,65092,65094,65095,65097,65096,65098,65099,65100,65101,65103,65102,65105,65104,65106,65107,65108,65109,65111,65110,65112,65113,65115,65114,65117,65116,65118,65119,65121,65120,65122,65123,65124,65125,65127,65126,65128,65129,65131,65130,65133,65132,65134,65135,65136,65137,65139,65138,65141,65140,65142,65143,65145,65144,65146,65147,65148,65149,65151,65150,65152,65153,65155,65154,65157,65156,65158,65159,65161,65160,65162,65163,65164,65165,65167,65166,65169,65168,65170,65171,65172,65173,65175,65174,65176,65177,65179,65178,65181,65180,65182,65183,65185,65184,65186,65187,65188,65189,65191,65190,65192,65193,65195,65194,65197,65196,65198,65199,65200,65201,65203,65202,65205,65204,65206,65207,65209,65208,65210,65211,65212,65213,65215,65214,65217,65216,65218,65219,65220,65221,65223,65222,65224,65225,65227,65226,65229,65228,65230,65231,65232,65233,65235,65234,65237,65236,65238,65239,65241,65240,65242,65243,65244,65245,65247,65246,65248,65249,65251,65250,65253,65252,65254,65255,65257,65256,65258,65259,65260,65261,65263,65262,65265,65264,65266,65267,65268,65269,65271,65270,65272,65273,65275,65274,65277,65276,65278,65279,65280,65281,65283,65282,65285,65284,65286,65287,65289,65288,65290,65291,65292,65293,65295,65294,65297,65296,65298,65299,65300,65301,65303,65302,65304,65305,65307,65306,65309,65308,65310,65311,65313,65312,65314,65315,65316,65317,65319,65318,65320,65321,65323,65322,65325,65324,65326,65327,65328,65329,65331,65330,65333,65332,65334,65335,65337,65336,65338,65339,65340,65341,65343,65342,65345,65344,65346,65347,65348,65349,65351,65350,65352,65353,65355,65354,65357,65356,65358,65359,65360,65361,65363,65362,65365,65364,65366,65367,65369,65368,65370,65371,65372,65373,65375,65374,65376,65377,65379,65378,65381,65380,65382,65383,65385,65384,65386,65387,65388,65389,65391,65390,65393,65392,65394,65395,65396,65397,65399,65398,65400,65401,65403,65402,65405,65404,65406,65407,65409,65408,65410,65411,65412,65413,65415,65414,65416,65417,65419,65418,65421,65420,65422,65423,65424,65425,65427,65426,65429,65428,65430,65431,65433,65432,65434,65435,65436,65437,65439,65438,65440,65441,65443,65442,65445,65444,65446,65447,65449,65448,65450,65451,65452,65453,65455,65454,65457,65456,65458,65459,65460,65461,65463,65462,65464,65465,65467,65466,65469,65468,65470,65471,65472,65473,65475,65474,65477,65476,65478,65479,65481,65480,65482,65483,65484,65485,65487,65486,65489,65488,65490,65491,65492,65493,65495,65494,65496,65497,65499,65498,65501,65500,65502,65503,65505,65504,65506,65507,65508,65509,65511,65510,65512,65513,65515,65514,65517,65516,65518,65519,65520,65521,65523,65522,65525,65524,65526,65527,65529,65528,65530,65531,65532,65533,65535,65534])
-arr_sgn=np.array([1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,-1,-1,1,-1,1,1,1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,-1,-1,1,-1,1,1,1,-1,1,1,1,1,1,1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,-1,1,1,1,1,1,1,-1,1,1,1,-1,1,-1,-1,-1,1,1,1,-1,1,-1,-1,-1,1,-1,-1,-1,-1,-1,-1,1])
+####################################################
+##             Vectorized index tables            ##
+####################################################
+
+# In the canonical encoder, bit k of an index is the occupation of the k-th Grassmann generator.
+# The tables below are computed for a whole range of indices at once with integer bit operations.
+
+def popcount(arr):
+    # the number of set bits of every element of a non-negative integer array (SWAR bit counting)
+    x = np.asarray(arr).astype(np.uint64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0f0f0f0f0f0f0f0f)
+    x = (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    return x.astype(int)
+
+def gparity_vector(d):
+    # gparity(i) for i = 0,1,...,d-1
+    return popcount(np.arange(d))
+
+def sgn_vector(d):
+    # sgn(i) for i = 0,1,...,d-1; (-1)**(p(p-1)/2) is -1 exactly when bit 1 of p is set
+    return 1-2*((gparity_vector(d) >> 1) & 1)
+
+def encoder_vector(d):
+    # encoder(i) for i = 0,1,...,d-1; the lowest bit is flipped when the other bits have odd parity
+    i = np.arange(d)
+    return i ^ (popcount(i >> 1) & 1)
+
+# the lookup tables of gparity, sgn and encoder, generated at import instead of stored as literals
+table_size = 2**16
+arr_gparity = gparity_vector(table_size)
+arr_sgn = sgn_vector(table_size)
+arr_encoder = encoder_vector(table_size)
 
 def to_bin_canonical(i,n):
     if(i>=2**n):
         print("error[to_bin_canonical]: n is too small.")
         exit()
-    ret = np.zeros([n],dtype=int)
-    num = i
-    for p in range(n):
-        ret[n-1-p] = math.floor(num*(2**(p-n+1)))
-        num = num - ret[n-1-p]*2**(n-1-p)
-    return ret;
+    return (i >> np.arange(n)) & 1
 
 def from_bin_canonical(vec):
     ret=0
@@ -23,13 +48,11 @@ def from_bin_canonical(vec):
     return ret
 
 def to_bin_parity_preserving(i,n):
-    for j in range(2**n):
-        v = to_bin_canonical(j,n)
-        I = from_bin_parity_preserving(v)
-        if(I==i):
-            return v
-    print("error[to_bin_parity_preserving]: cannot convert the decimal index to binary.")
-    exit()
+    # the encoder is an involution, so this is the canonical binary of encoder(i)
+    if(i>=2**n):
+        print("error[to_bin_parity_preserving]: cannot convert the decimal index to binary.")
+        exit()
+    return to_bin_canonical(encoder(i),n)
 
 def from_bin_parity_preserving(vec):
     condition = 0
@@ -47,16 +70,11 @@ def from_bin_parity_preserving(vec):
     return I
 
 def fn_gparity(i,n):
-    Ia = to_bin_canonical(i,n)
-    p = 0
-    for i in range(Ia.size):
-        p = p + Ia[i]
-    return p
+    return bin(i).count("1")
 
 def fn_sgn(i,n):
-    I = to_bin_canonical(i,n)
-    p = np.sum(I)
-    return (-1)**round(p*(p-1)/2)
+    p = fn_gparity(i,n)
+    return 1-2*((p >> 1) & 1)
 
 def gparity(i):
 	if i<arr_gparity.size :
@@ -76,9 +94,6 @@ def encoder(i):
 	if i<arr_encoder.size :
 		return arr_encoder[i]
 	else:
-		n = int(1+np.ceil(np.log2(i)))
-		binary = to_bin_canonical(i,n)
-		aki = from_bin_parity_preserving(binary)
-		return aki
+		return i ^ (fn_gparity(i >> 1,0) & 1)
 
 	
\ No newline at end of file
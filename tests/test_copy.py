@@ -0,0 +1,56 @@
+import numpy as np
+import grassmanntn as gtn
+
+def random_dense():
+    np.random.seed(0)
+    return gtn.random((4,4),(1,-1),dtype=float,skip_trimming=True)
+
+def test_dense_copy_then_write():
+    A = random_dense()
+    reference = A.data.copy()
+    B = A.copy()
+    B.data[0,0] = 5
+    assert np.array_equal(A.data,reference)
+    assert B.data[0,0] == 5
+
+def test_dense_copy_then_getitem_view():
+    A = random_dense()
+    reference = A.data.copy()
+    B = A.copy()
+    B[0][:] = 7
+    assert np.array_equal(A.data,reference)
+    assert np.all(B.data[0]==7)
+
+def test_dense_escaped_buffer_is_not_shared():
+    A = random_dense()
+    reference = A.data.copy()
+    d = A.data
+    B = A.copy()
+    d[1,1] = -1
+    assert A.data[1,1] == -1
+    assert np.array_equal(B.data,reference)
+
+def test_sparse_copy_isolation():
+    A = gtn.sparse(random_dense())
+    reference = A.data.todense()
+    d = A.data
+    B = A.copy()
+    d.data[:] = 0
+    assert np.array_equal(B.data.todense(),reference)
+    C = B.copy()
+    C.data.data[:] = 1
+    assert np.array_equal(B.data.todense(),reference)
+
+def test_block_copy_isolation():
+    np.random.seed(0)
+    A = gtn.random_block((4,4),(1,-1))
+    reference = A.todense().data.copy()
+    B = A.copy()
+    B.data[0,0][:] = 3
+    assert np.array_equal(A.todense().data,reference)
+
+    cell = A.data[1,1]
+    C = A.copy()
+    cell[:] = -2
+    assert np.array_equal(C.todense().data,reference)
+    assert np.all(A.data[1,1]==-2)
@@ -0,0 +1,56 @@
+import numpy as np
+import grassmanntn as gtn
+
+def diagonal_pair(statistics,encoder="canonical",format="standard"):
+    # the diagonal tensor and the same tensor built from the full matrix
+    vector = np.arange(1.0,9.0)
+    D = gtn.diagonal(vector,statistics,encoder=encoder,format=format)
+    M = gtn.dense(np.diag(vector),statistics=statistics,encoder=encoder,format=format)
+    return D, M
+
+def test_switches_match_full_matrix():
+    for statistics in [(1,-1),(-1,1),(1,1),(0,0)]:
+        for encoder in gtn.encoder_type:
+            for format in gtn.format_type:
+                D, M = diagonal_pair(statistics,encoder,format)
+                for new_encoder in gtn.encoder_type:
+                    for new_format in gtn.format_type:
+                        D2 = D.force_encoder(new_encoder).force_format(new_format)
+                        M2 = M.force_encoder(new_encoder).force_format(new_format)
+                        assert np.array_equal(D2.data,M2.data)
+
+def test_arithmetic_matches_full_matrix():
+    D, M = diagonal_pair((-1,1),format="matrix")
+    assert D.shape == M.shape and D.size == M.size and D.ndim == M.ndim
+    assert np.isclose(D.norm,M.norm)
+    assert np.array_equal((D*3).data,(M*3).data)
+    assert np.array_equal((D/2).data,(M/2).data)
+    assert np.allclose(gtn.power(D,2).data,gtn.power(M,2).data)
+    assert np.allclose(gtn.sqrt(D).data,gtn.sqrt(M).data)
+    E = D.copy()
+    assert E.is_diagonal and np.array_equal(E.data,M.data)
+    assert D.is_diagonal
+
+def test_einsum_matches_full_matrix():
+    np.random.seed(0)
+    A = gtn.random((8,4,4),(-1,1,-1),dtype=float)
+    B = gtn.random((4,8,4),(1,-1,-1),dtype=float)
+    C = gtn.random((4,8,4),(1,0,-1),dtype=float)
+    for format in gtn.format_type:
+        D, M = diagonal_pair((-1,1),format=format)
+        assert np.allclose(gtn.einsum("ij,jkl->ikl",D,A).data,gtn.einsum("ij,jkl->ikl",M,A).data)
+        assert np.allclose(gtn.einsum("kjl,ij->kil",B,D).data,gtn.einsum("kjl,ij->kil",B,M).data)
+        # the contraction only scales the other operand, so the diagonal is not expanded
+        assert D.is_diagonal
+        D, M = diagonal_pair((0,0),format=format)
+        assert np.allclose(gtn.einsum("ij,kjl->kil",D,C).data,gtn.einsum("ij,kjl->kil",M,C).data)
+
+def test_svd_keeps_diagonal():
+    np.random.seed(1)
+    A = gtn.random((8,8,8,8),(1,1,-1,-1),dtype=float)
+    U, S, V = A.svd("ij|kl",16)
+    assert S.is_diagonal
+    full_S = gtn.dense(S.data,statistics=S.statistics,encoder=S.encoder,format=S.format)
+    reference = gtn.einsum("ija,ab,bkl->ijkl",U,full_S,V)
+    U, S, V = A.svd("ij|kl",16)
+    assert np.allclose(gtn.einsum("ija,ab,bkl->ijkl",U,S,V).data,reference.data)
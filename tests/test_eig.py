@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+import grassmanntn as gtn
+
+def positive_matrix(seed,dtype=float):
+    # a 60x60 positive semi-definite matrix with the eigenvalues 1, 1/4, 1/16, ...
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((60,40))
+    if dtype == complex :
+        X = X + complex(0,1)*rng.standard_normal((60,40))
+    u, s, v = np.linalg.svd(X,full_matrices=False)
+    M = (u*0.5**np.arange(40))@v
+    return M@np.conjugate(M.T)
+
+@pytest.mark.parametrize("dtype",[float,complex])
+def test_full_matches_numpy(dtype):
+    M = positive_matrix(0,dtype)
+    U, Λ, cU = gtn.SortedEig(M,8,method="full")
+    reference = np.sort(np.linalg.eigvalsh(M))[::-1][:8]
+    assert np.allclose(Λ,reference)
+    assert np.allclose(cU,np.conjugate(U.T))
+
+@pytest.mark.parametrize("method",["partial","lanczos"])
+@pytest.mark.parametrize("dtype",[float,complex])
+def test_truncated_matches_full(method,dtype):
+    pytest.importorskip("scipy")
+    M = positive_matrix(0,dtype)
+    U0, Λ0, cU0 = gtn.SortedEig(M,8,method="full")
+    U, Λ, cU = gtn.SortedEig(M,8,method=method)
+    assert U.shape == U0.shape and cU.shape == cU0.shape
+    assert np.allclose(Λ,Λ0)
+    assert np.allclose((U*Λ)@cU,(U0*Λ0)@cU0)
+
+@pytest.mark.parametrize("method",["partial","lanczos"])
+def test_tensor_eig_matches_full(method):
+    pytest.importorskip("scipy")
+    np.random.seed(0)
+    C = gtn.random((8,8,8,8),(1,1,-1,-1),dtype=complex)
+    M = gtn.einsum("ijkl,klmn->ijmn",C.hconjugate("ij|kl"),C)
+    for Mx in (M,M.toblock()):
+        U0, S0, V0 = Mx.eig("ij|kl",8,method="full")
+        reference = gtn.einsum("ija,ab,bkl->ijkl",U0,S0,V0)
+        U, S, V = Mx.eig("ij|kl",8,method=method)
+        result = gtn.einsum("ija,ab,bkl->ijkl",U,S,V)
+        if type(Mx) == gtn.block :
+            reference, result = reference.todense(), result.todense()
+        assert np.allclose(result.data,reference.data)
@@ -0,0 +1,100 @@
+import numpy as np
+import grassmanntn as gtn
+
+def random_pair(seed):
+    np.random.seed(seed)
+    A = gtn.random((4,8,4),(1,-1,1),dtype=float)
+    B = gtn.random((4,8,4),(-1,1,-1),dtype=float)
+    return A, B
+
+def test_block_matches_dense():
+    A, B = random_pair(0)
+    for subscripts in ("ijk,kjl->il","ijk,klm->ijlm","ijk,kji"):
+        reference = gtn.einsum(subscripts,A,B)
+        result = gtn.einsum(subscripts,A.toblock(),B.toblock())
+        if np.isscalar(reference) :
+            assert np.isclose(result,reference)
+        else :
+            assert np.allclose(result.todense().data,reference.data)
+
+def test_block_zero_cells_follow_writes():
+    A, B = random_pair(1)
+    Ab, Bb = A.toblock(), B.toblock()
+    gtn.einsum("ijk,kjl->il",Ab,Bb)
+    Ab.data[0,0,0][:] = 0
+    result = gtn.einsum("ijk,kjl->il",Ab,Bb)
+    reference = gtn.einsum("ijk,kjl->il",Ab.todense(),B)
+    assert np.allclose(result.todense().data,reference.data)
+    assert (0,0,0) in gtn.zero_cells(Ab)[0]
+
+    # cells handed out through data can still be written after the next contraction
+    cells = Ab.data
+    gtn.einsum("ijk,kjl->il",Ab,Bb)
+    cells[0,0,0][:] = 1.0
+    result = gtn.einsum("ijk,kjl->il",Ab,Bb)
+    reference = gtn.einsum("ijk,kjl->il",Ab.todense(),B)
+    assert np.allclose(result.todense().data,reference.data)
+
+def sector_einsum(subscripts,*obj_list):
+    # force the parity-sector contraction regardless of the cost thresholds
+    settings = (gtn.parity_sector_min_intensity,gtn.parity_sector_min_cost)
+    gtn.parity_sector_min_intensity = 0
+    gtn.parity_sector_min_cost = 0
+    try:
+        return gtn.einsum(subscripts,*obj_list)
+    finally:
+        gtn.parity_sector_min_intensity, gtn.parity_sector_min_cost = settings
+
+def plain_einsum(subscripts,*obj_list):
+    gtn.parity_sector_enabled = False
+    try:
+        return gtn.einsum(subscripts,*obj_list)
+    finally:
+        gtn.parity_sector_enabled = True
+
+def test_sectors_follow_writes():
+    A, B = random_pair(2)
+    reference = plain_einsum("ijk,kjl->il",A,B)
+    assert np.allclose(sector_einsum("ijk,kjl->il",A,B).data,reference.data)
+    assert A.sector_cache is not None
+    assert np.allclose(sector_einsum("ijk,kjl->il",A,B).data,reference.data)
+
+    # an entry of odd total parity: the cached data must not be reused
+    A.data[1,0,0] = 1.0
+    reference = plain_einsum("ijk,kjl->il",A,B)
+    assert np.allclose(sector_einsum("ijk,kjl->il",A,B).data,reference.data)
+
+def test_contraction_cache_limits():
+    cache = gtn.contraction_cache(maxsize=2,maxbytes=100)
+    cache.put("a","plan a",40)
+    cache.put("b","plan b",40)
+    assert cache.get("a") == "plan a"
+    # the least recently used plan is evicted first
+    cache.put("c","plan c",10)
+    assert len(cache) == 2 and cache.get("b") is None
+    # the stored plans may not take more than maxbytes
+    cache.put("d","plan d",80)
+    assert cache.get("a") is None and cache.get("c") == "plan c" and cache.get("d") == "plan d"
+    assert cache.nbytes == 90
+    cache.put("f","plan f",20)
+    assert cache.get("c") is None and cache.nbytes == 100
+    # a plan larger than maxbytes is not stored at all
+    cache.put("e","plan e",200)
+    assert cache.get("e") is None and cache.get("d") == "plan d"
+    assert cache.info()["hits"] == 4
+
+def test_einsum_cache_bytes():
+    A, B = random_pair(3)
+    reference = gtn.einsum("ijk,kjl->il",A,B)
+    gtn.clear_einsum_cache(maxbytes=0)
+    try:
+        # the sign tensors do not fit, so the plan is compiled again on every call
+        for n in range(2):
+            assert np.allclose(gtn.einsum("ijk,kjl->il",A,B).data,reference.data)
+        assert gtn.einsum_cache_info()["size"] == 0
+    finally:
+        gtn.clear_einsum_cache(maxbytes=2**26)
+    gtn.einsum("ijk,kjl->il",A,B)
+    gtn.einsum("ijk,kjl->il",A,B)
+    info = gtn.einsum_cache_info()
+    assert info["size"] == 1 and info["hits"] == 1 and info["nbytes"] > 0
@@ -0,0 +1,68 @@
+import numpy as np
+import grassmanntn as gtn
+
+def convert(obj,this_type):
+    if this_type == "sparse" :
+        return gtn.sparse(obj)
+    if this_type == "block" :
+        return obj.toblock()
+    return obj
+
+def to_dense(obj):
+    if type(obj) == gtn.block :
+        return obj.todense()
+    return gtn.dense(obj)
+
+def low_rank_factors():
+    # the product has rank 4 between the legs ai and bk
+    np.random.seed(0)
+    C = gtn.random((16,8,4),(1,1,-1),dtype=float)
+    B = gtn.random((4,16,8),(1,-1,1),dtype=float)
+    return C, B
+
+def test_contract_matches_einsum():
+    C, B = low_rank_factors()
+    np.random.seed(1)
+    W = gtn.random((16,8,8),(1,-1,1),dtype=float)
+    for this_type in ("dense","sparse","block"):
+        Cx, Bx, Wx = [ convert(obj,this_type) for obj in (C,B,W) ]
+        Op = gtn.product_operator("aij,jbk->aibk",Cx,Bx)
+        reference = gtn.einsum("aibk,bkc->aic",gtn.einsum("aij,jbk->aibk",C,B),W)
+        result = Op.contract("aibk,bkc->aic",Wx)
+        assert np.allclose(to_dense(result).data,reference.data)
+
+def test_low_rank_is_exact():
+    C, B = low_rank_factors()
+    for this_type in ("dense","sparse","block"):
+        Cx, Bx = [ convert(obj,this_type) for obj in (C,B) ]
+        M = gtn.einsum("aij,jbk->aibk",Cx,Bx)
+        U, S, V = gtn.svd(gtn.product_operator("aij,jbk->aibk",Cx,Bx),"ai|bk",8)
+        R = gtn.einsum("aic,cd,dbk->aibk",U,S,V)
+        assert np.allclose(to_dense(R).data,to_dense(M).data)
+        assert gtn.svd_report["range_residual"] < 1e-10*gtn.svd_report["total_weight"]
+
+def test_matches_explicit_svd():
+    np.random.seed(1)
+    C = gtn.random((16,8,8),(1,1,-1),dtype=float)
+    B = gtn.random((8,8,16),(-1,1,-1),dtype=float)
+    M = gtn.einsum("ajk,jib->aibk",C,B)
+    Op = gtn.product_operator("ajk,jib->aibk",C,B)
+    for cutoff in (8,16):
+        U, S, V = M.svd("ai|bk",cutoff)
+        error = np.linalg.norm((gtn.einsum("aic,cd,dbk->aibk",U,S,V)-M).data)
+        report = dict(gtn.svd_report)
+        U, S, V = gtn.svd(Op,"ai|bk",cutoff)
+        implicit_error = np.linalg.norm((gtn.einsum("aic,cd,dbk->aibk",U,S,V)-M).data)
+        assert implicit_error < 1.001*error
+        # the range residual is an estimate, so the reported weights only agree roughly
+        assert gtn.svd_report["range_residual"] > 0
+        assert np.isclose(gtn.svd_report["relative_error"],report["relative_error"],rtol=0.05)
+
+def test_rng_is_reproducible():
+    np.random.seed(1)
+    C = gtn.random((16,8,8),(1,1,-1),dtype=float)
+    B = gtn.random((8,8,16),(-1,1,-1),dtype=float)
+    Op = gtn.product_operator("ajk,jib->aibk",C,B)
+    S1 = gtn.implicit_svd(Op,"ai|bk",8,rng=7)[1]
+    S2 = gtn.implicit_svd(Op,"ai|bk",8,rng=np.random.default_rng(7))[1]
+    assert np.array_equal(S1.data,S2.data)
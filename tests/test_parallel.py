@@ -0,0 +1,46 @@
+import numpy as np
+import grassmanntn as gtn
+
+def random_blocks(seed):
+    np.random.seed(seed)
+    A = gtn.random((4,8,4),(1,-1,1),dtype=float)
+    B = gtn.random((4,8,4),(-1,1,-1),dtype=float)
+    return A.toblock(), B.toblock()
+
+def test_run_parallel_keeps_order():
+    task_list = [ (lambda n=n: n*n) for n in range(8) ]
+    serial = gtn.run_parallel(task_list)
+    gtn.set_executor(4)
+    try:
+        parallel = gtn.run_parallel(task_list)
+    finally:
+        gtn.set_executor(1)
+    assert serial == parallel == [ n*n for n in range(8) ]
+    assert gtn.executor is None
+
+def test_block_einsum_matches_serial():
+    A, B = random_blocks(0)
+    serial = [ gtn.einsum(subscripts,A,B) for subscripts in ("ijk,kjl->il","ijk,klm->ijlm","ijk,kji") ]
+    gtn.set_executor(4)
+    try:
+        parallel = [ gtn.einsum(subscripts,A,B) for subscripts in ("ijk,kjl->il","ijk,klm->ijlm","ijk,kji") ]
+    finally:
+        gtn.set_executor(1)
+    for ret_serial,ret_parallel in zip(serial,parallel):
+        if np.isscalar(ret_serial) :
+            # the cells are summed in the same order, so the results agree exactly
+            assert ret_parallel == ret_serial
+        else :
+            assert np.array_equal(ret_parallel.todense().data,ret_serial.todense().data)
+
+def test_block_svd_matches_serial():
+    A, B = random_blocks(1)
+    M = gtn.einsum("ijk,klm->ijlm",A,B)
+    serial = M.svd("ij|lm",8)
+    gtn.set_executor(2)
+    try:
+        parallel = M.svd("ij|lm",8)
+    finally:
+        gtn.set_executor(1)
+    for ret_serial,ret_parallel in zip(serial,parallel):
+        assert np.allclose(ret_parallel.todense().data,ret_serial.todense().data)
@@ -0,0 +1,74 @@
+import numpy as np
+import grassmanntn as gtn
+
+# the inversion count of the original (pre-compiled) sign routines, used as the reference
+
+def old_absolute_sign(object_set, parity):
+    noncommutative_elements = [x for i,x in enumerate(object_set) if parity[i]%2==1]
+    inversions = 0
+    for i in range(len(noncommutative_elements)):
+        for j in range(i+1, len(noncommutative_elements)):
+            if noncommutative_elements[i] > noncommutative_elements[j]:
+                inversions += 1
+    return (-1)**inversions
+
+def old_relative_sign(string1, string2, parity1):
+    # the objects absent from string2 are dropped, then the two orderings are compared by inversions
+    kept = [ [c,p] for c,p in zip(string1,parity1) if c in string2 ]
+    parity_of = { c:p for [c,p] in kept }
+    value = { c:i for i,c in enumerate(sorted(set(string1+string2))) }
+    set1 = [ value[c] for [c,p] in kept ]
+    set2 = [ value[c] for c in string2 ]
+    return ( old_absolute_sign(set1,[ p for [c,p] in kept ])
+            *old_absolute_sign(set2,[ parity_of[c] for c in string2 ]) )
+
+def random_string(rng, chars, n):
+    return "".join(rng.choice(list(chars),n,replace=False))
+
+def test_docstring_examples():
+    assert gtn.relative_sign("abCdE,aXdYb->XCEY",[0,0,1,0,1,0,1,0,1,0]) == 1
+    assert gtn.relative_sign("abCdE,aXYb->CXEY",[0,0,1,0,1,0,1,1,0]) == -1
+
+def test_absolute_sign_repeated_objects():
+    assert gtn.absolute_sign([3,1,3,2],[1,1,1,1]) == -1
+    rng = np.random.default_rng(0)
+    for trial in range(500):
+        n = rng.integers(1,9)
+        object_set = list(rng.integers(0,5,n))
+        parity = list(rng.integers(0,2,n))
+        assert gtn.absolute_sign(object_set,parity) == old_absolute_sign(object_set,parity)
+
+def test_relative_sign_dropped_objects():
+    rng = np.random.default_rng(1)
+    for trial in range(500):
+        n = rng.integers(1,9)
+        string1 = random_string(rng,"abcdefghij",n)
+        string2 = random_string(rng,string1,rng.integers(0,n+1))
+        parity = list(rng.integers(0,2,n))
+        expected = old_relative_sign(string1,string2,parity)
+        assert gtn.relative_sign_single_input(string1+"->"+string2,parity) == expected
+        assert gtn.relative_sign_int(list(string1),list(string2),parity) == expected
+
+def test_relative_sign_summed_indices():
+    rng = np.random.default_rng(2)
+    for trial in range(500):
+        free = random_string(rng,"abcdefghij",rng.integers(1,7))
+        summed = random_string(rng,"ABCDEFGH",rng.integers(0,4))
+        terms = list(rng.permutation(list(free+summed+summed)))
+        cut = rng.integers(0,len(terms)+1)
+        string_input = "".join(terms[:cut])+","+"".join(terms[cut:])
+        string_output = random_string(rng,free,len(free))
+        parity = list(rng.integers(0,2,len(terms)))
+        joined = string_input.replace(",","")
+        expected = old_relative_sign(joined,string_output,parity)
+        assert gtn.relative_sign(string_input+"->"+string_output,parity) == expected
+
+def test_sign_program_vectorized():
+    rng = np.random.default_rng(3)
+    program = gtn.compiled_sign_program("abcdef","fbdx")
+    packed = rng.integers(0,2**6,100)
+    signs = program.sign(packed)
+    for P,s in zip(packed,signs):
+        parity = [ (int(P)>>a)&1 for a in range(6) ]
+        assert s == program.sign(int(P)) == old_relative_sign("abcdef","fbd",parity)
+    assert gtn.compiled_sign_program("abcdef","fbdx") is program
@@ -0,0 +1,51 @@
+import numpy as np
+import grassmanntn as gtn
+
+def random_sparse(seed):
+    np.random.seed(seed)
+    return gtn.sparse(gtn.random((4,4,2),(1,-1,0),dtype=float))
+
+def test_set_values():
+    A = random_sparse(0)
+    B = A.copy()
+    reference = gtn.dense(A).data
+    coords = A.data.coords
+    B.set_values([0,2,5],[1.0,-2.0,3.0])
+    for entry,value in zip([0,2,5],[1.0,-2.0,3.0]):
+        reference[tuple(coords[:,entry])] = value
+    assert np.array_equal(gtn.dense(B).data,reference)
+    assert not np.array_equal(gtn.dense(A).data,reference)
+
+def test_remove_entries():
+    A = random_sparse(1)
+    B = A.copy()
+    reference = gtn.dense(A).data
+    coords = A.data.coords
+    B.remove_entries([1,3])
+    for entry in [1,3]:
+        reference[tuple(coords[:,entry])] = 0
+    assert B.data.nnz == A.data.nnz-2
+    assert np.array_equal(gtn.dense(B).data,reference)
+
+def test_append_entries():
+    A = random_sparse(2)
+    B = A.copy()
+    C = A.copy()
+    reference = gtn.dense(A).data
+    # the second coordinate is already stored, so its value is added to the existing entry
+    coords_list = np.array([[0,1],[1,0],[0,1]])
+    coords_list[:,1] = A.data.coords[:,0]
+    value_list = [2.0,5.0]
+    B.append_entries(coords_list,value_list)
+    for k in range(2):
+        C.append_entry(coords_list[:,k],value_list[k])
+        reference[tuple(coords_list[:,k])] += value_list[k]
+    assert np.array_equal(gtn.dense(B).data,reference)
+    assert np.array_equal(gtn.dense(C).data,reference)
+
+def test_remove_zeros_keeps_nan():
+    A = random_sparse(3)
+    A.set_values([0,1],[0.0,np.nan])
+    B = A.remove_zeros()
+    assert B.data.nnz == A.data.nnz-1
+    assert np.isnan(B.data.data).sum() == 1
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+import grassmanntn as gtn
+
+def decaying_matrix(seed,dtype=float):
+    # a 60x40 matrix with the singular values 1, 1/2, 1/4, ...
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((60,40))
+    if dtype == complex :
+        X = X + complex(0,1)*rng.standard_normal((60,40))
+    u, s, v = np.linalg.svd(X,full_matrices=False)
+    return (u*0.5**np.arange(40))@v
+
+def check_truncated(method,dtype):
+    M = decaying_matrix(0,dtype)
+    U0, Λ0, V0 = gtn.SortedSVD(M,8,method="full")
+    U, Λ, V = gtn.SortedSVD(M,8,method=method)
+    assert U.shape == U0.shape and V.shape == V0.shape
+    assert np.allclose(Λ,Λ0)
+    assert np.allclose((U*Λ)@V,(U0*Λ0)@V0)
+
+@pytest.mark.parametrize("dtype",[float,complex])
+def test_randomized_matches_full(dtype):
+    check_truncated("randomized",dtype)
+
+@pytest.mark.parametrize("dtype",[float,complex])
+def test_lanczos_matches_full(dtype):
+    pytest.importorskip("scipy")
+    check_truncated("lanczos",dtype)
+
+@pytest.mark.parametrize("method",["randomized","lanczos"])
+def test_tensor_svd_matches_full(method):
+    if method == "lanczos" :
+        pytest.importorskip("scipy")
+    np.random.seed(0)
+    A = gtn.random((8,8,8,8),(1,1,-1,-1),dtype=float)
+    M = gtn.einsum("ijab,abkl->ijkl",A,A)
+    for Mx in (M,M.toblock()):
+        U0, S0, V0 = Mx.svd("ij|kl",16,method="full")
+        reference = gtn.einsum("ija,ab,bkl->ijkl",U0,S0,V0)
+        report = dict(gtn.svd_report)
+        U, S, V = Mx.svd("ij|kl",16,method=method)
+        result = gtn.einsum("ija,ab,bkl->ijkl",U,S,V)
+        if type(Mx) == gtn.block :
+            reference, result = reference.todense(), result.todense()
+        assert gtn.svd_report["method"] == method
+        assert np.isclose(gtn.svd_report["relative_error"],report["relative_error"],rtol=1e-3)
+        assert np.linalg.norm((result-reference).data) < 1e-3*np.linalg.norm(reference.data)